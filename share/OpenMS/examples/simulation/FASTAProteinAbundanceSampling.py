@@ -31,145 +31,137 @@
 # $Maintainer: Chris Bielow $
 # $Authors: Chris Bielow $
 # --------------------------------------------------------------------------
-
-import re
-import random
-import math
-import sys
-import argparse
-
-## holds FASTA header + sequence
-class FASTAEntry:
-    pass
-		
-
-## grab entries from FASTA file
-def nextEntry(fileobj):
-				entry = FASTAEntry()
-				entry.header = fileobj.readline()	
-				entry.sequence = ""
-				for line in fileobj:	
-								if '>' == line[0]:	
-												yield entry	
-												entry.header = line
-												entry.sequence = ""
-								else:	
-												entry.sequence += line	
-				yield entry	
-
-
-## sample abundance from Gaussian in log space
-def sampleAbundance(mu=3, sigma=1):
-		return math.exp(random.gauss(mu, sigma))
-
-
-def main(argv):
-		## we use ArgumentParser, which requires 2.7
-		if sys.version_info < (2, 7):
-			raise "This script requires python 2.7 or greater"
-
-		## add weight filtering functionality if BioPython is available
-		try:
-			from Bio.SeqUtils.ProtParam import ProteinAnalysis	
-			has_biopython = 1
-		except :
-			has_biopython = 0
-			
-  		
-		parser = argparse.ArgumentParser(description='Add abundance to FASTA files.')
-		parser.add_argument('infile', type=argparse.FileType('r'), help='Input FASTA file')
-		parser.add_argument('outfile', type=argparse.FileType('w'), help='Output FASTA file')
-		
-		parser.add_argument('--mu', dest='mu', action='store', default=3, help='mean of gaussian in log space')
-		parser.add_argument('--sigma', dest='sigma', action='store', default=1, help='sd of gaussian in log space')
-		parser.add_argument('--sample', dest='sample', action='store', default=0, help='Number of entries to keep (for sampling a bigger FASTA file)')
-		parser.add_argument('--random', dest='random', action='store_true', help='Randomly shuffle entries before sampling (only if --sample is given). If not given, the first \'X\' samples are used.')
-		if (has_biopython):
-			parser.add_argument('--weight_low', dest='weight_low', action='store', default=0, help='minimum molecular weight of protein')
-			parser.add_argument('--weight_up', dest='weight_up', action='store', default=0, help='Maximum molecular weight of protein (use 0 for unlimited)')
-		else:
-			print "Warning: protein weight filtering not supported, as BioPython module is not installed."
-			
-		## argument parsing
-		args = parser.parse_args()
-		fileobj = args.infile
-		fileoutobj = args.outfile
-		sample_size = int(args.sample)
-		sample_random = bool(args.random)
-		if (has_biopython):
-			weight_low = float(args.weight_low)
-			weight_up = float(args.weight_up)
-			if (weight_up <= 0): weight_up = sys.float_info.max
-			
-		
-		## list of final entries
-		fasta_entries = []
-		
-		for entry in nextEntry(fileobj):
-				header = entry.header
-				## check if it contains 'intensity'?
-				rep = re.compile(r"\[# *(.*) *#\]")
-				m = rep.search(header)
-				header_new = ""
-				other = []
-				if (m):
-					header_new = header.replace(m.group(0), "") ## delete meta
-					for element in m.group(1).split(','):
-							#print "element:", element
-							if (element.find("intensity") == -1):
-									other.append(element)
-				else:
-					header_new = header	## nothing to replace
-
-				## create new metainfo array
-				i = "intensity=" + str(sampleAbundance(float(args.mu), float(args.sigma)))
-				other.append(i)
-
-				entry.header = header_new.rstrip() + "[# " + (", ").join(other) + " #]"
-				
-				if (has_biopython):
-					sequence = "".join(entry.sequence.split("\n"))
-					##
-					## BioPython does not like some AA letters - they need replacement
-					##
-					## replace "U" (Selenocystein) with "C" (Cystein)
-					sequence = sequence.replace("U","C")
-					## replace "X" (unknown) with "P" (Proline) [arbitrary choice - but weight of 115 is very close to averagine]
-					sequence = sequence.replace("X","P")
-					## replace "B" (Asparagine or aspartic acid) with "N" (Asparagine)
-					sequence = sequence.replace("B","N")
-					## replace "Z" (Glutamine or glutamic acid) with "Q" (Glutamine)
-					sequence = sequence.replace("Z","Q")
-					## replace "Z" (Glutamine or glutamic acid) with "Q" (Glutamine)
-					sequence = sequence.replace("Z","Q")
-					## replace "J" (Leucine or Isoleucine) with "L" (Leucine)
-					sequence = sequence.replace("J","L")
-					analysed_seq = ProteinAnalysis(sequence)
-					weight = analysed_seq.molecular_weight()
-					if (not(weight_low <= weight and weight <= weight_up)):
-						continue
-				
-				
-				fasta_entries.append(entry.header + "\n" + entry.sequence)
-				
-				## only read to sample size (the rest is thrown away anyways)
-				if (sample_size > 0 and not(sample_random)):
-					if (len(fasta_entries) >= sample_size):
-						break
-					
-				
-		## select subset (if required)		
-		if (sample_size > 0):
-			indices = range(0,len(fasta_entries))
-			## random sampling only makes sense if we take a subset
-			if (sample_random and sample_size < len(fasta_entries)):
-				random.shuffle(indices)
-			indices = [indices[i] for i in range(0,sample_size)]
-			fasta_entries = [fasta_entries[i] for i in indices]
-			
-		## write to file
-		for entry in fasta_entries:
-			fileoutobj.write(entry)		
-
-if __name__ == "__main__":
-		main(sys.argv)
+
+"""Add a sampled abundance ('intensity') to the entries of a FASTA file.
+
+The input is read in a single streaming pass. With --sample (and --random),
+the kept entries are selected by reservoir sampling, so memory use only
+depends on the sample size, not on the size of the input file.
+"""
+
+from __future__ import print_function
+
+import argparse
+import io
+import math
+import random
+import re
+import sys
+
+META = re.compile(r"\[# *(.*) *#\]")
+
+## BioPython does not like some AA letters - they need replacement
+AA_REPLACEMENTS = [("U", "C"),  # Selenocystein -> Cystein
+                   ("X", "P"),  # unknown -> Proline [arbitrary choice - but weight of 115 is very close to averagine]
+                   ("B", "N"),  # Asparagine or aspartic acid -> Asparagine
+                   ("Z", "Q"),  # Glutamine or glutamic acid -> Glutamine
+                   ("J", "L")]  # Leucine or Isoleucine -> Leucine
+
+
+## grab (header, sequence lines) from a FASTA file
+def nextEntry(fileobj):
+    header = None
+    lines = []
+    for line in fileobj:
+        if line.startswith(">"):
+            if header is not None:
+                yield header, lines
+            header = line
+            lines = []
+        elif header is None:
+            continue  # text before the first header
+        else:
+            lines.append(line)
+    if header is not None:
+        yield header, lines
+
+
+## sample abundance from Gaussian in log space
+def sampleAbundance(mu=3, sigma=1):
+    return math.exp(random.gauss(mu, sigma))
+
+
+## replace the intensity in the meta information of the header by a sampled one
+def annotateHeader(header, mu, sigma):
+    other = []
+    m = META.search(header)
+    if m:
+        header = header.replace(m.group(0), "")  ## delete meta
+        other = [element for element in m.group(1).split(",") if "intensity" not in element]
+    other.append("intensity=" + str(sampleAbundance(mu, sigma)))
+    return header.rstrip() + "[# " + ", ".join(other) + " #]\n"
+
+
+## reservoir sampling (algorithm R): a uniform random subset of size k of the items
+def reservoirSample(items, k):
+    reservoir = []
+    for n, item in enumerate(items):
+        if n < k:
+            reservoir.append((n, item))
+        else:
+            j = random.randint(0, n)
+            if j < k:
+                reservoir[j] = (n, item)
+    ## keep the order of the input file
+    reservoir.sort(key=lambda x: x[0])
+    return [item for _, item in reservoir]
+
+
+def main(argv):
+    ## add weight filtering functionality if BioPython is available
+    try:
+        from Bio.SeqUtils.ProtParam import ProteinAnalysis
+        has_biopython = True
+    except ImportError:
+        has_biopython = False
+
+    parser = argparse.ArgumentParser(description='Add abundance to FASTA files.')
+    parser.add_argument('infile', help='Input FASTA file')
+    parser.add_argument('outfile', help='Output FASTA file')
+
+    parser.add_argument('--mu', dest='mu', action='store', type=float, default=3, help='mean of gaussian in log space')
+    parser.add_argument('--sigma', dest='sigma', action='store', type=float, default=1, help='sd of gaussian in log space')
+    parser.add_argument('--sample', dest='sample', action='store', type=int, default=0, help='Number of entries to keep (for sampling a bigger FASTA file)')
+    parser.add_argument('--random', dest='random', action='store_true', help='Randomly sample entries (only if --sample is given). If not given, the first \'X\' entries are used.')
+    if has_biopython:
+        parser.add_argument('--weight_low', dest='weight_low', action='store', type=float, default=0, help='minimum molecular weight of protein')
+        parser.add_argument('--weight_up', dest='weight_up', action='store', type=float, default=0, help='Maximum molecular weight of protein (use 0 for unlimited)')
+    else:
+        print("Warning: protein weight filtering not supported, as BioPython module is not installed.")
+
+    ## argument parsing
+    args = parser.parse_args(argv[1:])
+    sample_size = args.sample
+    if has_biopython:
+        weight_low = args.weight_low
+        weight_up = args.weight_up if args.weight_up > 0 else sys.float_info.max
+
+    def acceptedEntries(fileobj):
+        for header, lines in nextEntry(fileobj):
+            if has_biopython:
+                sequence = "".join(line.strip() for line in lines)
+                for old, new in AA_REPLACEMENTS:
+                    sequence = sequence.replace(old, new)
+                weight = ProteinAnalysis(sequence).molecular_weight()
+                if not (weight_low <= weight <= weight_up):
+                    continue
+            yield header, lines
+
+    buffer_size = 1 << 20
+    with io.open(args.infile, "r", buffering=buffer_size) as fileobj, \
+         io.open(args.outfile, "w", buffering=buffer_size) as fileoutobj:
+        entries = acceptedEntries(fileobj)
+        if sample_size > 0:
+            if args.random:
+                entries = reservoirSample(entries, sample_size)
+            else:
+                ## only read to sample size (the rest is thrown away anyways)
+                entries = (entry for _, entry in zip(range(sample_size), entries))
+
+        ## write to file
+        for header, lines in entries:
+            fileoutobj.write(annotateHeader(header, args.mu, args.sigma))
+            fileoutobj.writelines(lines)
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,124 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#pragma once
+
+#include <OpenMS/config.h>
+#include <OpenMS/DATASTRUCTURES/String.h>
+#include <OpenMS/OPENSWATHALGO/DATAACCESS/TransitionExperiment.h>
+
+#include <fstream>
+
+#define TRANSITION_CACHE_FILE_IDENTIFIER 8096
+#define TRANSITION_CACHE_FILE_VERSION 1
+
+namespace OpenMS
+{
+
+  /**
+      @brief Binary cache for OpenSwath::LightTargetedExperiment assay libraries
+
+      Parsing a large assay library (TraML, TSV or PQP) and converting it to
+      a LightTargetedExperiment is slow. This class stores the converted
+      experiment in a compact binary format that can be read back without
+      any parsing.
+
+      A cache file remembers the size, modification time and SHA1 hash of
+      the assay library it was created from. isValid() accepts a cache if
+      the size and modification time of the library are unchanged or, if
+      only the modification time differs (e.g. after copying), if the hash
+      of the library is unchanged.
+  */
+  class OPENMS_DLLAPI TransitionCacheFile
+  {
+
+public:
+
+    //@{
+    /// Constructor
+    TransitionCacheFile();
+
+    /// Destructor
+    virtual ~TransitionCacheFile();
+    //@}
+
+    /** @brief Stores a LightTargetedExperiment in binary format
+     *
+     * The cache is written to a temporary file next to @p filename which is
+     * then renamed, so a concurrent load() never sees a partially written file.
+     *
+     * @param filename The output (cache) file
+     * @param targeted_exp The experiment to store
+     * @param source The assay library @p targeted_exp was created from (may be empty)
+     *
+     * @exception Exception::UnableToCreateFile is thrown if the file cannot be written
+    */
+    void store(const String& filename, const OpenSwath::LightTargetedExperiment& targeted_exp, const String& source = "");
+
+    /** @brief Loads a LightTargetedExperiment stored with store()
+     *
+     * @param filename The input (cache) file
+     * @param targeted_exp The output experiment (previous content is replaced)
+     *
+     * @exception Exception::FileNotFound is thrown if the file does not exist
+     * @exception Exception::ParseError is thrown if the file is not a (complete) transition cache
+    */
+    void load(const String& filename, OpenSwath::LightTargetedExperiment& targeted_exp);
+
+    /** @brief Checks whether a cache file was created from the current version of an assay library
+     *
+     * @param filename The cache file
+     * @param source The assay library
+     *
+     * @return false if the cache does not exist, is not a transition cache, has a different format
+     * version or belongs to a different version of @p source
+    */
+    bool isValid(const String& filename, const String& source);
+
+protected:
+
+    /// Size, modification time (ms since epoch) and SHA1 hash of a file
+    struct SourceInfo_
+    {
+      Int64 size;
+      Int64 modified;
+      String hash;
+    };
+
+    SourceInfo_ getSourceInfo_(const String& source, bool compute_hash) const;
+
+    /// Reads the header of a cache file, returns false if it is not a cache file of the current version
+    bool readHeader_(std::ifstream& ifs, SourceInfo_& info) const;
+  };
+}
@@ -31,6 +31,7 @@ set(sources_list_h
   SwathWindowLoader.h
   TransitionTSVFile.h
   TransitionPQPFile.h
+  TransitionCacheFile.h
   MRMFeatureQC.h
   MRMFeatureFilter.h
 )
@@ -35,6 +35,7 @@
 #pragma once
 
 #include <OpenMS/config.h>
+#include <OpenMS/CONCEPT/Parallel.h>
 #include <OpenMS/KERNEL/StandardTypes.h>
 #include <OpenMS/KERNEL/Feature.h>
 #include <OpenMS/DATASTRUCTURES/DefaultParamHandler.h>
@@ -42,6 +43,8 @@
 #include <OpenMS/DATASTRUCTURES/KDTree.h>
 #include <OpenMS/ANALYSIS/QUANTITATION/KDTreeFeatureNode.h>
 
+#include <algorithm>
+
 namespace OpenMS
 {
 
@@ -135,6 +138,31 @@ public:
   /// Fill @p result with indices of all features within the specified boundaries
   void queryRegion(double rt_low, double rt_high, double mz_low, double mz_high, std::vector<Size>& result_indices, Size ignored_map_index = std::numeric_limits<Size>::max()) const;
 
+  /**
+    @brief Queries many regions at once
+
+    The indices of the features within the box rt_low[i] to rt_high[i], mz_low[i] to mz_high[i]
+    are result_indices[offsets[i]] ... result_indices[offsets[i+1] - 1] (sorted).
+    The queries run on @p nr_threads threads (0 uses the OpenMP default).
+  */
+  void queryRegions(const std::vector<double>& rt_low, const std::vector<double>& rt_high, const std::vector<double>& mz_low, const std::vector<double>& mz_high, std::vector<Size>& offsets, std::vector<Size>& result_indices, Size nr_threads = 0) const;
+
+  /**
+    @brief Finds the features within an elliptical tolerance around many points
+
+    A feature is within the tolerance of a point if (delta_rt / rt_tol)^2 + (delta_mz / mz_tol)^2 <= 1
+    (with @p mz_tol in ppm of the point's m/z if @p mz_ppm is set). Output layout as for queryRegions().
+  */
+  void queryRadius(const std::vector<double>& rt, const std::vector<double>& mz, double rt_tol, double mz_tol, bool mz_ppm, std::vector<Size>& offsets, std::vector<Size>& result_indices, Size nr_threads = 0) const;
+
+  /**
+    @brief Finds the nearest feature of many points
+
+    Distances are measured as in queryRadius(). @p result_indices[i] is the index of the nearest feature
+    within the tolerance of point i (ties: lowest index) or -1 if there is none.
+  */
+  void nearestNeighbors(const std::vector<double>& rt, const std::vector<double>& mz, double rt_tol, double mz_tol, bool mz_ppm, std::vector<SignedSize>& result_indices, Size nr_threads = 0) const;
+
   /// Apply RT transformations
   void applyTransformations(const std::vector<TransformationModelLowess*>& trafos);
 
@@ -142,6 +170,36 @@ protected:
 
   void updateMembers_() override;
 
+  /// Runs @p query (i, result) for all i < @p n on @p nr_threads threads and concatenates the (sorted) results
+  template <typename QueryFunction>
+  void queryBatch_(Size n, const QueryFunction& query, std::vector<Size>& offsets, std::vector<Size>& result_indices, Size nr_threads) const
+  {
+    offsets.assign(1, 0);
+    offsets.reserve(n + 1);
+    result_indices.clear();
+
+    // blocks limit the memory of the intermediate results
+    const Size block_size = 10000;
+    std::vector<std::vector<Size> > results;
+    for (Size block_start = 0; block_start < n; block_start += block_size)
+    {
+      const Size block_end = std::min(n, block_start + block_size);
+      results.assign(block_end - block_start, std::vector<Size>());
+      parallelFor(block_end - block_start, nr_threads, [&](Size k)
+      {
+        std::vector<Size>& result = results[k];
+        query(block_start + k, result);
+        std::sort(result.begin(), result.end());
+      }, 100);
+
+      for (const std::vector<Size>& result : results)
+      {
+        result_indices.insert(result_indices.end(), result.begin(), result.end());
+        offsets.push_back(result_indices.size());
+      }
+    }
+  }
+
   /// Feature data
   std::vector<const BaseFeature*> features_;
 
@@ -151,6 +209,11 @@ protected:
   /// (Potentially transformed) retention times
   std::vector<double> rt_;
 
+  /// m/z, intensity and charge of the features (copied, so the tree stays valid if the maps are destroyed)
+  std::vector<double> mz_;
+  std::vector<float> intensity_;
+  std::vector<Int> charge_;
+
   /// Number of maps
   Size num_maps_;
 
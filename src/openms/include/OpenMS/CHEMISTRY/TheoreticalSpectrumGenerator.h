@@ -87,6 +87,39 @@ namespace OpenMS
     /// returns a spectrum with the ion types, that are set in the tool parameters
     virtual void getSpectrum(PeakSpectrum & spec, const AASequence & peptide, Int min_charge, Int max_charge) const;
 
+    /**
+      @brief Generates the spectra of many peptides on @p nr_threads threads (0 uses the OpenMP default)
+
+      The peaks of all spectra are concatenated (compressed sparse row layout): the peaks of
+      peptides[i] are at positions offsets[i] to offsets[i + 1] - 1 of @p mz, @p intensity and
+      @p ion_codes (see encodeIonAnnotation()), sorted by m/z. @p min_charges and @p max_charges
+      contain either one charge range for all peptides or one range per peptide.
+
+      The result is identical to calling getSpectrum() for each peptide. Ion codes are computed
+      independently of the add_metainfo parameter.
+
+      @exception Exception::IllegalArgument is thrown if the number of charge ranges does not fit
+    */
+    void getSpectra(const std::vector<AASequence> & peptides, const std::vector<Int> & min_charges, const std::vector<Int> & max_charges,
+                    std::vector<Size> & offsets, std::vector<double> & mz, std::vector<float> & intensity, std::vector<Int> & ion_codes,
+                    Size nr_threads = 0) const;
+
+    /// ion types of encodeIonAnnotation()
+    enum IonAnnotationType
+    {
+      UNKNOWN_ION = 0, A_ION, B_ION, C_ION, X_ION, Y_ION, Z_ION, PRECURSOR_ION, IMMONIUM_ION
+    };
+
+    /**
+      @brief Encodes a peak annotation (as written to the "IonNames" and "Charges" arrays) as integer
+
+      Bits 24-31 hold the IonAnnotationType, bits 16-23 the charge, bits 12-15 the neutral loss
+      (0: none, 1: water, 2: ammonia, 3: other) and bits 0-11 the ion number (number of residues
+      of a fragment ion, the one letter code of the residue of an immonium ion, 0 for the precursor).
+      E.g. "y8-H2O1++" with charge 2 is (Y_ION << 24) | (2 << 16) | (1 << 12) | 8.
+    */
+    static Int encodeIonAnnotation(const String & ion_name, Int charge);
+
     /// overwrite
     void updateMembers_() override;
 
@@ -0,0 +1,160 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#pragma once
+
+#include <OpenMS/DATASTRUCTURES/DefaultParamHandler.h>
+#include <OpenMS/KERNEL/StandardTypes.h>
+
+#include <utility>
+#include <vector>
+
+namespace OpenMS
+{
+
+  /**
+    @brief All-vs-all similarity search of binned spectra
+
+    Comparing many spectra pairwise with a BinnedSpectrumCompareFunctor
+    creates a BinnedSpectrum per spectrum and calls the functor per pair.
+    This class bins all spectra once into a compressed sparse row (CSR)
+    matrix of unit-length vectors and computes the @p top_k most similar
+    spectra (cosine similarity) of every spectrum on multiple threads, e.g.
+    as the similarity graph for spectrum clustering.
+
+    Only spectra with similar precursor m/z (@p precursor_mass_tolerance)
+    and, optionally, the same precursor charge are compared. Spectra are
+    binned with the same binning as BinnedSpectrum (@p bin_size,
+    @p bin_offset, @p bin_spread, @p bin_unit).
+
+    Besides the cosine, the dot bias of each neighbor is reported (see
+    SpectraSTSimilarityScore): values close to 1 indicate that the
+    similarity is dominated by a single peak.
+
+    @htmlinclude OpenMS_BinnedSpectrumNeighborSearch.parameters
+
+    @see BinnedSpectrum
+
+    @ingroup SpectraComparison
+  */
+  class OPENMS_DLLAPI BinnedSpectrumNeighborSearch :
+    public DefaultParamHandler
+  {
+public:
+
+    /// default constructor
+    BinnedSpectrumNeighborSearch();
+
+    /// copy constructor
+    BinnedSpectrumNeighborSearch(const BinnedSpectrumNeighborSearch& source);
+
+    /// destructor
+    ~BinnedSpectrumNeighborSearch() override;
+
+    /// assignment operator
+    BinnedSpectrumNeighborSearch& operator=(const BinnedSpectrumNeighborSearch& source);
+
+    /**
+      @brief Bins the spectra (replaces previously set spectra)
+
+      The spectra need to be sorted by m/z. Spectra without precursor have a
+      precursor m/z and charge of 0. Changing the binning parameters
+      afterwards requires setting the spectra again.
+
+      @param spectra The spectra to compare
+      @param nr_threads Number of threads (0 uses the OpenMP default)
+    */
+    void setSpectra(const std::vector<PeakSpectrum>& spectra, Size nr_threads = 0);
+
+    /// Bins all spectra of an experiment (the neighbors refer to the spectrum indices in @p exp)
+    void setSpectra(const PeakMap& exp, Size nr_threads = 0);
+
+    /// number of spectra
+    Size size() const;
+
+    /**
+      @brief Returns the binned spectra as CSR matrix
+
+      The non-zero bins of spectrum i are bins[offsets[i]] ... bins[offsets[i+1] - 1]
+      (sorted by bin index), their values are normalized to unit length.
+    */
+    void getBinnedMatrix(std::vector<Size>& offsets, std::vector<Int>& bins, std::vector<float>& values) const;
+
+    /**
+      @brief Computes the most similar spectra of each spectrum
+
+      The neighbors of spectrum i are neighbors[offsets[i]] ... neighbors[offsets[i+1] - 1],
+      sorted by decreasing cosine (ties by index). A spectrum has at most
+      @p top_k neighbors with a cosine of at least @p min_score; it is never its own neighbor.
+
+      @param offsets Start of the neighbors of each spectrum (size() + 1 entries)
+      @param neighbors Indices of the neighbors
+      @param scores Cosine similarity of the neighbors
+      @param dot_bias Dot bias of the neighbors
+      @param nr_threads Number of threads (0 uses the OpenMP default)
+    */
+    void getNeighbors(std::vector<Size>& offsets, std::vector<Size>& neighbors, std::vector<float>& scores,
+                      std::vector<float>& dot_bias, Size nr_threads = 0) const;
+
+protected:
+    void updateMembers_() override;
+
+    /// returns the begin and end (in order_) of the spectra within the precursor window of spectrum @p i
+    std::pair<Size, Size> getWindow_(Size i) const;
+
+    double bin_size_;
+    double bin_offset_;
+    UInt bin_spread_;
+    bool bin_unit_ppm_;
+    bool sqrt_intensities_;
+    double precursor_mass_tolerance_;
+    bool precursor_mass_tolerance_ppm_;
+    bool match_charge_;
+    Size top_k_;
+    double min_score_;
+
+    /// CSR matrix of the binned spectra
+    std::vector<Size> offsets_;
+    std::vector<Int> bins_;
+    std::vector<float> values_;
+
+    /// precursor m/z and charge of the spectra
+    std::vector<double> precursor_mz_;
+    std::vector<Int> precursor_charge_;
+
+    /// spectrum indices sorted by precursor m/z
+    std::vector<Size> order_;
+    /// precursor m/z in the order of order_
+    std::vector<double> sorted_mz_;
+  };
+
+}
@@ -6,6 +6,7 @@ set(sources_list_h
 BinnedSharedPeakCount.h
 BinnedSpectralContrastAngle.h
 BinnedSpectrum.h
+BinnedSpectrumNeighborSearch.h
 BinnedSpectrumCompareFunctor.h
 BinnedSumAgreeingIntensities.h
 PeakAlignment.h
@@ -0,0 +1,144 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#pragma once
+
+#include <OpenMS/CONCEPT/Types.h>
+
+#include <algorithm>
+#include <exception>
+#include <memory>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
+
+namespace OpenMS
+{
+
+  /**
+    @brief Returns the number of threads to use for a requested thread count
+
+    @p nr_threads = 0 selects the OpenMP default (omp_get_max_threads()).
+    Without OpenMP, the result is always 1.
+  */
+  inline int getParallelThreadCount(Size nr_threads)
+  {
+#ifdef _OPENMP
+    return nr_threads > 0 ? static_cast<int>(nr_threads) : omp_get_max_threads();
+#else
+    (void) nr_threads;
+    return 1;
+#endif
+  }
+
+  /**
+    @brief Calls body(state, i) for all i in [0, n) on OpenMP threads
+
+    Every thread creates its own state with make_state() before it processes
+    its first index, e.g. a copy of an object that must not be shared between
+    threads. The indices are distributed dynamically in chunks of
+    @p chunk_size. @p nr_threads = 0 uses the OpenMP default.
+
+    Exceptions must not leave an OpenMP region, so the first exception thrown
+    by make_state or body is stored and rethrown once all threads have
+    finished.
+  */
+  template <typename MakeState, typename Body>
+  void parallelForWithState(Size n, Size nr_threads, MakeState make_state, Body body, Size chunk_size = 1)
+  {
+    typedef decltype(make_state()) State;
+    const SignedSize size = static_cast<SignedSize>(n);
+    const int chunk = static_cast<int>(std::max<Size>(chunk_size, 1));
+    std::exception_ptr error;
+
+#ifdef _OPENMP
+#pragma omp parallel num_threads(getParallelThreadCount(nr_threads))
+#else
+    (void) nr_threads;
+    (void) chunk;
+#endif
+    {
+      std::unique_ptr<State> state;
+      try
+      {
+        state.reset(new State(make_state()));
+      }
+      catch (...)
+      {
+#ifdef _OPENMP
+#pragma omp critical (OpenMS_parallelFor)
+#endif
+        if (!error) error = std::current_exception();
+      }
+
+#ifdef _OPENMP
+#pragma omp for schedule(dynamic, chunk)
+#endif
+      for (SignedSize i = 0; i < size; ++i)
+      {
+        // the thread could not create its state (the error is stored)
+        if (!state) continue;
+
+        try
+        {
+          body(*state, static_cast<Size>(i));
+        }
+        catch (...)
+        {
+#ifdef _OPENMP
+#pragma omp critical (OpenMS_parallelFor)
+#endif
+          if (!error) error = std::current_exception();
+        }
+      }
+    }
+
+    if (error) std::rethrow_exception(error);
+  }
+
+  /**
+    @brief Calls body(i) for all i in [0, n) on OpenMP threads
+
+    Like parallelForWithState, without per-thread state: @p nr_threads = 0
+    uses the OpenMP default and the first exception thrown by body is
+    rethrown after the loop.
+  */
+  template <typename Body>
+  void parallelFor(Size n, Size nr_threads, Body body, Size chunk_size = 1)
+  {
+    parallelForWithState(n, nr_threads, []() { return 0; }, [&body](int&, Size i) { body(i); }, chunk_size);
+  }
+
+}
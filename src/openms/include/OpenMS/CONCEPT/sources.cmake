@@ -14,6 +14,7 @@ Helpers.h
 LogConfigHandler.h
 LogStream.h
 Macros.h
+Parallel.h
 PrecisionWrapper.h
 ProgressLogger.h
 SingletonRegistry.h
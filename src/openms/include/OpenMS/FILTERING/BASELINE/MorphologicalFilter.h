@@ -199,10 +199,6 @@ public:
     template <typename InputIterator, typename OutputIterator>
     void filterRange(InputIterator input_begin, InputIterator input_end, OutputIterator output_begin)
     {
-      // the buffer is static only to avoid reallocation
-      static std::vector<typename InputIterator::value_type> buffer;
-      const UInt size = input_end - input_begin;
-
       //determine the struct size in data points if not already set
       if (struct_size_in_datapoints_ == 0)
       {
@@ -210,60 +206,7 @@ public:
       }
 
       //apply the filtering
-      String method = param_.getValue("method");
-      if (method == "identity")
-      {
-        std::copy(input_begin, input_end, output_begin);
-      }
-      else if (method == "erosion")
-      {
-        applyErosion_(struct_size_in_datapoints_, input_begin, input_end, output_begin);
-      }
-      else if (method == "dilation")
-      {
-        applyDilation_(struct_size_in_datapoints_, input_begin, input_end, output_begin);
-      }
-      else if (method == "opening")
-      {
-        if (buffer.size() < size) buffer.resize(size);
-        applyErosion_(struct_size_in_datapoints_, input_begin, input_end, buffer.begin());
-        applyDilation_(struct_size_in_datapoints_, buffer.begin(), buffer.begin() + size, output_begin);
-      }
-      else if (method == "closing")
-      {
-        if (buffer.size() < size) buffer.resize(size);
-        applyDilation_(struct_size_in_datapoints_, input_begin, input_end, buffer.begin());
-        applyErosion_(struct_size_in_datapoints_, buffer.begin(), buffer.begin() + size, output_begin);
-      }
-      else if (method == "gradient")
-      {
-        if (buffer.size() < size) buffer.resize(size);
-        applyErosion_(struct_size_in_datapoints_, input_begin, input_end, buffer.begin());
-        applyDilation_(struct_size_in_datapoints_, input_begin, input_end, output_begin);
-        for (UInt i = 0; i < size; ++i) output_begin[i] -= buffer[i];
-      }
-      else if (method == "tophat")
-      {
-        if (buffer.size() < size) buffer.resize(size);
-        applyErosion_(struct_size_in_datapoints_, input_begin, input_end, buffer.begin());
-        applyDilation_(struct_size_in_datapoints_, buffer.begin(), buffer.begin() + size, output_begin);
-        for (UInt i = 0; i < size; ++i) output_begin[i] = input_begin[i] - output_begin[i];
-      }
-      else if (method == "bothat")
-      {
-        if (buffer.size() < size) buffer.resize(size);
-        applyDilation_(struct_size_in_datapoints_, input_begin, input_end, buffer.begin());
-        applyErosion_(struct_size_in_datapoints_, buffer.begin(), buffer.begin() + size, output_begin);
-        for (UInt i = 0; i < size; ++i) output_begin[i] = input_begin[i] - output_begin[i];
-      }
-      else if (method == "erosion_simple")
-      {
-        applyErosionSimple_(struct_size_in_datapoints_, input_begin, input_end, output_begin);
-      }
-      else if (method == "dilation_simple")
-      {
-        applyDilationSimple_(struct_size_in_datapoints_, input_begin, input_end, output_begin);
-      }
+      applyMethod_((String)param_.getValue("method"), struct_size_in_datapoints_, input_begin, input_end, output_begin);
 
       struct_size_in_datapoints_ = 0;
     }
@@ -291,25 +234,28 @@ public:
       if (spectrum.size() <= 1) { return; }
 
       //Determine structuring element size in datapoints (depending on the unit)
+      UInt struc_size;
       if ((String)(param_.getValue("struc_elem_unit")) == "Thomson")
       {
         const double struc_elem_length = (double)param_.getValue("struc_elem_length");
         const double mz_diff = spectrum.back().getMZ() - spectrum.begin()->getMZ();        
-        struct_size_in_datapoints_ = (UInt)(ceil(struc_elem_length*(double)(spectrum.size() - 1)/mz_diff));
+        struc_size = (UInt)(ceil(struc_elem_length*(double)(spectrum.size() - 1)/mz_diff));
       }
       else
       {
-        struct_size_in_datapoints_ = (UInt)(double)param_.getValue("struc_elem_length");
+        struc_size = (UInt)(double)param_.getValue("struc_elem_length");
       }
       //make it odd (needed for the algorithm)
-      if (!Math::isOdd(struct_size_in_datapoints_)) ++struct_size_in_datapoints_;
+      if (!Math::isOdd(struc_size)) ++struc_size;
 
       //apply the filtering and overwrite the input data
+      //(struct_size_in_datapoints_ is not used, so spectra can be filtered concurrently)
       std::vector<Peak1D::IntensityType> output(spectrum.size());
-      filterRange(Internal::intensityIteratorWrapper(spectrum.begin()),
-                  Internal::intensityIteratorWrapper(spectrum.end()),
-                  output.begin()
-                  );
+      applyMethod_((String)param_.getValue("method"), struc_size,
+                   Internal::intensityIteratorWrapper(spectrum.begin()),
+                   Internal::intensityIteratorWrapper(spectrum.end()),
+                   output.begin()
+                   );
 
       //overwrite output with data
       for (Size i = 0; i < spectrum.size(); ++i)
@@ -323,23 +269,84 @@ public:
 
         The size of the structuring element is computed for each spectrum individually, if it is given in 'Thomson'.
         See the filtering method for MSSpectrum for details.
+
+        The spectra are filtered in parallel; the result does not depend on the number of threads.
+
+        @param exp The experiment to filter
+        @param nr_threads Number of threads (0: OpenMP default)
     */
-    void filterExperiment(PeakMap & exp)
-    {
-      startProgress(0, exp.size(), "filtering baseline");
-      for (UInt i = 0; i < exp.size(); ++i)
-      {
-        filter(exp[i]);
-        setProgress(i);
-      }
-      endProgress();
-    }
+    void filterExperiment(PeakMap & exp, Size nr_threads = 0);
 
 protected:
 
     ///Member for struct size in data points
     UInt struct_size_in_datapoints_;
 
+    /** @brief Applies the filtering operation @p method with a structuring element of @p struc_size data points.
+
+    Unlike filterRange, this does not modify the filter, so it may be called concurrently.
+    */
+    template <typename InputIterator, typename OutputIterator>
+    void applyMethod_(const String& method, UInt struc_size, InputIterator input_begin, InputIterator input_end, OutputIterator output_begin)
+    {
+      std::vector<typename InputIterator::value_type> buffer;
+      const UInt size = input_end - input_begin;
+
+      if (method == "identity")
+      {
+        std::copy(input_begin, input_end, output_begin);
+      }
+      else if (method == "erosion")
+      {
+        applyErosion_(struc_size, input_begin, input_end, output_begin);
+      }
+      else if (method == "dilation")
+      {
+        applyDilation_(struc_size, input_begin, input_end, output_begin);
+      }
+      else if (method == "opening")
+      {
+        if (buffer.size() < size) buffer.resize(size);
+        applyErosion_(struc_size, input_begin, input_end, buffer.begin());
+        applyDilation_(struc_size, buffer.begin(), buffer.begin() + size, output_begin);
+      }
+      else if (method == "closing")
+      {
+        if (buffer.size() < size) buffer.resize(size);
+        applyDilation_(struc_size, input_begin, input_end, buffer.begin());
+        applyErosion_(struc_size, buffer.begin(), buffer.begin() + size, output_begin);
+      }
+      else if (method == "gradient")
+      {
+        if (buffer.size() < size) buffer.resize(size);
+        applyErosion_(struc_size, input_begin, input_end, buffer.begin());
+        applyDilation_(struc_size, input_begin, input_end, output_begin);
+        for (UInt i = 0; i < size; ++i) output_begin[i] -= buffer[i];
+      }
+      else if (method == "tophat")
+      {
+        if (buffer.size() < size) buffer.resize(size);
+        applyErosion_(struc_size, input_begin, input_end, buffer.begin());
+        applyDilation_(struc_size, buffer.begin(), buffer.begin() + size, output_begin);
+        for (UInt i = 0; i < size; ++i) output_begin[i] = input_begin[i] - output_begin[i];
+      }
+      else if (method == "bothat")
+      {
+        if (buffer.size() < size) buffer.resize(size);
+        applyDilation_(struc_size, input_begin, input_end, buffer.begin());
+        applyErosion_(struc_size, buffer.begin(), buffer.begin() + size, output_begin);
+        for (UInt i = 0; i < size; ++i) output_begin[i] = input_begin[i] - output_begin[i];
+      }
+      else if (method == "erosion_simple")
+      {
+        applyErosionSimple_(struc_size, input_begin, input_end, output_begin);
+      }
+      else if (method == "dilation_simple")
+      {
+        applyDilationSimple_(struc_size, input_begin, input_end, output_begin);
+      }
+    }
+
     /** @brief Applies erosion.  This implementation uses van Herk's method.
     Only 3 min/max comparisons are required per data point, independent of
     struc_size.
@@ -351,8 +358,7 @@ protected:
       const Int size = input_end - input;
       const Int struc_size_half = struc_size / 2;           // yes, integer division
 
-      static std::vector<ValueType> buffer;
-      if (Int(buffer.size()) < struc_size) buffer.resize(struc_size);
+      std::vector<ValueType> buffer(std::max(struc_size, 0));
 
       Int anchor;           // anchoring position of the current block
       Int i;                // index relative to anchor, used for 'for' loops
@@ -451,8 +457,7 @@ protected:
       const Int size = input_end - input;
       const Int struc_size_half = struc_size / 2;           // yes, integer division
 
-      static std::vector<ValueType> buffer;
-      if (Int(buffer.size()) < struc_size) buffer.resize(struc_size);
+      std::vector<ValueType> buffer(std::max(struc_size, 0));
 
       Int anchor;           // anchoring position of the current block
       Int i;                // index relative to anchor, used for 'for' loops
@@ -36,11 +36,23 @@
 
 #include <OpenMS/KERNEL/StandardTypes.h>
 #include <OpenMS/TRANSFORMATIONS/FEATUREFINDER/FeatureFinderAlgorithmPickedHelperStructs.h>
+#include <OpenMS/CHEMISTRY/EmpiricalFormula.h>
+
+#define ISOTOPE_DISTRIBUTION_CACHE_FILE_IDENTIFIER 8097
+#define ISOTOPE_DISTRIBUTION_CACHE_FILE_VERSION 1
 
 namespace OpenMS
 {
   /**
    * @brief Pre-calculate isotope distributions for interesting mass ranges
+   *
+   * The averagine isotope distributions are calculated for mass windows of
+   * width @p mass_window_width up to @p max_mass. The table can be stored
+   * to and loaded from a binary file, which is much faster than
+   * recalculating it for large mass ranges.
+   *
+   * getIsotopeDistributions() looks up the distributions of many masses at
+   * once and returns them as a dense matrix with one row per mass.
    */
   class OPENMS_DLLAPI IsotopeDistributionCache
   {
@@ -52,6 +64,47 @@ public:
     /// Returns the isotope distribution for a certain mass window
     const TheoreticalIsotopePattern & getIsotopeDistribution(double mass) const;
 
+    /**
+     * @brief Returns the isotope distributions of many masses as row-major matrix
+     *
+     * Row i (@p width entries) holds the intensities of the isotopes 0
+     * (monoisotopic) to @p width - 1 of the distribution of @p masses[i],
+     * scaled to a maximum of 1 (isotopes beyond the pattern are 0).
+     *
+     * @exception Exception::InvalidValue is thrown if a mass exceeds the pre-calculated range
+     */
+    void getIsotopeDistributions(const std::vector<double> & masses, Size width, std::vector<double> & intensities) const;
+
+    /**
+     * @brief Calculates the isotope distributions of many formulas as row-major matrix
+     *
+     * Same layout as getIsotopeDistributions(), the distributions are
+     * calculated exactly (CoarseIsotopePatternGenerator) on @p nr_threads
+     * threads (0 uses the OpenMP default).
+     */
+    static void getFormulaIsotopeDistributions(const std::vector<EmpiricalFormula> & formulas, Size width, std::vector<double> & intensities, Size nr_threads = 0);
+
+    /// Returns the width of the mass windows
+    double getMassWindowWidth() const;
+
+    /// Returns the largest mass of the pre-calculated range
+    double getMaxMass() const;
+
+    /**
+     * @brief Stores the pre-calculated distributions in a binary file
+     *
+     * @exception Exception::UnableToCreateFile is thrown if the file cannot be written
+     */
+    void store(const String & filename) const;
+
+    /**
+     * @brief Replaces the distributions by those stored in a binary file
+     *
+     * @exception Exception::FileNotFound is thrown if the file does not exist
+     * @exception Exception::ParseError is thrown if the file is not a valid cache file
+     */
+    void load(const String & filename);
+
 private:
     /// Vector of pre-calculated isotope distributions for several mass windows
     std::vector<TheoreticalIsotopePattern> isotope_distributions_;
@@ -90,6 +90,46 @@ public:
         @exception Exception::IllegalArgument is thrown, if the @em gaussian_width parameter is too small.
       */
     void filter(MSSpectrum & spectrum)
+    {
+      filterSpectrum_(spectrum, gauss_algo_);
+    }
+
+    /**
+      @brief Smoothes an MSChromatogram.
+
+      @exception Exception::IllegalArgument is thrown, if the @em use_ppm_tolerance parameter is set.
+    */
+    void filter(MSChromatogram & chromatogram)
+    {
+      filterChromatogram_(chromatogram, gauss_algo_);
+    }
+
+    /**
+      @brief Smoothes an MSExperiment containing profile data.
+
+      Spectra and chromatograms are filtered in parallel; the result does not depend on the number of threads.
+
+      @param map The experiment to filter
+      @param nr_threads Number of threads (0: OpenMP default)
+
+      @exception Exception::IllegalArgument is thrown, if the @em gaussian_width parameter is too small.
+    */
+    void filterExperiment(PeakMap & map, Size nr_threads = 0);
+
+protected:
+
+    GaussFilterAlgorithm gauss_algo_;
+
+    /// The spacing of the pre-tabulated kernel coefficients
+    double spacing_;
+
+    /**
+      @brief Smoothes a spectrum using the given algorithm (see filter())
+
+      With a ppm tolerance, @p algo recomputes its kernel for every data point,
+      so concurrent calls need their own copy of the algorithm.
+    */
+    void filterSpectrum_(MSSpectrum & spectrum, GaussFilterAlgorithm & algo)
     {
       typedef std::vector<double> ContainerT;
 
@@ -109,7 +149,7 @@ public:
       // apply filter
       ContainerT::iterator mz_out_it = mz_out.begin();
       ContainerT::iterator int_out_it = int_out.begin();
-      found_signal = gauss_algo_.filter(mz_in.begin(), mz_in.end(), int_in.begin(), mz_out_it, int_out_it);
+      found_signal = algo.filter(mz_in.begin(), mz_in.end(), int_in.begin(), mz_out_it, int_out_it);
 
       // If all intensities are zero in the scan and the scan has a reasonable size, throw an exception.
       // This is the case if the Gaussian filter is smaller than the spacing of raw data
@@ -135,7 +175,8 @@ public:
       }
     }
 
-    void filter(MSChromatogram & chromatogram)
+    /// Smoothes a chromatogram using the given algorithm (see filterSpectrum_())
+    void filterChromatogram_(MSChromatogram & chromatogram, GaussFilterAlgorithm & algo)
     {
       typedef std::vector<double> ContainerT;
 
@@ -159,7 +200,7 @@ public:
       // apply filter
       ContainerT::iterator mz_out_it = rt_out.begin();
       ContainerT::iterator int_out_it = int_out.begin();
-      found_signal = gauss_algo_.filter(rt_in.begin(), rt_in.end(), int_in.begin(), mz_out_it, int_out_it);
+      found_signal = algo.filter(rt_in.begin(), rt_in.end(), int_in.begin(), mz_out_it, int_out_it);
 
       // If all intensities are zero in the scan and the scan has a reasonable size, throw an exception.
       // This is the case if the Gaussian filter is smaller than the spacing of raw data
@@ -185,35 +226,6 @@ public:
       }
     }
 
-    /**
-      @brief Smoothes an MSExperiment containing profile data.
-
-      @exception Exception::IllegalArgument is thrown, if the @em gaussian_width parameter is too small.
-    */
-    void filterExperiment(PeakMap & map)
-    {
-      Size progress = 0;
-      startProgress(0, map.size() + map.getChromatograms().size(), "smoothing data");
-      for (Size i = 0; i < map.size(); ++i)
-      {
-        filter(map[i]);
-        setProgress(++progress);
-      }
-      for (Size i = 0; i < map.getChromatograms().size(); ++i)
-      {
-        filter(map.getChromatogram(i));
-        setProgress(++progress);
-      }
-      endProgress();
-    }
-
-protected:
-
-    GaussFilterAlgorithm gauss_algo_;
-
-    /// The spacing of the pre-tabulated kernel coefficients
-    double spacing_;
-
     // Docu in base class
     void updateMembers_() override;
   };
@@ -210,23 +210,13 @@ public:
 
     /**
       @brief Removed the noise from an MSExperiment containing profile data.
+
+      Spectra and chromatograms are filtered in parallel; the result does not depend on the number of threads.
+
+      @param map The experiment to filter
+      @param nr_threads Number of threads (0: OpenMP default)
     */
-    void filterExperiment(PeakMap & map)
-    {
-      Size progress = 0;
-      startProgress(0, map.size() + map.getChromatograms().size(), "smoothing data");
-      for (Size i = 0; i < map.size(); ++i)
-      {
-        filter(map[i]);
-        setProgress(++progress);
-      }
-      for (Size i = 0; i < map.getChromatograms().size(); ++i)
-      {
-        filter(map.getChromatogram(i));
-        setProgress(++progress);
-      }
-      endProgress();
-    }
+    void filterExperiment(PeakMap & map, Size nr_threads = 0);
 
 protected:
     /// Coefficients
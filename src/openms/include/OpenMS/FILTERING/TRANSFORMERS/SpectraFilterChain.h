@@ -0,0 +1,142 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#pragma once
+
+#include <OpenMS/KERNEL/StandardTypes.h>
+#include <OpenMS/DATASTRUCTURES/Param.h>
+#include <OpenMS/DATASTRUCTURES/ListUtils.h>
+
+#include <functional>
+#include <vector>
+
+namespace OpenMS
+{
+
+  /**
+    @brief Applies a sequence of spectrum filters to spectra in a single pass
+
+    Filters are appended by their class name together with their parameters
+    (missing parameters take the filter's defaults), e.g.
+
+    @code
+    SpectraFilterChain chain;
+    chain.addFilter("ThresholdMower", threshold_param);
+    chain.addFilter("WindowMower");
+    chain.addFilter("Normalizer");
+    chain.filterPeakMap(exp);
+    @endcode
+
+    Each spectrum runs through all filters in the order they were added
+    before the next spectrum is processed, instead of walking the whole map
+    once per filter. filterPeakMap processes the spectra on several threads;
+    every thread works with its own copies of the filters. Empty spectra
+    and chromatograms are left untouched.
+
+    Supported filters are listed by getAvailableFilters().
+
+    @ingroup SpectraPreprocessers
+  */
+  class OPENMS_DLLAPI SpectraFilterChain
+  {
+public:
+
+    /// default constructor (empty chain)
+    SpectraFilterChain();
+    /// copy constructor
+    SpectraFilterChain(const SpectraFilterChain & source);
+    /// destructor
+    virtual ~SpectraFilterChain();
+    /// assignment operator
+    SpectraFilterChain & operator=(const SpectraFilterChain & source);
+
+    /**
+      @brief Appends a filter to the chain
+
+      @param name Class name of the filter (see getAvailableFilters())
+      @param param Parameters of the filter, unset parameters take the defaults
+
+      @exception Exception::InvalidValue if the filter is not supported
+      @exception Exception::InvalidParameter if the parameters are not valid for the filter
+    */
+    void addFilter(const String & name, const Param & param = Param());
+
+    /// Returns the number of filters
+    Size size() const;
+
+    /// Returns whether the chain contains no filters
+    bool empty() const;
+
+    /// Removes all filters
+    void clear();
+
+    /// Returns the class names of the filters, in the order they are applied
+    const StringList & getFilterNames() const;
+
+    /// Returns the parameters (including defaults) of filter @p index
+    const Param & getFilterParameters(Size index) const;
+
+    /// Applies all filters to a spectrum
+    void filterPeakSpectrum(PeakSpectrum & spectrum);
+
+    /**
+      @brief Applies all filters to every spectrum of a map
+
+      @param exp The map to filter (in place)
+      @param nr_threads Number of threads, 0 uses the OpenMP default
+    */
+    void filterPeakMap(PeakMap & exp, Size nr_threads = 0) const;
+
+    /// Returns the names of the filters that can be added to a chain
+    static StringList getAvailableFilters();
+
+protected:
+
+    /// A filter with its parameters, bound to a function
+    typedef std::function<void(PeakSpectrum &)> Step;
+
+    /// Creates the step of filter @p name
+    static Step createStep_(const String & name, const Param & param, Param & used_param);
+
+    /// The filters
+    std::vector<Step> steps_;
+
+    /// Class names of the filters
+    StringList names_;
+
+    /// Parameters of the filters
+    std::vector<Param> params_;
+  };
+
+}
@@ -21,6 +21,7 @@ Normalizer.h
 ParentPeakMower.h
 PeakMarker.h
 Scaler.h
+SpectraFilterChain.h
 SpectraMerger.h
 SqrtMower.h
 TICFilter.h
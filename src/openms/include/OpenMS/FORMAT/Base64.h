@@ -97,6 +97,24 @@ public:
     template <typename ToType>
     static void decode(const String & in, ByteOrder from_byte_order, std::vector<ToType> & out, bool zlib_compression = false);
 
+    /**
+        @brief Encodes several vectors of floating point numbers to Base64 strings in parallel
+
+        Equivalent to calling encode for each vector, the vectors are encoded
+        concurrently using @p nr_threads threads (0 uses the OpenMP default).
+
+        @note The vectors in @p in may be modified (byte order) by this method
+    */
+    static void encodeBatch(std::vector<std::vector<double> > & in, ByteOrder to_byte_order, std::vector<String> & out, bool zlib_compression = false, Size nr_threads = 0);
+
+    /**
+        @brief Decodes several Base64 strings to vectors of floating point numbers in parallel
+
+        Equivalent to calling decode for each string, the strings are decoded
+        concurrently using @p nr_threads threads (0 uses the OpenMP default).
+    */
+    static void decodeBatch(const std::vector<String> & in, ByteOrder from_byte_order, std::vector<std::vector<double> > & out, bool zlib_compression = false, Size nr_threads = 0);
+
     /**
         @brief Encodes a vector of integer point numbers to a Base64 string
 
@@ -83,6 +83,15 @@ public:
       return meta_ms_experiment_;
     }
 
+    /// Returns the positions of the spectra in the cached data file
+    const std::vector<std::streampos>& getSpectraIndex() const;
+
+    /// Returns the positions of the chromatograms in the cached data file
+    const std::vector<std::streampos>& getChromatogramIndex() const;
+
+    /// Returns the name of the cached data file (ends in .mzML.cached)
+    const String& getCachedFilename() const;
+
     /**
       @brief Stores a map in a cached MzML file.
 
@@ -84,6 +84,22 @@ namespace OpenMS
       return exp.openFile(filename);
     }
 
+    /**
+      @brief Load a file into memory, decoding the data in parallel
+
+      The meta data is parsed first, then the binary data of all spectra and
+      chromatograms is decoded concurrently (using @p nr_threads threads, 0
+      uses the OpenMP default) with the help of the index of the file. The
+      result is identical to loading the file with MzMLFile::load, however
+      the loading options are not applied.
+
+      @param filename Filename determines where the file is located
+      @param exp Object which will contain the data after the call
+
+      @return Indicates whether parsing was successful (if it is false, the file most likely was not an mzML or not indexed).
+    */
+    bool loadParallel(const String& filename, PeakMap& exp, Size nr_threads = 0);
+
     /**
       @brief Store a file from an on-disc data-structure
 
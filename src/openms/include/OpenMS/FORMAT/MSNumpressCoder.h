@@ -215,6 +215,40 @@ public:
     */
     void decodeNPRaw(const std::string & in, std::vector<double> & out, const NumpressConfig & config);
 
+    /**
+     * @brief Encodes several vectors of floating point numbers in parallel
+     *
+     * Equivalent to calling encodeNP for each vector, the vectors are encoded
+     * concurrently using @p nr_threads threads (0 uses the OpenMP default).
+     *
+     * @param in The vectors of floating point numbers to be encoded
+     * @param result The resulting strings (one per vector)
+     * @param zlib_compression Whether to apply zlib compression after numpress compression
+     * @param config The numpress configuration defining the compression strategy
+     * @param nr_threads The number of threads to use
+     *
+    */
+    void encodeNPBatch(const std::vector<std::vector<double> > & in, std::vector<String> & result,
+        bool zlib_compression, const NumpressConfig & config, Size nr_threads = 0);
+
+    /**
+     * @brief Decodes several Base64 strings in parallel
+     *
+     * Equivalent to calling decodeNP for each string, the strings are decoded
+     * concurrently using @p nr_threads threads (0 uses the OpenMP default).
+     *
+     * @param in The base64 encoded strings
+     * @param out The resulting vectors of doubles (one per string)
+     * @param zlib_compression Whether to apply zlib de-compression before numpress de-compression
+     * @param config The numpress configuration defining the compression strategy
+     * @param nr_threads The number of threads to use
+     *
+     * @throw throws Exception::ConversionError if a string cannot be converted
+     *
+    */
+    void decodeNPBatch(const std::vector<String> & in, std::vector<std::vector<double> > & out,
+        bool zlib_compression, const NumpressConfig & config, Size nr_threads = 0);
+
 private:
 
     void decodeNPInternal_(const unsigned char* in, size_t in_size, std::vector<double>& out, const NumpressConfig & config);
@@ -515,6 +515,31 @@ public:
     /// returns the total ion chromatogram (TIC)
     const MSChromatogram getTIC() const;
 
+    /**
+      @brief Extracts the ion chromatograms (XICs) of many m/z and RT windows in one pass over the spectra
+
+      Window @p w sums the intensities of all peaks with @p mz_lo[w] <= m/z <= @p mz_hi[w]
+      of the spectra with @p rt_lo[w] <= RT <= @p rt_hi[w]. All spectra of MS level
+      @p ms_level are visited once (in parallel); within a spectrum, the windows are
+      processed in order of their lower m/z bound and located by binary search, so the
+      spectra must be sorted by m/z.
+
+      @param mz_lo Lower m/z bounds of the windows
+      @param mz_hi Upper m/z bounds of the windows
+      @param rt_lo Lower RT bounds of the windows
+      @param rt_hi Upper RT bounds of the windows
+      @param rts Retention times of the spectra of MS level @p ms_level (the columns of @p intensities)
+      @param intensities Row-major matrix of windows x spectra; 0 where a spectrum is outside the RT range of a window
+      @param ms_level MS level of the spectra to extract from
+      @param nr_threads Number of threads (0: OpenMP default)
+
+      @exception Exception::IllegalArgument is thrown if the window vectors differ in size
+    */
+    void extractXICs(const std::vector<double>& mz_lo, const std::vector<double>& mz_hi,
+                     const std::vector<double>& rt_lo, const std::vector<double>& rt_hi,
+                     std::vector<double>& rts, std::vector<float>& intensities,
+                     UInt ms_level = 1, Size nr_threads = 0) const;
+
     /**
       @brief Clears all data and meta data
 
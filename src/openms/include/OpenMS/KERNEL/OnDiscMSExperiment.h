@@ -193,6 +193,21 @@ public:
       return spectrum;
     }
 
+    /**
+      @brief returns multiple spectra, read and decoded in parallel
+
+      The spectra are decoded concurrently (using OpenMP), each thread reads
+      the file through its own file handle. Since the internal file handle is
+      not used, this function may also be called concurrently from several
+      threads.
+
+      @param ids The indices of the spectra (the result has the same order)
+      @param nr_threads The number of threads to use (0 uses the OpenMP default)
+
+      @exception Exception::IndexOverflow is thrown if an index is out of range
+    */
+    std::vector<MSSpectrum> getSpectra(const std::vector<Size>& ids, Size nr_threads = 0) const;
+
     /**
       @brief returns a single spectrum
     */
@@ -213,6 +228,18 @@ public:
       return chromatogram;
     }
 
+    /**
+      @brief returns multiple chromatograms, read and decoded in parallel
+
+      See getSpectra for details.
+
+      @param ids The indices of the chromatograms (the result has the same order)
+      @param nr_threads The number of threads to use (0 uses the OpenMP default)
+
+      @exception Exception::IndexOverflow is thrown if an index is out of range
+    */
+    std::vector<MSChromatogram> getChromatograms(const std::vector<Size>& ids, Size nr_threads = 0) const;
+
     /**
       @brief returns a single chromatogram
     */
@@ -132,27 +132,50 @@ public:
 
     /**
      * @brief Applies the peak-picking algorithm to a map (MSExperiment). This
-     * method picks peaks for each scan in the map consecutively. The resulting
-     * picked peaks are written to the output map.
+     * method picks peaks for the scans and chromatograms of the map in parallel.
+     * The resulting picked peaks are written to the output map, in the order of the input.
      *
      * @param input  input map in profile mode
      * @param output  output map with picked peaks
      * @param check_spectrum_type  if set, checks spectrum type and throws an exception if a centroided spectrum is passed 
+     * @param nr_threads  number of threads (0: OpenMP default)
      */
-    void pickExperiment(const PeakMap& input, PeakMap& output, const bool check_spectrum_type = true) const;
+    void pickExperiment(const PeakMap& input, PeakMap& output, const bool check_spectrum_type = true, Size nr_threads = 0) const;
 
     /**
      * @brief Applies the peak-picking algorithm to a map (MSExperiment). This
-     * method picks peaks for each scan in the map consecutively. The resulting
-     * picked peaks are written to the output map.
+     * method picks peaks for the scans and chromatograms of the map in parallel.
+     * The resulting picked peaks are written to the output map, in the order of the input.
      *
      * @param input  input map in profile mode
      * @param output  output map with picked peaks
-     * @param boundaries_spec  boundaries of the picked peaks in spectra
+     * @param boundaries_spec  boundaries of the picked peaks in spectra (for each picked spectrum, in input order)
      * @param boundaries_chrom  boundaries of the picked peaks in chromatograms
      * @param check_spectrum_type  if set, checks spectrum type and throws an exception if a centroided spectrum is passed 
+     * @param nr_threads  number of threads (0: OpenMP default)
      */
-    void pickExperiment(const PeakMap& input, PeakMap& output, std::vector<std::vector<PeakBoundary> >& boundaries_spec, std::vector<std::vector<PeakBoundary> >& boundaries_chrom, const bool check_spectrum_type = true) const;
+    void pickExperiment(const PeakMap& input, PeakMap& output, std::vector<std::vector<PeakBoundary> >& boundaries_spec, std::vector<std::vector<PeakBoundary> >& boundaries_chrom, const bool check_spectrum_type = true, Size nr_threads = 0) const;
+
+    /**
+     * @brief Applies the peak-picking algorithm to a range of a map (MSExperiment) in parallel.
+     *
+     * Spectra and chromatograms are numbered consecutively, spectra first. Calling this
+     * method for consecutive ranges picks a map block by block, which allows to report
+     * progress or to stop in between. A call with @p begin = 0 (re)initializes @p output:
+     * it is cleared, the experimental settings of @p input are copied and it is resized to
+     * the number of spectra and chromatograms of @p input. Later calls only replace the
+     * spectra and chromatograms of their range.
+     *
+     * @param input  input map in profile mode
+     * @param output  output map with picked peaks
+     * @param begin  first spectrum or chromatogram to pick
+     * @param end  end of the range (exclusive)
+     * @param check_spectrum_type  if set, checks spectrum type and throws an exception if a centroided spectrum is passed 
+     * @param nr_threads  number of threads (0: OpenMP default)
+     *
+     * @exception Exception::IllegalArgument is thrown if the range is invalid or @p output was not initialized for @p input
+     */
+    void pickExperimentRange(const PeakMap& input, PeakMap& output, Size begin, Size end, const bool check_spectrum_type = true, Size nr_threads = 0) const;
 
     /**
       @brief Applies the peak-picking algorithm to a map (MSExperiment). This
@@ -185,6 +208,16 @@ protected:
     /// unit of 'FWHM' float data array (can be absolute or ppm).
     bool report_FWHM_as_ppm_;
 
+    /**
+     * @brief Picks the spectra and chromatograms [@p begin, @p end) of @p input into the same positions of @p output.
+     *
+     * @p output must have as many spectra and chromatograms as @p input. If given, the peak boundaries
+     * are stored at the index of each spectrum or chromatogram and @p picked marks the items that were
+     * picked (rather than copied). Progress is reported for each item.
+     */
+    void pickRange_(const PeakMap& input, PeakMap& output, Size begin, Size end, const bool check_spectrum_type, Size nr_threads,
+                    std::vector<std::vector<PeakBoundary> >* boundaries, std::vector<char>* picked) const;
+
     // docu in base class
     void updateMembers_() override;
 
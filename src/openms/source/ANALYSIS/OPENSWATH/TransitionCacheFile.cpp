@@ -0,0 +1,300 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#include <OpenMS/ANALYSIS/OPENSWATH/TransitionCacheFile.h>
+
+#include <OpenMS/CONCEPT/Exception.h>
+#include <OpenMS/FORMAT/FileHandler.h>
+#include <OpenMS/SYSTEM/File.h>
+
+#include <QtCore/QDateTime>
+#include <QtCore/QFileInfo>
+
+namespace OpenMS
+{
+
+  namespace
+  {
+    template <typename T>
+    void writeValue(std::ofstream& ofs, const T& value)
+    {
+      ofs.write((const char*)&value, sizeof(value));
+    }
+
+    void writeString(std::ofstream& ofs, const std::string& s)
+    {
+      UInt64 len = s.size();
+      writeValue(ofs, len);
+      ofs.write(s.data(), len);
+    }
+
+    template <typename T>
+    void readValue(std::ifstream& ifs, T& value)
+    {
+      ifs.read((char*)&value, sizeof(value));
+    }
+
+    void readString(std::ifstream& ifs, std::string& s)
+    {
+      UInt64 len = 0;
+      readValue(ifs, len);
+      if (!ifs.good()) return;
+      s.resize(len);
+      if (len > 0) ifs.read(&s[0], len);
+    }
+
+    void writeBool(std::ofstream& ofs, bool b)
+    {
+      char c = b ? 1 : 0;
+      writeValue(ofs, c);
+    }
+
+    void readBool(std::ifstream& ifs, bool& b)
+    {
+      char c = 0;
+      readValue(ifs, c);
+      b = (c != 0);
+    }
+  }
+
+  TransitionCacheFile::TransitionCacheFile()
+  {
+  }
+
+  TransitionCacheFile::~TransitionCacheFile()
+  {
+  }
+
+  TransitionCacheFile::SourceInfo_ TransitionCacheFile::getSourceInfo_(const String& source, bool compute_hash) const
+  {
+    SourceInfo_ info;
+    info.size = -1;
+    info.modified = -1;
+    if (source.empty() || !File::exists(source)) return info;
+
+    QFileInfo fi(source.toQString());
+    info.size = fi.size();
+    info.modified = fi.lastModified().toMSecsSinceEpoch();
+    if (compute_hash) info.hash = FileHandler::computeFileHash(source);
+    return info;
+  }
+
+  bool TransitionCacheFile::readHeader_(std::ifstream& ifs, SourceInfo_& info) const
+  {
+    int file_identifier = 0, version = 0;
+    readValue(ifs, file_identifier);
+    readValue(ifs, version);
+    if (!ifs.good() || file_identifier != TRANSITION_CACHE_FILE_IDENTIFIER || version != TRANSITION_CACHE_FILE_VERSION)
+    {
+      return false;
+    }
+    readValue(ifs, info.size);
+    readValue(ifs, info.modified);
+    std::string hash;
+    readString(ifs, hash);
+    info.hash = hash;
+    return ifs.good();
+  }
+
+  void TransitionCacheFile::store(const String& filename, const OpenSwath::LightTargetedExperiment& targeted_exp, const String& source)
+  {
+    // other processes may load the cache while it is written, so it is
+    // written to a temporary file first and then moved into place
+    String tmp_filename = filename + "." + File::getUniqueName(false) + ".tmp";
+    std::ofstream ofs(tmp_filename.c_str(), std::ios::binary);
+    if (!ofs.good())
+    {
+      throw Exception::UnableToCreateFile(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, filename);
+    }
+
+    int file_identifier = TRANSITION_CACHE_FILE_IDENTIFIER;
+    int version = TRANSITION_CACHE_FILE_VERSION;
+    writeValue(ofs, file_identifier);
+    writeValue(ofs, version);
+    SourceInfo_ info = getSourceInfo_(source, true);
+    writeValue(ofs, info.size);
+    writeValue(ofs, info.modified);
+    writeString(ofs, info.hash);
+
+    const std::vector<OpenSwath::LightProtein>& proteins = targeted_exp.getProteins();
+    writeValue(ofs, (UInt64)proteins.size());
+    for (const auto& p : proteins)
+    {
+      writeString(ofs, p.id);
+      writeString(ofs, p.sequence);
+    }
+
+    const std::vector<OpenSwath::LightCompound>& compounds = targeted_exp.getCompounds();
+    writeValue(ofs, (UInt64)compounds.size());
+    for (const auto& c : compounds)
+    {
+      writeValue(ofs, c.drift_time);
+      writeValue(ofs, c.rt);
+      writeValue(ofs, c.charge);
+      writeString(ofs, c.sequence);
+      writeValue(ofs, (UInt64)c.protein_refs.size());
+      for (const auto& ref : c.protein_refs)
+      {
+        writeString(ofs, ref);
+      }
+      writeString(ofs, c.peptide_group_label);
+      writeString(ofs, c.id);
+      writeString(ofs, c.sum_formula);
+      writeString(ofs, c.compound_name);
+      writeValue(ofs, (UInt64)c.modifications.size());
+      for (const auto& m : c.modifications)
+      {
+        writeValue(ofs, m.location);
+        writeValue(ofs, m.unimod_id);
+      }
+    }
+
+    const std::vector<OpenSwath::LightTransition>& transitions = targeted_exp.getTransitions();
+    writeValue(ofs, (UInt64)transitions.size());
+    for (const auto& t : transitions)
+    {
+      writeString(ofs, t.transition_name);
+      writeString(ofs, t.peptide_ref);
+      writeValue(ofs, t.library_intensity);
+      writeValue(ofs, t.product_mz);
+      writeValue(ofs, t.precursor_mz);
+      writeValue(ofs, t.fragment_charge);
+      writeBool(ofs, t.decoy);
+      writeBool(ofs, t.detecting_transition);
+      writeBool(ofs, t.quantifying_transition);
+      writeBool(ofs, t.identifying_transition);
+    }
+
+    ofs.close();
+    if (ofs.fail() || !File::rename(tmp_filename, filename, true, false))
+    {
+      File::remove(tmp_filename);
+      throw Exception::UnableToCreateFile(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, filename);
+    }
+  }
+
+  void TransitionCacheFile::load(const String& filename, OpenSwath::LightTargetedExperiment& targeted_exp)
+  {
+    std::ifstream ifs(filename.c_str(), std::ios::binary);
+    if (ifs.fail())
+    {
+      throw Exception::FileNotFound(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, filename);
+    }
+
+    SourceInfo_ info;
+    if (!readHeader_(ifs, info))
+    {
+      throw Exception::ParseError(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION,
+        "File might not be a transition cache file (wrong file magic number or version). Aborting!", filename);
+    }
+
+    OpenSwath::LightTargetedExperiment exp;
+    UInt64 n = 0;
+
+    readValue(ifs, n);
+    if (ifs.good()) exp.proteins.resize(n);
+    for (auto& p : exp.proteins)
+    {
+      readString(ifs, p.id);
+      readString(ifs, p.sequence);
+    }
+
+    readValue(ifs, n);
+    if (ifs.good()) exp.compounds.resize(n);
+    for (auto& c : exp.compounds)
+    {
+      readValue(ifs, c.drift_time);
+      readValue(ifs, c.rt);
+      readValue(ifs, c.charge);
+      readString(ifs, c.sequence);
+      readValue(ifs, n);
+      if (!ifs.good()) break;
+      c.protein_refs.resize(n);
+      for (auto& ref : c.protein_refs)
+      {
+        readString(ifs, ref);
+      }
+      readString(ifs, c.peptide_group_label);
+      readString(ifs, c.id);
+      readString(ifs, c.sum_formula);
+      readString(ifs, c.compound_name);
+      readValue(ifs, n);
+      if (!ifs.good()) break;
+      c.modifications.resize(n);
+      for (auto& m : c.modifications)
+      {
+        readValue(ifs, m.location);
+        readValue(ifs, m.unimod_id);
+      }
+    }
+
+    readValue(ifs, n);
+    if (ifs.good()) exp.transitions.resize(n);
+    for (auto& t : exp.transitions)
+    {
+      readString(ifs, t.transition_name);
+      readString(ifs, t.peptide_ref);
+      readValue(ifs, t.library_intensity);
+      readValue(ifs, t.product_mz);
+      readValue(ifs, t.precursor_mz);
+      readValue(ifs, t.fragment_charge);
+      readBool(ifs, t.decoy);
+      readBool(ifs, t.detecting_transition);
+      readBool(ifs, t.quantifying_transition);
+      readBool(ifs, t.identifying_transition);
+    }
+
+    if (!ifs.good())
+    {
+      throw Exception::ParseError(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION,
+        "Transition cache file is truncated. Aborting!", filename);
+    }
+    targeted_exp = std::move(exp);
+  }
+
+  bool TransitionCacheFile::isValid(const String& filename, const String& source)
+  {
+    if (!File::exists(filename) || !File::exists(source)) return false;
+
+    std::ifstream ifs(filename.c_str(), std::ios::binary);
+    SourceInfo_ cached;
+    if (!readHeader_(ifs, cached)) return false;
+
+    SourceInfo_ current = getSourceInfo_(source, false);
+    if (cached.size != current.size) return false;
+    if (cached.modified == current.modified) return true;
+    // e.g. a copy of the library: compare the content
+    return cached.hash == FileHandler::computeFileHash(source);
+  }
+}
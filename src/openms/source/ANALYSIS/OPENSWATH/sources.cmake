@@ -9,6 +9,7 @@ MRMDecoy.cpp
 MRMRTNormalizer.cpp
 TransitionTSVFile.cpp
 TransitionPQPFile.cpp
+TransitionCacheFile.cpp
 SwathMapMassCorrection.cpp
 OpenSwathHelper.cpp
 OpenSwathScoring.cpp
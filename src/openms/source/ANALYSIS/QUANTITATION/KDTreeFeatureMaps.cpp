@@ -45,6 +45,9 @@ void KDTreeFeatureMaps::addFeature(Size mt_map_index, const BaseFeature* feature
   map_index_.push_back(mt_map_index);
   features_.push_back(feature);
   rt_.push_back(feature->getRT());
+  mz_.push_back(feature->getMZ());
+  intensity_.push_back(feature->getIntensity());
+  charge_.push_back(feature->getCharge());
 
   KDTreeFeatureNode mt_node(this, size() - 1);
   kd_tree_.insert(mt_node);
@@ -62,17 +65,17 @@ double KDTreeFeatureMaps::rt(Size i) const
 
 double KDTreeFeatureMaps::mz(Size i) const
 {
-  return features_[i]->getMZ();
+  return mz_[i];
 }
 
 float KDTreeFeatureMaps::intensity(Size i) const
 {
-  return features_[i]->getIntensity();
+  return intensity_[i];
 }
 
 Int KDTreeFeatureMaps::charge(Size i) const
 {
-  return features_[i]->getCharge();
+  return charge_[i];
 }
 
 Size KDTreeFeatureMaps::mapIndex(Size i) const
@@ -99,6 +102,10 @@ void KDTreeFeatureMaps::clear()
 {
   features_.clear();
   map_index_.clear();
+  rt_.clear();
+  mz_.clear();
+  intensity_.clear();
+  charge_.clear();
   kd_tree_.clear();
 }
 
@@ -122,11 +129,11 @@ void KDTreeFeatureMaps::getNeighborhood(Size index, vector<Size>& result_indices
   }
   else // max log foldchange check enabled
   {
-    double int_1 = features_[index]->getIntensity();
+    double int_1 = intensity_[index];
 
     for (vector<Size>::const_iterator it = tmp_result.begin(); it != tmp_result.end(); ++it)
     {
-      double int_2 = features_[*it]->getIntensity();
+      double int_2 = intensity_[*it];
       double abs_log_fc = fabs(log10(int_2 / int_1));
 
       // abs_log_fc could assume +nan or +inf if negative
@@ -166,6 +173,64 @@ void KDTreeFeatureMaps::queryRegion(double rt_low, double rt_high, double mz_low
   }
 }
 
+void KDTreeFeatureMaps::queryRegions(const vector<double>& rt_low, const vector<double>& rt_high, const vector<double>& mz_low, const vector<double>& mz_high, vector<Size>& offsets, vector<Size>& result_indices, Size nr_threads) const
+{
+  if (rt_high.size() != rt_low.size() || mz_low.size() != rt_low.size() || mz_high.size() != rt_low.size())
+  {
+    throw Exception::IllegalArgument(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, "The region boundaries must have the same number of entries");
+  }
+  queryBatch_(rt_low.size(), [&](Size i, vector<Size>& result)
+  {
+    queryRegion(rt_low[i], rt_high[i], mz_low[i], mz_high[i], result);
+  }, offsets, result_indices, nr_threads);
+}
+
+void KDTreeFeatureMaps::queryRadius(const vector<double>& rt, const vector<double>& mz, double rt_tol, double mz_tol, bool mz_ppm, vector<Size>& offsets, vector<Size>& result_indices, Size nr_threads) const
+{
+  if (mz.size() != rt.size())
+  {
+    throw Exception::IllegalArgument(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, "rt and mz must have the same number of entries");
+  }
+  queryBatch_(rt.size(), [&](Size i, vector<Size>& result)
+  {
+    const double mz_tol_abs = mz_ppm ? mz[i] * mz_tol * 1e-6 : mz_tol;
+    vector<Size> box;
+    queryRegion(rt[i] - rt_tol, rt[i] + rt_tol, mz[i] - mz_tol_abs, mz[i] + mz_tol_abs, box);
+    for (Size index : box)
+    {
+      const double d_rt = rt_tol > 0 ? (rt_[index] - rt[i]) / rt_tol : 0.0;
+      const double d_mz = mz_tol_abs > 0 ? (mz_[index] - mz[i]) / mz_tol_abs : 0.0;
+      if (d_rt * d_rt + d_mz * d_mz <= 1.0) result.push_back(index);
+    }
+  }, offsets, result_indices, nr_threads);
+}
+
+void KDTreeFeatureMaps::nearestNeighbors(const vector<double>& rt, const vector<double>& mz, double rt_tol, double mz_tol, bool mz_ppm, vector<SignedSize>& result_indices, Size nr_threads) const
+{
+  vector<Size> offsets, candidates;
+  queryRadius(rt, mz, rt_tol, mz_tol, mz_ppm, offsets, candidates, nr_threads);
+
+  result_indices.assign(rt.size(), -1);
+  for (Size i = 0; i < rt.size(); ++i)
+  {
+    const double mz_tol_abs = mz_ppm ? mz[i] * mz_tol * 1e-6 : mz_tol;
+    double best = numeric_limits<double>::max();
+    // candidates are sorted by index, so ties are resolved by the lowest index
+    for (Size k = offsets[i]; k < offsets[i + 1]; ++k)
+    {
+      const Size index = candidates[k];
+      const double d_rt = rt_tol > 0 ? (rt_[index] - rt[i]) / rt_tol : 0.0;
+      const double d_mz = mz_tol_abs > 0 ? (mz_[index] - mz[i]) / mz_tol_abs : 0.0;
+      const double dist = d_rt * d_rt + d_mz * d_mz;
+      if (dist < best)
+      {
+        best = dist;
+        result_indices[i] = (SignedSize)index;
+      }
+    }
+  }
+}
+
 void KDTreeFeatureMaps::applyTransformations(const vector<TransformationModelLowess*>& trafos)
 {
   for (Size i = 0; i < size(); ++i)
@@ -36,11 +36,14 @@
 
 #include <OpenMS/CHEMISTRY/ISOTOPEDISTRIBUTION/CoarseIsotopePatternGenerator.h>
 #include <OpenMS/CONCEPT/Constants.h>
+#include <OpenMS/CONCEPT/Parallel.h>
 #include <OpenMS/CHEMISTRY/AASequence.h>
 #include <OpenMS/CHEMISTRY/ResidueDB.h>
 
 #include <OpenMS/KERNEL/MSSpectrum.h>
 
+#include <cctype>
+
 using namespace std;
 
 namespace OpenMS
@@ -212,6 +215,107 @@ namespace OpenMS
     return;
   }
 
+  void TheoreticalSpectrumGenerator::getSpectra(const std::vector<AASequence> & peptides, const std::vector<Int> & min_charges, const std::vector<Int> & max_charges,
+                                                std::vector<Size> & offsets, std::vector<double> & mz, std::vector<float> & intensity, std::vector<Int> & ion_codes,
+                                                Size nr_threads) const
+  {
+    if (min_charges.size() != max_charges.size() || (min_charges.size() != 1 && min_charges.size() != peptides.size()))
+    {
+      throw Exception::IllegalArgument(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION,
+        "Expected one charge range or one charge range per peptide, got " + String(min_charges.size()) + " minimal and " + String(max_charges.size()) + " maximal charges for " + String(peptides.size()) + " peptides");
+    }
+
+    // the annotation is needed for the ion codes
+    TheoreticalSpectrumGenerator generator(*this);
+    Param param = generator.getParameters();
+    param.setValue("add_metainfo", "true");
+    generator.setParameters(param);
+
+    offsets.assign(1, 0);
+    offsets.reserve(peptides.size() + 1);
+    mz.clear();
+    intensity.clear();
+    ion_codes.clear();
+
+    // spectra are generated block-wise to limit the memory used for intermediate spectra
+    const Size block_size = 10000;
+    std::vector<PeakSpectrum> spectra;
+    for (Size block_start = 0; block_start < peptides.size(); block_start += block_size)
+    {
+      const Size block_end = std::min(peptides.size(), block_start + block_size);
+      spectra.assign(block_end - block_start, PeakSpectrum());
+      parallelFor(block_end - block_start, nr_threads, [&](Size k)
+      {
+        const Size i = block_start + k;
+        const Size range = min_charges.size() == 1 ? 0 : i;
+        generator.getSpectrum(spectra[k], peptides[i], min_charges[range], max_charges[range]);
+      }, 100);
+
+      for (const PeakSpectrum& spec : spectra)
+      {
+        if (spec.empty()) // e.g. empty peptide sequence
+        {
+          offsets.push_back(mz.size());
+          continue;
+        }
+        const PeakSpectrum::StringDataArray& names = spec.getStringDataArrays()[0];
+        const PeakSpectrum::IntegerDataArray& charges = spec.getIntegerDataArrays()[0];
+        for (Size k = 0; k < spec.size(); ++k)
+        {
+          mz.push_back(spec[k].getMZ());
+          intensity.push_back(spec[k].getIntensity());
+          ion_codes.push_back(encodeIonAnnotation(names[k], charges[k]));
+        }
+        offsets.push_back(mz.size());
+      }
+    }
+  }
+
+  Int TheoreticalSpectrumGenerator::encodeIonAnnotation(const String & ion_name, Int charge)
+  {
+    Int type = UNKNOWN_ION, number = 0, loss = 0;
+    String rest;
+    if (ion_name.hasPrefix("[M"))
+    {
+      type = PRECURSOR_ION;
+      Size end = ion_name.find(']');
+      if (end != String::npos) rest = ion_name.substr(end + 1);
+    }
+    else if (ion_name.size() > 1 && ion_name[0] == 'i')
+    {
+      type = IMMONIUM_ION;
+      number = ion_name[1];
+    }
+    else if (!ion_name.empty())
+    {
+      switch (ion_name[0])
+      {
+        case 'a': type = A_ION; break;
+        case 'b': type = B_ION; break;
+        case 'c': type = C_ION; break;
+        case 'x': type = X_ION; break;
+        case 'y': type = Y_ION; break;
+        case 'z': type = Z_ION; break;
+        default: break;
+      }
+      Size pos = 1;
+      while (pos < ion_name.size() && isdigit(ion_name[pos]))
+      {
+        number = number * 10 + (ion_name[pos] - '0');
+        ++pos;
+      }
+      rest = ion_name.substr(pos);
+    }
+
+    if (rest.hasPrefix("-"))
+    {
+      if (rest.hasPrefix("-H2O")) loss = 1;
+      else if (rest.hasPrefix("-H3N") || rest.hasPrefix("-NH3")) loss = 2;
+      else loss = 3;
+    }
+    return (type << 24) | ((charge & 0xFF) << 16) | (loss << 12) | (number & 0xFFF);
+  }
+
   void TheoreticalSpectrumGenerator::addAbundantImmoniumIons_(PeakSpectrum & spectrum, const AASequence& peptide, DataArrays::StringDataArray& ion_names, DataArrays::IntegerDataArray& charges) const
   {
     Peak1D p;
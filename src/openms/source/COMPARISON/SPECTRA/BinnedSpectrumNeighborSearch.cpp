@@ -0,0 +1,326 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+//
+
+#include <OpenMS/COMPARISON/SPECTRA/BinnedSpectrumNeighborSearch.h>
+
+#include <OpenMS/COMPARISON/SPECTRA/BinnedSpectrum.h>
+#include <OpenMS/CONCEPT/Parallel.h>
+
+#include <algorithm>
+#include <cmath>
+#include <numeric>
+#include <queue>
+
+using namespace std;
+
+namespace OpenMS
+{
+  namespace
+  {
+    typedef pair<float, Size> Neighbor;
+
+    // orders better neighbors first: higher score, then lower index
+    struct BetterNeighbor
+    {
+      bool operator()(const Neighbor& a, const Neighbor& b) const
+      {
+        return a.first > b.first || (a.first == b.first && a.second < b.second);
+      }
+    };
+
+    // block size for binning and searching, limits the memory of intermediate results
+    const Size BLOCK_SIZE = 10000;
+  }
+
+  BinnedSpectrumNeighborSearch::BinnedSpectrumNeighborSearch() :
+    DefaultParamHandler("BinnedSpectrumNeighborSearch"),
+    offsets_(1, 0)
+  {
+    defaults_.setValue("bin_size", 0.02, "Bin size (in Th or ppm, see 'bin_unit'; BinnedSpectrum recommends 0.02 Th for high-resolution and 1.0005 Th with offset 0.4 for low-resolution data).");
+    defaults_.setMinFloat("bin_size", 0.0);
+    defaults_.setValue("bin_offset", 0.0, "Offset of the bin boundaries in units of the bin size (ignored for 'bin_unit' ppm).");
+    defaults_.setValue("bin_spread", 0, "Number of neighboring bins on both sides a peak is also added to.");
+    defaults_.setMinInt("bin_spread", 0);
+    defaults_.setValue("bin_unit", "Da", "Unit of the bin size.");
+    defaults_.setValidStrings("bin_unit", ListUtils::create<String>("Da,ppm"));
+    defaults_.setValue("intensity_scaling", "sqrt", "Transformation of the peak intensities before binning ('sqrt' reduces the influence of the most intense peaks).");
+    defaults_.setValidStrings("intensity_scaling", ListUtils::create<String>("none,sqrt"));
+    defaults_.setValue("precursor_mass_tolerance", 2.0, "Only spectra with a precursor m/z difference of at most this value are compared (negative value: compare all spectra).");
+    defaults_.setValue("precursor_mass_tolerance_unit", "Da", "Unit of the precursor mass tolerance.");
+    defaults_.setValidStrings("precursor_mass_tolerance_unit", ListUtils::create<String>("Da,ppm"));
+    defaults_.setValue("match_charge", "true", "Only compare spectra with the same precursor charge (an unknown charge of 0 matches all charges).");
+    defaults_.setValidStrings("match_charge", ListUtils::create<String>("true,false"));
+    defaults_.setValue("top_k", 10, "Maximal number of neighbors per spectrum.");
+    defaults_.setMinInt("top_k", 1);
+    defaults_.setValue("min_score", 0.0, "Minimal cosine similarity of a neighbor.");
+    defaults_.setMinFloat("min_score", 0.0);
+    defaults_.setMaxFloat("min_score", 1.0);
+    defaultsToParam_();
+  }
+
+  BinnedSpectrumNeighborSearch::BinnedSpectrumNeighborSearch(const BinnedSpectrumNeighborSearch& source) = default;
+
+  BinnedSpectrumNeighborSearch::~BinnedSpectrumNeighborSearch()
+  {
+  }
+
+  BinnedSpectrumNeighborSearch& BinnedSpectrumNeighborSearch::operator=(const BinnedSpectrumNeighborSearch& source) = default;
+
+  void BinnedSpectrumNeighborSearch::updateMembers_()
+  {
+    bin_size_ = param_.getValue("bin_size");
+    bin_offset_ = param_.getValue("bin_offset");
+    bin_spread_ = (UInt)param_.getValue("bin_spread");
+    bin_unit_ppm_ = param_.getValue("bin_unit") == "ppm";
+    sqrt_intensities_ = param_.getValue("intensity_scaling") == "sqrt";
+    precursor_mass_tolerance_ = param_.getValue("precursor_mass_tolerance");
+    precursor_mass_tolerance_ppm_ = param_.getValue("precursor_mass_tolerance_unit") == "ppm";
+    match_charge_ = param_.getValue("match_charge").toBool();
+    top_k_ = (Size)param_.getValue("top_k");
+    min_score_ = param_.getValue("min_score");
+  }
+
+  void BinnedSpectrumNeighborSearch::setSpectra(const PeakMap& exp, Size nr_threads)
+  {
+    setSpectra(exp.getSpectra(), nr_threads);
+  }
+
+  void BinnedSpectrumNeighborSearch::setSpectra(const vector<PeakSpectrum>& spectra, Size nr_threads)
+  {
+    const Size n = spectra.size();
+    offsets_.assign(1, 0);
+    offsets_.reserve(n + 1);
+    bins_.clear();
+    values_.clear();
+    precursor_mz_.assign(n, 0.0);
+    precursor_charge_.assign(n, 0);
+
+    vector<vector<pair<Int, float> > > binned;
+    for (Size block_start = 0; block_start < n; block_start += BLOCK_SIZE)
+    {
+      const Size block_end = std::min(n, block_start + BLOCK_SIZE);
+      binned.assign(block_end - block_start, vector<pair<Int, float> >());
+      parallelFor(block_end - block_start, nr_threads, [&](Size k)
+      {
+        const Size i = block_start + k;
+        const PeakSpectrum& spec = spectra[i];
+        if (!spec.getPrecursors().empty())
+        {
+          precursor_mz_[i] = spec.getPrecursors()[0].getMZ();
+          precursor_charge_[i] = spec.getPrecursors()[0].getCharge();
+        }
+
+        BinnedSpectrum bs;
+        if (sqrt_intensities_)
+        {
+          PeakSpectrum scaled;
+          scaled.reserve(spec.size());
+          for (const Peak1D& p : spec)
+          {
+            scaled.push_back(Peak1D(p.getMZ(), std::sqrt(std::max(p.getIntensity(), 0.0f))));
+          }
+          bs = BinnedSpectrum(scaled, bin_size_, bin_unit_ppm_, bin_spread_, bin_offset_);
+        }
+        else
+        {
+          bs = BinnedSpectrum(spec, bin_size_, bin_unit_ppm_, bin_spread_, bin_offset_);
+        }
+
+        vector<pair<Int, float> >& row = binned[k];
+        double norm = 0.0;
+        for (BinnedSpectrum::SparseVectorIteratorType it(bs.getBins()); it; ++it)
+        {
+          if (it.value() == 0.0f) continue;
+          row.push_back(make_pair((Int)it.index(), it.value()));
+          norm += (double)it.value() * it.value();
+        }
+        if (norm > 0.0)
+        {
+          const double scale = 1.0 / std::sqrt(norm);
+          for (pair<Int, float>& b : row) b.second = (float)(b.second * scale);
+        }
+        else
+        {
+          row.clear();
+        }
+      }, 100);
+
+      for (const vector<pair<Int, float> >& row : binned)
+      {
+        for (const pair<Int, float>& b : row)
+        {
+          bins_.push_back(b.first);
+          values_.push_back(b.second);
+        }
+        offsets_.push_back(bins_.size());
+      }
+    }
+
+    order_.resize(n);
+    std::iota(order_.begin(), order_.end(), 0);
+    std::stable_sort(order_.begin(), order_.end(), [this](Size a, Size b) { return precursor_mz_[a] < precursor_mz_[b]; });
+    sorted_mz_.resize(n);
+    for (Size i = 0; i < n; ++i)
+    {
+      sorted_mz_[i] = precursor_mz_[order_[i]];
+    }
+  }
+
+  Size BinnedSpectrumNeighborSearch::size() const
+  {
+    return offsets_.size() - 1;
+  }
+
+  void BinnedSpectrumNeighborSearch::getBinnedMatrix(vector<Size>& offsets, vector<Int>& bins, vector<float>& values) const
+  {
+    offsets = offsets_;
+    bins = bins_;
+    values = values_;
+  }
+
+  pair<Size, Size> BinnedSpectrumNeighborSearch::getWindow_(Size i) const
+  {
+    if (precursor_mass_tolerance_ < 0.0)
+    {
+      return make_pair(Size(0), order_.size());
+    }
+    const double mz = precursor_mz_[i];
+    const double tolerance = precursor_mass_tolerance_ppm_ ? mz * precursor_mass_tolerance_ * 1e-6 : precursor_mass_tolerance_;
+    Size begin = std::lower_bound(sorted_mz_.begin(), sorted_mz_.end(), mz - tolerance) - sorted_mz_.begin();
+    Size end = std::upper_bound(sorted_mz_.begin(), sorted_mz_.end(), mz + tolerance) - sorted_mz_.begin();
+    return make_pair(begin, end);
+  }
+
+  void BinnedSpectrumNeighborSearch::getNeighbors(vector<Size>& offsets, vector<Size>& neighbors, vector<float>& scores,
+                                                  vector<float>& dot_bias, Size nr_threads) const
+  {
+    const Size n = size();
+    offsets.assign(1, 0);
+    offsets.reserve(n + 1);
+    neighbors.clear();
+    scores.clear();
+    dot_bias.clear();
+
+    vector<vector<Neighbor> > results;
+    vector<vector<float> > biases;
+    for (Size block_start = 0; block_start < n; block_start += BLOCK_SIZE)
+    {
+      const Size block_end = std::min(n, block_start + BLOCK_SIZE);
+      results.assign(block_end - block_start, vector<Neighbor>());
+      biases.assign(block_end - block_start, vector<float>());
+      parallelFor(block_end - block_start, nr_threads, [&](Size k)
+      {
+        const Size i = block_start + k;
+        const Size q_begin = offsets_[i], q_end = offsets_[i + 1];
+        if (q_begin == q_end) return; // empty spectrum
+
+        // min-heap of the best neighbors (worst on top)
+        priority_queue<Neighbor, vector<Neighbor>, BetterNeighbor> best;
+        const pair<Size, Size> window = getWindow_(i);
+        for (Size w = window.first; w < window.second; ++w)
+        {
+          const Size j = order_[w];
+          if (j == i) continue;
+          if (match_charge_ && precursor_charge_[i] != 0 && precursor_charge_[j] != 0 &&
+              precursor_charge_[i] != precursor_charge_[j]) continue;
+
+          // sparse dot product of the sorted bin lists
+          double dot = 0.0;
+          Size a = q_begin, b = offsets_[j];
+          const Size b_end = offsets_[j + 1];
+          while (a < q_end && b < b_end)
+          {
+            if (bins_[a] < bins_[b]) ++a;
+            else if (bins_[b] < bins_[a]) ++b;
+            else dot += (double)values_[a++] * values_[b++];
+          }
+          const float score = (float)dot;
+          if (dot <= 0.0 || score < min_score_) continue;
+
+          const Neighbor candidate(score, j);
+          if (best.size() < top_k_)
+          {
+            best.push(candidate);
+          }
+          else if (BetterNeighbor()(candidate, best.top()))
+          {
+            best.pop();
+            best.push(candidate);
+          }
+        }
+
+        vector<Neighbor>& result = results[k];
+        result.reserve(best.size());
+        while (!best.empty())
+        {
+          result.push_back(best.top());
+          best.pop();
+        }
+        std::reverse(result.begin(), result.end());
+
+        // dot bias (see SpectraSTSimilarityScore): sqrt(sum (a_k * b_k)^2) / dot
+        vector<float>& bias = biases[k];
+        bias.reserve(result.size());
+        for (const Neighbor& nb : result)
+        {
+          double sum_squares = 0.0;
+          Size a = q_begin, b = offsets_[nb.second];
+          const Size b_end = offsets_[nb.second + 1];
+          while (a < q_end && b < b_end)
+          {
+            if (bins_[a] < bins_[b]) ++a;
+            else if (bins_[b] < bins_[a]) ++b;
+            else
+            {
+              const double product = (double)values_[a++] * values_[b++];
+              sum_squares += product * product;
+            }
+          }
+          bias.push_back((float)(std::sqrt(sum_squares) / nb.first));
+        }
+      }, 100);
+
+      for (Size k = 0; k < results.size(); ++k)
+      {
+        for (Size l = 0; l < results[k].size(); ++l)
+        {
+          neighbors.push_back(results[k][l].second);
+          scores.push_back(results[k][l].first);
+          dot_bias.push_back(biases[k][l]);
+        }
+        offsets.push_back(neighbors.size());
+      }
+    }
+  }
+
+}
@@ -6,6 +6,7 @@ set(sources_list
 BinnedSharedPeakCount.cpp
 BinnedSpectralContrastAngle.cpp
 BinnedSpectrum.cpp
+BinnedSpectrumNeighborSearch.cpp
 BinnedSpectrumCompareFunctor.cpp
 BinnedSumAgreeingIntensities.cpp
 PeakAlignment.cpp
@@ -33,7 +33,26 @@
 // --------------------------------------------------------------------------
 //
 
+#include <OpenMS/FILTERING/BASELINE/MorphologicalFilter.h>
+
+#include <OpenMS/CONCEPT/Parallel.h>
+
 namespace OpenMS
 {
 
+  void MorphologicalFilter::filterExperiment(PeakMap & exp, Size nr_threads)
+  {
+    Size progress = 0;
+    startProgress(0, exp.size(), "filtering baseline");
+    parallelFor(exp.size(), nr_threads, [&](Size i)
+    {
+      filter(exp[i]);
+#ifdef _OPENMP
+#pragma omp critical (MorphologicalFilter_progress)
+#endif
+      setProgress(++progress);
+    }, 10);
+    endProgress();
+  }
+
 }
@@ -35,10 +35,29 @@
 #include <OpenMS/FILTERING/DATAREDUCTION/IsotopeDistributionCache.h>
 
 #include <OpenMS/CHEMISTRY/ISOTOPEDISTRIBUTION/CoarseIsotopePatternGenerator.h>
+#include <OpenMS/CONCEPT/Parallel.h>
 #include <OpenMS/DATASTRUCTURES/String.h>
+#include <OpenMS/SYSTEM/File.h>
+
+#include <algorithm>
+#include <fstream>
 
 namespace OpenMS
 {
+  namespace
+  {
+    template <typename T>
+    void writeValue(std::ofstream& ofs, const T& value)
+    {
+      ofs.write((const char*)&value, sizeof(value));
+    }
+
+    template <typename T>
+    void readValue(std::ifstream& ifs, T& value)
+    {
+      ifs.read((char*)&value, sizeof(value));
+    }
+  }
 
   IsotopeDistributionCache::IsotopeDistributionCache(double max_mass, double mass_window_width, double intensity_percentage, double intensity_percentage_optional) :
     mass_window_width_(mass_window_width)
@@ -125,4 +144,131 @@ namespace OpenMS
     return isotope_distributions_[index];
   }
 
+  void IsotopeDistributionCache::getIsotopeDistributions(const std::vector<double>& masses, Size width, std::vector<double>& intensities) const
+  {
+    intensities.assign(masses.size() * width, 0.0);
+    for (Size i = 0; i < masses.size(); ++i)
+    {
+      const TheoreticalIsotopePattern& pattern = getIsotopeDistribution(masses[i]);
+      double* row = &intensities[i * width];
+      for (Size j = 0; j < pattern.intensity.size() && j + pattern.trimmed_left < width; ++j)
+      {
+        row[j + pattern.trimmed_left] = pattern.intensity[j];
+      }
+    }
+  }
+
+  void IsotopeDistributionCache::getFormulaIsotopeDistributions(const std::vector<EmpiricalFormula>& formulas, Size width, std::vector<double>& intensities, Size nr_threads)
+  {
+    intensities.assign(formulas.size() * width, 0.0);
+    if (width == 0) return;
+    parallelFor(formulas.size(), nr_threads, [&](Size i)
+    {
+      IsotopeDistribution d = formulas[i].getIsotopeDistribution(CoarseIsotopePatternGenerator(width));
+      double* row = &intensities[i * width];
+      double max = 0.0;
+      for (Size j = 0; j < d.size() && j < width; ++j)
+      {
+        row[j] = d[j].getIntensity();
+        max = std::max(max, row[j]);
+      }
+      if (max > 0.0)
+      {
+        for (Size j = 0; j < width; ++j) row[j] /= max;
+      }
+    }, 1000);
+  }
+
+  double IsotopeDistributionCache::getMassWindowWidth() const
+  {
+    return mass_window_width_;
+  }
+
+  double IsotopeDistributionCache::getMaxMass() const
+  {
+    return isotope_distributions_.size() * mass_window_width_;
+  }
+
+  void IsotopeDistributionCache::store(const String& filename) const
+  {
+    std::ofstream ofs(filename.c_str(), std::ios::binary);
+    if (!ofs.good())
+    {
+      throw Exception::UnableToCreateFile(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, filename);
+    }
+
+    int file_identifier = ISOTOPE_DISTRIBUTION_CACHE_FILE_IDENTIFIER;
+    int version = ISOTOPE_DISTRIBUTION_CACHE_FILE_VERSION;
+    writeValue(ofs, file_identifier);
+    writeValue(ofs, version);
+    writeValue(ofs, mass_window_width_);
+    writeValue(ofs, (UInt64)isotope_distributions_.size());
+    for (const TheoreticalIsotopePattern& pattern : isotope_distributions_)
+    {
+      writeValue(ofs, (UInt64)pattern.optional_begin);
+      writeValue(ofs, (UInt64)pattern.optional_end);
+      writeValue(ofs, (UInt64)pattern.trimmed_left);
+      writeValue(ofs, pattern.max);
+      writeValue(ofs, (UInt64)pattern.intensity.size());
+      if (!pattern.intensity.empty())
+      {
+        ofs.write((const char*)&pattern.intensity[0], pattern.intensity.size() * sizeof(double));
+      }
+    }
+    if (!ofs.good())
+    {
+      throw Exception::UnableToCreateFile(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, filename);
+    }
+  }
+
+  void IsotopeDistributionCache::load(const String& filename)
+  {
+    if (!File::exists(filename))
+    {
+      throw Exception::FileNotFound(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, filename);
+    }
+    std::ifstream ifs(filename.c_str(), std::ios::binary);
+
+    int file_identifier = 0, version = 0;
+    double mass_window_width = 0.0;
+    UInt64 count = 0;
+    readValue(ifs, file_identifier);
+    readValue(ifs, version);
+    readValue(ifs, mass_window_width);
+    readValue(ifs, count);
+    if (!ifs.good() || file_identifier != ISOTOPE_DISTRIBUTION_CACHE_FILE_IDENTIFIER || version != ISOTOPE_DISTRIBUTION_CACHE_FILE_VERSION)
+    {
+      throw Exception::ParseError(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, "", "File '" + filename + "' is not a valid isotope distribution cache");
+    }
+
+    std::vector<TheoreticalIsotopePattern> distributions;
+    for (UInt64 i = 0; i < count && ifs.good(); ++i)
+    {
+      TheoreticalIsotopePattern pattern;
+      UInt64 optional_begin = 0, optional_end = 0, trimmed_left = 0, size = 0;
+      readValue(ifs, optional_begin);
+      readValue(ifs, optional_end);
+      readValue(ifs, trimmed_left);
+      readValue(ifs, pattern.max);
+      readValue(ifs, size);
+      if (!ifs.good()) break;
+      pattern.optional_begin = optional_begin;
+      pattern.optional_end = optional_end;
+      pattern.trimmed_left = trimmed_left;
+      pattern.intensity.resize(size);
+      if (size > 0)
+      {
+        ifs.read((char*)&pattern.intensity[0], size * sizeof(double));
+      }
+      distributions.push_back(pattern);
+    }
+    if (!ifs.good() || distributions.size() != count)
+    {
+      throw Exception::ParseError(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, "", "File '" + filename + "' is truncated");
+    }
+
+    mass_window_width_ = mass_window_width;
+    isotope_distributions_.swap(distributions);
+  }
+
 }
@@ -34,6 +34,8 @@
 
 #include <OpenMS/FILTERING/SMOOTHING/GaussFilter.h>
 
+#include <OpenMS/CONCEPT/Parallel.h>
+
 namespace OpenMS
 {
 
@@ -54,6 +56,32 @@ namespace OpenMS
   {
   }
 
+  void GaussFilter::filterExperiment(PeakMap & map, Size nr_threads)
+  {
+    const Size nr_spectra = map.size();
+    const Size nr_total = nr_spectra + map.getChromatograms().size();
+    Size progress = 0;
+    startProgress(0, nr_total, "smoothing data");
+    // the algorithm is not thread-safe with a ppm tolerance, so every thread uses its own copy
+    parallelForWithState(nr_total, nr_threads, [this]() { return gauss_algo_; },
+      [&](GaussFilterAlgorithm& algo, Size i)
+      {
+        if (i < nr_spectra)
+        {
+          filterSpectrum_(map[i], algo);
+        }
+        else
+        {
+          filterChromatogram_(map.getChromatogram(i - nr_spectra), algo);
+        }
+#ifdef _OPENMP
+#pragma omp critical (GaussFilter_progress)
+#endif
+        setProgress(++progress);
+      }, 10);
+    endProgress();
+  }
+
   void GaussFilter::updateMembers_()
   {
     gauss_algo_.initialize((double)param_.getValue("gaussian_width"), spacing_,
@@ -38,6 +38,8 @@
 #include <Eigen/Core>
 #include <Eigen/SVD>
 
+#include <OpenMS/CONCEPT/Parallel.h>
+
 namespace OpenMS
 {
   SavitzkyGolayFilter::SavitzkyGolayFilter() :
@@ -55,6 +57,30 @@ namespace OpenMS
   {
   }
 
+  void SavitzkyGolayFilter::filterExperiment(PeakMap & map, Size nr_threads)
+  {
+    const Size nr_spectra = map.size();
+    const Size nr_total = nr_spectra + map.getChromatograms().size();
+    Size progress = 0;
+    startProgress(0, nr_total, "smoothing data");
+    parallelFor(nr_total, nr_threads, [&](Size i)
+    {
+      if (i < nr_spectra)
+      {
+        filter(map[i]);
+      }
+      else
+      {
+        filter(map.getChromatogram(i - nr_spectra));
+      }
+#ifdef _OPENMP
+#pragma omp critical (SavitzkyGolayFilter_progress)
+#endif
+      setProgress(++progress);
+    }, 10);
+    endProgress();
+  }
+
   void SavitzkyGolayFilter::updateMembers_()
   {
     frame_size_ = (UInt)param_.getValue("frame_length");
@@ -0,0 +1,182 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#include <OpenMS/FILTERING/TRANSFORMERS/SpectraFilterChain.h>
+
+#include <OpenMS/CONCEPT/Exception.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/BernNorm.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/NLargest.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/Normalizer.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/ParentPeakMower.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/Scaler.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/SqrtMower.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/ThresholdMower.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/WindowMower.h>
+#include <OpenMS/KERNEL/MSExperiment.h>
+#include <OpenMS/CONCEPT/Parallel.h>
+
+using namespace std;
+
+namespace OpenMS
+{
+
+  namespace
+  {
+    // binds a configured copy of the filter; the step owns the filter, so
+    // copies of a step can be used concurrently
+    template <typename FilterType>
+    function<void(PeakSpectrum &)> bindFilter(const Param & param, Param & used_param)
+    {
+      FilterType filter;
+      if (!param.empty())
+      {
+        filter.setParameters(param);
+      }
+      used_param = filter.getParameters();
+      return [filter](PeakSpectrum & spectrum) mutable { filter.filterPeakSpectrum(spectrum); };
+    }
+  }
+
+  SpectraFilterChain::SpectraFilterChain()
+  {
+  }
+
+  SpectraFilterChain::SpectraFilterChain(const SpectraFilterChain & source) :
+    steps_(source.steps_),
+    names_(source.names_),
+    params_(source.params_)
+  {
+  }
+
+  SpectraFilterChain::~SpectraFilterChain()
+  {
+  }
+
+  SpectraFilterChain & SpectraFilterChain::operator=(const SpectraFilterChain & source)
+  {
+    if (this != &source)
+    {
+      steps_ = source.steps_;
+      names_ = source.names_;
+      params_ = source.params_;
+    }
+    return *this;
+  }
+
+  StringList SpectraFilterChain::getAvailableFilters()
+  {
+    return ListUtils::create<String>("BernNorm,NLargest,Normalizer,ParentPeakMower,Scaler,SqrtMower,ThresholdMower,WindowMower");
+  }
+
+  SpectraFilterChain::Step SpectraFilterChain::createStep_(const String & name, const Param & param, Param & used_param)
+  {
+    if (name == "BernNorm") return bindFilter<BernNorm>(param, used_param);
+    if (name == "NLargest") return bindFilter<NLargest>(param, used_param);
+    if (name == "Normalizer") return bindFilter<Normalizer>(param, used_param);
+    if (name == "ParentPeakMower") return bindFilter<ParentPeakMower>(param, used_param);
+    if (name == "Scaler") return bindFilter<Scaler>(param, used_param);
+    if (name == "SqrtMower") return bindFilter<SqrtMower>(param, used_param);
+    if (name == "ThresholdMower") return bindFilter<ThresholdMower>(param, used_param);
+    if (name == "WindowMower") return bindFilter<WindowMower>(param, used_param);
+    throw Exception::InvalidValue(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION,
+                                  "Unsupported spectrum filter. Valid filters are: " + ListUtils::concatenate(getAvailableFilters(), ", "), name);
+  }
+
+  void SpectraFilterChain::addFilter(const String & name, const Param & param)
+  {
+    Param used_param;
+    Step step = createStep_(name, param, used_param);
+    steps_.push_back(step);
+    names_.push_back(name);
+    params_.push_back(used_param);
+  }
+
+  Size SpectraFilterChain::size() const
+  {
+    return steps_.size();
+  }
+
+  bool SpectraFilterChain::empty() const
+  {
+    return steps_.empty();
+  }
+
+  void SpectraFilterChain::clear()
+  {
+    steps_.clear();
+    names_.clear();
+    params_.clear();
+  }
+
+  const StringList & SpectraFilterChain::getFilterNames() const
+  {
+    return names_;
+  }
+
+  const Param & SpectraFilterChain::getFilterParameters(Size index) const
+  {
+    if (index >= params_.size())
+    {
+      throw Exception::IndexOverflow(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, index, params_.size());
+    }
+    return params_[index];
+  }
+
+  void SpectraFilterChain::filterPeakSpectrum(PeakSpectrum & spectrum)
+  {
+    if (spectrum.empty()) return;
+    for (vector<Step>::iterator it = steps_.begin(); it != steps_.end(); ++it)
+    {
+      (*it)(spectrum);
+    }
+  }
+
+  void SpectraFilterChain::filterPeakMap(PeakMap & exp, Size nr_threads) const
+  {
+    if (steps_.empty()) return;
+
+    // every thread uses its own copies of the filters
+    parallelForWithState(exp.size(), nr_threads, [this]() { return steps_; },
+      [&](vector<Step> & steps, Size i)
+      {
+        PeakSpectrum & spectrum = exp[i];
+        if (spectrum.empty()) return;
+        for (vector<Step>::iterator it = steps.begin(); it != steps.end(); ++it)
+        {
+          (*it)(spectrum);
+        }
+      }, 10);
+  }
+
+}
@@ -21,6 +21,7 @@ ParentPeakMower.cpp
 PeakMarker.cpp
 #~ PreprocessingFunctor.cpp
 Scaler.cpp
+SpectraFilterChain.cpp
 SpectraMerger.cpp
 SqrtMower.cpp
 TICFilter.cpp
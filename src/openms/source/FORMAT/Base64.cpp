@@ -34,6 +34,8 @@
 
 #include <OpenMS/FORMAT/Base64.h>
 
+#include <OpenMS/CONCEPT/Parallel.h>
+
 #include <QtCore/QList>
 #include <QtCore/QString>
 
@@ -272,4 +274,24 @@ print s
     }
   }
 
+  void Base64::encodeBatch(std::vector<std::vector<double> > & in, ByteOrder to_byte_order, std::vector<String> & out, bool zlib_compression, Size nr_threads)
+  {
+    out.clear();
+    out.resize(in.size());
+    parallelFor(in.size(), nr_threads, [&](Size i)
+    {
+      encode(in[i], to_byte_order, out[i], zlib_compression);
+    });
+  }
+
+  void Base64::decodeBatch(const std::vector<String> & in, ByteOrder from_byte_order, std::vector<std::vector<double> > & out, bool zlib_compression, Size nr_threads)
+  {
+    out.clear();
+    out.resize(in.size());
+    parallelFor(in.size(), nr_threads, [&](Size i)
+    {
+      decode(in[i], from_byte_order, out[i], zlib_compression);
+    });
+  }
+
 } //end OpenMS
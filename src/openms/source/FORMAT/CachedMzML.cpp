@@ -65,6 +65,7 @@ namespace OpenMS
     meta_ms_experiment_(rhs.meta_ms_experiment_),
     ifs_(rhs.filename_cached_.c_str(), std::ios::binary),
     filename_(rhs.filename_),
+    filename_cached_(rhs.filename_cached_),
     spectra_index_(rhs.spectra_index_),
     chrom_index_(rhs.chrom_index_)
   {
@@ -134,6 +135,21 @@ namespace OpenMS
     return meta_ms_experiment_.getChromatograms().size();
   }
 
+  const std::vector<std::streampos>& CachedmzML::getSpectraIndex() const
+  {
+    return spectra_index_;
+  }
+
+  const std::vector<std::streampos>& CachedmzML::getChromatogramIndex() const
+  {
+    return chrom_index_;
+  }
+
+  const String& CachedmzML::getCachedFilename() const
+  {
+    return filename_cached_;
+  }
+
   void CachedmzML::store(const String& filename, const PeakMap& map)
   {
     Internal::CachedMzMLHandler().writeMemdump(map, filename + ".cached");
@@ -59,4 +59,24 @@ namespace OpenMS
   {
       options_ = options;
   }
+
+  bool IndexedMzMLFileLoader::loadParallel(const String& filename, PeakMap& exp, Size nr_threads)
+  {
+    OnDiscPeakMap ondisc;
+    if (!ondisc.openFile(filename))
+    {
+      return false;
+    }
+
+    std::vector<Size> spectrum_ids(ondisc.getNrSpectra());
+    for (Size i = 0; i < spectrum_ids.size(); ++i) spectrum_ids[i] = i;
+    std::vector<Size> chromatogram_ids(ondisc.getNrChromatograms());
+    for (Size i = 0; i < chromatogram_ids.size(); ++i) chromatogram_ids[i] = i;
+
+    exp = *ondisc.getMetaData();
+    exp.getSpectra() = ondisc.getSpectra(spectrum_ids, nr_threads);
+    exp.getChromatograms() = ondisc.getChromatograms(chromatogram_ids, nr_threads);
+    exp.updateRanges();
+    return true;
+  }
 }
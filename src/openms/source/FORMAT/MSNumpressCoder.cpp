@@ -34,6 +34,7 @@
 
 #include <OpenMS/FORMAT/MSNumpressCoder.h>
 
+#include <OpenMS/CONCEPT/Parallel.h>
 #include <OpenMS/FORMAT/Base64.h>
 #include <OpenMS/MATH/MISC/MSNumpress.h>
 #include <boost/math/special_functions/fpclassify.hpp> // boost::math::isfinite
@@ -363,4 +364,26 @@ namespace OpenMS
 
   }
 
+  void MSNumpressCoder::encodeNPBatch(const std::vector<std::vector<double> > & in, std::vector<String> & result,
+      bool zlib_compression, const NumpressConfig & config, Size nr_threads)
+  {
+    result.clear();
+    result.resize(in.size());
+    parallelFor(in.size(), nr_threads, [&](Size i)
+    {
+      encodeNP(in[i], result[i], zlib_compression, config);
+    });
+  }
+
+  void MSNumpressCoder::decodeNPBatch(const std::vector<String> & in, std::vector<std::vector<double> > & out,
+      bool zlib_compression, const NumpressConfig & config, Size nr_threads)
+  {
+    out.clear();
+    out.resize(in.size());
+    parallelFor(in.size(), nr_threads, [&](Size i)
+    {
+      decodeNP(in[i], out[i], zlib_compression, config);
+    });
+  }
+
 } //namespace OpenMS
@@ -35,6 +35,7 @@
 #include <OpenMS/KERNEL/MSExperiment.h>
 
 #include <OpenMS/CONCEPT/LogStream.h>
+#include <OpenMS/CONCEPT/Parallel.h>
 #include <OpenMS/DATASTRUCTURES/ListUtils.h>
 #include <OpenMS/KERNEL/ChromatogramPeak.h>
 #include <OpenMS/KERNEL/Peak1D.h>
@@ -657,6 +658,57 @@ namespace OpenMS
     return TIC;
   }
 
+  void MSExperiment::extractXICs(const std::vector<double>& mz_lo, const std::vector<double>& mz_hi,
+                                 const std::vector<double>& rt_lo, const std::vector<double>& rt_hi,
+                                 std::vector<double>& rts, std::vector<float>& intensities,
+                                 UInt ms_level, Size nr_threads) const
+  {
+    const Size n_windows = mz_lo.size();
+    if (mz_hi.size() != n_windows || rt_lo.size() != n_windows || rt_hi.size() != n_windows)
+    {
+      throw Exception::IllegalArgument(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION,
+        "Expected the same number of lower and upper m/z and RT bounds, got " + String(mz_lo.size()) + ", " + String(mz_hi.size()) + ", " + String(rt_lo.size()) + " and " + String(rt_hi.size()));
+    }
+
+    std::vector<Size> spectrum_indices;
+    rts.clear();
+    for (Size s = 0; s < spectra_.size(); ++s)
+    {
+      if (spectra_[s].getMSLevel() == ms_level)
+      {
+        spectrum_indices.push_back(s);
+        rts.push_back(spectra_[s].getRT());
+      }
+    }
+    const Size n_spectra = spectrum_indices.size();
+    intensities.assign(n_windows * n_spectra, 0.0f);
+    if (n_windows == 0 || n_spectra == 0) return;
+
+    // windows ordered by their lower m/z bound: the binary search for a window
+    // only needs to consider the peaks after the start of the previous window
+    std::vector<Size> order(n_windows);
+    for (Size w = 0; w < n_windows; ++w) order[w] = w;
+    std::sort(order.begin(), order.end(), [&mz_lo](Size a, Size b) { return mz_lo[a] < mz_lo[b]; });
+
+    parallelFor(n_spectra, nr_threads, [&](Size k)
+    {
+      const SpectrumType& spectrum = spectra_[spectrum_indices[k]];
+      const double rt = rts[k];
+      SpectrumType::ConstIterator first = spectrum.begin();
+      for (Size w : order)
+      {
+        if (rt < rt_lo[w] || rt > rt_hi[w]) continue;
+        first = spectrum.MZBegin(first, mz_lo[w], spectrum.end());
+        double sum = 0.0;
+        for (SpectrumType::ConstIterator it = first; it != spectrum.end() && it->getMZ() <= mz_hi[w]; ++it)
+        {
+          sum += it->getIntensity();
+        }
+        intensities[w * n_spectra + k] = (float)sum;
+      }
+    }, 10);
+  }
+
   /**
   @brief Clears all data and meta data
 
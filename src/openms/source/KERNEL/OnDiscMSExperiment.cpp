@@ -35,9 +35,55 @@
 #include <OpenMS/KERNEL/OnDiscMSExperiment.h>
 
 #include <OpenMS/FORMAT/MzMLFile.h>
+#include <OpenMS/CONCEPT/Exception.h>
+#include <OpenMS/CONCEPT/Parallel.h>
+
 namespace OpenMS
 {
 
+  std::vector<MSSpectrum> OnDiscMSExperiment::getSpectra(const std::vector<Size>& ids, Size nr_threads) const
+  {
+    for (Size i = 0; i < ids.size(); ++i)
+    {
+      if (ids[i] >= getNrSpectra())
+      {
+        throw Exception::IndexOverflow(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, ids[i], getNrSpectra());
+      }
+    }
+
+    std::vector<MSSpectrum> spectra(ids.size());
+    // a copy of the handler opens its own file stream
+    parallelForWithState(ids.size(), nr_threads,
+      [this]() { return Internal::IndexedMzMLHandler(indexed_mzml_file_); },
+      [&](Internal::IndexedMzMLHandler& handler, Size i)
+      {
+        spectra[i] = meta_ms_experiment_->operator[](ids[i]);
+        handler.getMSSpectrumById(static_cast<int>(ids[i]), spectra[i]);
+      });
+    return spectra;
+  }
+
+  std::vector<MSChromatogram> OnDiscMSExperiment::getChromatograms(const std::vector<Size>& ids, Size nr_threads) const
+  {
+    for (Size i = 0; i < ids.size(); ++i)
+    {
+      if (ids[i] >= getNrChromatograms())
+      {
+        throw Exception::IndexOverflow(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, ids[i], getNrChromatograms());
+      }
+    }
+
+    std::vector<MSChromatogram> chromatograms(ids.size());
+    parallelForWithState(ids.size(), nr_threads,
+      [this]() { return Internal::IndexedMzMLHandler(indexed_mzml_file_); },
+      [&](Internal::IndexedMzMLHandler& handler, Size i)
+      {
+        chromatograms[i] = meta_ms_experiment_->getChromatogram(ids[i]);
+        handler.getMSChromatogramById(static_cast<int>(ids[i]), chromatograms[i]);
+      });
+    return chromatograms;
+  }
+
   void OnDiscMSExperiment::loadMetaData_(const String& filename)
   {
     meta_ms_experiment_ = boost::shared_ptr< PeakMap >(new PeakMap);
@@ -40,6 +40,7 @@
 #include <OpenMS/KERNEL/MSChromatogram.h>
 #include <OpenMS/MATH/MISC/SplineBisection.h>
 #include <OpenMS/MATH/MISC/CubicSpline2d.h>
+#include <OpenMS/CONCEPT/Parallel.h>
 
 
 using namespace std;
@@ -414,37 +415,17 @@ namespace OpenMS
     }
   }
 
-  /**
-  * @brief Applies the peak-picking algorithm to a map (MSExperiment). This
-  * method picks peaks for each scan in the map consecutively. The resulting
-  * picked peaks are written to the output map.
-  *
-  * @param input  input map in profile mode
-  * @param output  output map with picked peaks
-  * @param check_spectrum_type  if set, checks spectrum type and throws an exception if a centroided spectrum is passed 
-  */
-  void PeakPickerHiRes::pickExperiment(const PeakMap& input, PeakMap& output, const bool check_spectrum_type) const
+  void PeakPickerHiRes::pickExperiment(const PeakMap& input, PeakMap& output, const bool check_spectrum_type, Size nr_threads) const
   {
     std::vector<std::vector<PeakBoundary> > boundaries_spec;
     std::vector<std::vector<PeakBoundary> > boundaries_chrom;
-    pickExperiment(input, output, boundaries_spec, boundaries_chrom, check_spectrum_type);
+    pickExperiment(input, output, boundaries_spec, boundaries_chrom, check_spectrum_type, nr_threads);
   }
 
-  /**
-  * @brief Applies the peak-picking algorithm to a map (MSExperiment). This
-  * method picks peaks for each scan in the map consecutively. The resulting
-  * picked peaks are written to the output map.
-  *
-  * @param input  input map in profile mode
-  * @param output  output map with picked peaks
-  * @param boundaries_spec  boundaries of the picked peaks in spectra
-  * @param boundaries_chrom  boundaries of the picked peaks in chromatograms
-  * @param check_spectrum_type  if set, checks spectrum type and throws an exception if a centroided spectrum is passed 
-  */
   void PeakPickerHiRes::pickExperiment(const PeakMap& input, PeakMap& output, 
                                        std::vector<std::vector<PeakBoundary> >& boundaries_spec, 
                                        std::vector<std::vector<PeakBoundary> >& boundaries_chrom,
-                                       const bool check_spectrum_type) const
+                                       const bool check_spectrum_type, Size nr_threads) const
   {
     // make sure that output is clear
     output.clear(true);
@@ -454,65 +435,100 @@ namespace OpenMS
 
     // resize output with respect to input
     output.resize(input.size());
+    output.getChromatograms().resize(input.getChromatograms().size());
 
-    Size progress = 0;
-    startProgress(0, input.size() + input.getChromatograms().size(), "picking peaks");
+    const Size nr_items = input.size() + input.getChromatograms().size();
+    std::vector<std::vector<PeakBoundary> > boundaries(nr_items);
+    std::vector<char> picked(nr_items, 0);
 
-    if (input.getNrSpectra() > 0)
+    startProgress(0, nr_items, "picking peaks");
+    pickRange_(input, output, 0, nr_items, check_spectrum_type, nr_threads, &boundaries, &picked);
+    endProgress();
+
+    // boundaries of the picked spectra and of all chromatograms, in input order
+    for (Size i = 0; i < input.size(); ++i)
     {
-      for (Size scan_idx = 0; scan_idx != input.size(); ++scan_idx)
+      if (picked[i]) boundaries_spec.push_back(boundaries[i]);
+    }
+    for (Size i = input.size(); i < nr_items; ++i)
+    {
+      boundaries_chrom.push_back(boundaries[i]);
+    }
+  }
+
+  void PeakPickerHiRes::pickExperimentRange(const PeakMap& input, PeakMap& output, Size begin, Size end, const bool check_spectrum_type, Size nr_threads) const
+  {
+    const Size nr_items = input.size() + input.getChromatograms().size();
+    if (begin > end || end > nr_items)
+    {
+      throw Exception::IllegalArgument(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION,
+        "Invalid range [" + String(begin) + ", " + String(end) + ") for " + String(nr_items) + " spectra and chromatograms");
+    }
+    if (begin == 0)
+    {
+      output.clear(true);
+      static_cast<ExperimentalSettings &>(output) = input;
+      output.resize(input.size());
+      output.getChromatograms().resize(input.getChromatograms().size());
+      startProgress(0, nr_items, "picking peaks");
+    }
+    else if (output.size() != input.size() || output.getChromatograms().size() != input.getChromatograms().size())
+    {
+      throw Exception::IllegalArgument(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION,
+        "The output map was not initialized for the input map, start with the range beginning at 0");
+    }
+
+    pickRange_(input, output, begin, end, check_spectrum_type, nr_threads, nullptr, nullptr);
+    if (end == nr_items) endProgress();
+  }
+
+  void PeakPickerHiRes::pickRange_(const PeakMap& input, PeakMap& output, Size begin, Size end, const bool check_spectrum_type, Size nr_threads,
+                                   std::vector<std::vector<PeakBoundary> >* boundaries, std::vector<char>* picked) const
+  {
+    const Size nr_spectra = input.size();
+    Size progress = begin;
+    parallelFor(end - begin, nr_threads, [&](Size k)
+    {
+      const Size i = begin + k;
+      std::vector<PeakBoundary> boundaries_i; // peak boundaries of a single spectrum or chromatogram
+      bool picked_i = true;
+      if (i >= nr_spectra)
+      {
+        pick(input.getChromatograms()[i - nr_spectra], output.getChromatograms()[i - nr_spectra], boundaries_i);
+      }
+      else if (ms_levels_.empty()) // auto mode
       {
-        if (ms_levels_.empty()) // auto mode
+        if (input[i].getType() == SpectrumSettings::CENTROID)
         {
-          SpectrumSettings::SpectrumType spectrum_type = input[scan_idx].getType();
-          if (spectrum_type == SpectrumSettings::CENTROID)
-          {
-            output[scan_idx] = input[scan_idx];
-          }
-          else
-          {
-            std::vector<PeakBoundary> boundaries_s; // peak boundaries of a single spectrum
-
-            pick(input[scan_idx], output[scan_idx], boundaries_s);
-            boundaries_spec.push_back(boundaries_s);
-          }
+          output[i] = input[i];
+          picked_i = false;
         }
-        else if (!ListUtils::contains(ms_levels_, input[scan_idx].getMSLevel())) // manual mode
+        else
         {
-          output[scan_idx] = input[scan_idx];
+          pick(input[i], output[i], boundaries_i);
         }
-        else
+      }
+      else if (!ListUtils::contains(ms_levels_, input[i].getMSLevel())) // manual mode
+      {
+        output[i] = input[i];
+        picked_i = false;
+      }
+      else
+      {
+        // determine type of spectral data (profile or centroided)
+        if (input[i].getType() == SpectrumSettings::CENTROID && check_spectrum_type)
         {
-          std::vector<PeakBoundary> boundaries_s; // peak boundaries of a single spectrum
-
-                                                  // determine type of spectral data (profile or centroided)
-          SpectrumSettings::SpectrumType spectrum_type = input[scan_idx].getType();
-
-          if (spectrum_type == SpectrumSettings::CENTROID && check_spectrum_type)
-          {
-            throw OpenMS::Exception::IllegalArgument(__FILE__, __LINE__, __FUNCTION__, "Error: Centroided data provided but profile spectra expected.");
-          }
-
-          pick(input[scan_idx], output[scan_idx], boundaries_s);
-          boundaries_spec.push_back(boundaries_s);
+          throw OpenMS::Exception::IllegalArgument(__FILE__, __LINE__, __FUNCTION__, "Error: Centroided data provided but profile spectra expected.");
         }
-        setProgress(++progress);
+        pick(input[i], output[i], boundaries_i);
       }
-    }
-
-
-    for (Size i = 0; i < input.getChromatograms().size(); ++i)
-    {
-      MSChromatogram chromatogram;
-      std::vector<PeakBoundary> boundaries_c; // peak boundaries of a single chromatogram
-      pick(input.getChromatograms()[i], chromatogram, boundaries_c);
-      output.addChromatogram(chromatogram);
-      boundaries_chrom.push_back(boundaries_c);
+      if (boundaries != nullptr) (*boundaries)[i].swap(boundaries_i);
+      if (picked != nullptr) (*picked)[i] = picked_i;
+#ifdef _OPENMP
+#pragma omp critical (PeakPickerHiRes_progress)
+#endif
       setProgress(++progress);
-    }
-    endProgress();
-
-    return;
+    }, 10);
   }
 
   /**
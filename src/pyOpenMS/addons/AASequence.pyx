@@ -1,3 +1,4 @@
+from AASequence cimport fromString as _fromString_AASequence
 
 
     def getAAFrequencies(self, dict mmap):
@@ -5,3 +6,27 @@
         for k,v in mmap.iteritems():
             c_mmap[ _String(<char *>k) ] = v # add <size_t> ?
         self.inst.get().getAAFrequencies(c_mmap)
+
+    def __copy__(self):
+        cdef AASequence rv = AASequence.__new__(AASequence)
+        rv.inst = shared_ptr[_AASequence](new _AASequence(deref(self.inst.get())))
+        return rv
+
+    @staticmethod
+    def fromString(s, bool permissive):
+        """
+        Parses a sequence with modifications, e.g. "PEPTM(Oxidation)IDEK"
+
+        Unknown residues or modifications raise a RuntimeError unless
+        permissive is True. Parsed sequences are kept in the process-wide
+        AASequenceCache (see getAASequenceCache), the returned sequence is a
+        copy that may be modified.
+        """
+        from pyopenms.sequence_cache import getAASequenceCache
+        return getAASequenceCache().fromString(s, permissive)
+
+    @staticmethod
+    def _fromStringUncached(s, bool permissive):
+        cdef AASequence rv = AASequence.__new__(AASequence)
+        rv.inst = shared_ptr[_AASequence](new _AASequence(_fromString_AASequence(deref(convString(s).get()), permissive)))
+        return rv
@@ -1 +1,2 @@
-from pyopenms_1 cimport convString
+from pyopenms_1 cimport convString, convStringBorrowed, convOutputString, convDataValue
+from pyopenms_1 cimport convNumpyToDoubleVector, convDoubleVectorToNumpy
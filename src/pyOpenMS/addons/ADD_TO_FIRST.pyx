@@ -1,5 +1,15 @@
 from String cimport String as _String
+from DataValue cimport DataValue as _DataValue
+from DataValue cimport STRING_VALUE as _STRING_VALUE, INT_VALUE as _INT_VALUE, DOUBLE_VALUE as _DOUBLE_VALUE
+from libc.string cimport memcpy
+from libcpp.vector cimport vector as libcpp_vector
+from DataValue cimport STRING_LIST as _STRING_LIST, INT_LIST as _INT_LIST, DOUBLE_LIST as _DOUBLE_LIST, EMPTY_VALUE as _EMPTY_VALUE
 cdef shared_ptr[_String] convString(argument_var)
+cdef _String * convStringBorrowed(argument_var, _String * storage) except NULL
+cdef object convOutputString(const _String & value)
+cdef object convDataValue(const _DataValue & value)
+cdef int convNumpyToDoubleVector(data, libcpp_vector[double] & out) except -1
+cdef object convDoubleVectorToNumpy(const libcpp_vector[double] & values)
 
 
 
@@ -37,3 +47,109 @@ cdef inline shared_ptr[_String] convString(argument_var):
     else:
         raise Exception("Can only convert the following types to String: pyopenms.String, bytes, str, unicode")
 
+cdef inline _String * convStringBorrowed(argument_var, _String * storage) except NULL:
+    # Low-overhead variant of convString for const arguments
+    #
+    # Instead of allocating a new OpenMS::String (and its shared_ptr) on the
+    # heap, the content of a str, unicode or bytes argument is copied into
+    # storage, which the caller provides (typically on the stack). A
+    # pyopenms.String argument is borrowed directly without any copy. The
+    # returned pointer is only valid as long as storage and argument_var are
+    # alive, i.e. for the duration of the wrapped function call.
+    #
+    cdef bytes py_byte_string
+    if isinstance(argument_var, String):
+        return (<String>argument_var).inst.get()
+    elif isinstance(argument_var, bytes):
+        storage.assign(<char*>argument_var, len(<bytes>argument_var))
+        return storage
+    elif isinstance(argument_var, str) or isinstance(argument_var, unicode):
+        py_byte_string = argument_var.encode('UTF-8')
+        storage.assign(<char*>py_byte_string, len(py_byte_string))
+        return storage
+    else:
+        raise Exception("Can only convert the following types to String: pyopenms.String, bytes, str, unicode")
+
+
+cdef bint _decode_output_strings = False
+
+def setStringOutputDecoding(bint decode):
+    """Sets whether functions returning OpenMS::String return str instead of bytes
+
+    By default, String return values are handed back as bytes (which need to
+    be decoded in Python). If decoding is enabled, they are decoded as UTF-8
+    during the conversion and returned as (unicode) str directly, avoiding
+    the intermediate bytes object. This is a process-wide setting.
+    """
+    global _decode_output_strings
+    _decode_output_strings = decode
+
+def getStringOutputDecoding():
+    """Returns whether String return values are decoded to str (see setStringOutputDecoding)"""
+    return _decode_output_strings
+
+cdef inline object convOutputString(const _String & value):
+    # Converts an OpenMS::String return value to bytes or, if enabled through
+    # setStringOutputDecoding, directly to a UTF-8 decoded str
+    cdef char * c_string = _cast_const_away(<char*>value.c_str())
+    cdef Py_ssize_t length = value.length()
+    if _decode_output_strings:
+        return c_string[:length].decode('UTF-8')
+    return c_string[:length]
+
+
+cdef inline object convDataValue(const _DataValue & value):
+    # Generic function to convert OpenMS::DataValue to the matching Python type
+    #
+    # Switches directly on the C++ value type and converts the content without
+    # going through a (shared_ptr-owned) copy held by the Python DataValue
+    # type. Strings are returned as bytes (as DataValue.toString() does),
+    # lists as Python lists and an empty value as None.
+    #
+    cdef int value_type = value.valueType()
+    cdef libcpp_vector[_String] string_list
+    cdef libcpp_vector[_String].iterator it
+    cdef list result
+    if value_type == _STRING_VALUE:
+        return <char*>value.toChar()
+    elif value_type == _INT_VALUE:
+        return <int>value
+    elif value_type == _DOUBLE_VALUE:
+        return <double>value
+    elif value_type == _INT_LIST:
+        return value.toIntList()
+    elif value_type == _DOUBLE_LIST:
+        return value.toDoubleList()
+    elif value_type == _STRING_LIST:
+        string_list = value.toStringList()
+        result = []
+        it = string_list.begin()
+        while it != string_list.end():
+            result.append(<char*>deref(it).c_str())
+            inc(it)
+        return result
+    elif value_type == _EMPTY_VALUE:
+        return None
+    else:
+        raise Exception("DataValue instance has invalid value type %d" % value_type)
+
+
+cdef inline int convNumpyToDoubleVector(data, libcpp_vector[double] & out) except -1:
+    # Copies a one-dimensional array (or any sequence of numbers) into a
+    # std::vector<double> with a single memcpy instead of converting it
+    # element by element
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] arr = np.ascontiguousarray(data, dtype=np.float64)
+    cdef size_t n = arr.shape[0]
+    out.resize(n)
+    if n > 0:
+        memcpy(&out[0], &arr[0], n * sizeof(double))
+    return 0
+
+
+cdef inline object convDoubleVectorToNumpy(const libcpp_vector[double] & values):
+    # Copies a std::vector<double> into a new NumPy float64 array
+    cdef size_t n = values.size()
+    cdef np.ndarray[np.float64_t, ndim=1, mode="c"] result = np.empty((n,), dtype=np.float64)
+    if n > 0:
+        memcpy(&result[0], &values[0], n * sizeof(double))
+    return result
@@ -0,0 +1,71 @@
+from Base64 cimport ByteOrder as _ByteOrder
+from String cimport String as _String
+
+
+    def encodeNumpy(self, data, int to_byte_order, bool zlib_compression):
+        """
+        Encodes a NumPy array (or any sequence of numbers) as 64 bit floats
+
+        Same as encode but the input is copied in one block and the GIL is
+        released during encoding. Returns the Base64 encoded bytes.
+        """
+        cdef libcpp_vector[double] in_
+        convNumpyToDoubleVector(data, in_)
+        cdef _String result
+        cdef _Base64 * base64 = self.inst.get()
+        with nogil:
+            base64.encode(in_, <_ByteOrder>to_byte_order, result, zlib_compression)
+        return result.c_str()[:result.length()]
+
+    def decodeNumpy(self, data, int from_byte_order, bool zlib_compression):
+        """
+        Decodes Base64 encoded 64 bit floats (bytes or str) to a NumPy float64 array
+
+        The GIL is released during decoding.
+        """
+        cdef _String storage
+        cdef _String * in_ = convStringBorrowed(data, &storage)
+        cdef libcpp_vector[double] out
+        cdef _Base64 * base64 = self.inst.get()
+        with nogil:
+            base64.decode(deref(in_), <_ByteOrder>from_byte_order, out, zlib_compression)
+        return convDoubleVectorToNumpy(out)
+
+    def encodeNumpyBatch(self, arrays, int to_byte_order, bool zlib_compression, Size nr_threads=0):
+        """
+        Encodes a list of NumPy arrays, returns a list of Base64 encoded bytes
+
+        The arrays are encoded concurrently on nr_threads native threads (0
+        uses the OpenMP default) with the GIL released.
+        """
+        cdef libcpp_vector[libcpp_vector[double]] in_
+        in_.resize(len(arrays))
+        cdef size_t i
+        for i, data in enumerate(arrays):
+            convNumpyToDoubleVector(data, in_[i])
+        cdef libcpp_vector[_String] result
+        cdef _Base64 * base64 = self.inst.get()
+        with nogil:
+            base64.encodeBatch(in_, <_ByteOrder>to_byte_order, result, zlib_compression, nr_threads)
+        return [result[i].c_str()[:result[i].length()] for i in range(result.size())]
+
+    def decodeNumpyBatch(self, encoded, int from_byte_order, bool zlib_compression, Size nr_threads=0):
+        """
+        Decodes a list of Base64 encoded 64 bit floats, returns a list of NumPy float64 arrays
+
+        The data is decoded concurrently on nr_threads native threads (0 uses
+        the OpenMP default) with the GIL released.
+        """
+        cdef libcpp_vector[_String] in_
+        in_.resize(len(encoded))
+        cdef _String * borrowed
+        cdef size_t i
+        for i, data in enumerate(encoded):
+            borrowed = convStringBorrowed(data, &in_[i])
+            if borrowed != &in_[i]:
+                in_[i] = deref(borrowed)
+        cdef libcpp_vector[libcpp_vector[double]] out
+        cdef _Base64 * base64 = self.inst.get()
+        with nogil:
+            base64.decodeBatch(in_, <_ByteOrder>from_byte_order, out, zlib_compression, nr_threads)
+        return [convDoubleVectorToNumpy(out[i]) for i in range(out.size())]
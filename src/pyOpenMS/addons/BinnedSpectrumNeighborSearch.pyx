@@ -0,0 +1,63 @@
+from libcpp.vector cimport vector as libcpp_vector
+
+
+    def getBinnedMatrix(self):
+        """
+        Returns the binned spectra as CSR matrix (offsets, bins, values)
+
+        The non-zero bins of spectrum i are bins[offsets[i]:offsets[i+1]]
+        with values values[offsets[i]:offsets[i+1]] (unit length). With
+        SciPy, the matrix is
+        scipy.sparse.csr_matrix((values, bins, offsets), shape=(len(offsets) - 1, bins.max() + 1))
+        """
+        cdef libcpp_vector[size_t] offsets
+        cdef libcpp_vector[int] bins
+        cdef libcpp_vector[float] values
+        cdef _BinnedSpectrumNeighborSearch * search = self.inst.get()
+        with nogil:
+            search.getBinnedMatrix(offsets, bins, values)
+
+        cdef np.ndarray[np.int64_t, ndim=1] offsets_np = np.empty((offsets.size(),), dtype=np.int64)
+        cdef np.ndarray[np.int32_t, ndim=1] bins_np = np.empty((bins.size(),), dtype=np.int32)
+        cdef np.ndarray[np.float32_t, ndim=1] values_np = np.empty((values.size(),), dtype=np.float32)
+        cdef size_t i
+        for i in range(offsets.size()):
+            offsets_np[i] = offsets[i]
+        if bins.size() > 0:
+            memcpy(&bins_np[0], &bins[0], bins.size() * sizeof(int))
+            memcpy(&values_np[0], &values[0], values.size() * sizeof(float))
+        return offsets_np, bins_np, values_np
+
+    def getNeighbors(self, Size nr_threads=0):
+        """
+        Computes the most similar spectra of each spectrum
+
+        The search runs on nr_threads native threads (0 uses the OpenMP
+        default) with the GIL released. Returns the NumPy arrays (offsets,
+        neighbors, scores, dot_bias): the neighbors of spectrum i are
+        neighbors[offsets[i]:offsets[i+1]], sorted by decreasing cosine
+        (scores), at most top_k per spectrum. With SciPy, the similarity
+        graph is
+        scipy.sparse.csr_matrix((scores, neighbors, offsets), shape=(n, n))
+        """
+        cdef libcpp_vector[size_t] offsets
+        cdef libcpp_vector[size_t] neighbors
+        cdef libcpp_vector[float] scores
+        cdef libcpp_vector[float] dot_bias
+        cdef _BinnedSpectrumNeighborSearch * search = self.inst.get()
+        with nogil:
+            search.getNeighbors(offsets, neighbors, scores, dot_bias, nr_threads)
+
+        cdef np.ndarray[np.int64_t, ndim=1] offsets_np = np.empty((offsets.size(),), dtype=np.int64)
+        cdef np.ndarray[np.int64_t, ndim=1] neighbors_np = np.empty((neighbors.size(),), dtype=np.int64)
+        cdef np.ndarray[np.float32_t, ndim=1] scores_np = np.empty((scores.size(),), dtype=np.float32)
+        cdef np.ndarray[np.float32_t, ndim=1] dot_bias_np = np.empty((dot_bias.size(),), dtype=np.float32)
+        cdef size_t i
+        for i in range(offsets.size()):
+            offsets_np[i] = offsets[i]
+        for i in range(neighbors.size()):
+            neighbors_np[i] = neighbors[i]
+        if scores.size() > 0:
+            memcpy(&scores_np[0], &scores[0], scores.size() * sizeof(float))
+            memcpy(&dot_bias_np[0], &dot_bias[0], dot_bias.size() * sizeof(float))
+        return offsets_np, neighbors_np, scores_np, dot_bias_np
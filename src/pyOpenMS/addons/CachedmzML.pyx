@@ -0,0 +1,22 @@
+cimport numpy as np
+import numpy as np
+from streampos cimport streampos as _streampos
+
+
+    def getSpectraOffsets(self):
+        """Returns the byte offsets of the spectra in the cached data file as NumPy int64 array"""
+        cdef libcpp_vector[_streampos] index = self.inst.get().getSpectraIndex()
+        cdef np.ndarray[np.int64_t, ndim=1] offsets = np.empty((index.size(),), dtype=np.int64)
+        cdef size_t i
+        for i in range(index.size()):
+            offsets[i] = <np.int64_t>index[i]
+        return offsets
+
+    def getChromatogramOffsets(self):
+        """Returns the byte offsets of the chromatograms in the cached data file as NumPy int64 array"""
+        cdef libcpp_vector[_streampos] index = self.inst.get().getChromatogramIndex()
+        cdef np.ndarray[np.int64_t, ndim=1] offsets = np.empty((index.size(),), dtype=np.int64)
+        cdef size_t i
+        for i in range(index.size()):
+            offsets[i] = <np.int64_t>index[i]
+        return offsets
@@ -0,0 +1,19 @@
+
+
+    def position(self):
+        """Byte offset of the next entry in the file opened by readStart"""
+        return self.inst.get().position()
+
+    def setPosition(self, long long pos):
+        """Continues reading at byte offset pos (as returned by position) of the file opened by readStart"""
+        return self.inst.get().setPosition(pos)
+
+    def iterEntries(self, filename):
+        """
+        Yields the entries of a FASTA file one at a time (using readStart and
+        readNext), without loading the whole file
+        """
+        entry = FASTAEntry()
+        self.readStart(filename)
+        while self.readNext(entry):
+            yield FASTAEntry(entry)
@@ -0,0 +1,16 @@
+
+
+
+    def getMetaValues(self, keys):
+        """Returns the meta values for a list of keys as a dict
+
+        Keys may be bytes, str or String, missing keys map to None. All values
+        are converted in a single call (see getMetaValue for single keys).
+        """
+        cdef _Feature * inst_ = self.inst.get()
+        cdef shared_ptr[_String] key_
+        cdef dict result = {}
+        for k in keys:
+            key_ = convString(k)
+            result[k] = convDataValue(inst_.getMetaValue(deref(key_.get())))
+        return result
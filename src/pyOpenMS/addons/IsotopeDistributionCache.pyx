@@ -0,0 +1,43 @@
+from EmpiricalFormula cimport EmpiricalFormula as _EmpiricalFormula
+from IsotopeDistributionCache cimport getFormulaIsotopeDistributions as _getFormulaIsotopeDistributions_IsotopeDistributionCache
+from libcpp.vector cimport vector as libcpp_vector
+
+
+    def getIsotopeDistributions(self, masses, Size width):
+        """
+        Returns the averagine isotope distributions of many masses
+
+        The result is a float64 array of shape (len(masses), width): row i
+        holds the intensities of the isotopes 0 (monoisotopic) to width - 1
+        of the pre-calculated distribution of masses[i], scaled to a
+        maximum of 1. Raises RuntimeError for masses beyond getMaxMass().
+        """
+        cdef libcpp_vector[double] c_masses
+        cdef libcpp_vector[double] intensities
+        convNumpyToDoubleVector(masses, c_masses)
+        cdef _IsotopeDistributionCache * cache = self.inst.get()
+        with nogil:
+            cache.getIsotopeDistributions(c_masses, width, intensities)
+        return convDoubleVectorToNumpy(intensities).reshape((c_masses.size(), width))
+
+    @staticmethod
+    def getFormulaIsotopeDistributions(formulas, Size width, Size nr_threads=0):
+        """
+        Calculates the isotope distributions of many formulas
+
+        formulas are EmpiricalFormula objects or formula strings; the
+        result has the same layout as getIsotopeDistributions. The
+        distributions are calculated on nr_threads native threads (0 uses
+        the OpenMP default).
+        """
+        cdef libcpp_vector[_EmpiricalFormula] c_formulas
+        cdef libcpp_vector[double] intensities
+        c_formulas.reserve(len(formulas))
+        for formula in formulas:
+            if isinstance(formula, EmpiricalFormula):
+                c_formulas.push_back(deref((<EmpiricalFormula>formula).inst.get()))
+            else:
+                c_formulas.push_back(_EmpiricalFormula(deref(convString(formula).get())))
+        with nogil:
+            _getFormulaIsotopeDistributions_IsotopeDistributionCache(c_formulas, width, intensities, nr_threads)
+        return convDoubleVectorToNumpy(intensities).reshape((c_formulas.size(), width))
@@ -0,0 +1,98 @@
+from libcpp.vector cimport vector as libcpp_vector
+
+
+    def get_coordinates(self):
+        """Returns the RT and m/z of all features as NumPy arrays (rt, mz)"""
+        cdef _KDTreeFeatureMaps * tree = self.inst.get()
+        cdef size_t n = tree.size()
+        cdef np.ndarray[np.float64_t, ndim=1] rt = np.empty((n,), dtype=np.float64)
+        cdef np.ndarray[np.float64_t, ndim=1] mz = np.empty((n,), dtype=np.float64)
+        cdef size_t i
+        for i in range(n):
+            rt[i] = tree.rt(i)
+            mz[i] = tree.mz(i)
+        return rt, mz
+
+    def query_box(self, double rt_lo, double rt_hi, double mz_lo, double mz_hi):
+        """Returns the (sorted) indices of the features within an RT x m/z box as NumPy array"""
+        offsets, indices = self.query_boxes([rt_lo], [rt_hi], [mz_lo], [mz_hi], 1)
+        return indices
+
+    def query_boxes(self, rt_lo, rt_hi, mz_lo, mz_hi, Size nr_threads=0):
+        """
+        Queries many RT x m/z boxes at once
+
+        The arguments are arrays with one entry per box. Returns the NumPy
+        arrays (offsets, indices): the features within box i are
+        indices[offsets[i]:offsets[i+1]] (sorted). The queries run on
+        nr_threads native threads (0 uses the OpenMP default) with the GIL
+        released.
+        """
+        cdef libcpp_vector[double] c_rt_lo, c_rt_hi, c_mz_lo, c_mz_hi
+        convNumpyToDoubleVector(rt_lo, c_rt_lo)
+        convNumpyToDoubleVector(rt_hi, c_rt_hi)
+        convNumpyToDoubleVector(mz_lo, c_mz_lo)
+        convNumpyToDoubleVector(mz_hi, c_mz_hi)
+        cdef libcpp_vector[size_t] offsets
+        cdef libcpp_vector[size_t] indices
+        cdef _KDTreeFeatureMaps * tree = self.inst.get()
+        with nogil:
+            tree.queryRegions(c_rt_lo, c_rt_hi, c_mz_lo, c_mz_hi, offsets, indices, nr_threads)
+        cdef np.ndarray[np.int64_t, ndim=1] offsets_np = np.empty((offsets.size(),), dtype=np.int64)
+        cdef np.ndarray[np.int64_t, ndim=1] indices_np = np.empty((indices.size(),), dtype=np.int64)
+        cdef size_t i
+        for i in range(offsets.size()):
+            offsets_np[i] = offsets[i]
+        for i in range(indices.size()):
+            indices_np[i] = indices[i]
+        return offsets_np, indices_np
+
+    def query_radius(self, rt, mz, double rt_tol, double mz_tol, bool mz_ppm=False, Size nr_threads=0):
+        """
+        Finds the features within an elliptical tolerance around points
+
+        A feature is within the tolerance of a point if
+        (delta_rt / rt_tol)**2 + (delta_mz / mz_tol)**2 <= 1, mz_tol is in
+        ppm if mz_ppm is set. For a single point (rt and mz are numbers),
+        the sorted feature indices are returned; for arrays of points the
+        NumPy arrays (offsets, indices) as for query_boxes.
+        """
+        single = np.isscalar(rt)
+        cdef libcpp_vector[double] c_rt, c_mz
+        convNumpyToDoubleVector(np.atleast_1d(rt), c_rt)
+        convNumpyToDoubleVector(np.atleast_1d(mz), c_mz)
+        cdef libcpp_vector[size_t] offsets
+        cdef libcpp_vector[size_t] indices
+        cdef _KDTreeFeatureMaps * tree = self.inst.get()
+        with nogil:
+            tree.queryRadius(c_rt, c_mz, rt_tol, mz_tol, mz_ppm, offsets, indices, nr_threads)
+        cdef np.ndarray[np.int64_t, ndim=1] offsets_np = np.empty((offsets.size(),), dtype=np.int64)
+        cdef np.ndarray[np.int64_t, ndim=1] indices_np = np.empty((indices.size(),), dtype=np.int64)
+        cdef size_t i
+        for i in range(offsets.size()):
+            offsets_np[i] = offsets[i]
+        for i in range(indices.size()):
+            indices_np[i] = indices[i]
+        if single:
+            return indices_np
+        return offsets_np, indices_np
+
+    def nearest_neighbors(self, rt, mz, double rt_tol, double mz_tol, bool mz_ppm=False, Size nr_threads=0):
+        """
+        Returns the index of the nearest feature of each point as NumPy array
+
+        Distances are measured as in query_radius; points without a feature
+        within the tolerance get -1.
+        """
+        cdef libcpp_vector[double] c_rt, c_mz
+        convNumpyToDoubleVector(rt, c_rt)
+        convNumpyToDoubleVector(mz, c_mz)
+        cdef libcpp_vector[SignedSize] nearest
+        cdef _KDTreeFeatureMaps * tree = self.inst.get()
+        with nogil:
+            tree.nearestNeighbors(c_rt, c_mz, rt_tol, mz_tol, mz_ppm, nearest, nr_threads)
+        cdef np.ndarray[np.int64_t, ndim=1] result = np.empty((nearest.size(),), dtype=np.int64)
+        cdef size_t i
+        for i in range(nearest.size()):
+            result[i] = nearest[i]
+        return result
@@ -1,3 +1,4 @@
+from libcpp.vector cimport vector as libcpp_vector
 
 
 
@@ -11,6 +12,33 @@
             inc(it__r)
         return result
 
-
-
-
+    def extractXICs(self, mz_lo, mz_hi, rt_lo, rt_hi, unsigned int ms_level=1, Size nr_threads=0):
+        """
+        Extracts the ion chromatograms of many m/z and RT windows at once
+
+        Window i sums the intensities of the peaks within [mz_lo[i], mz_hi[i]]
+        of the spectra within [rt_lo[i], rt_hi[i]]. Returns the retention
+        times of the spectra of MS level ms_level (float64) and a float32
+        matrix of shape (number of windows, number of spectra), which is 0
+        where a spectrum is outside the RT range of a window. The spectra
+        must be sorted by m/z; they are processed on nr_threads native
+        threads (0 uses the OpenMP default).
+        """
+        cdef libcpp_vector[double] c_mz_lo
+        cdef libcpp_vector[double] c_mz_hi
+        cdef libcpp_vector[double] c_rt_lo
+        cdef libcpp_vector[double] c_rt_hi
+        convNumpyToDoubleVector(mz_lo, c_mz_lo)
+        convNumpyToDoubleVector(mz_hi, c_mz_hi)
+        convNumpyToDoubleVector(rt_lo, c_rt_lo)
+        convNumpyToDoubleVector(rt_hi, c_rt_hi)
+        cdef libcpp_vector[double] rts
+        cdef libcpp_vector[float] intensities
+        cdef _MSExperiment * exp_ = self.inst.get()
+        with nogil:
+            exp_.extractXICs(c_mz_lo, c_mz_hi, c_rt_lo, c_rt_hi, rts, intensities, ms_level, nr_threads)
+
+        cdef np.ndarray[np.float32_t, ndim=1] intensities_np = np.empty((intensities.size(),), dtype=np.float32)
+        if intensities.size() > 0:
+            memcpy(&intensities_np[0], &intensities[0], intensities.size() * sizeof(float))
+        return convDoubleVectorToNumpy(rts), intensities_np.reshape((c_mz_lo.size(), rts.size()))
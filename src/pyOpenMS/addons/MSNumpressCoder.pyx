@@ -0,0 +1,75 @@
+from MSNumpressCoder cimport NumpressConfig as _NumpressConfig
+from String cimport String as _String
+
+
+    def encodeNumpy(self, data, bool zlib_compression, NumpressConfig config):
+        """
+        Encodes a NumPy array (or any sequence of numbers) using numpress
+
+        Same as encodeNP but the input is copied in one block and the GIL is
+        released during encoding. Returns the Base64 encoded bytes.
+        """
+        cdef libcpp_vector[double] in_
+        convNumpyToDoubleVector(data, in_)
+        cdef _String result
+        cdef _MSNumpressCoder * coder = self.inst.get()
+        cdef _NumpressConfig * config_ = config.inst.get()
+        with nogil:
+            coder.encodeNP(in_, result, zlib_compression, deref(config_))
+        return result.c_str()[:result.length()]
+
+    def decodeNumpy(self, data, bool zlib_compression, NumpressConfig config):
+        """
+        Decodes Base64 encoded numpress data (bytes or str) to a NumPy float64 array
+
+        The GIL is released during decoding.
+        """
+        cdef _String storage
+        cdef _String * in_ = convStringBorrowed(data, &storage)
+        cdef libcpp_vector[double] out
+        cdef _MSNumpressCoder * coder = self.inst.get()
+        cdef _NumpressConfig * config_ = config.inst.get()
+        with nogil:
+            coder.decodeNP(deref(in_), out, zlib_compression, deref(config_))
+        return convDoubleVectorToNumpy(out)
+
+    def encodeNumpyBatch(self, arrays, bool zlib_compression, NumpressConfig config, Size nr_threads=0):
+        """
+        Encodes a list of NumPy arrays, returns a list of Base64 encoded bytes
+
+        The arrays are encoded concurrently on nr_threads native threads (0
+        uses the OpenMP default) with the GIL released.
+        """
+        cdef libcpp_vector[libcpp_vector[double]] in_
+        in_.resize(len(arrays))
+        cdef size_t i
+        for i, data in enumerate(arrays):
+            convNumpyToDoubleVector(data, in_[i])
+        cdef libcpp_vector[_String] result
+        cdef _MSNumpressCoder * coder = self.inst.get()
+        cdef _NumpressConfig * config_ = config.inst.get()
+        with nogil:
+            coder.encodeNPBatch(in_, result, zlib_compression, deref(config_), nr_threads)
+        return [result[i].c_str()[:result[i].length()] for i in range(result.size())]
+
+    def decodeNumpyBatch(self, encoded, bool zlib_compression, NumpressConfig config, Size nr_threads=0):
+        """
+        Decodes a list of Base64 encoded numpress data, returns a list of NumPy float64 arrays
+
+        The data is decoded concurrently on nr_threads native threads (0 uses
+        the OpenMP default) with the GIL released.
+        """
+        cdef libcpp_vector[_String] in_
+        in_.resize(len(encoded))
+        cdef _String * borrowed
+        cdef size_t i
+        for i, data in enumerate(encoded):
+            borrowed = convStringBorrowed(data, &in_[i])
+            if borrowed != &in_[i]:
+                in_[i] = deref(borrowed)
+        cdef libcpp_vector[libcpp_vector[double]] out
+        cdef _MSNumpressCoder * coder = self.inst.get()
+        cdef _NumpressConfig * config_ = config.inst.get()
+        with nogil:
+            coder.decodeNPBatch(in_, out, zlib_compression, deref(config_), nr_threads)
+        return [convDoubleVectorToNumpy(out[i]) for i in range(out.size())]
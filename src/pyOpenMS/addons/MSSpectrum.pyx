@@ -50,25 +50,44 @@ import numpy as np
 
         spec_.updateRanges()
 
-    def intensityInRange(self, float mzmin, float mzmax):
-
-        cdef int n
-        cdef double I
+    def intensityInRange(self, double mzmin, double mzmax):
+        """Returns the summed intensity of the peaks with mzmin <= m/z <= mzmax (the spectrum must be sorted by m/z)"""
 
         cdef _MSSpectrum * spec_ = self.inst.get()
-        cdef int N = spec_.size()
-
-        I = 0
-        for i in range(N):
-                if deref(spec_)[i].getMZ() >= mzmin:
-                    break
+        cdef size_t lo = 0
+        cdef size_t hi = spec_.size()
+        cdef size_t mid
+        cdef double I = 0
+
+        # first peak with m/z >= mzmin
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if deref(spec_)[mid].getMZ() < mzmin:
+                lo = mid + 1
+            else:
+                hi = mid
 
         cdef _Peak1D * p
-        for j in range(i, N):
-                p = address(deref(spec_)[i])
-                if p.getMZ() > mzmax:
-                    break
-                I += p.getIntensity()
+        cdef size_t j
+        for j in range(lo, spec_.size()):
+            p = address(deref(spec_)[j])
+            if p.getMZ() > mzmax:
+                break
+            I += p.getIntensity()
 
         return I
 
+
+    def getMetaValues(self, keys):
+        """Returns the meta values for a list of keys as a dict
+
+        Keys may be bytes, str or String, missing keys map to None. All values
+        are converted in a single call (see getMetaValue for single keys).
+        """
+        cdef _MSSpectrum * spec_ = self.inst.get()
+        cdef shared_ptr[_String] key_
+        cdef dict result = {}
+        for k in keys:
+            key_ = convString(k)
+            result[k] = convDataValue(spec_.getMetaValue(deref(key_.get())))
+        return result
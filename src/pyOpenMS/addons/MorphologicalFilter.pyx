@@ -0,0 +1,16 @@
+from MSExperiment cimport MSExperiment as _MSExperiment
+
+
+    def filterExperiment(self, MSExperiment exp, Size nr_threads=0):
+        """
+        Filters all spectra of an experiment
+
+        The spectra are filtered in parallel on nr_threads native threads (0
+        uses the OpenMP default) without holding the GIL; the result does not
+        depend on the number of threads. Progress is reported according to
+        setLogType.
+        """
+        cdef _MorphologicalFilter * filter_ = self.inst.get()
+        cdef _MSExperiment * exp_ = exp.inst.get()
+        with nogil:
+            filter_.filterExperiment(deref(exp_), nr_threads)
@@ -0,0 +1,26 @@
+from MSSpectrum cimport MSSpectrum as _MSSpectrum
+
+
+    def getSpectra(self, indices, Size nr_threads=0):
+        """
+        Returns the spectra with the given indices (in this order)
+
+        The spectra are read and decoded on native threads (nr_threads,
+        0 uses the OpenMP default) while the GIL is released, so other Python
+        threads continue to run. Unlike getSpectrum, this may be called
+        concurrently from several threads.
+        """
+        cdef libcpp_vector[Size] ids = indices
+        cdef libcpp_vector[_MSSpectrum] spectra
+        cdef _OnDiscMSExperiment * exp_ = self.inst.get()
+        with nogil:
+            spectra = exp_.getSpectra(ids, nr_threads)
+
+        cdef list result = []
+        cdef MSSpectrum spec
+        cdef size_t i
+        for i in range(spectra.size()):
+            spec = MSSpectrum.__new__(MSSpectrum)
+            spec.inst = shared_ptr[_MSSpectrum](new _MSSpectrum(spectra[i]))
+            result.append(spec)
+        return result
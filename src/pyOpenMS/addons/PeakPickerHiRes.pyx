@@ -0,0 +1,43 @@
+from MSExperiment cimport MSExperiment as _MSExperiment
+from cpython.exc cimport PyErr_CheckSignals
+import time
+
+
+    def pickExperimentParallel(self, MSExperiment input, MSExperiment output, Size nr_threads=0,
+                               callback=None, Size block_size=1000, bool check_spectrum_type=True):
+        """
+        Picks the spectra and chromatograms of input in parallel
+
+        Like pickExperiment, but the spectra (followed by the chromatograms)
+        are picked in blocks of block_size on nr_threads native threads (0
+        uses the OpenMP default), without holding the GIL. The output keeps
+        the order of the input.
+
+        After each block, callback(done, total, rate) is called with the
+        number of picked spectra and chromatograms, their total number and
+        the throughput (per second). If it returns False, picking stops and
+        False is returned (the spectra not yet picked are left empty),
+        otherwise True. Python signal handlers run between blocks, so
+        KeyboardInterrupt stops the picking as well.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be positive")
+        cdef _PeakPickerHiRes * picker = self.inst.get()
+        cdef _MSExperiment * input_ = input.inst.get()
+        cdef _MSExperiment * output_ = output.inst.get()
+        cdef Size total = input_.size() + input_.getNrChromatograms()
+        cdef Size begin = 0
+        cdef Size end
+        start = time.time()
+        while True:
+            end = min(begin + block_size, total)
+            with nogil:
+                picker.pickExperimentRange(deref(input_), deref(output_), begin, end, check_spectrum_type, nr_threads)
+            PyErr_CheckSignals()
+            if callback is not None:
+                elapsed = time.time() - start
+                if callback(end, total, end / elapsed if elapsed > 0 else 0.0) is False:
+                    return False
+            begin = end
+            if begin >= total:
+                return True
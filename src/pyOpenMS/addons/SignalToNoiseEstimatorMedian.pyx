@@ -1,4 +1,69 @@
 # two empty lines are important !
+from libcpp.vector cimport vector as libcpp_vector
+
+
+    def getSignalToNoiseArray(self, MSSpectrum spectrum):
+        """
+        Returns the signal-to-noise ratios of all peaks of a spectrum
+
+        Initializes the estimator with the spectrum (like init) and returns a
+        float64 array with the S/N of every peak, in peak order.
+        """
+        assert isinstance(spectrum, MSSpectrum), 'arg spectrum wrong type'
+        cdef _SignalToNoiseEstimatorMedian[_MSSpectrum] * estimator = self.inst.get()
+        cdef _MSSpectrum * spec_ = spectrum.inst.get()
+        cdef Size n = spec_.size()
+        cdef np.ndarray[np.float64_t, ndim=1] result = np.empty((n,), dtype=np.float64)
+        if n == 0:
+            return result
+        cdef double * out = &result[0]
+        cdef libcpp_vector[_Peak1D].iterator it
+        with nogil:
+            estimator.init(deref(spec_))
+            it = spec_.begin()
+            while it != spec_.end():
+                out[0] = estimator.getSignalToNoise(deref(it))
+                out += 1
+                inc(it)
+        return result
+
+    def getSignalToNoiseArrays(self, MSExperiment exp):
+        """
+        Returns the signal-to-noise ratios of all peaks of all spectra of an experiment
+
+        The result is a pair (offsets, sn) of NumPy arrays: the S/N of the
+        peaks of spectrum i are sn[offsets[i]:offsets[i + 1]]. The estimator
+        is re-initialized with every spectrum; afterwards it holds the
+        estimates of the last non-empty spectrum.
+        """
+        assert isinstance(exp, MSExperiment), 'arg exp wrong type'
+        cdef _SignalToNoiseEstimatorMedian[_MSSpectrum] * estimator = self.inst.get()
+        cdef _MSExperiment * exp_ = exp.inst.get()
+        cdef Size n_spectra = exp_.size()
+        cdef np.ndarray[np.int64_t, ndim=1] offsets = np.zeros((n_spectra + 1,), dtype=np.int64)
+        cdef libcpp_vector[_MSSpectrum].iterator spec_it = exp_.begin()
+        cdef Size i = 0
+        while spec_it != exp_.end():
+            offsets[i + 1] = offsets[i] + deref(spec_it).size()
+            inc(spec_it)
+            i += 1
+        cdef np.ndarray[np.float64_t, ndim=1] result = np.empty((offsets[n_spectra],), dtype=np.float64)
+        if offsets[n_spectra] == 0:
+            return offsets, result
+        cdef double * out = &result[0]
+        cdef libcpp_vector[_Peak1D].iterator it
+        with nogil:
+            spec_it = exp_.begin()
+            while spec_it != exp_.end():
+                if deref(spec_it).size() > 0:
+                    estimator.init(deref(spec_it))
+                    it = deref(spec_it).begin()
+                    while it != deref(spec_it).end():
+                        out[0] = estimator.getSignalToNoise(deref(it))
+                        out += 1
+                        inc(it)
+                inc(spec_it)
+        return offsets, result
 
 
 cdef class SignalToNoiseEstimatorMedianChrom:
@@ -25,7 +90,7 @@ cdef class SignalToNoiseEstimatorMedianChrom:
     def __init__(self, *args):
         if not args:
              self._init_0(*args)
-        elif (len(args)==1) and (isinstance(args[0], SignalToNoiseEstimatorMedian)):
+        elif (len(args)==1) and (isinstance(args[0], SignalToNoiseEstimatorMedianChrom)):
              self._init_1(*args)
         else:
                raise Exception('can not handle type of %s' % (args,))
@@ -33,4 +98,61 @@ cdef class SignalToNoiseEstimatorMedianChrom:
     def getSignalToNoise(self, ChromatogramPeak data_point ):
         assert isinstance(data_point, ChromatogramPeak), 'arg data_point wrong type'
 
-        self.inst.get().getSignalToNoise((deref(data_point.inst.get())))
+        return self.inst.get().getSignalToNoise((deref(data_point.inst.get())))
+
+    def getSignalToNoiseArray(self, MSChromatogram chromatogram):
+        """
+        Returns the signal-to-noise ratios of all peaks of a chromatogram
+
+        Initializes the estimator with the chromatogram (like init) and
+        returns a float64 array with the S/N of every peak, in peak order.
+        """
+        assert isinstance(chromatogram, MSChromatogram), 'arg chromatogram wrong type'
+        cdef _SignalToNoiseEstimatorMedian[_MSChromatogram] * estimator = self.inst.get()
+        cdef _MSChromatogram * chrom_ = chromatogram.inst.get()
+        cdef Size n = chrom_.size()
+        cdef np.ndarray[np.float64_t, ndim=1] result = np.empty((n,), dtype=np.float64)
+        if n == 0:
+            return result
+        cdef double * out = &result[0]
+        cdef libcpp_vector[_ChromatogramPeak].iterator it
+        with nogil:
+            estimator.init(deref(chrom_))
+            it = chrom_.begin()
+            while it != chrom_.end():
+                out[0] = estimator.getSignalToNoise(deref(it))
+                out += 1
+                inc(it)
+        return result
+
+    def getSignalToNoiseArrays(self, MSExperiment exp):
+        """
+        Returns the signal-to-noise ratios of all peaks of all chromatograms of an experiment
+
+        Like SignalToNoiseEstimatorMedian.getSignalToNoiseArrays, but for the
+        chromatograms: returns (offsets, sn), the S/N of chromatogram i are
+        sn[offsets[i]:offsets[i + 1]].
+        """
+        assert isinstance(exp, MSExperiment), 'arg exp wrong type'
+        cdef _SignalToNoiseEstimatorMedian[_MSChromatogram] * estimator = self.inst.get()
+        cdef _MSExperiment * exp_ = exp.inst.get()
+        cdef Size n_chroms = exp_.getNrChromatograms()
+        cdef np.ndarray[np.int64_t, ndim=1] offsets = np.zeros((n_chroms + 1,), dtype=np.int64)
+        cdef libcpp_vector[double] values
+        cdef libcpp_vector[Size] sizes
+        cdef _MSChromatogram * chrom
+        cdef libcpp_vector[_ChromatogramPeak].iterator it
+        cdef Size i
+        with nogil:
+            for i in range(n_chroms):
+                chrom = address(exp_.getChromatogram(i))
+                sizes.push_back(chrom.size())
+                if chrom.size() > 0:
+                    estimator.init(deref(chrom))
+                    it = chrom.begin()
+                    while it != chrom.end():
+                        values.push_back(estimator.getSignalToNoise(deref(it)))
+                        inc(it)
+        for i in range(n_chroms):
+            offsets[i + 1] = offsets[i] + sizes[i]
+        return offsets, convDoubleVectorToNumpy(values)
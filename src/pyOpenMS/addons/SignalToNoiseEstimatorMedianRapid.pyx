@@ -0,0 +1,64 @@
+from libcpp.vector cimport vector as libcpp_vector
+
+
+
+    def estimateNoiseArray(self, mz, intensity):
+        """
+        Returns the noise level at every point of a spectrum or chromatogram
+
+        Like estimateNoise(mz_array, int_array) followed by get_noise_value
+        for every point, but mz and intensity may be NumPy arrays (for
+        chromatograms pass the retention times as mz). The positions must be
+        sorted and at least 3 points are required. Returns a float64 array;
+        as with get_noise_value, noise levels below 1 are reported as 1.
+        """
+        cdef libcpp_vector[double] c_mz
+        cdef libcpp_vector[double] c_int
+        _checkRapidInput(mz, intensity, c_mz, c_int)
+        cdef Size n = c_mz.size()
+        cdef np.ndarray[np.float64_t, ndim=1] result = np.empty((n,), dtype=np.float64)
+        cdef double * out = &result[0]
+        cdef _SignalToNoiseEstimatorMedianRapid * estimator = self.inst.get()
+        cdef _NoiseEstimator noise
+        cdef Size i
+        with nogil:
+            noise = estimator.estimateNoise(c_mz, c_int)
+            for i in range(n):
+                out[i] = noise.get_noise_value(c_mz[i])
+        return result
+
+    def getSignalToNoiseArray(self, mz, intensity):
+        """
+        Returns the signal-to-noise ratio of every point of a spectrum or chromatogram
+
+        The intensities divided by estimateNoiseArray(mz, intensity).
+        """
+        cdef libcpp_vector[double] c_mz
+        cdef libcpp_vector[double] c_int
+        _checkRapidInput(mz, intensity, c_mz, c_int)
+        cdef Size n = c_mz.size()
+        cdef np.ndarray[np.float64_t, ndim=1] result = np.empty((n,), dtype=np.float64)
+        cdef double * out = &result[0]
+        cdef _SignalToNoiseEstimatorMedianRapid * estimator = self.inst.get()
+        cdef _NoiseEstimator noise
+        cdef Size i
+        with nogil:
+            noise = estimator.estimateNoise(c_mz, c_int)
+            for i in range(n):
+                out[i] = c_int[i] / noise.get_noise_value(c_mz[i])
+        return result
+
+
+cdef int _checkRapidInput(mz, intensity, libcpp_vector[double] & c_mz, libcpp_vector[double] & c_int) except -1:
+    # SignalToNoiseEstimatorMedianRapid only asserts its preconditions
+    convNumpyToDoubleVector(mz, c_mz)
+    convNumpyToDoubleVector(intensity, c_int)
+    if c_mz.size() != c_int.size():
+        raise ValueError("mz and intensity must have the same length (%d != %d)" % (c_mz.size(), c_int.size()))
+    if c_mz.size() < 3:
+        raise ValueError("at least 3 data points are required, got %d" % c_mz.size())
+    cdef Size i
+    for i in range(1, c_mz.size()):
+        if c_mz[i] < c_mz[i - 1]:
+            raise ValueError("mz must be sorted in ascending order")
+    return 0
@@ -0,0 +1,37 @@
+
+
+
+    def addFilter(self, filter, Param param=None):
+        """
+        Appends a filter to the chain
+
+        filter is either the class name of a filter (see
+        getAvailableFilters), optionally with a Param, or a configured filter
+        object such as NLargest or WindowMower, whose parameters are copied:
+
+            chain.addFilter(b"ThresholdMower", param)
+            chain.addFilter(pyopenms.WindowMower())
+        """
+        if hasattr(filter, "getParameters"):
+            if param is not None:
+                raise ValueError("param cannot be given together with a filter object")
+            param = filter.getParameters()
+            filter = type(filter).__name__
+        cdef shared_ptr[_String] name = convString(filter)
+        if param is None:
+            self.inst.get().addFilter(deref(name.get()))
+        else:
+            self.inst.get().addFilter(deref(name.get()), deref(param.inst.get()))
+
+    def filterPeakMap(self, MSExperiment exp, Size nr_threads=0):
+        """
+        Applies all filters to every spectrum of the experiment (in place)
+
+        The spectra are processed on nr_threads native threads (0 uses the
+        OpenMP default) with the GIL released.
+        """
+        assert isinstance(exp, MSExperiment), 'arg exp wrong type'
+        cdef _SpectraFilterChain * chain = self.inst.get()
+        cdef _MSExperiment * exp_ = exp.inst.get()
+        with nogil:
+            chain.filterPeakMap(deref(exp_), nr_threads)
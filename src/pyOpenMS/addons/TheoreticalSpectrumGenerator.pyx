@@ -0,0 +1,63 @@
+from AASequence cimport AASequence as _AASequence
+from AASequence cimport fromString as _fromString_AASequence
+from String cimport String as _String
+from libcpp.vector cimport vector as libcpp_vector
+
+
+    def getSpectraCSR(self, peptides, min_charge, max_charge, Size nr_threads=0):
+        """
+        Generates the theoretical spectra of many peptides at once
+
+        peptides is a list of AASequence objects or sequence strings,
+        min_charge and max_charge are either single charges or sequences
+        with one charge per peptide. The spectra are generated on nr_threads
+        native threads (0 uses the OpenMP default) with the GIL released.
+
+        Returns the tuple (offsets, mz, intensity, ion_codes) of NumPy
+        arrays: the peaks of peptides[i] are mz[offsets[i]:offsets[i+1]]
+        etc. ion_codes are the annotations as encoded by
+        encodeIonAnnotation: ion type (IonAnnotationType) = codes >> 24,
+        charge = (codes >> 16) & 0xFF, loss = (codes >> 12) & 0xF (1: water,
+        2: ammonia, 3: other) and ion number = codes & 0xFFF.
+        """
+        cdef libcpp_vector[_AASequence] c_peptides
+        c_peptides.reserve(len(peptides))
+        for peptide in peptides:
+            if isinstance(peptide, AASequence):
+                c_peptides.push_back(deref((<AASequence>peptide).inst.get()))
+            else:
+                c_peptides.push_back(_fromString_AASequence(deref(convString(peptide).get()), False))
+
+        cdef libcpp_vector[int] min_charges
+        cdef libcpp_vector[int] max_charges
+        if isinstance(min_charge, int) and isinstance(max_charge, int):
+            min_charges.push_back(min_charge)
+            max_charges.push_back(max_charge)
+        else:
+            n = len(peptides)
+            min_list = [int(min_charge)] * n if np.ndim(min_charge) == 0 else [int(c) for c in min_charge]
+            max_list = [int(max_charge)] * n if np.ndim(max_charge) == 0 else [int(c) for c in max_charge]
+            if len(min_list) != n or len(max_list) != n:
+                raise ValueError("min_charge and max_charge must be single charges or have one charge "
+                                 "per peptide (%d peptides, %d and %d charges given)" % (n, len(min_list), len(max_list)))
+            min_charges = min_list
+            max_charges = max_list
+
+        cdef libcpp_vector[size_t] offsets
+        cdef libcpp_vector[double] mz
+        cdef libcpp_vector[float] intensity
+        cdef libcpp_vector[int] ion_codes
+        cdef _TheoreticalSpectrumGenerator * generator = self.inst.get()
+        with nogil:
+            generator.getSpectra(c_peptides, min_charges, max_charges, offsets, mz, intensity, ion_codes, nr_threads)
+
+        cdef np.ndarray[np.int64_t, ndim=1] offsets_np = np.empty((offsets.size(),), dtype=np.int64)
+        cdef np.ndarray[np.float32_t, ndim=1] intensity_np = np.empty((intensity.size(),), dtype=np.float32)
+        cdef np.ndarray[np.int32_t, ndim=1] codes_np = np.empty((ion_codes.size(),), dtype=np.int32)
+        cdef size_t i
+        for i in range(offsets.size()):
+            offsets_np[i] = offsets[i]
+        if intensity.size() > 0:
+            memcpy(&intensity_np[0], &intensity[0], intensity.size() * sizeof(float))
+            memcpy(&codes_np[0], &ion_codes[0], ion_codes.size() * sizeof(int))
+        return offsets_np, convDoubleVectorToNumpy(mz), intensity_np, codes_np
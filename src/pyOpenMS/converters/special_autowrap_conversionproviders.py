@@ -1,4 +1,5 @@
 from __future__ import print_function
+import sys
 from autowrap.Code import Code
 from autowrap.ConversionProvider import (TypeConverterBase,
                                          mangle,
@@ -133,29 +134,10 @@ class OpenMSDataValue(TypeConverterBase):
         return "", call_as, ""
 
     def output_conversion(self, cpp_type, input_cpp_var, output_py_var):
-        # this one is slow as it uses construction of python type DataValue for
-        # delegating conversion to this type, which reduces code below:
+        # convDataValue (see addons/ADD_TO_FIRST.pyx) switches on the C++ value
+        # type and converts directly, without constructing a Python DataValue
         return Code().add("""
-                    |cdef DataValue _value = DataValue.__new__(DataValue)
-                    |_value.inst = shared_ptr[_DataValue](new _DataValue($input_cpp_var))
-                    |cdef int _type = $input_cpp_var.valueType()
-                    |cdef object $output_py_var
-                    |if _type == DataType.STRING_VALUE:
-                    |    $output_py_var = _value.toString()
-                    |elif _type == DataType.INT_VALUE:
-                    |    $output_py_var = _value.toInt()
-                    |elif _type == DataType.DOUBLE_VALUE:
-                    |    $output_py_var = _value.toDouble()
-                    |elif _type == DataType.INT_LIST:
-                    |    $output_py_var = _value.toIntList()
-                    |elif _type == DataType.DOUBLE_LIST:
-                    |    $output_py_var = _value.toDoubleList()
-                    |elif _type == DataType.STRING_LIST:
-                    |    $output_py_var = _value.toStringList()
-                    |elif _type == DataType.EMPTY_VALUE:
-                    |    $output_py_var = None
-                    |else:
-                    |    raise Exception("DataValue instance has invalid value type %d" % _type)
+                    |cdef object $output_py_var = convDataValue($input_cpp_var)
                 """, locals())
 
 
@@ -183,21 +165,51 @@ class OpenMSStringConverter(TypeConverterBase):
 
     def input_conversion(self, cpp_type, argument_var, arg_num):
 
-        # Assume that convString is declared in String.pyx
-        call_as = "deref((convString(%s)).get())" % argument_var
-        cleanup = ""
-        code = ""
         # Need to treat ptr and reference differently as these may be modified
         # and the results needs to be available in Python
         if cpp_type.is_ptr and not cpp_type.is_const:
             call_as = "((<String>%s).inst.get())" % argument_var
+            return "", call_as, ""
         if cpp_type.is_ref and not cpp_type.is_const:
             call_as = "deref((<String>%s).inst.get())" % argument_var
-        return code, call_as, cleanup
+            return "", call_as, ""
+
+        if self._convertsContainerElement():
+            # Container converters (e.g. for libcpp_map[String, double]) paste
+            # the element conversion into the body of their loop, where Cython
+            # does not allow cdef statements, and pass the same arg_num for
+            # keys and values. Elements are therefore converted into a
+            # temporary shared_ptr, see convString in addons/ADD_TO_FIRST.pyx
+            call_as = "deref((convString(%s)).get())" % argument_var
+            if cpp_type.is_ptr:
+                call_as = "(convString(%s)).get()" % argument_var
+            return "", call_as, ""
+
+        # Read-only arguments are converted into a stack-allocated String (or
+        # borrowed from a pyopenms.String), see convStringBorrowed in
+        # addons/ADD_TO_FIRST.pyx
+        storage = "_str_storage_%s" % arg_num
+        ptr = "_str_ptr_%s" % arg_num
+        code = Code().add("""
+            |cdef _String $storage
+            |cdef _String * $ptr = convStringBorrowed($argument_var, &$storage)
+        """, locals())
+        call_as = "deref(%s)" % ptr
+        if cpp_type.is_ptr:
+            call_as = ptr
+        return code, call_as, ""
 
     def output_conversion(self, cpp_type, input_cpp_var, output_py_var):
-        return "%s = _cast_const_away(<char*>%s.c_str())" % (output_py_var,
-                                                             input_cpp_var)
+        # returns bytes or str, see setStringOutputDecoding
+        return "%s = convOutputString(%s)" % (output_py_var, input_cpp_var)
+
+    @staticmethod
+    def _convertsContainerElement():
+        # input_conversion is called by the autowrap code generator for the
+        # arguments of a wrapped function and by other converters for the
+        # elements of a container argument
+        caller = sys._getframe(2).f_locals.get("self")
+        return isinstance(caller, TypeConverterBase)
 
 class AbstractOpenMSListConverter(TypeConverterBase):
 
@@ -113,7 +113,8 @@ cdef extern from "<OpenMS/CHEMISTRY/AASequence.h>" namespace "OpenMS":
 cdef extern from "<OpenMS/CHEMISTRY/AASequence.h>" namespace "OpenMS::AASequence":
 
         # static members
-        AASequence fromString(String s, bool permissive) nogil except +  # wrap-attach:AASequence
+        AASequence fromString(String s, bool permissive) nogil except +  # wrap-ignore
+        # COMMENT: see fromString in the addon, parsed sequences are cached (see AASequenceCache)
 
         # TODO: autowrap 0.18 will allow this
         #
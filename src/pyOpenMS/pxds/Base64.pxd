@@ -11,6 +11,9 @@ cdef extern from "<OpenMS/FORMAT/Base64.h>" namespace "OpenMS":
 
         void encode(libcpp_vector[ double ] & in_, ByteOrder to_byte_order, String &out, bool zlib_compression) nogil except +
         void decode(const String & in_, ByteOrder from_byte_order, libcpp_vector[ double ] &out, bool zlib_compression) nogil except +
+        # COMMENT: NumPy based and batch (multi-threaded) versions, see addon
+        void encodeBatch(libcpp_vector[ libcpp_vector[ double ] ] & in_, ByteOrder to_byte_order, libcpp_vector[ String ] &out, bool zlib_compression, Size nr_threads) nogil except + # wrap-ignore
+        void decodeBatch(libcpp_vector[ String ] & in_, ByteOrder from_byte_order, libcpp_vector[ libcpp_vector[ double ] ] &out, bool zlib_compression, Size nr_threads) nogil except + # wrap-ignore
         void encodeIntegers(libcpp_vector[ int ] & in_, ByteOrder to_byte_order, String &out, bool zlib_compression) nogil except +
         void decodeIntegers(const String & in_, ByteOrder from_byte_order, libcpp_vector[ int ] &out, bool zlib_compression) nogil except +
 
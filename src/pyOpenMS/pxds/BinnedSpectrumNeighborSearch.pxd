@@ -0,0 +1,27 @@
+from Types cimport *
+from libcpp.vector cimport vector as libcpp_vector
+from DefaultParamHandler cimport *
+from MSExperiment cimport *
+from MSSpectrum cimport *
+
+cdef extern from "<OpenMS/COMPARISON/SPECTRA/BinnedSpectrumNeighborSearch.h>" namespace "OpenMS":
+
+    cdef cppclass BinnedSpectrumNeighborSearch(DefaultParamHandler):
+        # wrap-inherits:
+        #    DefaultParamHandler
+        #
+        # wrap-doc:
+        #   All-vs-all similarity search of binned spectra, see getNeighbors
+
+        BinnedSpectrumNeighborSearch() nogil except +
+        BinnedSpectrumNeighborSearch(BinnedSpectrumNeighborSearch) nogil except +
+
+        # COMMENT: bins the spectra on nr_threads native threads (0 uses the OpenMP default)
+        void setSpectra(libcpp_vector[MSSpectrum] & spectra, Size nr_threads) nogil except +
+        void setSpectra(MSExperiment & exp, Size nr_threads) nogil except +
+        Size size() nogil except +
+
+        # COMMENT: see getBinnedMatrix and getNeighbors in the addon
+        void getBinnedMatrix(libcpp_vector[size_t] & offsets, libcpp_vector[int] & bins, libcpp_vector[float] & values) nogil except + # wrap-ignore
+        void getNeighbors(libcpp_vector[size_t] & offsets, libcpp_vector[size_t] & neighbors, libcpp_vector[float] & scores,
+                          libcpp_vector[float] & dot_bias, Size nr_threads) nogil except + # wrap-ignore
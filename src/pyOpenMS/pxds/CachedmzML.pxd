@@ -24,6 +24,11 @@ cdef extern from "<OpenMS/FORMAT/CachedMzML.h>" namespace "OpenMS":
         # COMMENT: useful for filtering by attributes to then retrieve data
         MSExperiment getMetaData() nogil except +
 
+        # COMMENT: file positions of the data, see getSpectraOffsets / getChromatogramOffsets
+        libcpp_vector[streampos] getSpectraIndex() nogil except + # wrap-ignore
+        libcpp_vector[streampos] getChromatogramIndex() nogil except + # wrap-ignore
+        String getCachedFilename() nogil except +
+
 # COMMENT: wrap static methods
 cdef extern from "<OpenMS/FORMAT/CachedMzML.h>" namespace "OpenMS::CachedmzML":
     
@@ -1,3 +1,4 @@
+from libc.string cimport const_char
 from libcpp.string cimport string as libcpp_string
 from libcpp.vector cimport vector as libcpp_vector
 from String cimport *
@@ -30,6 +31,7 @@ cdef extern from "<OpenMS/DATASTRUCTURES/DataValue.h>" namespace "OpenMS":
 
          # QString toQString()
          String toString() nogil except +
+         const_char * toChar() nogil except + # wrap-ignore
          bool toBool() nogil except +
          bool hasUnit() nogil except +
          String  getUnit() nogil except +
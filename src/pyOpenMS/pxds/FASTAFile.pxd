@@ -18,6 +18,17 @@ cdef extern from "<OpenMS/FORMAT/FASTAFile.h>" namespace "OpenMS":
         void load(const String& filename, libcpp_vector[FASTAEntry] & data) nogil except +
         void store(const String& filename, libcpp_vector[FASTAEntry] & data) nogil except +
 
+        void readStart(const String& filename) nogil except +
+        bool readNext(FASTAEntry & protein) nogil except +
+        bool atEnd() nogil except +
+        # std::streampos converts implicitly from and to long long (see addon)
+        long long position() nogil except + # wrap-ignore
+        bool setPosition(long long pos) nogil except + # wrap-ignore
+
+        void writeStart(const String& filename) nogil except +
+        void writeNext(const FASTAEntry& protein) nogil except +
+        void writeEnd() nogil except +
+
 
 cdef extern from "<OpenMS/FORMAT/FASTAFile.h>" namespace "OpenMS::FASTAFile":
 
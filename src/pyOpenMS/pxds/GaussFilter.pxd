@@ -1,3 +1,4 @@
+from Types cimport *
 from ProgressLogger cimport *
 from DefaultParamHandler cimport *
 from MSExperiment cimport *
@@ -18,5 +19,6 @@ cdef extern from "<OpenMS/FILTERING/SMOOTHING/GaussFilter.h>" namespace "OpenMS"
 
         void filter(MSSpectrum & spectrum) nogil except +
         void filter(MSChromatogram & chromatogram) nogil except +
-        void filterExperiment(MSExperiment & exp) nogil except +
+        # COMMENT: see filterExperiment in the addon
+        void filterExperiment(MSExperiment & exp, Size nr_threads) nogil except + # wrap-ignore
 
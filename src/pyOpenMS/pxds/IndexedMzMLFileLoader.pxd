@@ -11,6 +11,8 @@ cdef extern from "<OpenMS/FORMAT/IndexedMzMLFileLoader.h>" namespace "OpenMS":
         IndexedMzMLFileLoader() nogil except +
  
         bool load(String, OnDiscMSExperiment &) nogil except+
+        # COMMENT: decodes the data on nr_threads native threads (0 uses the OpenMP default)
+        bool loadParallel(String filename, MSExperiment & exp, Size nr_threads) nogil except+
         void store(String, OnDiscMSExperiment &) nogil except+
         void store(String, MSExperiment &) nogil except+
 
@@ -1,4 +1,6 @@
 from Types cimport *
+from String cimport *
+from EmpiricalFormula cimport *
 from FeatureFinderAlgorithmPickedHelperStructs cimport *
 
 cdef extern from "<OpenMS/FILTERING/DATAREDUCTION/IsotopeDistributionCache.h>" namespace "OpenMS":
@@ -7,4 +9,15 @@ cdef extern from "<OpenMS/FILTERING/DATAREDUCTION/IsotopeDistributionCache.h>" n
         IsotopeDistributionCache(IsotopeDistributionCache) nogil except + #wrap-ignore
         IsotopeDistributionCache(double max_mass, double mass_window_width, double intensity_percentage, double intensity_percentage_optional) nogil except +
         TheoreticalIsotopePattern  getIsotopeDistribution(double mass) nogil except +
+        # COMMENT: see getIsotopeDistributions in the addon
+        void getIsotopeDistributions(libcpp_vector[double] & masses, Size width, libcpp_vector[double] & intensities) nogil except + # wrap-ignore
+        double getMassWindowWidth() nogil except +
+        double getMaxMass() nogil except +
+        void store(String filename) nogil except +
+        void load(String filename) nogil except +
 
+# COMMENT: wrap static methods
+cdef extern from "<OpenMS/FILTERING/DATAREDUCTION/IsotopeDistributionCache.h>" namespace "OpenMS::IsotopeDistributionCache":
+
+        # COMMENT: see getFormulaIsotopeDistributions in the addon
+        void getFormulaIsotopeDistributions(libcpp_vector[EmpiricalFormula] & formulas, Size width, libcpp_vector[double] & intensities, Size nr_threads) nogil except + # wrap-ignore
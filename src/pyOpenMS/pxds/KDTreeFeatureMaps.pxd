@@ -42,5 +42,12 @@ cdef extern from "<OpenMS/ANALYSIS/QUANTITATION/KDTreeFeatureMaps.h>" namespace
                              bool include_features_from_same_map,
                              double max_pairwise_log_fc) nogil except +
         void queryRegion(double rt_low, double rt_high, double mz_low, double mz_high, libcpp_vector[ size_t ] & result_indices, Size ignored_map_index) nogil except +
+        # COMMENT: see query_boxes, query_radius and nearest_neighbors in the addon
+        void queryRegions(libcpp_vector[double] & rt_low, libcpp_vector[double] & rt_high, libcpp_vector[double] & mz_low, libcpp_vector[double] & mz_high,
+                          libcpp_vector[size_t] & offsets, libcpp_vector[size_t] & result_indices, Size nr_threads) nogil except + # wrap-ignore
+        void queryRadius(libcpp_vector[double] & rt, libcpp_vector[double] & mz, double rt_tol, double mz_tol, bool mz_ppm,
+                         libcpp_vector[size_t] & offsets, libcpp_vector[size_t] & result_indices, Size nr_threads) nogil except + # wrap-ignore
+        void nearestNeighbors(libcpp_vector[double] & rt, libcpp_vector[double] & mz, double rt_tol, double mz_tol, bool mz_ppm,
+                              libcpp_vector[SignedSize] & result_indices, Size nr_threads) nogil except + # wrap-ignore
         # void applyTransformations(libcpp_vector[ TransformationModelLowess * ] & trafos) nogil except +
 
@@ -49,7 +49,7 @@ cdef extern from "<OpenMS/KERNEL/MSExperiment.h>" namespace "OpenMS":
         libcpp_vector[MSSpectrum] getSpectra() nogil except +
 
         # COMMENT: Chromatogram functions
-        MSChromatogram getChromatogram(Size id_) nogil except +
+        MSChromatogram & getChromatogram(Size id_) nogil except +
         void addChromatogram(MSChromatogram chromatogram) nogil except +
         void setChromatograms(libcpp_vector[MSChromatogram] chromatograms) nogil except +
         libcpp_vector[MSChromatogram] getChromatograms() nogil except +
@@ -59,6 +59,10 @@ cdef extern from "<OpenMS/KERNEL/MSExperiment.h>" namespace "OpenMS":
         libcpp_vector[MSSpectrum].iterator end()    nogil except +       # wrap-iter-end:__iter__(MSSpectrum)
 
         MSChromatogram getTIC() nogil except +
+        void extractXICs(libcpp_vector[double] & mz_lo, libcpp_vector[double] & mz_hi,
+                         libcpp_vector[double] & rt_lo, libcpp_vector[double] & rt_hi,
+                         libcpp_vector[double] & rts, libcpp_vector[float] & intensities,
+                         unsigned int ms_level, Size nr_threads) nogil except + # wrap-ignore
         void clear(bool clear_meta_data) nogil except +
 
         void updateRanges() nogil except +
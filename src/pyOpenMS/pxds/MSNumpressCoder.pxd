@@ -14,6 +14,13 @@ cdef extern from "<OpenMS/FORMAT/MSNumpressCoder.h>" namespace "OpenMS":
         void decodeNP(const String& in_, libcpp_vector[double] & out,
                 bool zlib_compression, NumpressConfig config) nogil except +
 
+        # COMMENT: NumPy based and batch (multi-threaded) versions, see addon
+        void encodeNPBatch(libcpp_vector[libcpp_vector[double]] in_, libcpp_vector[String] & result,
+                bool zlib_compression, NumpressConfig config, Size nr_threads) nogil except + # wrap-ignore
+
+        void decodeNPBatch(libcpp_vector[String] in_, libcpp_vector[libcpp_vector[double]] & out,
+                bool zlib_compression, NumpressConfig config, Size nr_threads) nogil except + # wrap-ignore
+
 cdef extern from "<OpenMS/FORMAT/MSNumpressCoder.h>" namespace "OpenMS::MSNumpressCoder":
 
     cdef enum NumpressCompression:
@@ -1,3 +1,4 @@
+from Types cimport *
 from ProgressLogger cimport *
 from DefaultParamHandler cimport *
 from MSExperiment cimport *
@@ -16,5 +17,6 @@ cdef extern from "<OpenMS/FILTERING/BASELINE/MorphologicalFilter.h>" namespace "
         # MorphologicalFilter(MorphologicalFilter)      nogil except + #private
 
         void filter(MSSpectrum & spectrum)      nogil except +
-        void filterExperiment(MSExperiment & exp)      nogil except +
+        # COMMENT: see filterExperiment in the addon
+        void filterExperiment(MSExperiment & exp, Size nr_threads) nogil except + # wrap-ignore
 
@@ -24,6 +24,9 @@ cdef extern from "<OpenMS/KERNEL/OnDiscMSExperiment.h>" namespace "OpenMS":
         MSSpectrum getSpectrum(Size id) nogil except +
         MSChromatogram getChromatogram(Size id) nogil except +
 
+        # COMMENT: see addon, the GIL is released while the spectra are decoded
+        libcpp_vector[MSSpectrum] getSpectra(libcpp_vector[Size] ids, Size nr_threads) nogil except + # wrap-ignore
+
         # TODO decide for 1.12 whether to include those ... 
         shared_ptr[Spectrum] getSpectrumById(int id_) nogil except +
         shared_ptr[Chromatogram] getChromatogramById(int id_) nogil except +
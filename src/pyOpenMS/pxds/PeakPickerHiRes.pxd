@@ -1,3 +1,5 @@
+from Types cimport *
+from libcpp cimport bool
 from MSSpectrum cimport *
 from MSExperiment cimport *
 from ChromatogramPeak cimport *
@@ -24,6 +26,10 @@ cdef extern from "<OpenMS/TRANSFORMATIONS/RAW2PEAK/PeakPickerHiRes.h>" namespace
                             MSExperiment & output
                            ) nogil except +
 
+        # COMMENT: see pickExperimentParallel in the addon
+        void pickExperimentRange(MSExperiment & input, MSExperiment & output, Size begin, Size end,
+                                 bool check_spectrum_type, Size nr_threads) nogil except + # wrap-ignore
+
 cdef extern from "<OpenMS/TRANSFORMATIONS/RAW2PEAK/PeakPickerHiRes.h>" namespace "OpenMS::PeakPickerHiRes":
     
     cdef cppclass PeakBoundary "OpenMS::PeakPickerHiRes::PeakBoundary":
@@ -1,3 +1,4 @@
+from Types cimport *
 from ProgressLogger cimport *
 from DefaultParamHandler cimport *
 from MSExperiment cimport *
@@ -16,6 +17,7 @@ cdef extern from "<OpenMS/FILTERING/SMOOTHING/SavitzkyGolayFilter.h>" namespace
         SavitzkyGolayFilter(SavitzkyGolayFilter)      nogil except +
 
         void filter(MSSpectrum & spectrum)      nogil except +
-        void filterExperiment(MSExperiment & exp)      nogil except +
+        # COMMENT: see filterExperiment in the addon
+        void filterExperiment(MSExperiment & exp, Size nr_threads) nogil except + # wrap-ignore
 
 
@@ -0,0 +1,34 @@
+# part of the SpectraFilters
+from Types cimport *
+from libcpp cimport bool
+from String cimport *
+from StringList cimport *
+from Param cimport *
+from MSSpectrum cimport *
+from MSExperiment cimport *
+
+cdef extern from "<OpenMS/FILTERING/TRANSFORMERS/SpectraFilterChain.h>" namespace "OpenMS":
+
+    cdef cppclass SpectraFilterChain:
+
+        SpectraFilterChain() nogil except +
+        SpectraFilterChain(SpectraFilterChain) nogil except +
+
+        # COMMENT: see addFilter in the addon, which also accepts filter objects
+        void addFilter(String name, Param param) nogil except + # wrap-ignore
+        void addFilter(String name) nogil except + # wrap-ignore
+
+        Size size() nogil except +
+        bool empty() nogil except +
+        void clear() nogil except +
+        StringList getFilterNames() nogil except +
+        Param getFilterParameters(Size index) nogil except +
+
+        void filterPeakSpectrum(MSSpectrum & spectrum) nogil except +
+        # COMMENT: see filterPeakMap in the addon, which releases the GIL
+        void filterPeakMap(MSExperiment & exp, Size nr_threads) nogil except + # wrap-ignore
+
+cdef extern from "<OpenMS/FILTERING/TRANSFORMERS/SpectraFilterChain.h>" namespace "OpenMS::SpectraFilterChain":
+
+        # static members
+        StringList getAvailableFilters() nogil except + # wrap-attach:SpectraFilterChain
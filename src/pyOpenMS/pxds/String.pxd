@@ -30,6 +30,9 @@ cdef extern from "<OpenMS/DATASTRUCTURES/String.h>" namespace "OpenMS":
         # Rather perform string operations in Python (you will have a bad time
         # with unicode strings otherwise).
         size_t length() nogil except + # wrap-ignore
+        # Used by the conversion code to fill a stack-allocated String without
+        # going through a NULL-terminated intermediate
+        void assign(const_char *, size_t) nogil except + # wrap-ignore
         # libcpp_string operator[](int) nogil except + # wrap-upper-limit:length()
 
 cdef extern from "<OpenMS/DATASTRUCTURES/String.h>" namespace "OpenMS::String":
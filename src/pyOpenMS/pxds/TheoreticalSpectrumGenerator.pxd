@@ -15,3 +15,27 @@ cdef extern from "<OpenMS/CHEMISTRY/TheoreticalSpectrumGenerator.h>" namespace "
         TheoreticalSpectrumGenerator() nogil except +
         TheoreticalSpectrumGenerator(TheoreticalSpectrumGenerator) nogil except +
         void getSpectrum(MSSpectrum &spec, AASequence &peptide, Int min_charge, Int max_charge) nogil except +
+        # COMMENT: see getSpectraCSR
+        void getSpectra(libcpp_vector[AASequence] & peptides, libcpp_vector[int] & min_charges, libcpp_vector[int] & max_charges,
+                        libcpp_vector[size_t] & offsets, libcpp_vector[double] & mz, libcpp_vector[float] & intensity,
+                        libcpp_vector[int] & ion_codes, Size nr_threads) nogil except + # wrap-ignore
+
+# COMMENT: wrap static methods
+cdef extern from "<OpenMS/CHEMISTRY/TheoreticalSpectrumGenerator.h>" namespace "OpenMS::TheoreticalSpectrumGenerator":
+
+        Int encodeIonAnnotation(String ion_name, Int charge) nogil except + # wrap-attach:TheoreticalSpectrumGenerator
+
+cdef extern from "<OpenMS/CHEMISTRY/TheoreticalSpectrumGenerator.h>" namespace "OpenMS::TheoreticalSpectrumGenerator":
+
+    cdef enum IonAnnotationType:
+      # wrap-attach:
+      #     TheoreticalSpectrumGenerator
+      UNKNOWN_ION,
+      A_ION,
+      B_ION,
+      C_ION,
+      X_ION,
+      Y_ION,
+      Z_ION,
+      PRECURSOR_ION,
+      IMMONIUM_ION
@@ -0,0 +1,18 @@
+from Types cimport *
+from libcpp cimport bool
+from String cimport *
+from LightTargetedExperiment cimport *
+
+cdef extern from "<OpenMS/ANALYSIS/OPENSWATH/TransitionCacheFile.h>" namespace "OpenMS":
+
+    cdef cppclass TransitionCacheFile:
+
+        TransitionCacheFile() nogil except +
+        TransitionCacheFile(TransitionCacheFile) nogil except + #wrap-ignore
+
+        # COMMENT: Stores the experiment in binary format, tagged with size, modification time and hash of the assay library source
+        void store(const String& filename, LightTargetedExperiment & targeted_exp, const String& source) nogil except +
+        void store(const String& filename, LightTargetedExperiment & targeted_exp) nogil except +
+        void load(const String& filename, LightTargetedExperiment & targeted_exp) nogil except +
+        # COMMENT: Is the cache file up to date with the assay library source?
+        bool isValid(const String& filename, const String& source) nogil except +
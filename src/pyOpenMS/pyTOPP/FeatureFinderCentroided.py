@@ -1,17 +1,10 @@
 import argparse
 import pyopenms as pms
-from common import addDataProcessing, writeParamsIfRequested, updateDefaults
+from common import addDataProcessing, writeParamsIfRequested, updateDefaults, \
+        addCacheArguments, runCached
 
 
-def run_featurefinder_centroided(input_path, params, seeds, out_path):
-
-    fh = pms.MzMLFile()
-    options = pms.PeakFileOptions()
-    options.setMSLevels([1,1])
-    fh.setOptions(options)
-    input_map = pms.MSExperiment()
-    fh.load(input_path, input_map)
-    input_map.updateRanges()
+def find_features(input_map, params, seeds):
 
     ff = pms.FeatureFinder()
     ff.setLogType(pms.LogType.CMD)
@@ -22,6 +15,20 @@ def run_featurefinder_centroided(input_path, params, seeds, out_path):
 
     features.setUniqueIds()
     addDataProcessing(features, params, pms.ProcessingAction.QUANTITATION)
+    return features
+
+
+def run_featurefinder_centroided(input_path, params, seeds, out_path):
+
+    fh = pms.MzMLFile()
+    options = pms.PeakFileOptions()
+    options.setMSLevels([1,1])
+    fh.setOptions(options)
+    input_map = pms.MSExperiment()
+    fh.load(input_path, input_map)
+    input_map.updateRanges()
+
+    features = find_features(input_map, params, seeds)
 
     fh = pms.FeatureXMLFile()
     fh.store(out_path, features)
@@ -73,6 +80,8 @@ def main():
                         metavar="python_dict_ini_file",
                         )
 
+    addCacheArguments(parser)
+
     args = parser.parse_args()
 
     run_mode = args.in_ is not None and args.out is not None\
@@ -92,12 +101,17 @@ def main():
     if not write_requested:
         updateDefaults(args, defaults)
 
-        seeds = pms.FeatureMap()
-        if args.seeds:
-            fh = pms.FeatureXMLFile()
-            fh.load(args.seeds, seeds)
+        def run():
+            seeds = pms.FeatureMap()
+            if args.seeds:
+                fh = pms.FeatureXMLFile()
+                fh.load(args.seeds, seeds)
+
+            run_featurefinder_centroided(args.in_, defaults, seeds, args.out)
 
-        run_featurefinder_centroided(args.in_, defaults, seeds, args.out)
+        in_files = [args.in_, args.seeds] if args.seeds else [args.in_]
+        runCached(args, "FeatureFinderCentroided", in_files, [args.out],
+                  defaults, run)
 
 if __name__ == "__main__":
     main()
@@ -1,19 +1,25 @@
+from __future__ import print_function
 import argparse
 import pyopenms as pms
-from common import addDataProcessing, writeParamsIfRequested, updateDefaults
+from common import addDataProcessing, writeParamsIfRequested, updateDefaults, \
+        addCacheArguments, runCached
 from  collections import Counter
 
 
-def link(in_files, out_file, keep_subelements, params):
+def link_maps(maps, in_files, keep_subelements, params):
+    """
+    Links FeatureMaps or ConsensusMaps which are already in memory
 
-    in_types = set(pms.FileHandler.getType(in_) for in_ in in_files)
+    in_files are the file names recorded in the column headers of the
+    resulting ConsensusMap (one per map).
+    """
 
-    if in_types == set((pms.Type.CONSENSUSXML,)):
+    if all(isinstance(map_, pms.ConsensusMap) for map_ in maps):
         link_features = False
-    elif in_types == set((pms.Type.FEATUREXML,)):
+    elif all(isinstance(map_, pms.FeatureMap) for map_ in maps):
         link_features = True
     else:
-        raise Exception("different kinds of input files")
+        raise Exception("different kinds of input maps")
 
     algorithm_parameters = params.copy("algorithm:", True)
     algorithm = pms.FeatureGroupingAlgorithmQT()
@@ -22,28 +28,16 @@ def link(in_files, out_file, keep_subelements, params):
     out_map = pms.ConsensusMap()
     fds = out_map.getColumnHeaders()
     if link_features:
-        f = pms.FeatureXMLFile()
-        maps = []
-        for i, in_file in enumerate(in_files):
-            map_ = pms.FeatureMap()
-            f.load(in_file, map_)
-
+        for i, map_ in enumerate(maps):
             # set filedescriptions
             fd = fds.get(i, pms.ColumnHeader())
-            fd.filename = in_file
+            fd.filename = in_files[i]
             fd.size = map_.size()
             fd.unique_id = map_.getUniqueId()
             fds[i] = fd
-            maps.append(map_)
         out_map.setColumnHeaders(fds)
         algorithm.group(maps, out_map)
     else:
-        f = pms.ConsensusXMLFile()
-        maps = []
-        for i, in_file in enumerate(in_files):
-            map_ = pms.ConsensusMap()
-            f.load(in_file, map_)
-            maps.append(map_)
         algorithm.group(maps, out_map)
 
         if not keep_subelements:
@@ -60,18 +54,46 @@ def link(in_files, out_file, keep_subelements, params):
 
     out_map.setUniqueIds()
     addDataProcessing(out_map, params, pms.ProcessingAction.FEATURE_GROUPING)
+    return out_map
 
-    pms.ConsensusXMLFile().store(out_file, out_map)
+
+def print_summary(out_map):
 
     sizes = []
     for feat in out_map:
         sizes.append(feat.size())
 
     c = Counter(sizes)
-    print "Number of consensus features:"
+    print("Number of consensus features:")
     for size, count in c.most_common():
-        print "   of size %2d : %6d" % (size, count)
-    print "        total : %6d" % out_map.size()
+        print("   of size %2d : %6d" % (size, count))
+    print("        total : %6d" % out_map.size())
+
+
+def link(in_files, out_file, keep_subelements, params):
+
+    in_types = set(pms.FileHandler.getType(in_) for in_ in in_files)
+
+    if in_types == set((pms.Type.CONSENSUSXML,)):
+        f = pms.ConsensusXMLFile()
+        map_type = pms.ConsensusMap
+    elif in_types == set((pms.Type.FEATUREXML,)):
+        f = pms.FeatureXMLFile()
+        map_type = pms.FeatureMap
+    else:
+        raise Exception("different kinds of input files")
+
+    maps = []
+    for in_file in in_files:
+        map_ = map_type()
+        f.load(in_file, map_)
+        maps.append(map_)
+
+    out_map = link_maps(maps, in_files, keep_subelements, params)
+
+    pms.ConsensusXMLFile().store(out_file, out_map)
+
+    print_summary(out_map)
 
 
 def main():
@@ -119,6 +141,8 @@ def main():
                         )
 
 
+    addCacheArguments(parser)
+
     args = parser.parse_args()
 
 
@@ -144,7 +168,12 @@ def main():
         updateDefaults(args, defaults)
 
 
-        link(in_files, args.out, args.keep_subelements, defaults)
+        def run():
+            link(in_files, args.out, args.keep_subelements, defaults)
+
+        # the input file names end up in the column headers of the output
+        runCached(args, "FeatureLinkerUnlabeledQT", in_files, [args.out],
+                  defaults, run, extra=[in_files, args.keep_subelements])
 
 
 
@@ -1,13 +1,73 @@
-# import pyopenms
+import argparse
+import os.path
+import pyopenms as pms
+
+# in: file
+in_formats = "mzData,mzXML,mzML,DTA,DTA2D,mgf,featureXML,consensusXML,"\
+             "ms2,fid,tsv,peplist,kroenik,edta".split(",")
+# out: file, "columnar" is a directory of memory-mappable NumPy column files
+# (see pyopenms.storeColumnar / pyopenms.ColumnarExperiment)
+out_formats = "mzData,mzXML,mzML,DTA2D,mgf,columnar".split(",")
+
+
+def convert(in_file, out_file, out_type):
+
+    if out_type == "columnar":
+        if pms.FileHandler.getType(in_file) == pms.Type.MZML:
+            # streams the input, the run is never held in memory completely
+            pms.storeColumnar(in_file, out_file)
+        else:
+            exp = pms.MSExperiment()
+            pms.FileHandler().loadExperiment(in_file, exp)
+            pms.storeColumnar(exp, out_file)
+        return
+
+    fh = pms.FileHandler()
+    exp = pms.MSExperiment()
+    fh.loadExperiment(in_file, exp)
+    fh.storeExperiment(out_file, exp)
+
 
 def main():
-    import optparse
-    # in: file
-    in_formats = "mzData,mzXML,mzML,DTA,DTA2D,mgf,featureXML,consensusXML,"\
-                 "ms2,fid,tsv,peplist,kroenik,edta".split()
-    # out: file
-    out_formats = "mzData,mzXML,mzML,DTA2D,mgf,featureXML,"\
-                  "consensusXML".split(",")
+
+    parser = argparse.ArgumentParser(description="FileConverter")
+    parser.add_argument("-in",
+                        action="store",
+                        type=str,
+                        dest="in_",
+                        metavar="input_file",
+                        )
+
+    parser.add_argument("-out",
+                        action="store",
+                        type=str,
+                        metavar="output_file",
+                        )
+
+    parser.add_argument("-out_type",
+                        action="store",
+                        type=str,
+                        choices=out_formats,
+                        metavar="output_type",
+                        help="output format (determined from the -out file "
+                             "extension if not given): %s" % ", ".join(out_formats),
+                        )
+
+    args = parser.parse_args()
+
+    if args.in_ is None or args.out is None:
+        parser.error("need -in and -out")
+
+    out_type = args.out_type
+    if out_type is None:
+        ext = os.path.splitext(args.out)[1][1:]
+        matches = [f for f in out_formats if f.lower() == ext.lower()]
+        if not matches:
+            parser.error("can not determine output type from '%s', "
+                         "please specify -out_type" % args.out)
+        out_type = matches[0]
+
+    convert(args.in_, args.out, out_type)
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,25 @@
 import argparse
 import pyopenms as pms
-from common import addDataProcessing, writeParamsIfRequested, updateDefaults
+from common import addDataProcessing, writeParamsIfRequested, updateDefaults, \
+        addCacheArguments, runCached
+
+
+def annotate_map(map_, peptide_ids, protein_ids, params, use_centroid_rt,
+        use_centroid_mz, use_subelements):
+
+    mapper = pms.IDMapper()
+    mapper.setParameters(params)
+
+    if isinstance(map_, pms.ConsensusMap):
+        mapper.annotate(map_, peptide_ids, protein_ids, use_subelements)
+    elif isinstance(map_, pms.FeatureMap):
+        mapper.annotate(map_, peptide_ids, protein_ids, use_centroid_rt,
+                use_centroid_mz)
+    else:
+        raise Exception("can only annotate feature and consensus maps")
+
+    addDataProcessing(map_, params, pms.ProcessingAction.IDENTIFICATION_MAPPING)
+    return map_
 
 
 def id_mapper(in_file, id_file, out_file, params, use_centroid_rt,
@@ -13,24 +32,20 @@ def id_mapper(in_file, id_file, out_file, params, use_centroid_rt,
 
     pms.IdXMLFile().load(id_file, protein_ids, peptide_ids)
 
-    mapper = pms.IDMapper()
-    mapper.setParameters(params)
-
     if in_type == pms.Type.CONSENSUSXML:
         file_ = pms.ConsensusXMLFile()
         map_ = pms.ConsensusMap()
         file_.load(in_file, map_)
-        mapper.annotate(map_, peptide_ids, protein_ids, use_subelements)
-        addDataProcessing(map_, params, pms.ProcessingAction.IDENTIFICATION_MAPPING)
+        annotate_map(map_, peptide_ids, protein_ids, params, use_centroid_rt,
+                use_centroid_mz, use_subelements)
         file_.store(out_file, map_)
 
     elif in_type == pms.Type.FEATUREXML:
         file_ = pms.FeatureXMLFile()
         map_ = pms.FeatureMap()
         file_.load(in_file, map_)
-        mapper.annotate(map_, peptide_ids, protein_ids, use_centroid_rt,
-                use_centroid_mz)
-        addDataProcessing(map_, params, pms.ProcessingAction.IDENTIFICATION_MAPPING)
+        annotate_map(map_, peptide_ids, protein_ids, params, use_centroid_rt,
+                use_centroid_mz, use_subelements)
         file_.store(out_file, map_)
 
     elif in_type == pms.Type.MZQ:
@@ -39,8 +54,8 @@ def id_mapper(in_file, id_file, out_file, params, use_centroid_rt,
         file_.load(in_file, msq)
         maps = msq.getConsensusMaps()
         for map_ in maps:
-            mapper.annotate(map_, peptide_ids, protein_ids, use_subelements)
-            addDataProcessing(map_, params, pms.ProcessingAction.IDENTIFICATION_MAPPING)
+            annotate_map(map_, peptide_ids, protein_ids, params,
+                    use_centroid_rt, use_centroid_mz, use_subelements)
         msq.setConsensusMaps(maps)
         file_.store(out_file, msq)
 
@@ -124,6 +139,8 @@ def main():
     parser.add_argument("-consensusfeature:use_subelements",
                         action="store_true")
 
+    addCacheArguments(parser)
+
     args = parser.parse_args()
 
 
@@ -158,11 +175,16 @@ def main():
         consenususfeature_use_subelements = getattr(args,
                 "consensusfeature:use_subelements")
 
-        id_mapper(args.in_, args.id_, args.out, defaults,
-                feature_use_centroid_rt,
-                feature_use_centroid_mz,
-                consenususfeature_use_subelements
-                )
+        def run():
+            id_mapper(args.in_, args.id_, args.out, defaults,
+                    feature_use_centroid_rt,
+                    feature_use_centroid_mz,
+                    consenususfeature_use_subelements
+                    )
+
+        runCached(args, "IDMapper", [args.in_, args.id_], [args.out], defaults,
+                  run, extra=[feature_use_centroid_rt, feature_use_centroid_mz,
+                              consenususfeature_use_subelements])
 
 
 
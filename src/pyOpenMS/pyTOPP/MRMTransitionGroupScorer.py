@@ -83,9 +83,8 @@ def main(options):
     chromatograms = pyopenms.MSExperiment()
     fh = pyopenms.FileHandler()
     fh.loadExperiment(chromat_in, chromatograms)
-    targeted = pyopenms.TargetedExperiment();
-    tramlfile = pyopenms.TraMLFile();
-    tramlfile.load(traml_in, targeted);
+    # parses the TraML file only if its binary cache is missing or outdated
+    light_targeted = pyopenms.loadLightTargetedExperiment(traml_in)
 
     trafoxml = pyopenms.TransformationXMLFile()
     trafo = pyopenms.TransformationDescription()
@@ -97,8 +96,6 @@ def main(options):
         trafo.fitModel(model_type, model_params);
 
 
-    light_targeted = pyopenms.LightTargetedExperiment();
-    pyopenms.OpenSwathDataAccessHelper().convertTargetedExp(targeted, light_targeted)
     output = algorithm(chromatograms, light_targeted, pp, scorer, trafo)
 
     pyopenms.FeatureXMLFile().store(out, output);
@@ -1,6 +1,7 @@
 import argparse
 import pyopenms as pms
-from common import addDataProcessing, writeParamsIfRequested, updateDefaults
+from common import addDataProcessing, writeParamsIfRequested, updateDefaults, \
+        addCacheArguments, runCached
 
 
 def align(in_files, out_files, out_trafos, reference_index,
@@ -15,11 +16,6 @@ def align(in_files, out_files, out_trafos, reference_index,
     else:
         raise Exception("different kinds of input files")
 
-    algorithm = pms.MapAlignmentAlgorithmPoseClustering()
-    alignment_params = params.copy("algorithm:", True)
-    algorithm.setParameters(alignment_params)
-    algorithm.setLogType(pms.LogType.CMD)
-
     plog = pms.ProgressLogger()
     plog.setLogType(pms.LogType.CMD)
 
@@ -54,6 +50,7 @@ def align(in_files, out_files, out_trafos, reference_index,
         options.setLoadSubordinates(False)
         f_fmxl.setOptions(options)
 
+    algorithm = create_algorithm(params)
     if align_features:
         map_ref = pms.FeatureMap()
         f_fxml_tmp = pms.FeatureXMLFile()
@@ -68,32 +65,22 @@ def align(in_files, out_files, out_trafos, reference_index,
         pms.MzMLFile().load(file_, map_ref)
         algorithm.setReference(map_ref)
 
+    # only one map is held in memory at a time, see align_maps for maps
+    # which are already loaded
     plog.startProgress(0, len(in_files), "Align input maps")
     for i, in_file in enumerate(in_files):
-        trafo = pms.TransformationDescription()
         if align_features:
             map_ = pms.FeatureMap()
-            f_fxml_tmp = pms.FeatureXMLFile()
-            f_fxml_tmp.setOptions(f_fmxl.getOptions())
-            f_fxml_tmp.load(in_file, map_)
-            if in_file == file_:
-                trafo.fitModel("identity")
-            else:
-                algorithm.align(map_, trafo)
-            if out_files:
-                pms.MapAlignmentTransformer.transformRetentionTimes(map_, trafo)
-                addDataProcessing(map_, params, pms.ProcessingAction.ALIGNMENT)
-                f_fxml_tmp.store(out_files[i], map_)
+            f_fmxl.load(in_file, map_)
         else:
             map_ = pms.MSExperiment()
             pms.MzMLFile().load(in_file, map_)
-            if in_file == file_:
-                trafo.fitModel("identity")
+        trafo = align_map(algorithm, map_, in_file == file_, params,
+                          transform=bool(out_files))
+        if out_files:
+            if align_features:
+                f_fmxl.store(out_files[i], map_)
             else:
-                algorithm.align(map_, trafo)
-            if out_files:
-                pms.MapAlignmentTransformer.transformRetentionTimes(map_, trafo)
-                addDataProcessing(map_, params, pms.ProcessingAction.ALIGNMENT)
                 pms.MzMLFile().store(out_files[i], map_)
         if out_trafos:
             pms.TransformationXMLFile().store(out_trafos[i], trafo)
@@ -104,6 +91,55 @@ def align(in_files, out_files, out_trafos, reference_index,
 
 
 
+def create_algorithm(params):
+    algorithm = pms.MapAlignmentAlgorithmPoseClustering()
+    alignment_params = params.copy("algorithm:", True)
+    algorithm.setParameters(alignment_params)
+    algorithm.setLogType(pms.LogType.CMD)
+    return algorithm
+
+
+
+def align_map(algorithm, map_, is_reference, params, transform=True):
+    """
+    Aligns a single map to the reference of algorithm
+
+    Returns the TransformationDescription of the map. If transform is True,
+    the retention times of the map are transformed in place and the
+    alignment is recorded in its data processing information.
+    """
+
+    trafo = pms.TransformationDescription()
+    if is_reference:
+        trafo.fitModel("identity")
+    else:
+        algorithm.align(map_, trafo)
+    if transform:
+        pms.MapAlignmentTransformer.transformRetentionTimes(map_, trafo)
+        processed = addDataProcessing(map_, params, pms.ProcessingAction.ALIGNMENT)
+        if isinstance(map_, pms.MSExperiment):
+            # for an MSExperiment, addDataProcessing returns new spectra
+            # and leaves the map itself unchanged
+            map_.setSpectra(processed.getSpectra())
+    return trafo
+
+
+
+def align_maps(maps, reference_index, params, transform=True):
+    """
+    Aligns FeatureMaps or MSExperiments which are already in memory
+
+    Uses maps[reference_index] as reference and returns one
+    TransformationDescription per map, see align_map.
+    """
+
+    algorithm = create_algorithm(params)
+    algorithm.setReference(maps[reference_index])
+    return [align_map(algorithm, map_, i == reference_index, params, transform)
+            for i, map_ in enumerate(maps)]
+
+
+
 def getModelDefaults(default_model):
     params = pms.Param()
     params.setValue("type", default_model, "Type of model")
@@ -202,6 +238,8 @@ def main():
                         dest="reference_index",
                         )
 
+    addCacheArguments(parser)
+
     args = parser.parse_args()
 
     def collect(args):
@@ -246,8 +284,16 @@ def main():
                 parser.error("reference_file not in input files")
 
 
-        align(in_files, out_files, trafo_out_files, args.reference_index or 0,
-                args.reference_file or "", defaults)
+        def run():
+            align(in_files, out_files, trafo_out_files, args.reference_index or 0,
+                    args.reference_file or "", defaults)
+
+        # the reference is identified by its position, not by its file name
+        reference = in_files.index(args.reference_file) \
+                if args.reference_file else args.reference_index
+        runCached(args, "MapAlignerPoseClustering", in_files,
+                  out_files + trafo_out_files, defaults, run,
+                  extra=[reference, len(out_files), len(trafo_out_files)])
 
 
 
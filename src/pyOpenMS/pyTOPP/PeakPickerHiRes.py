@@ -1,10 +1,11 @@
 import argparse
 import pyopenms as pms
 import logging
-from common import addDataProcessing, writeParamsIfRequested, updateDefaults
+from common import addDataProcessing, writeParamsIfRequested, updateDefaults, \
+        addCacheArguments, runCached
 
 
-def run_peak_picker(input_map, params, out_path):
+def pick_peaks(input_map, params):
 
     spec0 = input_map[0]
     if pms.PeakTypeEstimator().estimateType(spec0) == \
@@ -17,9 +18,14 @@ def run_peak_picker(input_map, params, out_path):
     pp = pms.PeakPickerHiRes()
     pp.setParameters(params)
     out_map = pms.MSExperiment()
-    pp.pickExperiment(input_map, out_map)
+    pp.pickExperimentParallel(input_map, out_map)
+
+    return addDataProcessing(out_map, params, pms.ProcessingAction.PEAK_PICKING)
 
-    out_map = addDataProcessing(out_map, params, pms.ProcessingAction.PEAK_PICKING)
+
+def run_peak_picker(input_map, params, out_path):
+
+    out_map = pick_peaks(input_map, params)
     fh = pms.FileHandler()
     fh.storeExperiment(out_path, out_map)
 
@@ -64,6 +70,8 @@ def main():
                         metavar="python_dict_ini_file",
                         )
 
+    addCacheArguments(parser)
+
     args = parser.parse_args()
 
     run_mode = args.in_ is not None and args.out is not None\
@@ -82,12 +90,15 @@ def main():
     if not write_requested:
         updateDefaults(args, defaults)
 
-        fh = pms.MzMLFile()
-        fh.setLogType(pms.LogType.CMD)
-        input_map = pms.MSExperiment()
-        fh.load(args.in_, input_map)
+        def run():
+            fh = pms.MzMLFile()
+            fh.setLogType(pms.LogType.CMD)
+            input_map = pms.MSExperiment()
+            fh.load(args.in_, input_map)
+
+            run_peak_picker(input_map, defaults, args.out)
 
-        run_peak_picker(input_map, defaults, args.out)
+        runCached(args, "PeakPickerHiRes", [args.in_], [args.out], defaults, run)
 
 if __name__ == "__main__":
     main()
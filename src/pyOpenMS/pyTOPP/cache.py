@@ -0,0 +1,247 @@
+"""
+Content-addressed result cache for the pyTOPP tools.
+
+A result is identified by the tool name, the digests of all input files, the
+canonicalised parameters (Param.asDict()) and any additional tool options.
+On a cache hit the stored output files are copied to the requested output
+paths instead of running the algorithm again. The cache is limited in size;
+the least recently used entries are evicted first.
+
+Layout of the cache directory:
+
+    entries/<key>/<n>      stored output files (n = position of the output)
+    digests.json           memoised input digests by (path, size, mtime)
+    stats.json             accumulated hit / miss counts
+    .<name>.lock           locks for updating the json files
+
+Several tool runs may use the same cache directory concurrently.
+"""
+from __future__ import print_function
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
+
+
+def _canonical(value):
+    # Python 2/3 and bytes/str independent representation of parameter values
+    if isinstance(value, bytes):
+        return value.decode("UTF-8")
+    if isinstance(value, dict):
+        return sorted((_canonical(k), _canonical(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def fileDigest(path, chunk_size=1 << 20):
+    """Returns the SHA-1 digest of the content of a file"""
+    h = hashlib.sha1()
+    with open(path, "rb") as fp:
+        chunk = fp.read(chunk_size)
+        while chunk:
+            h.update(chunk)
+            chunk = fp.read(chunk_size)
+    return h.hexdigest()
+
+
+@contextlib.contextmanager
+def fileLock(path):
+    """Holds an exclusive lock on the file at path (created if necessary)"""
+    with open(path, "a") as fp:
+        if fcntl is not None:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+        else:
+            fp.seek(0)
+            msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+            else:
+                fp.seek(0)
+                msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class ResultCache(object):
+    """
+    Stores and retrieves tool results keyed on tool, inputs and parameters
+
+    max_size is the size limit of all stored outputs in bytes (None for no
+    limit).
+    """
+
+    def __init__(self, directory, max_size=None):
+        self.directory = directory
+        self.max_size = max_size
+        self.entries = os.path.join(directory, "entries")
+        if not os.path.isdir(self.entries):
+            os.makedirs(self.entries)
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, tool, in_files, params, extra=None):
+        """Computes the cache key for a tool invocation"""
+        description = {
+            "tool": tool,
+            "inputs": [self._digest(f) for f in in_files],
+            "params": _canonical(params.asDict()),
+            "extra": _canonical(extra),
+        }
+        text = json.dumps(description, sort_keys=True)
+        return hashlib.sha1(text.encode("UTF-8")).hexdigest()
+
+    def fetch(self, key, out_files):
+        """
+        Materialises a cached result at out_files
+
+        Returns True on a hit and False (without touching out_files) on a miss.
+        """
+        entry = os.path.join(self.entries, key)
+        stored = [os.path.join(entry, str(i)) for i in range(len(out_files))]
+        if not all(os.path.isfile(f) for f in stored):
+            self._count(misses=1)
+            return False
+
+        # the entry may be evicted by another tool run while it is copied, so
+        # the outputs are only moved into place once all copies succeeded
+        copies = []
+        try:
+            for src, dest in zip(stored, out_files):
+                fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(dest)), prefix=".tmp_")
+                os.close(fd)
+                copies.append(tmp)
+                shutil.copyfile(src, tmp)
+        except (IOError, OSError):
+            for tmp in copies:
+                os.remove(tmp)
+            self._count(misses=1)
+            return False
+        for tmp, dest in zip(copies, out_files):
+            shutil.move(tmp, dest)
+        try:
+            # record the access for LRU eviction
+            os.utime(entry, None)
+        except OSError:
+            pass
+        self._count(hits=1)
+        return True
+
+    def store(self, key, out_files):
+        """Adds the output files of a finished tool run to the cache"""
+        entry = os.path.join(self.entries, key)
+        if os.path.isdir(entry):
+            os.utime(entry, None)
+            return
+
+        # write to a temporary directory first, so that concurrent tool runs
+        # never see partially written entries
+        tmp = tempfile.mkdtemp(dir=self.entries, prefix=".tmp_")
+        try:
+            for i, out_file in enumerate(out_files):
+                shutil.copyfile(out_file, os.path.join(tmp, str(i)))
+            os.rename(tmp, entry)
+        except OSError:
+            # another process stored the same entry in the meantime
+            shutil.rmtree(tmp, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+        self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until the size limit holds"""
+        if self.max_size is None:
+            return
+        entries = []
+        total = 0
+        for name in os.listdir(self.entries):
+            if name.startswith("."):
+                continue
+            path = os.path.join(self.entries, name)
+            try:
+                size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+                mtime = os.path.getmtime(path)
+            except OSError:
+                # evicted by another tool run in the meantime
+                continue
+            entries.append((mtime, size, path))
+            total += size
+
+        entries.sort()
+        while entries and total > self.max_size:
+            __, size, path = entries.pop(0)
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def size(self):
+        """Returns the total size of all stored outputs in bytes"""
+        total = 0
+        for root, __, files in os.walk(self.entries):
+            total += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+        return total
+
+    def report(self):
+        """Returns a hit / miss report for this session and for the cache overall"""
+        stats = self._load("stats.json", {"hits": 0, "misses": 0})
+        lines = [
+            "Result cache %s (%.1f MB)" % (self.directory, self.size() / 1024.0 / 1024.0),
+            "  this run : %d hit(s), %d miss(es)" % (self.hits, self.misses),
+            "  overall  : %d hit(s), %d miss(es)" % (stats["hits"], stats["misses"]),
+        ]
+        return "\n".join(lines)
+
+    def _count(self, hits=0, misses=0):
+        self.hits += hits
+        self.misses += misses
+        # read-modify-write, other tool runs may update the counts as well
+        with self._lock("stats.json"):
+            stats = self._load("stats.json", {"hits": 0, "misses": 0})
+            stats["hits"] += hits
+            stats["misses"] += misses
+            self._save("stats.json", stats)
+
+    def _digest(self, path):
+        # hashing large inputs is expensive, so digests are memoised for
+        # files which did not change (same size and modification time)
+        st = os.stat(path)
+        memo_key = "%s:%d:%r" % (os.path.abspath(path), st.st_size, st.st_mtime)
+        digest = self._load("digests.json", {}).get(memo_key)
+        if digest is None:
+            digest = fileDigest(path)
+            # reload under the lock, so that digests added by other tool
+            # runs in the meantime are kept
+            with self._lock("digests.json"):
+                digests = self._load("digests.json", {})
+                digests[memo_key] = digest
+                self._save("digests.json", digests)
+        return digest
+
+    def _lock(self, name):
+        return fileLock(os.path.join(self.directory, ".%s.lock" % name))
+
+    def _load(self, name, default):
+        try:
+            with open(os.path.join(self.directory, name)) as fp:
+                return json.load(fp)
+        except (IOError, OSError, ValueError):
+            return default
+
+    def _save(self, name, data):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp_")
+        with os.fdopen(fd, "w") as fp:
+            json.dump(data, fp)
+        target = os.path.join(self.directory, name)
+        if os.name == "nt" and os.path.exists(target):
+            # os.rename does not replace existing files on Windows
+            os.remove(target)
+        os.rename(tmp, target)
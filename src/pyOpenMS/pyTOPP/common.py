@@ -1,3 +1,4 @@
+from __future__ import print_function
 import sys
 import os.path
 import pyopenms as pms
@@ -54,3 +55,48 @@ def updateDefaults(args, defaults):
             except:
                 raise Exception("could not parse %s" % args.dict_ini)
         defaults.update(dd)
+
+def addCacheArguments(parser):
+    parser.add_argument("-cache_dir",
+                        action="store",
+                        type=str,
+                        metavar="directory",
+                        help="reuse results of earlier runs with identical "
+                             "inputs and parameters (opt-in)",
+                        )
+
+    parser.add_argument("-cache_size",
+                        action="store",
+                        type=float,
+                        default=10240.0,
+                        metavar="MB",
+                        help="size limit of the result cache, least recently "
+                             "used results are evicted first",
+                        )
+
+    parser.add_argument("-cache_report",
+                        action="store_true",
+                        help="print cache hits and misses",
+                        )
+
+def runCached(args, tool, in_files, out_files, params, run, extra=None):
+    """Calls run() unless the result cache holds outputs for the same inputs
+
+    Without -cache_dir, run() is always called. Otherwise the cache key is
+    computed from the tool name, the digests of in_files, the parameters,
+    the output formats and extra (additional options that influence the
+    result); on a hit the cached outputs are copied to out_files.
+    """
+    if not args.cache_dir:
+        run()
+        return
+
+    from cache import ResultCache
+    cache = ResultCache(args.cache_dir, int(args.cache_size * 1024 * 1024))
+    formats = [os.path.splitext(f)[1].lower() for f in out_files]
+    key = cache.key(tool, in_files, params, [formats, extra])
+    if not cache.fetch(key, out_files):
+        run()
+        cache.store(key, out_files)
+    if args.cache_report:
+        print(cache.report())
@@ -0,0 +1,301 @@
+"""
+In-process runner for chaining pyTOPP tools.
+
+The pyTOPP scripts read their input from disk and write their results back,
+so chaining them re-serialises mzML / featureXML at every step. A Pipeline
+calls the core functions of the scripts directly instead and hands the
+MSExperiment / FeatureMap / ConsensusMap objects from one stage to the next
+in memory. Per-file stages run for one input file after the other, joint
+stages run once on the results of all files. Only checkpoints which were
+explicitly requested are written to disk.
+
+Calling this script runs the standard label-free workflow
+
+    PeakPickerHiRes -> FeatureFinderCentroided -> IDMapper
+        -> MapAlignerPoseClustering -> FeatureLinkerUnlabeledQT
+"""
+import argparse
+import os.path
+
+import pyopenms as pms
+from common import writeParamsIfRequested, updateDefaults
+from PeakPickerHiRes import pick_peaks
+from FeatureFinderCentroided import find_features
+from IDMapper import annotate_map
+from MapAlignerPoseClustering import align_maps, getDefaultParameters as getAlignerDefaults
+from FeatureLinkerUnlabeledQT import link_maps, print_summary
+
+
+def store(path, obj):
+    """Stores an MSExperiment, FeatureMap or ConsensusMap"""
+    if isinstance(obj, pms.MSExperiment):
+        pms.MzMLFile().store(path, obj)
+    elif isinstance(obj, pms.FeatureMap):
+        pms.FeatureXMLFile().store(path, obj)
+    elif isinstance(obj, pms.ConsensusMap):
+        pms.ConsensusXMLFile().store(path, obj)
+    else:
+        raise Exception("can not store objects of type %s" % type(obj).__name__)
+
+
+_extensions = {
+    pms.MSExperiment: "mzML",
+    pms.FeatureMap: "featureXML",
+    pms.ConsensusMap: "consensusXML",
+}
+
+
+class Pipeline(object):
+    """
+    Chain of pipeline stages operating on in-memory objects
+
+    A per-file stage is called as func(obj, index) for each input
+    separately and returns the object for the next stage. A joint stage is
+    called as func(objs) with the list of results of all inputs and returns
+    either a list (again one object per input) or a single object.
+
+    All stages run in the calling thread. The wrapped pyopenms methods (e.g.
+    MzMLFile.load, PeakPickerHiRes.pickExperiment) hold the GIL, so running
+    the inputs on several Python threads would not make them faster.
+    """
+
+    def __init__(self):
+        self.stages = []
+
+    def addPerFileStage(self, name, func):
+        self.stages.append((name, func, True))
+        return self
+
+    def addJointStage(self, name, func):
+        self.stages.append((name, func, False))
+        return self
+
+    def stageNames(self):
+        return [name for name, __, __ in self.stages]
+
+    def run(self, inputs, checkpoints=(), checkpoint_dir="."):
+        """
+        Runs all stages on the list of inputs and returns the final result
+
+        For every stage name in checkpoints, the intermediate result(s) of
+        this stage are written to checkpoint_dir.
+        """
+
+        unknown = set(checkpoints) - set(self.stageNames())
+        if unknown:
+            raise Exception("unknown checkpoint stage(s): %s" % ", ".join(sorted(unknown)))
+
+        names = [os.path.splitext(os.path.basename(str(in_)))[0] for in_ in inputs]
+        objs = list(inputs)
+
+        i = 0
+        while i < len(self.stages):
+            name, func, per_file = self.stages[i]
+            if per_file:
+                # run all consecutive per-file stages for one input before
+                # the next one, so that its intermediate results can be freed
+                chain = []
+                while i < len(self.stages) and self.stages[i][2]:
+                    chain.append(self.stages[i])
+                    i += 1
+                objs = self._runPerFile(chain, objs, names, checkpoints, checkpoint_dir)
+            else:
+                objs = func(objs)
+                i += 1
+                if name in checkpoints:
+                    self._checkpoint(name, objs, names, checkpoint_dir)
+        return objs
+
+    def _runPerFile(self, chain, objs, names, checkpoints, checkpoint_dir):
+
+        results = []
+        for index, obj in enumerate(objs):
+            for name, func, __ in chain:
+                obj = func(obj, index)
+                if name in checkpoints:
+                    self._store(name, obj, names[index], checkpoint_dir)
+            results.append(obj)
+        return results
+
+    def _checkpoint(self, name, objs, names, checkpoint_dir):
+        if isinstance(objs, list):
+            for obj, basename in zip(objs, names):
+                self._store(name, obj, basename, checkpoint_dir)
+        else:
+            self._store(name, objs, "pipeline", checkpoint_dir)
+
+    def _store(self, name, obj, basename, checkpoint_dir):
+        ext = _extensions.get(type(obj))
+        if ext is None:
+            raise Exception("can not write checkpoint for %s" % type(obj).__name__)
+        store(os.path.join(checkpoint_dir, "%s.%s.%s" % (basename, name, ext)), obj)
+
+
+def getDefaultParameters():
+    name = pms.FeatureFinderAlgorithmPicked.getProductName()
+    default = pms.Param()
+    default.insert("PeakPickerHiRes:", pms.PeakPickerHiRes().getDefaults())
+    default.insert("FeatureFinderCentroided:", pms.FeatureFinder().getParameters(name))
+    default.insert("IDMapper:", pms.IDMapper().getParameters())
+    default.insert("MapAlignerPoseClustering:", getAlignerDefaults())
+    default.insert("FeatureLinkerUnlabeledQT:", pms.FeatureGroupingAlgorithmQT().getParameters())
+    return default
+
+
+def createLabelFreePipeline(params, id_files, in_files):
+    """
+    Creates the label-free pipeline for a list of profile mzML input files
+
+    id_files (may be empty) holds one idXML file per input file. The final
+    result of the pipeline is a ConsensusMap.
+    """
+
+    pp_params = params.copy("PeakPickerHiRes:", True)
+    ff_params = params.copy("FeatureFinderCentroided:", True)
+    id_params = params.copy("IDMapper:", True)
+    ma_params = params.copy("MapAlignerPoseClustering:", True)
+    fl_params = params.copy("FeatureLinkerUnlabeledQT:", True)
+
+    def load(path, index):
+        fh = pms.MzMLFile()
+        fh.setLogType(pms.LogType.CMD)
+        input_map = pms.MSExperiment()
+        fh.load(path, input_map)
+        return input_map
+
+    def pick(input_map, index):
+        return pick_peaks(input_map, pp_params)
+
+    def features(picked_map, index):
+        ms1_map = pms.MSExperiment()
+        for spec in picked_map:
+            if spec.getMSLevel() == 1:
+                ms1_map.addSpectrum(spec)
+        ms1_map.updateRanges()
+        return find_features(ms1_map, ff_params, pms.FeatureMap())
+
+    def annotate(feature_map, index):
+        protein_ids = []
+        peptide_ids = []
+        pms.IdXMLFile().load(id_files[index], protein_ids, peptide_ids)
+        return annotate_map(feature_map, peptide_ids, protein_ids, id_params,
+                            False, False, False)
+
+    def align(feature_maps):
+        # use the largest map as reference (as MapAlignerPoseClustering does)
+        __, reference_index = max((m.size(), i) for i, m in enumerate(feature_maps))
+        align_maps(feature_maps, reference_index, ma_params)
+        return feature_maps
+
+    def link(feature_maps):
+        return link_maps(feature_maps, in_files, False, fl_params)
+
+    pipeline = Pipeline()
+    pipeline.addPerFileStage("load", load)
+    pipeline.addPerFileStage("picked", pick)
+    pipeline.addPerFileStage("features", features)
+    if id_files:
+        pipeline.addPerFileStage("annotated", annotate)
+    pipeline.addJointStage("aligned", align)
+    pipeline.addJointStage("linked", link)
+    return pipeline
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Label-free pipeline")
+    parser.add_argument("-in",
+                        action="append",
+                        type=str,
+                        dest="in_",
+                        metavar="input_files",
+                        )
+
+    parser.add_argument("-id",
+                        action="append",
+                        type=str,
+                        dest="id_",
+                        metavar="id_files",
+                        )
+
+    parser.add_argument("-out",
+                        action="store",
+                        type=str,
+                        metavar="output_file",
+                        )
+
+    parser.add_argument("-checkpoint",
+                        action="append",
+                        type=str,
+                        metavar="stage",
+                        help="also store the intermediate results of this "
+                             "stage (picked, features, annotated, aligned)",
+                        )
+
+    parser.add_argument("-checkpoint_dir",
+                        action="store",
+                        type=str,
+                        default=".",
+                        metavar="directory",
+                        )
+
+    parser.add_argument("-ini",
+                        action="store",
+                        type=str,
+                        metavar="ini_file",
+                        )
+
+    parser.add_argument("-dict_ini",
+                        action="store",
+                        type=str,
+                        metavar="python_dict_ini_file",
+                        )
+
+    parser.add_argument("-write_ini",
+                        action="store",
+                        type=str,
+                        metavar="ini_file",
+                        )
+
+    parser.add_argument("-write_dict_ini",
+                        action="store",
+                        type=str,
+                        metavar="python_dict_ini_file",
+                        )
+
+    args = parser.parse_args()
+
+    def collect(args):
+        return [f.strip() for arg in args or [] for f in arg.split(",")]
+
+    in_files = collect(args.in_)
+    id_files = collect(args.id_)
+    checkpoints = collect(args.checkpoint)
+
+    run_mode = (in_files and args.out) \
+                and (args.ini is not None or args.dict_ini is not None)
+
+    write_mode = args.write_ini is not None or args.write_dict_ini is not None
+    ok = run_mode or write_mode
+    if not ok:
+        parser.error("either specify -in, -out and -(dict)ini for running "
+                     "the pipeline\nor -write(dict)ini for creating std "
+                     "ini file")
+
+    defaults = getDefaultParameters()
+    write_requested = writeParamsIfRequested(args, defaults)
+
+    if not write_requested:
+        updateDefaults(args, defaults)
+
+        if id_files and len(id_files) != len(in_files):
+            parser.error("need as many -id files as -in files")
+
+        pipeline = createLabelFreePipeline(defaults, id_files, in_files)
+        out_map = pipeline.run(in_files, checkpoints, args.checkpoint_dir)
+        store(args.out, out_map)
+        print_summary(out_map)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,15 @@ if sys.platform.startswith("linux"):
 try:
     from .all_modules import *
     from .python_extras import *
+    from .columnar import *
+    from .cached_views import *
+    from .prefetch import *
+    from .sqmass import *
+    from .fasta_index import *
+    from .transition_cache import *
+    from .peptide_index import *
+    from .sequence_cache import *
+    from .filter_chain import *
 except Exception as e:
     print("\n")
     print("="*70)
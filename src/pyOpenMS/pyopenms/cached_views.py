@@ -0,0 +1,113 @@
+"""
+Zero-copy NumPy access to the data of cached mzML files.
+
+CachedmzML.getSpectrum() reads a spectrum from the .mzML.cached file and
+converts it to an MSSpectrum, so getting its peaks as NumPy arrays copies the
+data twice. CachedmzMLViews maps the cached data file into memory once and
+returns read-only NumPy views on the m/z and intensity blocks of a spectrum
+(or the retention time and intensity blocks of a chromatogram) directly, the
+data is paged in from disk by the operating system on access.
+
+Layout of a spectrum record in the cached data file (native byte order):
+
+    size_t  number of peaks (n)
+    size_t  number of extra data arrays
+    int     ms level
+    double  retention time
+    double  m/z values (n)
+    double  intensities (n)
+    ...     extra data arrays
+
+Chromatogram records are identical except for the ms level and retention time
+fields.
+"""
+from __future__ import absolute_import
+import mmap
+
+import numpy as np
+
+from .all_modules import CachedmzML
+
+__all__ = ["CachedmzMLViews"]
+
+_SIZE_DTYPE = np.dtype(np.uintp)
+_DATA_DTYPE = np.dtype(np.float64)
+_SPECTRUM_HEADER = 2 * _SIZE_DTYPE.itemsize + np.dtype(np.intc).itemsize + _DATA_DTYPE.itemsize
+_CHROMATOGRAM_HEADER = 2 * _SIZE_DTYPE.itemsize
+
+
+class CachedmzMLViews(object):
+    """
+    Read-only, memory-mapped NumPy views on a cached mzML file
+
+    cached is either a loaded CachedmzML object (whose index is reused) or
+    the path to the mzML file written by CachedmzML.store (the adjacent
+    .mzML.cached file holds the data).
+
+    The returned arrays are views on the mapping, no peak data is copied.
+    They stay valid as long as they are referenced, even after this object
+    was deleted.
+
+    Attributes:
+        cached: the CachedmzML object (meta data of spectra and chromatograms)
+        spectra_sizes, chromatogram_sizes: number of data points of each
+            spectrum / chromatogram
+    """
+
+    def __init__(self, cached):
+        if not isinstance(cached, CachedmzML):
+            filename = cached
+            cached = CachedmzML()
+            CachedmzML.load(filename, cached)
+        self.cached = cached
+
+        with open(cached.getCachedFilename(), "rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._bytes = np.frombuffer(self._map, dtype=np.uint8)
+
+        self._spectra_offsets = cached.getSpectraOffsets()
+        self._chromatogram_offsets = cached.getChromatogramOffsets()
+        self.spectra_sizes = self._readSizes(self._spectra_offsets)
+        self.chromatogram_sizes = self._readSizes(self._chromatogram_offsets)
+
+    def _readSizes(self, offsets):
+        # gather the leading size_t of all records at once
+        positions = offsets[:, np.newaxis] + np.arange(_SIZE_DTYPE.itemsize)
+        raw = np.ascontiguousarray(self._bytes[positions])
+        return raw.view(_SIZE_DTYPE).ravel().astype(np.int64)
+
+    def _views(self, start, n):
+        first = np.frombuffer(self._map, dtype=_DATA_DTYPE, count=n, offset=start)
+        second = np.frombuffer(self._map, dtype=_DATA_DTYPE, count=n,
+                               offset=start + n * _DATA_DTYPE.itemsize)
+        return first, second
+
+    def getNrSpectra(self):
+        return len(self._spectra_offsets)
+
+    def getNrChromatograms(self):
+        return len(self._chromatogram_offsets)
+
+    def getSpectrumPeaks(self, index):
+        """Returns (mz, intensity) of spectrum index as read-only float64 views"""
+        start = int(self._spectra_offsets[index]) + _SPECTRUM_HEADER
+        return self._views(start, int(self.spectra_sizes[index]))
+
+    def getSpectraPeaks(self, indices):
+        """Returns a list of (mz, intensity) views for all spectra in indices"""
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self._spectra_offsets[indices] + _SPECTRUM_HEADER
+        sizes = self.spectra_sizes[indices]
+        return [self._views(start, n) for start, n in zip(starts.tolist(), sizes.tolist())]
+
+    def getChromatogramPeaks(self, index):
+        """Returns (rt, intensity) of chromatogram index as read-only float64 views"""
+        start = int(self._chromatogram_offsets[index]) + _CHROMATOGRAM_HEADER
+        return self._views(start, int(self.chromatogram_sizes[index]))
+
+    def getChromatogramsPeaks(self, indices):
+        """Returns a list of (rt, intensity) views for all chromatograms in indices"""
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self._chromatogram_offsets[indices] + _CHROMATOGRAM_HEADER
+        sizes = self.chromatogram_sizes[indices]
+        return [self._views(start, n) for start, n in zip(starts.tolist(), sizes.tolist())]
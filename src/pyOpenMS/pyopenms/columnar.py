@@ -0,0 +1,193 @@
+"""
+Memory-mappable columnar storage of peak maps.
+
+A columnar peak map is a directory of NumPy (.npy) files:
+
+    mz.npy           float64, m/z of all peaks of all spectra (concatenated)
+    intensity.npy    float32, intensity of all peaks (same order as mz.npy)
+    offsets.npy      int64, spectrum i has peaks offsets[i]:offsets[i+1]
+    spectra.npy      structured array with one row per spectrum (rt, ms_level,
+                     precursor_mz, precursor_charge)
+    native_ids.npy   fixed-width bytes, native ID of each spectrum
+
+Writing streams the input (mzML files are never loaded completely) and
+reading maps the files with mmap, so opening even very large runs only
+parses the .npy headers, the peaks are paged in on access and the page
+cache is shared between processes. Chromatograms are not stored.
+"""
+from __future__ import absolute_import
+import os
+import struct
+
+import numpy as np
+
+from .all_modules import MSExperiment, MSSpectrum, MzMLFile
+
+__all__ = ["ColumnarExperiment", "storeColumnar"]
+
+_HEADER_SIZE = 128
+
+SPECTRUM_DTYPE = np.dtype([
+    ("rt", "<f8"),
+    ("ms_level", "<u2"),
+    ("precursor_mz", "<f8"),
+    ("precursor_charge", "<i4"),
+])
+
+
+def _npyHeader(dtype, length):
+    # .npy format version 1.0 with a header padded to a fixed size, so it can
+    # be written before the number of elements is known and rewritten at the
+    # end (the data always starts at offset _HEADER_SIZE)
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (
+        np.lib.format.dtype_to_descr(np.dtype(dtype)), length)
+    header = header.ljust(_HEADER_SIZE - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+class _ColumnWriter(object):
+
+    def __init__(self, path, dtype):
+        self.dtype = np.dtype(dtype)
+        self.length = 0
+        self.fp = open(path, "wb")
+        self.fp.write(_npyHeader(self.dtype, 0))
+
+    def append(self, values):
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        values.tofile(self.fp)
+        self.length += len(values)
+
+    def close(self):
+        self.fp.seek(0)
+        self.fp.write(_npyHeader(self.dtype, self.length))
+        self.fp.close()
+
+
+class _ColumnarConsumer(object):
+    # MSDataConsumer interface (see MzMLFile.transform)
+
+    def __init__(self, directory):
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.mz = _ColumnWriter(os.path.join(directory, "mz.npy"), "<f8")
+        self.intensity = _ColumnWriter(os.path.join(directory, "intensity.npy"), "<f4")
+        self.offsets = [0]
+        self.spectra = []
+        self.native_ids = []
+
+    def setExpectedSize(self, num_specs, num_chromo):
+        pass
+
+    def setExperimentalSettings(self, exp):
+        pass
+
+    def consumeChromatogram(self, chromo):
+        pass
+
+    def consumeSpectrum(self, spec):
+        mz, intensity = spec.get_peaks()
+        self.mz.append(mz)
+        self.intensity.append(intensity)
+        self.offsets.append(self.offsets[-1] + len(mz))
+
+        precursor_mz, precursor_charge = 0.0, 0
+        precursors = spec.getPrecursors()
+        if precursors:
+            precursor_mz = precursors[0].getMZ()
+            precursor_charge = precursors[0].getCharge()
+        self.spectra.append((spec.getRT(), spec.getMSLevel(), precursor_mz,
+                             precursor_charge))
+        native_id = spec.getNativeID()
+        if not isinstance(native_id, bytes):
+            native_id = native_id.encode("UTF-8")
+        self.native_ids.append(native_id)
+
+    def close(self):
+        self.mz.close()
+        self.intensity.close()
+        j = os.path.join
+        np.save(j(self.directory, "offsets.npy"), np.array(self.offsets, dtype="<i8"))
+        np.save(j(self.directory, "spectra.npy"), np.array(self.spectra, dtype=SPECTRUM_DTYPE))
+        np.save(j(self.directory, "native_ids.npy"), np.array(self.native_ids, dtype=bytes))
+
+
+def storeColumnar(source, directory):
+    """
+    Stores a peak map in columnar format in directory
+
+    source is either an MSExperiment or the path to an mzML file (which is
+    streamed and never loaded into memory completely).
+    """
+    consumer = _ColumnarConsumer(directory)
+    try:
+        if isinstance(source, MSExperiment):
+            for spec in source:
+                consumer.consumeSpectrum(spec)
+        else:
+            if not isinstance(source, bytes):
+                source = source.encode()
+            MzMLFile().transform(source, consumer)
+    finally:
+        consumer.close()
+
+
+class ColumnarExperiment(object):
+    """
+    Read-only, memory-mapped view on a peak map stored with storeColumnar
+
+    All arrays are numpy.memmap instances (or views on them), nothing is
+    copied when opening the map or accessing the peaks of a spectrum.
+
+    Attributes:
+        mz, intensity: peaks of all spectra
+        offsets: peak offsets of each spectrum (size() + 1 entries)
+        rt, ms_level, precursor_mz, precursor_charge: per-spectrum metadata
+        native_ids: native ID of each spectrum (bytes)
+    """
+
+    def __init__(self, directory):
+        j = os.path.join
+        self.directory = directory
+        self.mz = np.load(j(directory, "mz.npy"), mmap_mode="r")
+        self.intensity = np.load(j(directory, "intensity.npy"), mmap_mode="r")
+        self.offsets = np.load(j(directory, "offsets.npy"), mmap_mode="r")
+        self.spectra = np.load(j(directory, "spectra.npy"), mmap_mode="r")
+        self.native_ids = np.load(j(directory, "native_ids.npy"), mmap_mode="r")
+
+        self.rt = self.spectra["rt"]
+        self.ms_level = self.spectra["ms_level"]
+        self.precursor_mz = self.spectra["precursor_mz"]
+        self.precursor_charge = self.spectra["precursor_charge"]
+
+    def size(self):
+        return len(self.offsets) - 1
+
+    def __len__(self):
+        return self.size()
+
+    def getPeaks(self, index):
+        """Returns (mz, intensity) of spectrum index as read-only views"""
+        if index < 0:
+            index += self.size()
+        if not 0 <= index < self.size():
+            raise IndexError("spectrum index %d out of range" % index)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.mz[start:end], self.intensity[start:end]
+
+    def __getitem__(self, index):
+        return self.getPeaks(index)
+
+    def __iter__(self):
+        for index in range(self.size()):
+            yield self.getPeaks(index)
+
+    def getSpectrum(self, index):
+        """Returns spectrum index as (copied) MSSpectrum"""
+        spec = MSSpectrum()
+        spec.set_peaks(self.getPeaks(index))
+        spec.setRT(float(self.rt[index]))
+        spec.setMSLevel(int(self.ms_level[index]))
+        spec.setNativeID(bytes(self.native_ids[index]))
+        return spec
@@ -0,0 +1,199 @@
+"""
+Random access to the entries of a FASTA file by accession.
+
+FASTAFile.load reads the complete database. IndexedFASTAFile keeps a sorted
+(accession, byte offset) index of the file on disk, similar to a samtools
+.fai file, which is memory-mapped and searched with NumPy. Only the
+requested entries are read from the FASTA file (with FASTAFile.setPosition
+and FASTAFile.readNext), so looking up a few proteins of a huge database
+neither parses nor holds the rest of it.
+"""
+from __future__ import absolute_import
+import os
+import re
+import struct
+
+import numpy as np
+
+from .all_modules import FASTAFile, FASTAEntry
+
+__all__ = ["IndexedFASTAFile"]
+
+# magic, number of entries, accession width, FASTA file size and mtime (ns)
+_HEADER = struct.Struct("<8sQQQq")
+_MAGIC = b"OMSFAIDX"
+# identifier as parsed by FASTAFile::readNext (up to the first whitespace)
+_ACCESSION = re.compile(br"^>[ \t\v]*([^ \t\v\r\n]*)", re.MULTILINE)
+_CHUNK_SIZE = 1 << 24
+
+
+def _fileStamp(filename):
+    st = os.stat(filename)
+    return st.st_size, getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9))
+
+
+def _scanHeaders(filename):
+    """Returns the accessions and byte offsets of all entries, in file order"""
+    accessions = []
+    offsets = []
+    with open(filename, "rb") as f:
+        base = 0  # file offset of buffer[0], which always starts a line
+        rest = b""
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            buffer = rest + chunk
+            end = buffer.rfind(b"\n") + 1 if chunk else len(buffer)
+            matches = [(m.group(1), m.start()) for m in _ACCESSION.finditer(buffer, 0, end)]
+            if matches:
+                ids, pos = zip(*matches)
+                accessions.append(np.array(ids, dtype=bytes))
+                offsets.append(np.array(pos, dtype=np.int64) + base)
+            if not chunk:
+                break
+            rest = buffer[end:]
+            base += end
+    if not accessions:
+        return np.zeros(0, dtype="S1"), np.zeros(0, dtype=np.int64)
+    width = max(max(a.dtype.itemsize for a in accessions), 1)
+    return (np.concatenate([a.astype("S%d" % width) for a in accessions]),
+            np.concatenate(offsets))
+
+
+class IndexedFASTAFile(object):
+    """
+    Indexed access to a FASTA file
+
+    The index is stored next to the FASTA file (filename + ".oidx") unless
+    index_file is given. It is (re)built when it is missing or older than
+    the FASTA file, or, if create is False, an IOError is raised instead.
+
+    Entries are returned as FASTAEntry objects, e.g. for use with
+    ProteaseDigestion:
+
+        fasta = IndexedFASTAFile("db.fasta")
+        for entry in fasta.getEntries(accessions):
+            digestion.digest(AASequence.fromString(entry.sequence, False), peptides)
+
+    Use FASTAFile.iterEntries to stream over all entries.
+    """
+
+    def __init__(self, filename, index_file=None, create=True):
+        if isinstance(filename, bytes):
+            filename = filename.decode("UTF-8")
+        if not os.path.isfile(filename):
+            raise IOError("FASTA file %s does not exist" % filename)
+        self.filename = filename
+        self.index_file = index_file or filename + ".oidx"
+        if not self._indexIsCurrent():
+            if not create:
+                raise IOError("FASTA index %s is missing or outdated" % self.index_file)
+            IndexedFASTAFile.buildIndex(filename, self.index_file)
+        self._load()
+        self._reader = None
+
+    @staticmethod
+    def buildIndex(filename, index_file=None):
+        """Writes the index of a FASTA file and returns the index file name"""
+        if isinstance(filename, bytes):
+            filename = filename.decode("UTF-8")
+        index_file = index_file or filename + ".oidx"
+        size, mtime = _fileStamp(filename)
+        accessions, offsets = _scanHeaders(filename)
+        # stable sort: lookups of duplicate accessions return the first entry
+        order = np.argsort(accessions, kind="mergesort")
+        accessions = accessions[order]
+        offsets = offsets[order]
+        width = accessions.dtype.itemsize
+        with open(index_file, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(accessions), width, size, mtime))
+            f.write(accessions.tobytes())
+            f.write(b"\0" * (-f.tell() % 8))  # align the offsets
+            f.write(offsets.astype("<i8").tobytes())
+        return index_file
+
+    def _readHeader(self):
+        with open(self.index_file, "rb") as f:
+            data = f.read(_HEADER.size)
+        if len(data) != _HEADER.size:
+            return None
+        header = _HEADER.unpack(data)
+        return header if header[0] == _MAGIC else None
+
+    def _indexIsCurrent(self):
+        if not os.path.isfile(self.index_file):
+            return False
+        header = self._readHeader()
+        return header is not None and tuple(header[3:]) == _fileStamp(self.filename)
+
+    def _load(self):
+        _, n, width, _, _ = self._readHeader()
+        if n == 0:
+            self._accessions = np.zeros(0, dtype="S1")
+            self._offsets = np.zeros(0, dtype=np.int64)
+            return
+        start = _HEADER.size + n * width
+        start += -start % 8
+        self._accessions = np.memmap(self.index_file, dtype="S%d" % width, mode="r",
+                                     offset=_HEADER.size, shape=(n,))
+        self._offsets = np.memmap(self.index_file, dtype="<i8", mode="r",
+                                  offset=start, shape=(n,))
+
+    def close(self):
+        self._accessions = self._offsets = None
+        self._reader = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._accessions)
+
+    def __contains__(self, accession):
+        return self.getOffsets([accession])[0] >= 0
+
+    def getOffsets(self, accessions):
+        """Returns the byte offsets of the entries (-1 for unknown accessions)"""
+        keys = np.array([a if isinstance(a, bytes) else a.encode("UTF-8") for a in accessions],
+                        dtype=bytes)
+        result = np.full(len(keys), -1, dtype=np.int64)
+        if len(keys) == 0 or len(self._accessions) == 0:
+            return result
+        # longer keys cannot be in the index (and would be truncated by the cast)
+        valid = np.char.str_len(keys) <= self._accessions.dtype.itemsize
+        keys = keys.astype(self._accessions.dtype)
+        pos = np.searchsorted(self._accessions, keys)
+        pos = np.minimum(pos, len(self._accessions) - 1)
+        found = valid & (self._accessions[pos] == keys)
+        result[found] = self._offsets[pos[found]]
+        return result
+
+    def getEntries(self, accessions):
+        """
+        Returns the FASTAEntry objects of the accessions (in the given order)
+
+        The entries are read in file order. Raises KeyError for unknown
+        accessions.
+        """
+        accessions = list(accessions)
+        offsets = self.getOffsets(accessions)
+        missing = np.flatnonzero(offsets < 0)
+        if len(missing):
+            raise KeyError("accession %r not found in %s" % (accessions[missing[0]], self.filename))
+
+        if self._reader is None:
+            self._reader = FASTAFile()
+            self._reader.readStart(self.filename.encode("UTF-8"))
+        entries = {}
+        for offset in np.unique(offsets):
+            entry = FASTAEntry()
+            if not (self._reader.setPosition(int(offset)) and self._reader.readNext(entry)):
+                raise IOError("cannot read FASTA entry at offset %d of %s" % (offset, self.filename))
+            entries[offset] = entry
+        return [entries[offset] for offset in offsets]
+
+    def getEntry(self, accession):
+        """Returns the FASTAEntry of an accession (KeyError if it is unknown)"""
+        return self.getEntries([accession])[0]
@@ -0,0 +1,76 @@
+"""
+Streaming use of SpectraFilterChain.
+
+SpectraFilterChain.filterPeakMap filters an MSExperiment in memory.
+SpectraFilterChainConsumer is an MSDataConsumer stage (see
+MzMLFile.transform) that filters the spectra on their way to another
+consumer, so a file can be preprocessed without loading it completely:
+
+    chain = pyopenms.SpectraFilterChain()
+    chain.addFilter(b"ThresholdMower", threshold_param)
+    chain.addFilter(pyopenms.NLargest())
+    writer = pyopenms.PlainMSDataWritingConsumer(b"filtered.mzML")
+    with pyopenms.SpectraFilterChainConsumer(chain, writer) as consumer:
+        pyopenms.MzMLFile().transform(b"input.mzML", consumer)
+    del writer  # finishes the output file
+
+The spectra are collected in batches, which are filtered on native threads
+with the GIL released and then passed on in their original order.
+"""
+from __future__ import absolute_import
+
+from .all_modules import MSExperiment
+
+__all__ = ["SpectraFilterChainConsumer"]
+
+
+class SpectraFilterChainConsumer(object):
+    """
+    MSDataConsumer that applies a SpectraFilterChain and forwards to consumer
+
+    Spectra are filtered in batches of batch_size on nr_threads threads (0
+    uses the OpenMP default). Chromatograms and settings are passed on
+    unchanged. The spectra of the last batch are only forwarded by flush(),
+    which is called when the consumer is used as context manager.
+    """
+
+    def __init__(self, chain, consumer, nr_threads=0, batch_size=1000):
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.chain = chain
+        self.consumer = consumer
+        self.nr_threads = nr_threads
+        self.batch_size = int(batch_size)
+        self._batch = MSExperiment()
+
+    def setExpectedSize(self, num_specs, num_chromo):
+        self.consumer.setExpectedSize(num_specs, num_chromo)
+
+    def setExperimentalSettings(self, exp):
+        self.consumer.setExperimentalSettings(exp)
+
+    def consumeSpectrum(self, spec):
+        self._batch.addSpectrum(spec)
+        if self._batch.size() >= self.batch_size:
+            self.flush()
+
+    def consumeChromatogram(self, chromo):
+        # keep the order of the input
+        self.flush()
+        self.consumer.consumeChromatogram(chromo)
+
+    def flush(self):
+        """Filters the collected spectra and forwards them"""
+        if self._batch.size() == 0:
+            return
+        batch, self._batch = self._batch, MSExperiment()
+        self.chain.filterPeakMap(batch, self.nr_threads)
+        for spec in batch:
+            self.consumer.consumeSpectrum(spec)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.flush()
@@ -0,0 +1,301 @@
+"""
+Precursor mass index of the peptides of a digested protein database.
+
+Selecting the candidate peptides of a precursor by digesting all proteins
+(ProteaseDigestion.digest) and checking every peptide's getMonoWeight() is
+slow and has to be repeated in every run. PeptideMassIndex digests a FASTA
+file once and stores the unique peptides sorted by monoisotopic mass,
+together with the proteins they occur in, in an index file on disk. The
+arrays of the index file are memory-mapped and precursor windows are
+looked up with vectorised binary searches (numpy.searchsorted).
+"""
+from __future__ import absolute_import
+import json
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from .all_modules import (AASequence, FASTAFile, ModificationsDB,
+                          ProteaseDigestion, ResidueModification)
+
+__all__ = ["PeptideMassIndex"]
+
+# magic and length of the JSON metadata that follows the header
+_HEADER = struct.Struct("<8sQ")
+_MAGIC = b"OMSPEPIX"
+_VERSION = 1
+_PROTON_MASS = 1.007276466771
+# residues with undefined masses, peptides containing them are skipped
+_AMBIGUOUS = frozenset("BJXZ")
+
+_DEFAULT_SETTINGS = dict(enzyme="Trypsin", missed_cleavages=1, min_length=7, max_length=40,
+                         fixed_modifications=[])
+
+
+def _fileStamp(filename):
+    st = os.stat(filename)
+    return [st.st_size, getattr(st, "st_mtime_ns", int(st.st_mtime * 1e9))]
+
+
+def _toBytes(s):
+    return s if isinstance(s, bytes) else s.encode("UTF-8")
+
+
+def _fixedModifications(names):
+    """Returns (origin, term specificity, id) of the fixed modifications"""
+    db = ModificationsDB()
+    result = []
+    for name in names:
+        mod = db.getModification(_toBytes(name))
+        term = mod.getTermSpecificity()
+        if term not in (ResidueModification.TermSpecificity.ANYWHERE,
+                        ResidueModification.TermSpecificity.N_TERM,
+                        ResidueModification.TermSpecificity.C_TERM):
+            raise ValueError("fixed modification %s: protein terminal modifications are not supported" % name)
+        origin = mod.getOrigin()
+        origin = origin.decode() if isinstance(origin, bytes) else chr(origin) if isinstance(origin, int) else origin
+        if not origin.isalpha() or origin == "X":
+            if term == ResidueModification.TermSpecificity.ANYWHERE:
+                raise ValueError("fixed modification %s: origin %r is not an amino acid, only terminal "
+                                 "modifications may apply to any residue" % (name, origin))
+            origin = None
+        result.append((origin, term, mod.getId()))
+    return result
+
+
+def _applyFixedModifications(peptide, sequence, modifications):
+    for origin, term, mod_id in modifications:
+        if term == ResidueModification.TermSpecificity.ANYWHERE:
+            pos = sequence.find(origin)
+            while pos >= 0:
+                peptide.setModification(pos, mod_id)
+                pos = sequence.find(origin, pos + 1)
+        elif term == ResidueModification.TermSpecificity.N_TERM:
+            if origin is None or sequence[0] == origin:
+                peptide.setNTerminalModification(mod_id)
+        elif origin is None or sequence[-1] == origin:
+            peptide.setCTerminalModification(mod_id)
+
+
+class PeptideMassIndex(object):
+    """
+    Peptides of a digested FASTA file, sorted by monoisotopic mass
+
+    The index is stored next to the FASTA file (fasta_file + ".pepidx")
+    unless index_file is given. It is (re)built when it is missing, older
+    than the FASTA file or was built with different settings, or, if
+    create is False, an IOError is raised instead. Settings (see build)
+    that are not given are taken from an existing index, or the defaults.
+
+    Precursor windows are looked up for many precursors at once:
+
+        index = PeptideMassIndex("db.fasta", missed_cleavages=2,
+                                 fixed_modifications=["Carbamidomethyl (C)"])
+        begin, end = index.queryMZ(precursor_mz, charges, 10.0, "ppm")
+        for i in range(len(precursor_mz)):
+            for peptide in index.getSequences(np.arange(begin[i], end[i])):
+                ...
+
+    Peptide indices refer to the mass-sorted peptides; getProteins maps
+    them to protein accessions.
+    """
+
+    def __init__(self, fasta_file, index_file=None, create=True, **settings):
+        if isinstance(fasta_file, bytes):
+            fasta_file = fasta_file.decode("UTF-8")
+        if not os.path.isfile(fasta_file):
+            raise IOError("FASTA file %s does not exist" % fasta_file)
+        unknown = set(settings) - set(_DEFAULT_SETTINGS)
+        if unknown:
+            raise TypeError("unknown settings: %s" % ", ".join(sorted(unknown)))
+        self.fasta_file = fasta_file
+        self.index_file = index_file or fasta_file + ".pepidx"
+
+        metadata = self._readMetadata() if os.path.isfile(self.index_file) else None
+        requested = dict(metadata["settings"] if metadata is not None else _DEFAULT_SETTINGS)
+        requested.update(settings)
+        requested["fixed_modifications"] = list(requested["fixed_modifications"])
+        if metadata is not None and (metadata["settings"] != requested or
+                                     metadata["fasta_stamp"] != _fileStamp(fasta_file)):
+            metadata = None
+        if metadata is None:
+            if not create:
+                raise IOError("peptide index %s is missing or outdated" % self.index_file)
+            PeptideMassIndex.build(fasta_file, self.index_file, **requested)
+            metadata = self._readMetadata()
+        self.settings = metadata["settings"]
+        self._load(metadata)
+
+    @staticmethod
+    def build(fasta_file, index_file=None, enzyme="Trypsin", missed_cleavages=1, min_length=7,
+              max_length=40, fixed_modifications=()):
+        """
+        Digests a FASTA file and writes the peptide index, returns the index file name
+
+        enzyme is the name of a ProteaseDigestion enzyme, peptides with at
+        most missed_cleavages missed cleavages and min_length to max_length
+        residues are indexed. fixed_modifications are ModificationsDB names
+        (e.g. "Carbamidomethyl (C)" or "Acetyl (N-term)"). Peptides with
+        ambiguous residues (B, J, X, Z) are skipped.
+        """
+        if isinstance(fasta_file, bytes):
+            fasta_file = fasta_file.decode("UTF-8")
+        index_file = index_file or fasta_file + ".pepidx"
+        settings = dict(enzyme=enzyme, missed_cleavages=int(missed_cleavages), min_length=int(min_length),
+                        max_length=int(max_length), fixed_modifications=list(fixed_modifications))
+        stamp = _fileStamp(fasta_file)
+        modifications = _fixedModifications(fixed_modifications)
+
+        digestion = ProteaseDigestion()
+        digestion.setEnzyme(_toBytes(enzyme))
+        digestion.setMissedCleavages(int(missed_cleavages))
+
+        accessions = []
+        peptide_ids = {}  # unmodified sequence -> index into sequences
+        sequences = []
+        masses = []
+        mapping = []  # (peptide, protein) pairs
+        for protein, entry in enumerate(FASTAFile().iterEntries(fasta_file.encode("UTF-8"))):
+            accessions.append(_toBytes(entry.identifier))
+            peptides = []
+            # proteins are parsed once, they would only evict peptides from the sequence cache
+            digestion.digest(AASequence._fromStringUncached(entry.sequence, False), peptides, min_length, max_length)
+            for peptide in peptides:
+                sequence = peptide.toUnmodifiedString()
+                if isinstance(sequence, bytes):
+                    sequence = sequence.decode()
+                pid = peptide_ids.get(sequence)
+                if pid is None:
+                    if _AMBIGUOUS.intersection(sequence):
+                        continue
+                    _applyFixedModifications(peptide, sequence, modifications)
+                    pid = peptide_ids[sequence] = len(sequences)
+                    sequences.append(_toBytes(peptide.toString()))
+                    masses.append(peptide.getMonoWeight())
+                mapping.append((pid, protein))
+
+        masses = np.array(masses, dtype=np.float64)
+        order = np.argsort(masses, kind="mergesort")
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order))
+        # peptide -> protein mapping as CSR arrays (unique proteins per peptide)
+        mapping = np.unique(np.array(mapping, dtype=np.int64).reshape(-1, 2), axis=0)
+        mapping[:, 0] = rank[mapping[:, 0]]
+        mapping = mapping[np.lexsort((mapping[:, 1], mapping[:, 0]))]
+        protein_offsets = np.searchsorted(mapping[:, 0], np.arange(len(order) + 1)).astype(np.int64)
+
+        arrays = [
+            ("masses", masses[order]),
+            ("sequences", np.array([sequences[i] for i in order] or [b""], dtype=bytes)[:len(order)]),
+            ("protein_offsets", protein_offsets),
+            ("proteins", mapping[:, 1].copy()),
+            ("accessions", np.array(accessions or [b""], dtype=bytes)[:len(accessions)]),
+        ]
+        _write(index_file, dict(version=_VERSION, settings=settings, fasta_stamp=stamp), arrays)
+        return index_file
+
+    def _readMetadata(self):
+        with open(self.index_file, "rb") as f:
+            data = f.read(_HEADER.size)
+            if len(data) != _HEADER.size:
+                return None
+            magic, size = _HEADER.unpack(data)
+            if magic != _MAGIC:
+                return None
+            metadata = json.loads(f.read(size).decode("UTF-8"))
+        return metadata if metadata.get("version") == _VERSION else None
+
+    def _load(self, metadata):
+        for name, (dtype, n, offset) in metadata["arrays"].items():
+            if n == 0:
+                array = np.zeros(0, dtype=dtype)
+            else:
+                array = np.memmap(self.index_file, dtype=dtype, mode="r", offset=offset, shape=(n,))
+            setattr(self, "_" + name, array)
+
+    def close(self):
+        self._masses = self._sequences = self._protein_offsets = self._proteins = self._accessions = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return len(self._masses)
+
+    def getMasses(self):
+        """Returns the (sorted) monoisotopic masses of all peptides"""
+        return self._masses
+
+    def query(self, masses, tolerance, unit="ppm"):
+        """
+        Returns the peptide ranges (begin, end) of the given neutral masses
+
+        The peptides with indices begin[i] to end[i] - 1 have a mass within
+        tolerance (in "ppm" or "Da") of masses[i].
+        """
+        masses = np.asarray(masses, dtype=np.float64)
+        if unit == "ppm":
+            tolerance = masses * (tolerance * 1e-6)
+        elif unit != "Da":
+            raise ValueError("unit must be 'ppm' or 'Da', not %r" % unit)
+        begin = np.searchsorted(self._masses, masses - tolerance, side="left")
+        end = np.searchsorted(self._masses, masses + tolerance, side="right")
+        return begin, end
+
+    def queryMZ(self, mz, charges, tolerance, unit="ppm"):
+        """Like query, but for precursor m/z values and charges (ppm tolerances refer to the mass)"""
+        charges = np.asarray(charges, dtype=np.float64)
+        return self.query((np.asarray(mz, dtype=np.float64) - _PROTON_MASS) * charges, tolerance, unit)
+
+    def getCandidates(self, mass, tolerance, unit="ppm"):
+        """Returns the indices of the peptides within tolerance of a single mass"""
+        begin, end = self.query([mass], tolerance, unit)
+        return np.arange(begin[0], end[0])
+
+    def getSequences(self, indices):
+        """Returns the (modified) sequences of the peptides, see AASequence.fromString"""
+        return [bytes(s) for s in self._sequences[np.asarray(indices, dtype=np.int64)]]
+
+    def getProteins(self, index):
+        """Returns the accessions of the proteins a peptide occurs in"""
+        proteins = self._proteins[self._protein_offsets[index]:self._protein_offsets[index + 1]]
+        return [bytes(a) for a in self._accessions[proteins]]
+
+
+def _write(filename, metadata, arrays):
+    """Writes the header, JSON metadata and 8-byte aligned arrays"""
+    table = {}
+    # the metadata contains the array offsets, so its size is fixed first
+    offset = 0
+    for name, array in arrays:
+        table[name] = [array.dtype.str, len(array), offset]
+        offset += array.nbytes + (-array.nbytes % 8)
+    metadata["arrays"] = table
+    # reserve space for the offset digits, then shift them by the header size
+    size = len(json.dumps(metadata).encode("UTF-8")) + 32 * len(arrays)
+    start = _HEADER.size + size + (-(_HEADER.size + size) % 8)
+    for name in table:
+        table[name][2] += start
+    text = json.dumps(metadata).encode("UTF-8").ljust(start - _HEADER.size)
+    # an existing index may be memory-mapped by a reader, truncating it in
+    # place would crash the reader, so the new index replaces it atomically
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(filename) + ".",
+                               dir=os.path.dirname(os.path.abspath(filename)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(text)))
+            f.write(text)
+            for name, array in arrays:
+                f.write(np.ascontiguousarray(array).tobytes())
+                f.write(b"\0" * (-array.nbytes % 8))
+        # mkstemp creates the file readable by the owner only
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, filename)
+    except BaseException:
+        os.remove(tmp)
+        raise
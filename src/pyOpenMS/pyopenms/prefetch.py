@@ -0,0 +1,113 @@
+"""
+Read-ahead access to the spectra of an OnDiscMSExperiment.
+
+OnDiscMSExperiment.getSpectrum decodes a spectrum only when it is requested,
+so a loop over many spectra alternates between decoding and processing.
+SpectrumPrefetcher decodes the next spectra in a background thread (using
+OnDiscMSExperiment.getSpectra, which releases the GIL) while the caller is
+still processing the current ones.
+"""
+from __future__ import absolute_import
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+
+__all__ = ["SpectrumPrefetcher"]
+
+
+class SpectrumPrefetcher(object):
+    """
+    Prefetching, caching spectrum access for an OnDiscMSExperiment
+
+    When spectrum i is requested with getSpectrum, the spectra i+1 ...
+    i+read_ahead are decoded in the background. iterSpectra does the same for
+    an arbitrary access order, e.g. the spectra of a DIA window. At most
+    cache_size decoded spectra are kept, the least recently used ones are
+    discarded first.
+
+    nr_threads is the number of native threads used to decode a batch of
+    spectra (0 uses the OpenMP default).
+    """
+
+    def __init__(self, exp, read_ahead=16, cache_size=64, nr_threads=0):
+        if cache_size < read_ahead + 1:
+            raise ValueError("cache_size must be larger than read_ahead")
+        self.exp = exp
+        self.read_ahead = read_ahead
+        self.cache_size = cache_size
+        self.nr_threads = nr_threads
+        self.hits = 0
+        self.misses = 0
+        self._size = exp.getNrSpectra()
+        self._cache = OrderedDict()
+        self._pending = {}  # index -> (AsyncResult, indices) of the batch decoding it
+        self._pool = ThreadPool(1)
+
+    def close(self):
+        """Stops the background thread (pending prefetches are discarded)"""
+        self._pool.terminate()
+        self._pool.join()
+        self._pending.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def getSpectrum(self, index):
+        """Returns spectrum index and prefetches the following spectra"""
+        if index < 0:
+            index += self._size
+        spec = self._get(index)
+        self._prefetch(range(index + 1, min(index + 1 + self.read_ahead, self._size)))
+        return spec
+
+    def iterSpectra(self, indices):
+        """Yields the spectra in the order of indices, prefetching ahead"""
+        indices = list(indices)
+        for pos, index in enumerate(indices):
+            self._prefetch(indices[pos + 1:pos + 1 + self.read_ahead])
+            yield self._get(index)
+
+    def _get(self, index):
+        spec = self._cache.pop(index, None)
+        if spec is None and index in self._pending:
+            self._collect(*self._pending[index])
+            spec = self._cache.pop(index, None)
+        if spec is None:
+            self.misses += 1
+            spec = self.exp.getSpectra([index], self.nr_threads)[0]
+        else:
+            self.hits += 1
+        self._insert(index, spec)
+        return spec
+
+    def _prefetch(self, indices):
+        # move finished batches into the (bounded) cache first
+        for result, batch in set(self._pending.values()):
+            if result.ready():
+                self._collect(result, batch)
+
+        batch = []
+        for i in indices:
+            # indices may repeat, each spectrum is only requested once per batch
+            if i not in self._cache and i not in self._pending and i not in batch:
+                batch.append(i)
+        batch = tuple(batch)
+        if not batch:
+            return
+        result = self._pool.apply_async(self.exp.getSpectra, (list(batch), self.nr_threads))
+        for index in batch:
+            self._pending[index] = (result, batch)
+
+    def _collect(self, result, batch):
+        spectra = result.get()
+        for index, spec in zip(batch, spectra):
+            self._pending.pop(index, None)
+            self._insert(index, spec)
+
+    def _insert(self, index, spec):
+        self._cache.pop(index, None)
+        self._cache[index] = spec
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
@@ -0,0 +1,152 @@
+"""
+Memoised parsing and mass computation of peptide sequences.
+
+AASequence.fromString parses the modification syntax of a sequence against
+ModificationsDB and ResidueDB on every call, which dominates the run time of
+scripts that process the same peptides over and over (e.g. the PSMs of an
+identification run). AASequenceCache keeps the most recently used parsed
+sequences and their monoisotopic masses in a bounded LRU cache.
+
+A process-wide cache is used by AASequence.fromString, cachedFromString and
+sequenceMasses:
+
+    peptide = pyopenms.AASequence.fromString(b"PEPTM(Oxidation)IDEK", False)
+    mz = pyopenms.sequenceMasses(sequences, charges)
+    print(pyopenms.getAASequenceCache().getStatistics())
+"""
+from __future__ import absolute_import
+import copy
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .all_modules import AASequence, String
+
+__all__ = ["AASequenceCache", "getAASequenceCache", "cachedFromString", "sequenceMasses"]
+
+_PROTON_MASS = 1.007276466771
+
+
+def _toBytes(sequence):
+    if isinstance(sequence, bytes):
+        return sequence
+    if isinstance(sequence, String):
+        return sequence.c_str()
+    return sequence.encode("UTF-8")
+
+
+class AASequenceCache(object):
+    """
+    Bounded LRU cache of parsed AASequence objects and their masses
+
+    Sequences are parsed on the first request (non-permissive unless
+    requested otherwise) and evicted when more than max_size different
+    sequences are cached. The cache can be shared between threads.
+
+    Modifications added to ModificationsDB after a sequence was cached are
+    not picked up; call clear() in that case.
+    """
+
+    def __init__(self, max_size=100000):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self._max_size = int(max_size)
+        self._entries = OrderedDict()  # (sequence, permissive) -> (AASequence, monoisotopic mass)
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def _get(self, sequence, permissive=False):
+        key = (_toBytes(sequence), bool(permissive))
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._hits += 1
+                self._entries[key] = entry  # most recently used
+                return entry
+        # parse outside of the lock, a concurrent parse of the same sequence is harmless
+        peptide = AASequence._fromStringUncached(key[0], key[1])
+        entry = (peptide, peptide.getMonoWeight())
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = entry
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return entry
+
+    def fromString(self, sequence, permissive=False):
+        """Returns the parsed sequence (a copy, it may be modified)"""
+        return copy.copy(self._get(sequence, permissive)[0])
+
+    def getMonoWeight(self, sequence):
+        """Returns the monoisotopic mass of the (uncharged) peptide"""
+        return self._get(sequence)[1]
+
+    def masses(self, sequences, charges=None):
+        """
+        Returns the monoisotopic masses of many peptides as NumPy array
+
+        Without charges, the neutral masses are returned, otherwise the m/z
+        of the peptides at the given charge(s) (a single charge or one per
+        sequence, like AASequence.getMZ; charge 0 gives the neutral mass).
+        """
+        result = np.fromiter((self._get(s)[1] for s in sequences), dtype=np.float64)
+        if charges is None:
+            return result
+        charges = np.broadcast_to(np.asarray(charges, dtype=np.float64), result.shape)
+        charged = charges != 0
+        result[charged] = (result[charged] + charges[charged] * _PROTON_MASS) / charges[charged]
+        return result
+
+    def __contains__(self, sequence):
+        sequence = _toBytes(sequence)
+        return (sequence, False) in self._entries or (sequence, True) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def getMaxSize(self):
+        return self._max_size
+
+    def setMaxSize(self, max_size):
+        """Changes the capacity, evicting the least recently used sequences if necessary"""
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        with self._lock:
+            self._max_size = int(max_size)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def getStatistics(self):
+        """Returns the number of hits, misses and evictions, the size and the hit rate"""
+        with self._lock:
+            requests = self._hits + self._misses
+            return dict(hits=self._hits, misses=self._misses, evictions=self._evictions,
+                        size=len(self._entries), max_size=self._max_size,
+                        hit_rate=float(self._hits) / requests if requests else 0.0)
+
+    def clear(self):
+        """Removes all sequences and resets the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+_default_cache = AASequenceCache()
+
+
+def getAASequenceCache():
+    """Returns the process-wide cache used by cachedFromString and sequenceMasses"""
+    return _default_cache
+
+
+def cachedFromString(sequence):
+    """AASequence.fromString using the process-wide cache"""
+    return _default_cache.fromString(sequence)
+
+
+def sequenceMasses(sequences, charges=None):
+    """AASequenceCache.masses using the process-wide cache"""
+    return _default_cache.masses(sequences, charges)
@@ -0,0 +1,190 @@
+"""
+Indexed random access to sqMass files.
+
+SqMassFile.load always reads the complete file into an MSExperiment.
+SqMassReader keeps one connection to the SQLite database open and uses its
+indices to fetch only the requested chromatograms or spectra (by native ID,
+retention time range or MS level), returning the data as NumPy arrays.
+"""
+from __future__ import absolute_import
+import base64
+import os
+import sqlite3
+import zlib
+
+import numpy as np
+
+from .all_modules import MSNumpressCoder, NumpressConfig
+
+__all__ = ["SqMassReader"]
+
+# DATA.DATA_TYPE
+_MZ, _INTENSITY, _RT = 0, 1, 2
+# DATA.COMPRESSION (2-4, 7: numpress without zlib and pic are never written)
+_NONE, _ZLIB, _NP_LINEAR_ZLIB, _NP_SLOF_ZLIB = 0, 1, 5, 6
+
+# SQLite limits the number of host parameters of a statement
+_MAX_PARAMETERS = 500
+
+
+def _decodeNumpress(raw, compression):
+    config = NumpressConfig()
+    config.setCompression(compression)
+    return MSNumpressCoder().decodeNumpy(base64.b64encode(raw), False, config)
+
+
+def _decode(blob, compression):
+    if compression == _NONE:
+        return np.frombuffer(blob, dtype=np.float64)
+    if compression == _ZLIB:
+        return np.frombuffer(zlib.decompress(blob), dtype=np.float64)
+    if compression == _NP_LINEAR_ZLIB:
+        return _decodeNumpress(zlib.decompress(blob), b"linear")
+    if compression == _NP_SLOF_ZLIB:
+        return _decodeNumpress(zlib.decompress(blob), b"slof")
+    raise Exception("sqMass compression %d is not supported" % compression)
+
+
+def _chunks(values):
+    for start in range(0, len(values), _MAX_PARAMETERS):
+        yield values[start:start + _MAX_PARAMETERS]
+
+
+class SqMassReader(object):
+    """
+    Reads selected chromatograms and spectra from an sqMass file
+
+    The database is opened once and the connection is
+    reused for all queries; close() releases it. Chromatograms are returned
+    as (rt, intensity) and spectra as (mz, intensity) pairs of float64
+    arrays.
+    """
+
+    def __init__(self, filename):
+        if isinstance(filename, bytes):
+            filename = filename.decode("UTF-8")
+        if not os.path.isfile(filename):
+            raise IOError("sqMass file %s does not exist" % filename)
+        self.filename = filename
+        self.connection = sqlite3.connect(filename, check_same_thread=False)
+        self._chromatogram_ids = None
+        self._spectrum_ids = None
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def getNrChromatograms(self):
+        return self.connection.execute("SELECT COUNT(*) FROM CHROMATOGRAM").fetchone()[0]
+
+    def getNrSpectra(self):
+        return self.connection.execute("SELECT COUNT(*) FROM SPECTRUM").fetchone()[0]
+
+    # native IDs are not indexed in the database, they are mapped once per reader
+
+    def _idMap(self, table):
+        rows = self.connection.execute("SELECT NATIVE_ID, ID FROM %s" % table)
+        return dict((native_id.encode("UTF-8") if not isinstance(native_id, bytes) else native_id, id_)
+                    for native_id, id_ in rows)
+
+    def _lookup(self, id_map, native_ids):
+        result = np.empty(len(native_ids), dtype=np.int64)
+        for i, native_id in enumerate(native_ids):
+            if not isinstance(native_id, bytes):
+                native_id = native_id.encode("UTF-8")
+            try:
+                result[i] = id_map[native_id]
+            except KeyError:
+                raise KeyError("native ID %r not found in %s" % (native_id, self.filename))
+        return result
+
+    def getChromatogramIds(self, native_ids):
+        """Returns the database IDs of the chromatograms with the given native IDs"""
+        if self._chromatogram_ids is None:
+            self._chromatogram_ids = self._idMap("CHROMATOGRAM")
+        return self._lookup(self._chromatogram_ids, native_ids)
+
+    def getSpectrumIds(self, native_ids=None, rt_range=None, ms_level=None):
+        """
+        Returns the database IDs of the spectra matching all given criteria
+
+        Spectra selected by rt_range (rt_min, rt_max) and / or ms_level are
+        sorted by retention time, spectra selected by native_ids only are
+        returned in the given order.
+        """
+        if native_ids is not None:
+            if self._spectrum_ids is None:
+                self._spectrum_ids = self._idMap("SPECTRUM")
+            ids = self._lookup(self._spectrum_ids, native_ids)
+            if rt_range is None and ms_level is None:
+                return ids
+        else:
+            ids = None
+
+        conditions = []
+        parameters = []
+        if rt_range is not None:
+            conditions.append("RETENTION_TIME BETWEEN ? AND ?")
+            parameters.extend([float(rt_range[0]), float(rt_range[1])])
+        if ms_level is not None:
+            conditions.append("MSLEVEL = ?")
+            parameters.append(int(ms_level))
+        sql = "SELECT ID FROM SPECTRUM"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY RETENTION_TIME"
+        selected = np.array([row[0] for row in self.connection.execute(sql, parameters)],
+                            dtype=np.int64)
+        if ids is not None:
+            selected = selected[np.isin(selected, ids)]
+        return selected
+
+    def getSpectrumRTs(self, ids):
+        """Returns the retention times of the spectra with the given database IDs"""
+        rts = {}
+        for chunk in _chunks([int(i) for i in ids]):
+            sql = "SELECT ID, RETENTION_TIME FROM SPECTRUM WHERE ID IN (%s)" % ",".join("?" * len(chunk))
+            rts.update(self.connection.execute(sql, chunk))
+        return np.array([rts[int(i)] for i in ids], dtype=np.float64)
+
+    def _readData(self, column, ids, first_type):
+        ids = [int(i) for i in ids]
+        data = dict((i, [None, None]) for i in ids)
+        for chunk in _chunks(sorted(set(ids))):
+            sql = "SELECT %s, DATA_TYPE, COMPRESSION, DATA FROM DATA WHERE %s IN (%s)" % (
+                column, column, ",".join("?" * len(chunk)))
+            for id_, data_type, compression, blob in self.connection.execute(sql, chunk):
+                if data_type == first_type:
+                    data[id_][0] = _decode(blob, compression)
+                elif data_type == _INTENSITY:
+                    data[id_][1] = _decode(blob, compression)
+
+        empty = np.zeros(0, dtype=np.float64)
+        return [tuple(empty if a is None else a for a in data[i]) for i in ids]
+
+    def readChromatograms(self, ids):
+        """Returns (rt, intensity) of each chromatogram with the given database IDs"""
+        return self._readData("CHROMATOGRAM_ID", ids, _RT)
+
+    def readSpectra(self, ids):
+        """Returns (mz, intensity) of each spectrum with the given database IDs"""
+        return self._readData("SPECTRUM_ID", ids, _MZ)
+
+    def getChromatograms(self, native_ids):
+        """Returns (rt, intensity) of the chromatograms with the given native IDs"""
+        return self.readChromatograms(self.getChromatogramIds(native_ids))
+
+    def getSpectra(self, native_ids=None, rt_range=None, ms_level=None):
+        """
+        Returns the spectra matching all given criteria (see getSpectrumIds)
+
+        The result is a tuple of the retention times (NumPy array) and a list
+        of (mz, intensity) of the spectra.
+        """
+        ids = self.getSpectrumIds(native_ids, rt_range, ms_level)
+        return self.getSpectrumRTs(ids), self.readSpectra(ids)
@@ -0,0 +1,68 @@
+"""
+Cached loading of assay libraries as LightTargetedExperiment.
+
+Parsing a TraML, TSV or PQP assay library and converting it to a
+LightTargetedExperiment takes minutes for large libraries.
+loadLightTargetedExperiment stores the result in a binary cache file
+(TransitionCacheFile) next to the library and reads the cache instead of
+the library as long as the library is unchanged.
+"""
+from __future__ import absolute_import
+
+from .all_modules import (FileHandler, FileType, LightTargetedExperiment,
+                          OpenSwathDataAccessHelper, TargetedExperiment,
+                          TraMLFile, TransitionCacheFile, TransitionPQPFile,
+                          TransitionTSVFile)
+
+__all__ = ["loadLightTargetedExperiment"]
+
+
+def _parse(filename):
+    light = LightTargetedExperiment()
+    file_type = FileHandler.getType(filename)
+    if file_type == FileType.TRAML:
+        targeted = TargetedExperiment()
+        TraMLFile().load(filename, targeted)
+        OpenSwathDataAccessHelper().convertTargetedExp(targeted, light)
+    elif file_type == FileType.PQP:
+        TransitionPQPFile().convertPQPToTargetedExperiment(filename, light, False)
+    elif file_type == FileType.TSV:
+        TransitionTSVFile().convertTSVToTargetedExperiment(filename, FileType.TSV, light)
+    else:
+        raise ValueError("%s is not a TraML, TSV or PQP assay library" % filename)
+    return light
+
+
+def loadLightTargetedExperiment(filename, cache_file=None):
+    """
+    Loads an assay library (TraML, TSV or PQP) as LightTargetedExperiment
+
+    The library is only parsed if the cache file (default: filename +
+    ".trcache") is missing or was created from a different version of the
+    library; the cache is then (re)written. If the cache cannot be written
+    (e.g. read-only directory), the parsed library is returned anyway.
+    """
+    if not isinstance(filename, bytes):
+        filename = filename.encode("UTF-8")
+    if cache_file is None:
+        cache_file = filename + b".trcache"
+    elif not isinstance(cache_file, bytes):
+        cache_file = cache_file.encode("UTF-8")
+
+    cache = TransitionCacheFile()
+    if cache.isValid(cache_file, filename):
+        light = LightTargetedExperiment()
+        try:
+            cache.load(cache_file, light)
+            return light
+        except RuntimeError:
+            # removed or truncated (e.g. by a crashed writer) after the check
+            pass
+
+    light = _parse(filename)
+    try:
+        cache.store(cache_file, light, filename)
+    except RuntimeError:
+        # store writes to a temporary file first, the cache file is unchanged
+        pass
+    return light
@@ -72,6 +72,32 @@ def _testMetaInfoInterface(what):
     assert len(keys) == 0
 
 
+@report
+def _testBulkMetaValues(what):
+
+    what.setMetaValue(b"int_value", 42)
+    what.setMetaValue(b"double_value", 4.5)
+    what.setMetaValue(b"string_value", b"abc")
+    what.setMetaValue(b"int_list", [1, 2])
+    what.setMetaValue(b"double_list", [1.5, 2.5])
+    what.setMetaValue(b"string_list", [b"a", b"b"])
+
+    keys = [b"int_value", b"double_value", b"string_value", b"int_list",
+            b"double_list", b"string_list", b"missing"]
+    values = what.getMetaValues(keys)
+    assert values == {b"int_value": 42, b"double_value": 4.5,
+                      b"string_value": b"abc", b"int_list": [1, 2],
+                      b"double_list": [1.5, 2.5], b"string_list": [b"a", b"b"],
+                      b"missing": None}
+    for k in keys[:-1]:
+        assert what.getMetaValue(k) == values[k]
+
+    assert what.getMetaValues([u"int_value"]) == {u"int_value": 42}
+    assert what.getMetaValues([]) == {}
+
+    what.clearMetaInfo()
+
+
 @report
 def _testUniqueIdInterface(what):
 
@@ -1196,9 +1222,12 @@ def testFeature():
 
      Feature.getPeptideIdentifications
      Feature.setPeptideIdentifications
+
+     Feature.getMetaValues
     """
     f = pyopenms.Feature()
     _testMetaInfoInterface(f)
+    _testBulkMetaValues(f)
     _testUniqueIdInterface(f)
 
     f.setConvexHulls(f.getConvexHulls())
@@ -2862,6 +2891,7 @@ def testMSSpectrum():
      MSSpectrum.getDataProcessing
      MSSpectrum.getInstrumentSettings
      MSSpectrum.getKeys
+     MSSpectrum.getMetaValues
      MSSpectrum.getMSLevel
      MSSpectrum.getMetaValue
      MSSpectrum.getName
@@ -2914,6 +2944,7 @@ def testMSSpectrum():
     assert spec_ == spec
 
     _testMetaInfoInterface(spec)
+    _testBulkMetaValues(spec)
 
     testSpectrumSetting(spec)
 
@@ -3671,6 +3702,7 @@ def testPeptideHit():
      PeptideHit.getAABefore
      PeptideHit.getKeys
      PeptideHit.getMetaValue
+     PeptideHit.getMetaValues
      PeptideHit.getProteinAccessions
      PeptideHit.getRank
      PeptideHit.getScore
@@ -3699,6 +3731,7 @@ def testPeptideHit():
 
     ph = pyopenms.PeptideHit(1.0, 1, 0, pyopenms.AASequence.fromString(b"A", True))
     _testMetaInfoInterface(ph)
+    _testBulkMetaValues(ph)
 
     assert len(ph.getPeptideEvidences()) == 0
     assert ph.getPeptideEvidences() == []
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy as np
+
+import pyopenms
+
+def getMZ(peptide, charge):
+    return peptide.getMonoWeight(pyopenms.Residue.ResidueType.Full, charge) / charge
+
+class TestAASequenceCache(unittest.TestCase):
+
+    def test_fromString(self):
+        cache = pyopenms.AASequenceCache(10)
+        seq = cache.fromString(b"PEPTM(Oxidation)IDEK")
+        self.assertEqual(seq, pyopenms.AASequence.fromString(b"PEPTM(Oxidation)IDEK", False))
+        self.assertTrue("PEPTM(Oxidation)IDEK" in cache)
+
+        # the cached sequence is not affected by modifying the result
+        seq.setModification(3, b"Phospho")
+        self.assertEqual(cache.fromString(b"PEPTM(Oxidation)IDEK").toString(), b"PEPTM(Oxidation)IDEK")
+        self.assertEqual(cache.getStatistics()["misses"], 1)
+        self.assertEqual(cache.getStatistics()["hits"], 2)
+
+        self.assertRaises(RuntimeError, cache.fromString, b"PEPTIDE(NotAModification)")
+
+        # permissive parses are cached separately
+        self.assertEqual(cache.fromString(b"PEP TIDE", True).toString(), b"PEPTIDE")
+        self.assertEqual(cache.getStatistics()["misses"], 2)
+        self.assertRaises(RuntimeError, cache.fromString, b"PEP TIDE")
+
+    def test_masses(self):
+        cache = pyopenms.AASequenceCache()
+        sequences = [b"PEPTIDE", b"DFPIANGER", b"PEPTIDE", b"SYVAWDR"]
+        peptides = [pyopenms.AASequence.fromString(s, False) for s in sequences]
+
+        masses = cache.masses(sequences)
+        self.assertEqual(masses.dtype, np.float64)
+        for mass, peptide in zip(masses, peptides):
+            self.assertAlmostEqual(mass, peptide.getMonoWeight())
+        self.assertAlmostEqual(cache.getMonoWeight(b"PEPTIDE"), peptides[0].getMonoWeight())
+
+        charges = [1, 2, 3, 0]
+        mz = cache.masses(sequences, charges)
+        for i in range(3):
+            self.assertAlmostEqual(mz[i], getMZ(peptides[i], charges[i]), places=6)
+        self.assertAlmostEqual(mz[3], peptides[3].getMonoWeight())
+        self.assertTrue(np.allclose(cache.masses(sequences, 2), [getMZ(p, 2) for p in peptides]))
+        self.assertEqual(len(cache.masses([], 2)), 0)
+
+    def test_lru(self):
+        cache = pyopenms.AASequenceCache(2)
+        cache.masses([b"AAAK", b"CCCK", b"AAAK", b"DDDK"])
+        stats = cache.getStatistics()
+        self.assertEqual((stats["hits"], stats["misses"], stats["evictions"]), (1, 3, 1))
+        self.assertEqual(len(cache), 2)
+        # CCCK was the least recently used sequence
+        self.assertFalse(b"CCCK" in cache)
+        self.assertTrue(b"AAAK" in cache)
+
+        cache.setMaxSize(1)
+        self.assertEqual(len(cache), 1)
+        self.assertTrue(b"DDDK" in cache)
+        cache.clear()
+        self.assertEqual(cache.getStatistics()["size"], 0)
+        self.assertEqual(cache.getStatistics()["hit_rate"], 0.0)
+        self.assertRaises(ValueError, pyopenms.AASequenceCache, 0)
+
+    def test_processWide(self):
+        pyopenms.getAASequenceCache().clear()
+        pyopenms.cachedFromString(b"PEPTIDEK")
+        mz = pyopenms.sequenceMasses([b"PEPTIDEK"], [2])
+        self.assertEqual(pyopenms.getAASequenceCache().getStatistics()["hits"], 1)
+
+        # AASequence.fromString parses through the process-wide cache
+        peptide = pyopenms.AASequence.fromString(b"PEPTIDEK", False)
+        self.assertAlmostEqual(mz[0], getMZ(peptide, 2), places=6)
+        self.assertEqual(pyopenms.getAASequenceCache().getStatistics()["hits"], 2)
+        pyopenms.AASequence.fromString(pyopenms.String(b"SAMPLER"), False)
+        self.assertTrue(b"SAMPLER" in pyopenms.getAASequenceCache())
+
+        # the result is a copy
+        peptide.setModification(3, b"Phospho")
+        self.assertEqual(pyopenms.AASequence.fromString(b"PEPTIDEK", False).toString(), b"PEPTIDEK")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -30,5 +30,15 @@ class TestMorphologicalFilter(unittest.TestCase):
         self.assertEqual(old_firstspec[10].getMZ(), self.exp[0][10].getMZ())
         self.assertNotEqual(old_firstspec[10].getIntensity(), self.exp[0][10].getIntensity())
 
+    def test_run_threads(self):
+        thisfilter = pyopenms.MorphologicalFilter()
+        params = thisfilter.getDefaults()
+        params.setValue(b"struc_elem_length", 0.05, b'')
+        thisfilter.setParameters(params)
+        serial = pyopenms.MSExperiment(self.exp)
+        thisfilter.filterExperiment(serial, 1)
+        thisfilter.filterExperiment(self.exp, 4)
+        self.assertEqual(self.exp, serial)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+import numpy as np
+
+import pyopenms
+
+class TestBinnedSpectrumNeighborSearch(unittest.TestCase):
+
+    def setUp(self):
+        # spectra 0, 1 and 3 are similar, 2 has a different precursor, 4 a different charge
+        peaks = [[100.0, 200.0, 300.0, 400.0],
+                 [100.0, 200.0, 300.0, 450.0],
+                 [100.0, 200.0, 300.0, 400.0],
+                 [100.0, 250.0, 300.0, 400.0],
+                 [100.0, 200.0, 300.0, 400.0]]
+        precursors = [(500.0, 2), (500.5, 2), (800.0, 2), (501.0, 0), (500.2, 3)]
+        self.spectra = []
+        for mz, (prec_mz, charge) in zip(peaks, precursors):
+            spec = pyopenms.MSSpectrum()
+            spec.set_peaks((mz, [10.0, 20.0, 30.0, 40.0]))
+            prec = pyopenms.Precursor()
+            prec.setMZ(prec_mz)
+            prec.setCharge(charge)
+            spec.setPrecursors([prec])
+            self.spectra.append(spec)
+
+        self.search = pyopenms.BinnedSpectrumNeighborSearch()
+        p = self.search.getParameters()
+        p.setValue(b"intensity_scaling", b"none")
+        self.search.setParameters(p)
+
+    def test_binnedMatrix(self):
+        self.search.setSpectra(self.spectra, 0)
+        self.assertEqual(self.search.size(), 5)
+        offsets, bins, values = self.search.getBinnedMatrix()
+        self.assertEqual(list(offsets), [0, 4, 8, 12, 16, 20])
+        self.assertEqual(bins.dtype, np.int32)
+        self.assertEqual(values.dtype, np.float32)
+        for i in range(5):
+            row = values[offsets[i]:offsets[i + 1]]
+            self.assertAlmostEqual(float(np.dot(row, row)), 1.0, places=5)
+            self.assertTrue(np.all(np.diff(bins[offsets[i]:offsets[i + 1]]) > 0))
+
+    def test_neighbors(self):
+        exp = pyopenms.MSExperiment()
+        for spec in self.spectra:
+            exp.addSpectrum(spec)
+        self.search.setSpectra(exp, 2)
+        offsets, neighbors, scores, dot_bias = self.search.getNeighbors(2)
+        self.assertEqual(len(offsets), 6)
+        self.assertEqual(list(neighbors[offsets[0]:offsets[1]]), [3, 1])
+        self.assertTrue(scores[0] >= scores[1])
+        # cosine of the binned spectra
+        _, bins, values = self.search.getBinnedMatrix()
+        dense = np.zeros((5, bins.max() + 1))
+        for i in range(5):
+            dense[i, bins[4 * i:4 * i + 4]] = values[4 * i:4 * i + 4]
+        self.assertAlmostEqual(scores[1], np.dot(dense[0], dense[1]), places=5)
+        self.assertAlmostEqual(dot_bias[1], np.sqrt(np.sum((dense[0] * dense[1]) ** 2)) / scores[1], places=4)
+        # precursor window and charge
+        self.assertEqual(offsets[3] - offsets[2], 0)
+        self.assertEqual(list(neighbors[offsets[4]:offsets[5]]), [3])
+
+    def test_allPairs(self):
+        p = self.search.getParameters()
+        p.setValue(b"precursor_mass_tolerance", -1.0)
+        p.setValue(b"match_charge", b"false")
+        p.setValue(b"top_k", 1)
+        self.search.setParameters(p)
+        self.search.setSpectra(self.spectra, 0)
+        offsets, neighbors, scores, dot_bias = self.search.getNeighbors()
+        self.assertEqual(list(offsets), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(neighbors[0], 2)
+        self.assertAlmostEqual(scores[0], 1.0, places=5)
+
+    def test_empty(self):
+        self.search.setSpectra([], 0)
+        offsets, neighbors, scores, dot_bias = self.search.getNeighbors()
+        self.assertEqual(list(offsets), [0])
+        self.assertEqual(len(neighbors), 0)
+
+if __name__ == '__main__':
+    unittest.main()
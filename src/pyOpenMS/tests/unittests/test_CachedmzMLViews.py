@@ -0,0 +1,69 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import pyopenms
+
+class TestCachedmzMLViews(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.abspath(__file__))
+        self.exp = pyopenms.MSExperiment()
+        pyopenms.MzMLFile().load(os.path.join(dirname, "test2.mzML").encode(), self.exp)
+        chrom = pyopenms.MSChromatogram()
+        chrom.set_peaks((np.array([1.0, 2.0, 3.0]), np.array([10.0, 20.0, 30.0])))
+        self.exp.addChromatogram(chrom)
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "cache.mzML").encode()
+        pyopenms.CachedmzML.store(self.filename, self.exp)
+        self.cached = pyopenms.CachedmzML()
+        pyopenms.CachedmzML.load(self.filename, self.cached)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_offsets(self):
+        self.assertEqual(self.cached.getCachedFilename(), self.filename + b".cached")
+        offsets = self.cached.getSpectraOffsets()
+        self.assertEqual(len(offsets), self.exp.size())
+        self.assertEqual(offsets[0], 4)
+        self.assertTrue(np.all(np.diff(offsets) > 0))
+        self.assertEqual(len(self.cached.getChromatogramOffsets()), 1)
+
+    def test_spectra(self):
+        views = pyopenms.CachedmzMLViews(self.cached)
+        self.assertEqual(views.getNrSpectra(), self.exp.size())
+        for i, spec in enumerate(self.exp):
+            mz, intensity = spec.get_peaks()
+            v_mz, v_intensity = views.getSpectrumPeaks(i)
+            self.assertEqual(views.spectra_sizes[i], spec.size())
+            self.assertTrue(np.array_equal(mz, v_mz))
+            self.assertTrue(np.array_equal(intensity, v_intensity))
+            self.assertFalse(v_mz.flags.writeable)
+
+        indices = [2, 0, 2]
+        batch = views.getSpectraPeaks(indices)
+        self.assertEqual(len(batch), len(indices))
+        for i, (v_mz, v_intensity) in zip(indices, batch):
+            mz, intensity = views.getSpectrumPeaks(i)
+            self.assertTrue(np.array_equal(mz, v_mz))
+            self.assertTrue(np.array_equal(intensity, v_intensity))
+
+        self.assertRaises(IndexError, views.getSpectrumPeaks, self.exp.size())
+
+    def test_chromatograms(self):
+        # open from the file name
+        views = pyopenms.CachedmzMLViews(self.filename)
+        self.assertEqual(views.getNrChromatograms(), 1)
+        rt, intensity = views.getChromatogramPeaks(0)
+        self.assertEqual(list(rt), [1.0, 2.0, 3.0])
+        self.assertEqual(list(intensity), [10.0, 20.0, 30.0])
+        (rt, intensity), = views.getChromatogramsPeaks([0])
+        self.assertEqual(list(rt), [1.0, 2.0, 3.0])
+
+if __name__ == '__main__':
+    unittest.main()
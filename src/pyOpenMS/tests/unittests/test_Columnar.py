@@ -0,0 +1,64 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import pyopenms
+
+class TestColumnar(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.abspath(__file__))
+        self.filename = os.path.join(dirname, "test2.mzML").encode()
+        self.exp = pyopenms.MSExperiment()
+        pyopenms.MzMLFile().load(self.filename, self.exp)
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _check(self, columnar):
+        self.assertEqual(len(columnar), self.exp.size())
+        self.assertEqual(columnar.offsets[-1], len(columnar.mz))
+        for i, spec in enumerate(self.exp):
+            mz, intensity = spec.get_peaks()
+            c_mz, c_intensity = columnar.getPeaks(i)
+            self.assertTrue(np.array_equal(mz, c_mz))
+            self.assertTrue(np.array_equal(intensity, c_intensity))
+            self.assertAlmostEqual(columnar.rt[i], spec.getRT())
+            self.assertEqual(columnar.ms_level[i], spec.getMSLevel())
+            self.assertEqual(columnar.native_ids[i], spec.getNativeID())
+            if spec.getMSLevel() > 1:
+                self.assertAlmostEqual(columnar.precursor_mz[i],
+                                       spec.getPrecursors()[0].getMZ())
+
+        spec = columnar.getSpectrum(0)
+        self.assertEqual(spec.size(), self.exp[0].size())
+        self.assertEqual(spec.getNativeID(), self.exp[0].getNativeID())
+
+    def test_from_file(self):
+        out = os.path.join(self.tmpdir, "run.columnar")
+        pyopenms.storeColumnar(self.filename, out)
+        self._check(pyopenms.ColumnarExperiment(out))
+
+    def test_from_experiment(self):
+        out = os.path.join(self.tmpdir, "run.columnar")
+        pyopenms.storeColumnar(self.exp, out)
+        self._check(pyopenms.ColumnarExperiment(out))
+
+    def test_zero_copy(self):
+        out = os.path.join(self.tmpdir, "run.columnar")
+        pyopenms.storeColumnar(self.exp, out)
+        columnar = pyopenms.ColumnarExperiment(out)
+
+        self.assertTrue(isinstance(columnar.mz, np.memmap))
+        mz, intensity = columnar.getPeaks(0)
+        # views into the mapped file, not copies
+        self.assertTrue(mz.base is not None)
+        self.assertFalse(mz.flags.writeable)
+        self.assertRaises(IndexError, columnar.getPeaks, len(columnar))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import pyopenms
+
+class TestIndexedFASTAFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "db.fasta")
+        with open(self.filename, "w") as f:
+            f.write(">P1 first protein\nPEPTIDEKAAAR\nMKR\n")
+            f.write(">sp|P2|X\nLLLKPEPR\n")
+            for i in range(100):
+                f.write(">acc%d protein %d\n%s\n" % (i, i, "ACDEFGHIK" * (i + 1)))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_iterEntries(self):
+        entries = list(pyopenms.FASTAFile().iterEntries(self.filename.encode()))
+        self.assertEqual(len(entries), 102)
+        self.assertEqual(entries[0].identifier, b"P1")
+        self.assertEqual(entries[0].description, b"first protein")
+        self.assertEqual(entries[0].sequence, b"PEPTIDEKAAARMKR")
+        self.assertEqual(entries[-1].identifier, b"acc99")
+
+        # position / setPosition
+        f = pyopenms.FASTAFile()
+        f.readStart(self.filename.encode())
+        entry = pyopenms.FASTAEntry()
+        f.readNext(entry)
+        pos = f.position()
+        f.readNext(entry)
+        self.assertEqual(entry.identifier, b"sp|P2|X")
+        self.assertTrue(f.setPosition(pos))
+        f.readNext(entry)
+        self.assertEqual(entry.identifier, b"sp|P2|X")
+
+    def test_lookup(self):
+        fasta = pyopenms.IndexedFASTAFile(self.filename)
+        self.assertTrue(os.path.isfile(self.filename + ".oidx"))
+        self.assertEqual(len(fasta), 102)
+        self.assertTrue("sp|P2|X" in fasta)
+        self.assertFalse("P3" in fasta)
+        self.assertEqual(fasta.getOffsets(["P1", b"sp|P2|X", "nope"]).tolist(), [0, 35, -1])
+
+        entries = fasta.getEntries(["acc42", "P1", "acc7"])
+        self.assertEqual([e.identifier for e in entries], [b"acc42", b"P1", b"acc7"])
+        self.assertEqual(entries[2].sequence, b"ACDEFGHIK" * 8)
+        self.assertRaises(KeyError, fasta.getEntry, "nope")
+
+        # digestion of the selected proteins only
+        digestion = pyopenms.ProteaseDigestion()
+        digestion.setEnzyme(b"Trypsin")
+        peptides = []
+        for entry in fasta.getEntries(["P1", "sp|P2|X"]):
+            result = []
+            digestion.digest(pyopenms.AASequence.fromString(entry.sequence, False), result)
+            peptides.extend(p.toString() for p in result)
+        self.assertTrue(b"PEPTIDEK" in peptides)
+        self.assertTrue(b"AAAR" in peptides)
+        self.assertTrue(b"LLLKPEPR" in peptides)
+
+        # the existing index is reused, an outdated one is rejected
+        fasta = pyopenms.IndexedFASTAFile(self.filename, create=False)
+        self.assertEqual(len(fasta), 102)
+        with open(self.filename, "a") as f:
+            f.write(">new\nKKK\n")
+        os.utime(self.filename, (0, 0))
+        self.assertRaises(IOError, pyopenms.IndexedFASTAFile, self.filename, None, False)
+        self.assertEqual(pyopenms.IndexedFASTAFile(self.filename).getEntry("new").sequence, b"KKK")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -88,6 +88,48 @@ class TestIndexedMzMLFileLoader(unittest.TestCase):
 
             self.assertTrue(raised)
 
+    def test_loadParallel(self):
+        e = pyopenms.MSExperiment()
+        self.assertTrue(pyopenms.IndexedMzMLFileLoader().loadParallel(self.filename, e, 2))
+
+        e2 = pyopenms.MSExperiment()
+        pyopenms.MzMLFile().load(self.filename, e2)
+        self.assertEqual(e.size(), 2)
+        self.assertEqual(e.getNrChromatograms(), 1)
+        for s, s2 in zip(e, e2):
+            self.assertEqual(s, s2)
+        self.assertEqual(e.getChromatogram(0), e2.getChromatogram(0))
+
+    def test_getSpectra(self):
+        e = pyopenms.OnDiscMSExperiment();
+        pyopenms.IndexedMzMLFileLoader().load(self.filename, e)
+
+        spectra = e.getSpectra([1, 0, 1])
+        self.assertEqual([s.size() for s in spectra], [19800, 19914, 19800])
+        self.assertEqual(spectra[1], e.getSpectrum(0))
+        self.assertEqual(len(e.getSpectra([0, 1], 2)), 2)
+        self.assertEqual(e.getSpectra([]), [])
+        self.assertRaises(Exception, e.getSpectra, [2])
+
+    def test_prefetcher(self):
+        e = pyopenms.OnDiscMSExperiment();
+        pyopenms.IndexedMzMLFileLoader().load(self.filename, e)
+
+        with pyopenms.SpectrumPrefetcher(e, read_ahead=1, cache_size=2) as prefetcher:
+            self.assertEqual(prefetcher.getSpectrum(0).size(), 19914)
+            self.assertEqual(prefetcher.getSpectrum(1).size(), 19800)
+            self.assertEqual(prefetcher.misses, 1)
+            self.assertEqual(prefetcher.hits, 1)
+
+            sizes = [s.size() for s in prefetcher.iterSpectra([1, 0, 0, 1])]
+            self.assertEqual(sizes, [19800, 19914, 19914, 19800])
+
+        # repeated indices within one read-ahead batch
+        with pyopenms.SpectrumPrefetcher(e, read_ahead=3, cache_size=4) as prefetcher:
+            sizes = [s.size() for s in prefetcher.iterSpectra([1, 0, 0, 1, 1])]
+            self.assertEqual(sizes, [19800, 19914, 19914, 19800, 19800])
+            self.assertEqual(prefetcher.hits + prefetcher.misses, 5)
+
 class TestIndexedMzMLFile(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,58 @@
+import unittest
+import os
+import tempfile
+
+import numpy as np
+
+import pyopenms
+
+class TestIsotopeDistributionCache(unittest.TestCase):
+
+    def test_getIsotopeDistributions(self):
+        cache = pyopenms.IsotopeDistributionCache(5000.0, 1.0, 0.0, 0.0)
+        masses = np.array([500.0, 1500.2, 4999.0, 500.5])
+        patterns = cache.getIsotopeDistributions(masses, 8)
+        self.assertEqual(patterns.shape, (4, 8))
+        self.assertEqual(patterns.dtype, np.float64)
+        for mass, row in zip(masses, patterns):
+            pattern = cache.getIsotopeDistribution(mass)
+            n = min(len(pattern.intensity), 8 - pattern.trimmed_left)
+            self.assertTrue(np.allclose(row[pattern.trimmed_left:pattern.trimmed_left + n], pattern.intensity[:n]))
+            self.assertAlmostEqual(row.max(), 1.0)
+        self.assertTrue(np.array_equal(patterns[0], patterns[3]))
+        # the monoisotopic peak is the highest at low, but not at high masses
+        self.assertEqual(patterns[0].argmax(), 0)
+        self.assertTrue(patterns[2].argmax() > 0)
+
+        self.assertEqual(cache.getIsotopeDistributions([], 8).shape, (0, 8))
+        self.assertRaises(RuntimeError, cache.getIsotopeDistributions, [6000.0], 8)
+
+    def test_formulas(self):
+        formulas = [b"C6H12O6", pyopenms.EmpiricalFormula(b"C100H150N30O40S")]
+        patterns = pyopenms.IsotopeDistributionCache.getFormulaIsotopeDistributions(formulas, 5, 2)
+        self.assertEqual(patterns.shape, (2, 5))
+        for formula, row in zip(formulas, patterns):
+            if not isinstance(formula, pyopenms.EmpiricalFormula):
+                formula = pyopenms.EmpiricalFormula(formula)
+            d = formula.getIsotopeDistribution(pyopenms.CoarseIsotopePatternGenerator(5))
+            expected = np.array([p.getIntensity() for p in d.getContainer()])
+            self.assertTrue(np.allclose(row[:len(expected)], expected / expected.max()))
+
+    def test_storeLoad(self):
+        cache = pyopenms.IsotopeDistributionCache(2000.0, 10.0, 0.0, 0.0)
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            cache.store(filename.encode())
+            loaded = pyopenms.IsotopeDistributionCache(10.0, 1.0, 0.0, 0.0)
+            loaded.load(filename.encode())
+            self.assertEqual(loaded.getMassWindowWidth(), 10.0)
+            self.assertEqual(loaded.getMaxMass(), cache.getMaxMass())
+            masses = np.linspace(100.0, 1999.0, 50)
+            self.assertTrue(np.array_equal(cache.getIsotopeDistributions(masses, 6),
+                                           loaded.getIsotopeDistributions(masses, 6)))
+        finally:
+            os.remove(filename)
+
+if __name__ == '__main__':
+    unittest.main()
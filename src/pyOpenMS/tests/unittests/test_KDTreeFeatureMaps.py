@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+import pyopenms
+
+class TestKDTreeFeatureMapsQueries(unittest.TestCase):
+
+    def setUp(self):
+        # grid of features at RT 100, 200, ..., 1000 and m/z 100, 200, ..., 1000 (in two maps)
+        maps = [pyopenms.FeatureMap(), pyopenms.FeatureMap()]
+        for i in range(1, 11):
+            for j in range(1, 11):
+                f = pyopenms.Feature()
+                f.setRT(100.0 * i)
+                f.setMZ(100.0 * j)
+                f.setIntensity(float(i * j))
+                maps[i % 2].push_back(f)
+        self.tree = pyopenms.KDTreeFeatureMaps(maps, pyopenms.Param())
+        self.rt, self.mz = self.tree.get_coordinates()
+
+    def brute_force_box(self, rt_lo, rt_hi, mz_lo, mz_hi):
+        return np.flatnonzero((self.rt >= rt_lo) & (self.rt <= rt_hi) & (self.mz >= mz_lo) & (self.mz <= mz_hi))
+
+    def test_coordinates(self):
+        self.assertEqual(len(self.rt), 100)
+        for i in range(0, 100, 7):
+            self.assertEqual(self.rt[i], self.tree.rt(i))
+            self.assertEqual(self.mz[i], self.tree.mz(i))
+
+    def test_query_box(self):
+        indices = self.tree.query_box(150.0, 350.0, 450.0, 650.0)
+        self.assertEqual(indices.dtype, np.int64)
+        self.assertEqual(list(indices), list(self.brute_force_box(150.0, 350.0, 450.0, 650.0)))
+        self.assertEqual(len(self.tree.query_box(5000.0, 6000.0, 0.0, 1000.0)), 0)
+
+    def test_query_boxes(self):
+        rng = np.random.RandomState(42)
+        rt_lo = rng.uniform(0, 1000, 200)
+        mz_lo = rng.uniform(0, 1000, 200)
+        rt_hi = rt_lo + rng.uniform(0, 300, 200)
+        mz_hi = mz_lo + rng.uniform(0, 300, 200)
+        offsets, indices = self.tree.query_boxes(rt_lo, rt_hi, mz_lo, mz_hi, 2)
+        self.assertEqual(len(offsets), 201)
+        for i in range(200):
+            self.assertEqual(list(indices[offsets[i]:offsets[i + 1]]),
+                             list(self.brute_force_box(rt_lo[i], rt_hi[i], mz_lo[i], mz_hi[i])))
+        self.assertRaises(RuntimeError, self.tree.query_boxes, rt_lo, rt_hi[:10], mz_lo, mz_hi)
+
+    def test_query_radius(self):
+        indices = self.tree.query_radius(500.0, 500.0, 100.0, 100.0)
+        self.assertEqual(len(indices), 5)
+        distance = ((self.rt[indices] - 500.0) / 100.0) ** 2 + ((self.mz[indices] - 500.0) / 100.0) ** 2
+        self.assertTrue(np.all(distance <= 1.0))
+
+        offsets, indices = self.tree.query_radius([500.0, 510.0], [500.0, 500.0], 100.0, 2000.0, True)
+        self.assertEqual(list(np.diff(offsets)), [3, 2])
+        self.assertTrue(np.all(self.mz[indices] == 500.0))
+
+    def test_nearest_neighbors(self):
+        nearest = self.tree.nearest_neighbors([520.0, 5000.0, 290.0], [480.0, 500.0, 910.0], 100.0, 100.0)
+        self.assertEqual(nearest[1], -1)
+        self.assertEqual((self.rt[nearest[0]], self.mz[nearest[0]]), (500.0, 500.0))
+        self.assertEqual((self.rt[nearest[2]], self.mz[nearest[2]]), (300.0, 900.0))
+
+if __name__ == '__main__':
+    unittest.main()
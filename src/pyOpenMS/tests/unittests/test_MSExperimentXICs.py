@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+import pyopenms
+
+
+class TestMSExperimentXICs(unittest.TestCase):
+
+    def setUp(self):
+        self.exp = pyopenms.MSExperiment()
+        rng = np.random.RandomState(42)
+        for i in range(20):
+            spec = pyopenms.MSSpectrum()
+            spec.setRT(10.0 * i)
+            spec.setMSLevel(2 if i % 5 == 4 else 1)
+            mz = np.sort(rng.uniform(400.0, 600.0, 200))
+            spec.set_peaks((mz, rng.uniform(0.0, 100.0, 200)))
+            self.exp.addSpectrum(spec)
+
+    def reference(self, mz_lo, mz_hi, rt_lo, rt_hi, ms_level=1):
+        spectra = [s for s in self.exp if s.getMSLevel() == ms_level]
+        result = np.zeros((len(mz_lo), len(spectra)), dtype=np.float64)
+        for k, spec in enumerate(spectra):
+            for w in range(len(mz_lo)):
+                if rt_lo[w] <= spec.getRT() <= rt_hi[w]:
+                    result[w, k] = spec.intensityInRange(mz_lo[w], mz_hi[w])
+        return np.array([s.getRT() for s in spectra]), result
+
+    def testExtractXICs(self):
+        rng = np.random.RandomState(7)
+        mz_lo = rng.uniform(390.0, 610.0, 100)
+        mz_hi = mz_lo + rng.uniform(0.0, 5.0, 100)
+        rt_lo = rng.uniform(-10.0, 150.0, 100)
+        rt_hi = rt_lo + rng.uniform(0.0, 100.0, 100)
+
+        rts, xics = self.exp.extractXICs(mz_lo, mz_hi, rt_lo, rt_hi)
+        expected_rts, expected = self.reference(mz_lo, mz_hi, rt_lo, rt_hi)
+        self.assertEqual(xics.shape, (100, 16))
+        self.assertEqual(xics.dtype, np.float32)
+        np.testing.assert_array_equal(rts, expected_rts)
+        np.testing.assert_allclose(xics, expected, rtol=1e-5)
+        self.assertTrue((xics > 0).any())
+
+        # multi-threaded and MS2 extraction
+        _, xics_threaded = self.exp.extractXICs(mz_lo, mz_hi, rt_lo, rt_hi, nr_threads=4)
+        np.testing.assert_array_equal(xics_threaded, xics)
+        rts, xics = self.exp.extractXICs(mz_lo, mz_hi, rt_lo, rt_hi, ms_level=2)
+        expected_rts, expected = self.reference(mz_lo, mz_hi, rt_lo, rt_hi, 2)
+        np.testing.assert_array_equal(rts, expected_rts)
+        np.testing.assert_allclose(xics, expected, rtol=1e-5)
+
+    def testEmpty(self):
+        rts, xics = self.exp.extractXICs([], [], [], [])
+        self.assertEqual(len(rts), 16)
+        self.assertEqual(xics.shape, (0, 16))
+        rts, xics = pyopenms.MSExperiment().extractXICs([500.0], [501.0], [0.0], [10.0])
+        self.assertEqual(xics.shape, (1, 0))
+
+    def testInvalidWindows(self):
+        self.assertRaises(RuntimeError, self.exp.extractXICs, [500.0], [501.0, 502.0], [0.0], [10.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
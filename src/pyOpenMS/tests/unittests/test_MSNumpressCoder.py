@@ -1,6 +1,8 @@
 import unittest
 import os
 
+import numpy as np
+
 import pyopenms
 
 class TestMSNumpressCoder(unittest.TestCase):
@@ -108,5 +110,59 @@ class TestMSNumpressCoder(unittest.TestCase):
         for a,b in zip(self.testData, out):
             self.assertAlmostEqual( a, b, places=7)
 
+    def test_numpy(self):
+        coder = pyopenms.MSNumpressCoder()
+        config = pyopenms.NumpressConfig()
+        config.np_compression = pyopenms.MSNumpressCoder.NumpressCompression.LINEAR
+        config.estimate_fixed_point = True
+
+        out = coder.encodeNumpy(np.array(self.testData), False, config)
+        self.assertEqual(out, b"QWR64UAAAADo//8/0P//f1kSgA==")
+        # any sequence is accepted as input
+        self.assertEqual(coder.encodeNumpy(self.testData, False, config), out)
+
+        decoded = coder.decodeNumpy(out, False, config)
+        self.assertEqual(decoded.dtype, np.float64)
+        self.assertTrue(np.allclose(decoded, self.testData))
+        self.assertEqual(len(coder.decodeNumpy(coder.encodeNumpy([], True, config), True, config)), 0)
+
+    def test_numpy_batch(self):
+        coder = pyopenms.MSNumpressCoder()
+        config = pyopenms.NumpressConfig()
+        config.np_compression = pyopenms.MSNumpressCoder.NumpressCompression.SLOF
+        config.estimate_fixed_point = True
+
+        arrays = [np.array(self.testData) * (i + 1) for i in range(20)]
+        encoded = coder.encodeNumpyBatch(arrays, True, config, 4)
+        self.assertEqual(len(encoded), 20)
+        for data, enc in zip(arrays, encoded):
+            self.assertEqual(enc, coder.encodeNumpy(data, True, config))
+
+        decoded = coder.decodeNumpyBatch(encoded, True, config)
+        for data, dec in zip(arrays, decoded):
+            self.assertTrue(np.allclose(data, dec, rtol=1e-3))
+
+class TestBase64Numpy(unittest.TestCase):
+
+    def test_numpy(self):
+        b = pyopenms.Base64()
+        order = pyopenms.Base64.ByteOrder.BYTEORDER_BIGENDIAN
+        data = np.array([300.15, 303.998, 304.6])
+        out = b.encodeNumpy(data, order, False)
+        self.assertEqual(out, b"QHLCZmZmZmZAcv/3ztkWh0BzCZmZmZma")
+        self.assertTrue(np.array_equal(b.decodeNumpy(out, order, False), data))
+        # the input array is not modified (byte order)
+        self.assertEqual(data[0], 300.15)
+
+    def test_numpy_batch(self):
+        b = pyopenms.Base64()
+        order = pyopenms.Base64.ByteOrder.BYTEORDER_LITTLEENDIAN
+        arrays = [np.arange(i, dtype=np.float64) for i in range(10)]
+        encoded = b.encodeNumpyBatch(arrays, order, True, 2)
+        decoded = b.decodeNumpyBatch(encoded, order, True, 2)
+        self.assertEqual(len(decoded), 10)
+        for data, dec in zip(arrays, decoded):
+            self.assertTrue(np.array_equal(data, dec))
+
 if __name__ == '__main__':
     unittest.main()
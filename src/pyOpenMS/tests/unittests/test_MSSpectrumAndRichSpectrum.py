@@ -30,5 +30,17 @@ class TestMSSpectrumAndRichSpectrum(unittest.TestCase):
         assert spec.getMaxInt() == 1e5
         assert spec.getMinInt() == 1e5
 
+    def testIntensityInRange(self):
+        spec = pyopenms.MSSpectrum()
+        spec.set_peaks(([100.0, 101.0, 102.0, 103.0], [1.0, 2.0, 4.0, 8.0]))
+        self.assertEqual(spec.intensityInRange(100.5, 102.0), 6.0)
+        self.assertEqual(spec.intensityInRange(0.0, 1000.0), 15.0)
+        self.assertEqual(spec.intensityInRange(103.0, 103.0), 8.0)
+        # no peaks inside, above or below the range
+        self.assertEqual(spec.intensityInRange(101.2, 101.8), 0.0)
+        self.assertEqual(spec.intensityInRange(200.0, 300.0), 0.0)
+        self.assertEqual(spec.intensityInRange(10.0, 20.0), 0.0)
+        self.assertEqual(pyopenms.MSSpectrum().intensityInRange(0.0, 1000.0), 0.0)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import os
+
+import pyopenms
+
+
+class TestPeakPickerHiRes(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.abspath(__file__))
+        self.exp = pyopenms.MSExperiment()
+        pyopenms.MzMLFile().load(os.path.join(dirname, "test2.mzML").encode(), self.exp)
+
+    def test_pickExperimentParallel(self):
+        picker = pyopenms.PeakPickerHiRes()
+        serial = pyopenms.MSExperiment()
+        picker.pickExperiment(self.exp, serial)
+
+        parallel = pyopenms.MSExperiment()
+        progress = []
+        finished = picker.pickExperimentParallel(self.exp, parallel, 4, lambda done, total, rate: progress.append((done, total)), 2)
+        self.assertTrue(finished)
+        self.assertEqual(parallel, serial)
+
+        total = self.exp.size() + self.exp.getNrChromatograms()
+        self.assertEqual(progress[-1], (total, total))
+        self.assertEqual([done for done, _ in progress], [min(i, total) for i in range(2, total + 2, 2)])
+
+    def test_stop(self):
+        picker = pyopenms.PeakPickerHiRes()
+        output = pyopenms.MSExperiment()
+        calls = []
+
+        def callback(done, total, rate):
+            calls.append(done)
+            return False
+
+        self.assertFalse(picker.pickExperimentParallel(self.exp, output, callback=callback, block_size=1))
+        self.assertEqual(calls, [1])
+        # the output was initialized, but only the first spectrum was picked
+        self.assertEqual(output.size(), self.exp.size())
+        self.assertEqual(output[self.exp.size() - 1].size(), 0)
+
+    def test_empty(self):
+        output = pyopenms.MSExperiment()
+        self.assertTrue(pyopenms.PeakPickerHiRes().pickExperimentParallel(pyopenms.MSExperiment(), output))
+        self.assertEqual(output.size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
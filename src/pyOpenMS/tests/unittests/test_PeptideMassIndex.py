@@ -0,0 +1,87 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import pyopenms
+
+class TestPeptideMassIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "db.fasta")
+        with open(self.filename, "w") as f:
+            f.write(">P1 first\nMKWVTFISLLLLFSSAYSRGVFRRDTHKSEIAHRFKDLGEEHFK\n")
+            f.write(">P2 second\nGLVLIAFSQYLQQCPFDEHVKLVNELTEFAK\n")
+            f.write(">P3 shares a peptide with P2\nAAAAAKGLVLIAFSQYLQQCPFDEHVK\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_build(self):
+        index = pyopenms.PeptideMassIndex(self.filename, missed_cleavages=1, min_length=5,
+                                          fixed_modifications=["Carbamidomethyl (C)"])
+        self.assertTrue(os.path.isfile(self.filename + ".pepidx"))
+        masses = index.getMasses()
+        self.assertEqual(len(masses), len(index))
+        self.assertTrue(np.all(np.diff(masses) >= 0))
+
+        # same peptides as ProteaseDigestion
+        digestion = pyopenms.ProteaseDigestion()
+        digestion.setMissedCleavages(1)
+        expected = set()
+        for entry in pyopenms.FASTAFile().iterEntries(self.filename.encode()):
+            peptides = []
+            digestion.digest(pyopenms.AASequence.fromString(entry.sequence, False), peptides, 5, 40)
+            expected.update(p.toUnmodifiedString() for p in peptides)
+        sequences = index.getSequences(np.arange(len(index)))
+        self.assertEqual(set(pyopenms.AASequence.fromString(s, False).toUnmodifiedString() for s in sequences), expected)
+
+        for i, s in enumerate(sequences):
+            peptide = pyopenms.AASequence.fromString(s, False)
+            self.assertAlmostEqual(peptide.getMonoWeight(), masses[i], places=6)
+            if b"C" in peptide.toUnmodifiedString():
+                self.assertTrue(peptide.isModified())
+
+        shared = sequences.index(b"GLVLIAFSQYLQQC(Carbamidomethyl)PFDEHVK")
+        self.assertEqual(index.getProteins(shared), [b"P2", b"P3"])
+
+    def test_query(self):
+        index = pyopenms.PeptideMassIndex(self.filename, min_length=5)
+        masses = index.getMasses()
+        begin, end = index.query(masses + 0.001, 5.0, "ppm")
+        self.assertTrue(np.all(begin <= np.arange(len(index))))
+        self.assertTrue(np.all(end > np.arange(len(index))))
+        for i in range(len(index)):
+            window = masses[begin[i]:end[i]]
+            self.assertTrue(np.all(np.abs(window - masses[i] - 0.001) <= (masses[i] + 0.001) * 5e-6))
+
+        mz = (masses + 2 * 1.007276466771) / 2
+        begin2, end2 = index.queryMZ(mz, np.full(len(mz), 2), 0.01, "Da")
+        self.assertTrue(np.all(begin2 <= np.arange(len(index))))
+        self.assertEqual(list(index.getCandidates(masses[0], 0.0001, "Da")), [0])
+        self.assertEqual(len(index.getCandidates(10.0, 1.0, "Da")), 0)
+        self.assertRaises(ValueError, index.query, masses, 1.0, "Th")
+
+    def test_reuse(self):
+        index = pyopenms.PeptideMassIndex(self.filename, missed_cleavages=0)
+        n = len(index)
+        stamp = os.path.getmtime(index.index_file)
+        # settings are taken from the existing index
+        index = pyopenms.PeptideMassIndex(self.filename)
+        self.assertEqual(len(index), n)
+        self.assertEqual(index.settings["missed_cleavages"], 0)
+        self.assertEqual(os.path.getmtime(index.index_file), stamp)
+
+        self.assertRaises(IOError, pyopenms.PeptideMassIndex, self.filename, create=False, missed_cleavages=2)
+        old = index
+        index = pyopenms.PeptideMassIndex(self.filename, missed_cleavages=2)
+        self.assertTrue(len(index) > n)
+        # the rebuilt index replaces the file, the mapped old one stays readable
+        self.assertEqual(len(old.getMasses()), n)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["db.fasta", "db.fasta.pepidx"])
+
+if __name__ == '__main__':
+    unittest.main()
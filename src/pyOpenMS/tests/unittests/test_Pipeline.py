@@ -0,0 +1,78 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+import pyopenms
+
+# the pyTOPP scripts are not part of the pyopenms package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "..", "pyTOPP"))
+import pipeline
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def perFile(self, name):
+        def func(obj, index):
+            self.calls.append((name, index))
+            return obj + "|" + name
+        return func
+
+    def joint(self, name):
+        def func(objs):
+            self.calls.append((name, None))
+            return [obj + "|" + name for obj in objs]
+        return func
+
+    def testStageOrder(self):
+        p = pipeline.Pipeline()
+        p.addPerFileStage("a", self.perFile("a")).addPerFileStage("b", self.perFile("b"))
+        p.addJointStage("j", self.joint("j"))
+        p.addPerFileStage("c", self.perFile("c"))
+        self.assertEqual(p.stageNames(), ["a", "b", "j", "c"])
+
+        result = p.run(["x.mzML", "y.mzML"])
+        self.assertEqual(result, ["x.mzML|a|b|j|c", "y.mzML|a|b|j|c"])
+        # consecutive per-file stages run as one chain per input
+        self.assertEqual(self.calls,
+                         [("a", 0), ("b", 0), ("a", 1), ("b", 1), ("j", None),
+                          ("c", 0), ("c", 1)])
+
+    def testJointStageResult(self):
+        p = pipeline.Pipeline()
+        p.addPerFileStage("a", self.perFile("a"))
+        p.addJointStage("count", len)
+        self.assertEqual(p.run(["x.mzML", "y.mzML", "z.mzML"]), 3)
+
+    def testCheckpoints(self):
+        p = pipeline.Pipeline()
+        p.addPerFileStage("features", lambda obj, index: pyopenms.FeatureMap())
+        p.addPerFileStage("other", lambda obj, index: obj)
+        p.addJointStage("linked", lambda objs: pyopenms.ConsensusMap())
+
+        self.assertRaises(Exception, p.run, ["x.mzML"], ["unknown"], self.tmpdir)
+
+        result = p.run(["in/x.mzML", "in/y.mzML"], ["features", "linked"], self.tmpdir)
+        self.assertTrue(isinstance(result, pyopenms.ConsensusMap))
+        self.assertEqual(sorted(os.listdir(self.tmpdir)),
+                         ["pipeline.linked.consensusXML",
+                          "x.features.featureXML",
+                          "y.features.featureXML"])
+
+        # objects without a file format can not be written
+        p = pipeline.Pipeline()
+        p.addPerFileStage("strings", self.perFile("strings"))
+        self.assertRaises(Exception, p.run, ["x.mzML"], ["strings"], self.tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
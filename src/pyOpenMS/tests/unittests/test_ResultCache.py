@@ -0,0 +1,184 @@
+import unittest
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import pyopenms
+
+# the pyTOPP scripts are not part of the pyopenms package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "..", "pyTOPP"))
+from cache import ResultCache
+from common import runCached
+
+
+def write(path, content):
+    with open(path, "w") as fp:
+        fp.write(content)
+
+
+def read(path):
+    with open(path) as fp:
+        return fp.read()
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.tmpdir, "cache")
+        self.in_file = os.path.join(self.tmpdir, "in.mzML")
+        self.out_file = os.path.join(self.tmpdir, "out.mzML")
+        write(self.in_file, "input")
+        self.params = pyopenms.Param()
+        self.params.setValue(b"value", 1, b"")
+        self.runs = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def runTool(self, cache_size=10240.0):
+        def run():
+            self.runs += 1
+            write(self.out_file, "result of run %d" % self.runs)
+        args = argparse.Namespace(cache_dir=self.cache_dir, cache_size=cache_size,
+                                  cache_report=False)
+        runCached(args, "Tool", [self.in_file], [self.out_file], self.params, run)
+
+    def testMissAndHit(self):
+        self.runTool()
+        self.assertEqual(self.runs, 1)
+        os.remove(self.out_file)
+
+        # same inputs and parameters: the output is restored from the cache
+        self.runTool()
+        self.assertEqual(self.runs, 1)
+        self.assertEqual(read(self.out_file), "result of run 1")
+
+        # different parameters
+        self.params.setValue(b"value", 2, b"")
+        self.runTool()
+        self.assertEqual(self.runs, 2)
+
+        cache = ResultCache(self.cache_dir)
+        report = cache.report()
+        self.assertTrue("0 hit(s), 0 miss(es)" in report)
+        self.assertTrue("overall  : 1 hit(s), 2 miss(es)" in report)
+
+    def testCacheDisabled(self):
+        args = argparse.Namespace(cache_dir=None, cache_size=10240.0, cache_report=False)
+        for __ in range(2):
+            runCached(args, "Tool", [self.in_file], [self.out_file], self.params,
+                      lambda: write(self.out_file, "result"))
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def testStaleInput(self):
+        self.runTool()
+        self.runTool()
+        self.assertEqual(self.runs, 1)
+
+        # changing the content of an input invalidates the memoised digest
+        write(self.in_file, "changed input")
+        self.runTool()
+        self.assertEqual(self.runs, 2)
+        self.assertEqual(read(self.out_file), "result of run 2")
+
+        # touching an input without changing it still gives a hit
+        later = time.time() + 10
+        os.utime(self.in_file, (later, later))
+        self.runTool()
+        self.assertEqual(self.runs, 2)
+
+    def testKey(self):
+        cache = ResultCache(self.cache_dir)
+        key = cache.key("Tool", [self.in_file], self.params, [".mzml"])
+        self.assertEqual(key, cache.key("Tool", [self.in_file], self.params, [".mzml"]))
+        self.assertNotEqual(key, cache.key("Other", [self.in_file], self.params, [".mzml"]))
+        self.assertNotEqual(key, cache.key("Tool", [self.in_file], self.params, [".featurexml"]))
+
+    def testEviction(self):
+        cache = ResultCache(self.cache_dir, max_size=25)
+        now = time.time()
+        for i, key in enumerate(["a", "b"]):
+            write(self.out_file, "0123456789")
+            cache.store(key, [self.out_file])
+            os.utime(os.path.join(cache.entries, key), (now - 100 + i, now - 100 + i))
+        self.assertEqual(cache.size(), 20)
+
+        # "a" was used more recently than "b", so "b" is evicted first
+        self.assertTrue(cache.fetch("a", [self.out_file]))
+        write(self.out_file, "0123456789")
+        cache.store("c", [self.out_file])
+        self.assertEqual(cache.size(), 20)
+        self.assertTrue(cache.fetch("a", [self.out_file]))
+        self.assertFalse(cache.fetch("b", [self.out_file]))
+        self.assertTrue(cache.fetch("c", [self.out_file]))
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def testFetchEvictedEntry(self):
+        cache = ResultCache(self.cache_dir)
+        other_file = os.path.join(self.tmpdir, "other.mzML")
+        write(self.out_file, "result")
+        write(other_file, "other result")
+        cache.store("a", [self.out_file, other_file])
+        write(self.out_file, "old")
+        write(other_file, "old other")
+
+        # another tool run evicts the entry while the outputs are copied
+        copyfile = shutil.copyfile
+        def evictingCopy(src, dest):
+            copyfile(src, dest)
+            shutil.rmtree(os.path.join(cache.entries, "a"))
+        shutil.copyfile = evictingCopy
+        try:
+            self.assertFalse(cache.fetch("a", [self.out_file, other_file]))
+        finally:
+            shutil.copyfile = copyfile
+        self.assertEqual(read(self.out_file), "old")
+        self.assertEqual(read(other_file), "old other")
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertEqual(sorted(os.listdir(self.tmpdir)),
+                         ["cache", "in.mzML", "other.mzML", "out.mzML"])
+
+    def testEvictVanishedEntry(self):
+        cache = ResultCache(self.cache_dir)
+        for key in ["a", "b", "c"]:
+            write(self.out_file, "0123456789")
+            cache.store(key, [self.out_file])
+
+        # another tool run evicts "a" while the entries are listed
+        getmtime = os.path.getmtime
+        def vanishingMtime(path):
+            if os.path.basename(path) == "a":
+                shutil.rmtree(path)
+            return getmtime(path)
+        os.path.getmtime = vanishingMtime
+        try:
+            cache.max_size = 15
+            cache.evict()
+        finally:
+            os.path.getmtime = getmtime
+        self.assertEqual(cache.size(), 10)
+
+    def testConcurrentCounts(self):
+        caches = [ResultCache(self.cache_dir) for __ in range(4)]
+
+        def count(cache):
+            for __ in range(25):
+                cache._count(hits=1)
+                cache._count(misses=1)
+
+        threads = [threading.Thread(target=count, args=(c,)) for c in caches]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue("overall  : 100 hit(s), 100 miss(es)" in caches[0].report())
+
+
+if __name__ == '__main__':
+    unittest.main()
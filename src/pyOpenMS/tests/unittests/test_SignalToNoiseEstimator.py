@@ -0,0 +1,96 @@
+import unittest
+
+import numpy as np
+
+import pyopenms
+
+
+class TestSignalToNoiseEstimatorArrays(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.RandomState(42)
+        self.mz = np.sort(rng.uniform(400.0, 800.0, 500))
+        self.intensity = rng.exponential(100.0, 500)
+        self.intensity[::50] *= 50.0
+
+        self.spectrum = pyopenms.MSSpectrum()
+        self.spectrum.set_peaks((self.mz, self.intensity))
+        self.chromatogram = pyopenms.MSChromatogram()
+        self.chromatogram.set_peaks((self.mz - 400.0, self.intensity))
+
+    def testSpectrum(self):
+        sne = pyopenms.SignalToNoiseEstimatorMedian()
+        sn = sne.getSignalToNoiseArray(self.spectrum)
+        self.assertEqual(sn.shape, (500,))
+        self.assertEqual(sn.dtype, np.float64)
+
+        sne.init(self.spectrum)
+        expected = [sne.getSignalToNoise(peak) for peak in self.spectrum]
+        np.testing.assert_array_equal(sn, expected)
+        self.assertTrue(sn[0] > np.median(sn))
+
+        empty = sne.getSignalToNoiseArray(pyopenms.MSSpectrum())
+        self.assertEqual(empty.shape, (0,))
+
+    def testChromatogram(self):
+        sne = pyopenms.SignalToNoiseEstimatorMedianChrom()
+        sn = sne.getSignalToNoiseArray(self.chromatogram)
+        self.assertEqual(sn.shape, (500,))
+
+        sne.init(self.chromatogram)
+        expected = [sne.getSignalToNoise(peak) for peak in self.chromatogram]
+        np.testing.assert_array_equal(sn, expected)
+
+    def testExperiment(self):
+        exp = pyopenms.MSExperiment()
+        exp.addSpectrum(self.spectrum)
+        exp.addSpectrum(pyopenms.MSSpectrum())
+        half = pyopenms.MSSpectrum()
+        half.set_peaks((self.mz[::2], self.intensity[::2]))
+        exp.addSpectrum(half)
+        exp.addChromatogram(self.chromatogram)
+        exp.addChromatogram(pyopenms.MSChromatogram())
+
+        sne = pyopenms.SignalToNoiseEstimatorMedian()
+        offsets, sn = sne.getSignalToNoiseArrays(exp)
+        np.testing.assert_array_equal(offsets, [0, 500, 500, 750])
+        self.assertEqual(sn.shape, (750,))
+        np.testing.assert_array_equal(sn[:500], sne.getSignalToNoiseArray(self.spectrum))
+        np.testing.assert_array_equal(sn[500:], sne.getSignalToNoiseArray(half))
+
+        offsets, sn = pyopenms.SignalToNoiseEstimatorMedianChrom().getSignalToNoiseArrays(exp)
+        np.testing.assert_array_equal(offsets, [0, 500, 500])
+        np.testing.assert_array_equal(
+            sn, pyopenms.SignalToNoiseEstimatorMedianChrom().getSignalToNoiseArray(self.chromatogram))
+
+        offsets, sn = sne.getSignalToNoiseArrays(pyopenms.MSExperiment())
+        np.testing.assert_array_equal(offsets, [0])
+        self.assertEqual(sn.shape, (0,))
+
+    def testRapid(self):
+        sne = pyopenms.SignalToNoiseEstimatorMedianRapid(50.0)
+        noise = sne.estimateNoiseArray(self.mz, self.intensity)
+        self.assertEqual(noise.shape, (500,))
+
+        estimator = sne.estimateNoise(list(self.mz), list(self.intensity))
+        expected = [estimator.get_noise_value(mz) for mz in self.mz]
+        np.testing.assert_array_equal(noise, expected)
+        self.assertTrue(np.all(noise >= 1.0))
+
+        sn = sne.getSignalToNoiseArray(self.mz, self.intensity)
+        np.testing.assert_allclose(sn, self.intensity / noise)
+
+        # chromatograms: retention times instead of m/z
+        rt, intensity = self.chromatogram.get_peaks()
+        noise = sne.estimateNoiseArray(rt, intensity)
+        np.testing.assert_allclose(sne.getSignalToNoiseArray(rt, intensity), intensity / noise)
+
+    def testRapidInvalidInput(self):
+        sne = pyopenms.SignalToNoiseEstimatorMedianRapid(50.0)
+        self.assertRaises(ValueError, sne.getSignalToNoiseArray, self.mz, self.intensity[:-1])
+        self.assertRaises(ValueError, sne.getSignalToNoiseArray, self.mz[:2], self.intensity[:2])
+        self.assertRaises(ValueError, sne.estimateNoiseArray, self.mz[::-1], self.intensity)
+
+
+if __name__ == '__main__':
+    unittest.main()
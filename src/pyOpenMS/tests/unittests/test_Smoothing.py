@@ -26,6 +26,12 @@ class TestGaussFilter(unittest.TestCase):
         self.assertEqual(old_firstspec[10].getMZ(), self.exp[0][10].getMZ())
         self.assertNotEqual(old_firstspec[10].getIntensity(), self.exp[0][10].getIntensity())
 
+    def test_run_threads(self):
+        serial = pyopenms.MSExperiment(self.exp)
+        pyopenms.GaussFilter().filterExperiment(serial, 1)
+        pyopenms.GaussFilter().filterExperiment(self.exp, 4)
+        self.assertEqual(self.exp, serial)
+
 class TestSavitzkyGolayFilter(unittest.TestCase):
 
     def setUp(self):
@@ -49,6 +55,12 @@ class TestSavitzkyGolayFilter(unittest.TestCase):
         self.assertEqual(old_firstspec[10].getMZ(), self.exp[0][10].getMZ())
         self.assertNotEqual(old_firstspec[10].getIntensity(), self.exp[0][10].getIntensity())
 
+    def test_run_threads(self):
+        serial = pyopenms.MSExperiment(self.exp)
+        pyopenms.SavitzkyGolayFilter().filterExperiment(serial, 1)
+        pyopenms.SavitzkyGolayFilter().filterExperiment(self.exp, 4)
+        self.assertEqual(self.exp, serial)
+
 class TestLowessSmoothing(unittest.TestCase):
 
     def setUp(self):
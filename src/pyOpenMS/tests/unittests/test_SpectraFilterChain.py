@@ -0,0 +1,107 @@
+import unittest
+import os
+
+import pyopenms
+
+
+class ListConsumer(object):
+
+    def __init__(self):
+        self.spectra = []
+        self.chromatograms = []
+        self.expected_size = None
+
+    def setExpectedSize(self, num_specs, num_chromo):
+        self.expected_size = (num_specs, num_chromo)
+
+    def setExperimentalSettings(self, exp):
+        pass
+
+    def consumeSpectrum(self, spec):
+        self.spectra.append(spec)
+
+    def consumeChromatogram(self, chromo):
+        self.chromatograms.append(chromo)
+
+
+class TestSpectraFilterChain(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.abspath(__file__))
+        self.filename = os.path.join(dirname, "test2.mzML").encode()
+        self.exp = pyopenms.MSExperiment()
+        pyopenms.MzMLFile().load(self.filename, self.exp)
+
+        self.threshold = pyopenms.ThresholdMower()
+        param = self.threshold.getParameters()
+        param.setValue(b"threshold", 10.0, b"")
+        self.threshold.setParameters(param)
+        self.nlargest = pyopenms.NLargest()
+        param = self.nlargest.getParameters()
+        param.setValue(b"n", 20, b"")
+        self.nlargest.setParameters(param)
+
+    def chain(self):
+        chain = pyopenms.SpectraFilterChain()
+        chain.addFilter(self.threshold)
+        chain.addFilter(b"NLargest", self.nlargest.getParameters())
+        chain.addFilter(b"Normalizer")
+        return chain
+
+    def expected(self):
+        exp = pyopenms.MSExperiment(self.exp)
+        self.threshold.filterPeakMap(exp)
+        self.nlargest.filterPeakMap(exp)
+        pyopenms.Normalizer().filterPeakMap(exp)
+        return exp
+
+    def test_chain(self):
+        chain = self.chain()
+        self.assertEqual(chain.size(), 3)
+        self.assertEqual(chain.getFilterNames(), [b"ThresholdMower", b"NLargest", b"Normalizer"])
+        self.assertEqual(chain.getFilterParameters(1).getValue(b"n"), 20)
+        self.assertIn(b"WindowMower", pyopenms.SpectraFilterChain.getAvailableFilters())
+
+        self.assertRaises(RuntimeError, chain.addFilter, b"NoSuchFilter")
+        self.assertRaises(ValueError, chain.addFilter, self.nlargest, pyopenms.Param())
+        self.assertEqual(chain.size(), 3)
+
+        chain.clear()
+        self.assertTrue(chain.empty())
+
+    def test_filterPeakSpectrum(self):
+        expected = self.expected()
+        chain = self.chain()
+        for i in range(self.exp.size()):
+            spec = self.exp[i]
+            chain.filterPeakSpectrum(spec)
+            self.assertEqual(spec, expected[i])
+
+    def test_filterPeakMap(self):
+        expected = self.expected()
+        for nr_threads in (0, 1, 4):
+            exp = pyopenms.MSExperiment(self.exp)
+            self.chain().filterPeakMap(exp, nr_threads)
+            self.assertEqual(exp.size(), expected.size())
+            for spec, expected_spec in zip(exp, expected):
+                self.assertEqual(spec, expected_spec)
+                self.assertTrue(spec.size() <= 20)
+
+    def test_consumer(self):
+        expected = self.expected()
+        target = ListConsumer()
+        with pyopenms.SpectraFilterChainConsumer(self.chain(), target, batch_size=2) as consumer:
+            pyopenms.MzMLFile().transform(self.filename, consumer)
+
+        self.assertEqual(target.expected_size[0], self.exp.size())
+        self.assertEqual(len(target.spectra), expected.size())
+        for spec, expected_spec in zip(target.spectra, expected):
+            self.assertEqual(spec.getNativeID(), expected_spec.getNativeID())
+            self.assertEqual(spec.get_peaks()[0].tolist(), expected_spec.get_peaks()[0].tolist())
+        self.assertEqual(len(target.chromatograms), self.exp.getNrChromatograms())
+
+        self.assertRaises(ValueError, pyopenms.SpectraFilterChainConsumer, self.chain(), target, 0, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
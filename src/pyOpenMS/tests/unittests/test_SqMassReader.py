@@ -0,0 +1,61 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import pyopenms
+
+class TestSqMassReader(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.abspath(__file__))
+        self.exp = pyopenms.MSExperiment()
+        pyopenms.MzMLFile().load(os.path.join(dirname, "test.indexed.mzML").encode(), self.exp)
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "test.sqMass")
+        pyopenms.SqMassFile().store(self.filename.encode(), self.exp)
+        # reference: decoded by the C++ reader
+        self.ref = pyopenms.MSExperiment()
+        pyopenms.SqMassFile().load(self.filename.encode(), self.ref)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_chromatograms(self):
+        native_id = self.ref.getChromatogram(0).getNativeID()
+        with pyopenms.SqMassReader(self.filename) as reader:
+            self.assertEqual(reader.getNrChromatograms(), 1)
+            (rt, intensity), = reader.getChromatograms([native_id])
+            ref_rt, ref_intensity = self.ref.getChromatogram(0).get_peaks()
+            self.assertTrue(np.allclose(rt, ref_rt))
+            self.assertTrue(np.allclose(intensity, ref_intensity))
+            self.assertRaises(KeyError, reader.getChromatograms, [b"unknown"])
+
+    def test_spectra(self):
+        with pyopenms.SqMassReader(self.filename) as reader:
+            self.assertEqual(reader.getNrSpectra(), self.ref.size())
+
+            rts = [s.getRT() for s in self.ref]
+            rt_range = (min(rts) - 1, max(rts) + 1)
+            selected_rt, spectra = reader.getSpectra(rt_range=rt_range)
+            self.assertEqual(len(spectra), self.ref.size())
+            self.assertTrue(np.allclose(selected_rt, sorted(rts)))
+
+            # select by native ID
+            spec = self.ref[1]
+            selected_rt, spectra = reader.getSpectra(native_ids=[spec.getNativeID()])
+            self.assertAlmostEqual(selected_rt[0], spec.getRT())
+            mz, intensity = spectra[0]
+            self.assertTrue(np.allclose(mz, spec.get_peaks()[0]))
+            self.assertTrue(np.allclose(intensity, spec.get_peaks()[1]))
+
+            # an empty RT window and an MS level which does not exist
+            self.assertEqual(len(reader.getSpectrumIds(rt_range=(-2, -1))), 0)
+            self.assertEqual(len(reader.getSpectrumIds(ms_level=5)), 0)
+            self.assertEqual(len(reader.getSpectrumIds(ms_level=spec.getMSLevel())) > 0, True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8  -*-
+import unittest
+
+import pyopenms
+
+class TestStringConversion(unittest.TestCase):
+
+    def setUp(self):
+        self.spec = pyopenms.MSSpectrum()
+
+    def tearDown(self):
+        pyopenms.setStringOutputDecoding(False)
+
+    def test_input_types(self):
+        self.spec.setNativeID(b"scan=1")
+        self.assertEqual(self.spec.getNativeID(), b"scan=1")
+
+        self.spec.setNativeID(u"scan=2")
+        self.assertEqual(self.spec.getNativeID(), b"scan=2")
+
+        self.spec.setNativeID(pyopenms.String(b"scan=3"))
+        self.assertEqual(self.spec.getNativeID(), b"scan=3")
+
+        # non-ASCII input is stored as UTF-8
+        self.spec.setNativeID(u"scan=ä")
+        self.assertEqual(self.spec.getNativeID(), u"scan=ä".encode("UTF-8"))
+
+        # embedded NULL characters are not truncated
+        self.spec.setNativeID(b"scan\x00=4")
+        self.assertEqual(self.spec.getNativeID(), b"scan\x00=4")
+
+        self.assertRaises(Exception, self.spec.setNativeID, 5)
+
+    def test_output_decoding(self):
+        self.assertFalse(pyopenms.getStringOutputDecoding())
+        self.spec.setNativeID(u"scan=ä")
+
+        pyopenms.setStringOutputDecoding(True)
+        self.assertTrue(pyopenms.getStringOutputDecoding())
+        self.assertEqual(self.spec.getNativeID(), u"scan=ä")
+
+        pyopenms.setStringOutputDecoding(False)
+        self.assertEqual(self.spec.getNativeID(), u"scan=ä".encode("UTF-8"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+import pyopenms
+
+class TestTheoreticalSpectrumGeneratorCSR(unittest.TestCase):
+
+    def setUp(self):
+        self.sequences = [b"PEPTIDE", b"IFSQVGK", b"AAAAK", b"PEPTM(Oxidation)IDEK"]
+        self.tsg = pyopenms.TheoreticalSpectrumGenerator()
+
+    def test_getSpectraCSR(self):
+        peptides = [pyopenms.AASequence.fromString(s, False) for s in self.sequences]
+        offsets, mz, intensity, codes = self.tsg.getSpectraCSR(peptides, 1, 2, 2)
+        self.assertEqual(offsets.dtype, np.int64)
+        self.assertEqual(mz.dtype, np.float64)
+        self.assertEqual(intensity.dtype, np.float32)
+        self.assertEqual(codes.dtype, np.int32)
+        self.assertEqual(len(offsets), len(peptides) + 1)
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(offsets[-1], len(mz))
+        self.assertEqual(len(mz), len(intensity))
+        self.assertEqual(len(mz), len(codes))
+
+        for i, peptide in enumerate(peptides):
+            spec = pyopenms.MSSpectrum()
+            self.tsg.getSpectrum(spec, peptide, 1, 2)
+            expected_mz, _ = spec.get_peaks()
+            self.assertTrue(np.allclose(mz[offsets[i]:offsets[i + 1]], expected_mz))
+
+    def test_strings(self):
+        peptides = [pyopenms.AASequence.fromString(s, False) for s in self.sequences]
+        from_objects = self.tsg.getSpectraCSR(peptides, 1, 1)
+        from_strings = self.tsg.getSpectraCSR(self.sequences, 1, 1)
+        for a, b in zip(from_objects, from_strings):
+            self.assertTrue(np.array_equal(a, b))
+
+    def test_charge_ranges(self):
+        offsets, _, _, codes = self.tsg.getSpectraCSR(self.sequences, 1, [1, 2, 3, 1])
+        single = self.tsg.getSpectraCSR(self.sequences, 1, 1)[0]
+        sizes = np.diff(offsets)
+        self.assertEqual(sizes[0], np.diff(single)[0])
+        self.assertEqual(sizes[1], 2 * np.diff(single)[1])
+        self.assertEqual(sizes[2], 3 * np.diff(single)[2])
+        self.assertTrue(((codes >> 16) & 0xFF).max() <= 3)
+
+        # one charge range or one per peptide
+        self.assertRaises(ValueError, self.tsg.getSpectraCSR, self.sequences, [1, 1], [2, 2])
+        self.assertRaises(ValueError, self.tsg.getSpectraCSR, self.sequences, 1, [2, 2, 2, 2, 2])
+
+    def test_ion_codes(self):
+        offsets, mz, _, codes = self.tsg.getSpectraCSR([b"PEPTIDE"], 1, 1)
+        ion_types = codes >> 24
+        # default settings: b and y ions
+        self.assertEqual(set(ion_types), set([pyopenms.TheoreticalSpectrumGenerator.IonAnnotationType.B_ION,
+                                              pyopenms.TheoreticalSpectrumGenerator.IonAnnotationType.Y_ION]))
+        self.assertTrue(np.all((codes >> 16) & 0xFF == 1))
+        code = pyopenms.TheoreticalSpectrumGenerator.encodeIonAnnotation(b"y3+", 1)
+        self.assertEqual(code >> 24, pyopenms.TheoreticalSpectrumGenerator.IonAnnotationType.Y_ION)
+        self.assertEqual(code & 0xFFF, 3)
+        self.assertIn(code, codes)
+
+    def test_empty(self):
+        offsets, mz, intensity, codes = self.tsg.getSpectraCSR([], 1, 1)
+        self.assertEqual(list(offsets), [0])
+        self.assertEqual(len(mz), 0)
+
+if __name__ == '__main__':
+    unittest.main()
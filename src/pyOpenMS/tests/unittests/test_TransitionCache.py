@@ -0,0 +1,79 @@
+import unittest
+import os
+import shutil
+import tempfile
+
+import pyopenms
+
+class TestTransitionCache(unittest.TestCase):
+
+    def setUp(self):
+        dirname = os.path.dirname(os.path.abspath(__file__))
+        self.tmpdir = tempfile.mkdtemp()
+        self.traml = os.path.join(self.tmpdir, "test.TraML").encode()
+        shutil.copy(os.path.join(dirname, "test.TraML"), self.traml)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_TransitionCacheFile(self):
+        targeted = pyopenms.TargetedExperiment()
+        pyopenms.TraMLFile().load(self.traml, targeted)
+        light = pyopenms.LightTargetedExperiment()
+        pyopenms.OpenSwathDataAccessHelper().convertTargetedExp(targeted, light)
+
+        cache_file = os.path.join(self.tmpdir, "test.trcache").encode()
+        cache = pyopenms.TransitionCacheFile()
+        cache.store(cache_file, light, self.traml)
+        self.assertTrue(cache.isValid(cache_file, self.traml))
+
+        loaded = pyopenms.LightTargetedExperiment()
+        cache.load(cache_file, loaded)
+        self.assertEqual(len(loaded.getTransitions()), len(light.getTransitions()))
+        self.assertEqual(len(loaded.getCompounds()), len(light.getCompounds()))
+        self.assertEqual(len(loaded.getProteins()), len(light.getProteins()))
+        for a, b in zip(loaded.getTransitions(), light.getTransitions()):
+            self.assertEqual(a.getNativeID(), b.getNativeID())
+            self.assertEqual(a.getPeptideRef(), b.getPeptideRef())
+            self.assertAlmostEqual(a.getProductMZ(), b.getProductMZ())
+            self.assertAlmostEqual(a.getLibraryIntensity(), b.getLibraryIntensity())
+        for a, b in zip(loaded.getCompounds(), light.getCompounds()):
+            self.assertEqual(a.id, b.id)
+            self.assertEqual(a.sequence, b.sequence)
+            self.assertEqual(a.protein_refs, b.protein_refs)
+
+        self.assertRaises(RuntimeError, cache.load, self.traml, loaded)
+
+        # changing the library invalidates the cache
+        with open(self.traml, "ab") as f:
+            f.write(b"\n")
+        self.assertFalse(cache.isValid(cache_file, self.traml))
+
+    def test_loadLightTargetedExperiment(self):
+        light = pyopenms.loadLightTargetedExperiment(self.traml)
+        cache_file = self.traml + b".trcache"
+        self.assertTrue(os.path.isfile(cache_file))
+        self.assertTrue(len(light.getTransitions()) > 0)
+
+        # the second call reads the cache
+        mtime = os.path.getmtime(cache_file)
+        cached = pyopenms.loadLightTargetedExperiment(self.traml)
+        self.assertEqual(os.path.getmtime(cache_file), mtime)
+        self.assertEqual([t.getNativeID() for t in cached.getTransitions()],
+                         [t.getNativeID() for t in light.getTransitions()])
+
+        # a truncated cache with a valid header is parsed again and rewritten
+        size = os.path.getsize(cache_file)
+        with open(cache_file, "r+b") as f:
+            f.truncate(size - 1)
+        self.assertTrue(pyopenms.TransitionCacheFile().isValid(cache_file, self.traml))
+        reparsed = pyopenms.loadLightTargetedExperiment(self.traml)
+        self.assertEqual(len(reparsed.getTransitions()), len(light.getTransitions()))
+        self.assertEqual(os.path.getsize(cache_file), size)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["test.TraML", "test.TraML.trcache"])
+
+        self.assertRaises(ValueError, pyopenms.loadLightTargetedExperiment,
+                          os.path.join(self.tmpdir, "test.mzML"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,6 +10,7 @@ set(concept_executables_list
   VersionInfo_test
   LogConfigHandler_test
   LogStream_test
+  Parallel_test
   UniqueIdGenerator_test
   UniqueIdIndexer_test
   UniqueIdInterface_test
@@ -331,6 +332,7 @@ set(filtering_executables_list
   TOFCalibration_test
   ThresholdMower_test
   WindowMower_test
+  SpectraFilterChain_test
   SpectraMerger_test
 )
 
@@ -340,6 +342,7 @@ set(comparison_executables_list
   BinnedSpectralContrastAngle_test
   BinnedSpectrumCompareFunctor_test
   BinnedSpectrum_test
+  BinnedSpectrumNeighborSearch_test
   BinnedSumAgreeingIntensities_test
   ClusterAnalyzer_test
   ClusterFunctor_test
@@ -606,6 +609,7 @@ if(NOT DISABLE_OPENSWATH)
     MRMRTNormalizer_test
     TransitionTSVFile_test
     TransitionPQPFile_test
+    TransitionCacheFile_test
     ChromatogramExtractor_test
     ChromatogramExtractorAlgorithm_test
     OpenSwathHelper_test
@@ -195,6 +195,46 @@ START_SECTION((template < typename ToType > void decode(const String &in, ByteOr
 }
 END_SECTION
 
+START_SECTION((static void encodeBatch(std::vector<std::vector<double> > & in, ByteOrder to_byte_order, std::vector<String> & out, bool zlib_compression = false, Size nr_threads = 0)))
+{
+  std::vector<double> data;
+  data.push_back(300.15);
+  data.push_back(303.998);
+  data.push_back(304.6);
+  std::vector<std::vector<double> > in(4, data);
+  in[1].clear();
+
+  std::vector<String> out;
+  Base64::encodeBatch(in, Base64::BYTEORDER_BIGENDIAN, out, false, 2);
+  TEST_EQUAL(out.size(), 4)
+  TEST_EQUAL(out[0], "QHLCZmZmZmZAcv/3ztkWh0BzCZmZmZma")
+  TEST_EQUAL(out[1], "")
+  TEST_EQUAL(out[3], "QHLCZmZmZmZAcv/3ztkWh0BzCZmZmZma")
+}
+END_SECTION
+
+START_SECTION((static void decodeBatch(const std::vector<String> & in, ByteOrder from_byte_order, std::vector<std::vector<double> > & out, bool zlib_compression = false, Size nr_threads = 0)))
+  TOLERANCE_ABSOLUTE(0.001)
+{
+  std::vector<double> data;
+  data.push_back(300.15);
+  data.push_back(303.998);
+  std::vector<std::vector<double> > in(3, data);
+  std::vector<String> encoded;
+  Base64::encodeBatch(in, Base64::BYTEORDER_LITTLEENDIAN, encoded, true);
+
+  std::vector<std::vector<double> > out;
+  Base64::decodeBatch(encoded, Base64::BYTEORDER_LITTLEENDIAN, out, true);
+  TEST_EQUAL(out.size(), 3)
+  for (Size i = 0; i < out.size(); i++)
+  {
+    TEST_EQUAL(out[i].size(), 2)
+    TEST_REAL_SIMILAR(out[i][0], 300.15)
+    TEST_REAL_SIMILAR(out[i][1], 303.998)
+  }
+}
+END_SECTION
+
 START_SECTION([EXTRA] zlib functionality)
 {
   TOLERANCE_ABSOLUTE(0.001)
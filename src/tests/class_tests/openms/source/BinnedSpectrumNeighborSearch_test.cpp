@@ -0,0 +1,195 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#include <OpenMS/CONCEPT/ClassTest.h>
+#include <OpenMS/test_config.h>
+
+///////////////////////////
+#include <OpenMS/COMPARISON/SPECTRA/BinnedSpectrumNeighborSearch.h>
+#include <OpenMS/COMPARISON/SPECTRA/BinnedSpectralContrastAngle.h>
+#include <OpenMS/COMPARISON/SPECTRA/BinnedSpectrum.h>
+///////////////////////////
+
+using namespace OpenMS;
+using namespace std;
+
+START_TEST(BinnedSpectrumNeighborSearch, "$Id$")
+
+/////////////////////////////////////////////////////////////
+/////////////////////////////////////////////////////////////
+
+BinnedSpectrumNeighborSearch* ptr = nullptr;
+BinnedSpectrumNeighborSearch* nullPointer = nullptr;
+START_SECTION(BinnedSpectrumNeighborSearch())
+{
+  ptr = new BinnedSpectrumNeighborSearch();
+  TEST_NOT_EQUAL(ptr, nullPointer)
+  TEST_EQUAL(ptr->size(), 0)
+}
+END_SECTION
+
+START_SECTION(~BinnedSpectrumNeighborSearch())
+{
+  delete ptr;
+}
+END_SECTION
+
+// spectra 0, 1 and 3 are similar, 2 has a different precursor, 4 a different charge
+vector<PeakSpectrum> spectra(5);
+double peaks[5][4] = {{100.0, 200.0, 300.0, 400.0},
+                      {100.0, 200.0, 300.0, 450.0},
+                      {100.0, 200.0, 300.0, 400.0},
+                      {100.0, 250.0, 300.0, 400.0},
+                      {100.0, 200.0, 300.0, 400.0}};
+double precursor_mz[5] = {500.0, 500.5, 800.0, 501.0, 500.2};
+int precursor_charge[5] = {2, 2, 2, 0, 3};
+for (Size i = 0; i < 5; ++i)
+{
+  for (Size k = 0; k < 4; ++k)
+  {
+    spectra[i].push_back(Peak1D(peaks[i][k], 10.0 * (k + 1)));
+  }
+  Precursor prec;
+  prec.setMZ(precursor_mz[i]);
+  prec.setCharge(precursor_charge[i]);
+  spectra[i].getPrecursors().push_back(prec);
+}
+
+START_SECTION((void setSpectra(const std::vector<PeakSpectrum>& spectra, Size nr_threads = 0)))
+{
+  BinnedSpectrumNeighborSearch search;
+  search.setSpectra(spectra, 2);
+  TEST_EQUAL(search.size(), 5)
+
+  search.setSpectra(vector<PeakSpectrum>());
+  TEST_EQUAL(search.size(), 0)
+}
+END_SECTION
+
+START_SECTION((void setSpectra(const PeakMap& exp, Size nr_threads = 0)))
+{
+  PeakMap exp;
+  exp.setSpectra(spectra);
+  BinnedSpectrumNeighborSearch search;
+  search.setSpectra(exp);
+  TEST_EQUAL(search.size(), 5)
+}
+END_SECTION
+
+START_SECTION((void getBinnedMatrix(std::vector<Size>& offsets, std::vector<Int>& bins, std::vector<float>& values) const))
+{
+  BinnedSpectrumNeighborSearch search;
+  Param p = search.getParameters();
+  p.setValue("intensity_scaling", "none");
+  search.setParameters(p);
+  search.setSpectra(spectra);
+
+  vector<Size> offsets;
+  vector<Int> bins;
+  vector<float> values;
+  search.getBinnedMatrix(offsets, bins, values);
+  TEST_EQUAL(offsets.size(), 6)
+  TEST_EQUAL(offsets.back(), 20)
+  TEST_EQUAL(bins.size(), 20)
+  TEST_EQUAL(values.size(), 20)
+
+  BinnedSpectrum bs(spectra[0], 0.02, false, 0, 0.0);
+  TEST_EQUAL(bins[0], bs.getBinIndex(100.0))
+  TEST_EQUAL(bins[3], bs.getBinIndex(400.0))
+  // unit length
+  double norm = 0.0;
+  for (Size k = offsets[0]; k < offsets[1]; ++k) norm += values[k] * values[k];
+  TEST_REAL_SIMILAR(norm, 1.0)
+  TEST_REAL_SIMILAR(values[3] / values[0], 4.0)
+}
+END_SECTION
+
+START_SECTION((void getNeighbors(std::vector<Size>& offsets, std::vector<Size>& neighbors, std::vector<float>& scores, std::vector<float>& dot_bias, Size nr_threads = 0) const))
+{
+  BinnedSpectrumNeighborSearch search;
+  Param p = search.getParameters();
+  p.setValue("intensity_scaling", "none");
+  search.setParameters(p);
+  search.setSpectra(spectra);
+
+  vector<Size> offsets, neighbors;
+  vector<float> scores, dot_bias;
+  search.getNeighbors(offsets, neighbors, scores, dot_bias, 2);
+  TEST_EQUAL(offsets.size(), 6)
+  TEST_EQUAL(neighbors.size(), scores.size())
+  TEST_EQUAL(neighbors.size(), dot_bias.size())
+
+  // spectrum 0: 3 (same peaks except the second), 1 (same peaks except the fourth)
+  ABORT_IF(offsets[1] - offsets[0] != 2)
+  TEST_EQUAL(neighbors[0], 3)
+  TEST_EQUAL(neighbors[1], 1)
+  TEST_EQUAL(scores[0] >= scores[1], true)
+
+  // the score is the cosine of the binned spectra
+  BinnedSpectralContrastAngle cosine;
+  BinnedSpectrum b0(spectra[0], 0.02, false, 0, 0.0), b1(spectra[1], 0.02, false, 0, 0.0);
+  TEST_REAL_SIMILAR(scores[1], cosine(b0, b1))
+
+  // spectrum 2 has no neighbors within the precursor window
+  TEST_EQUAL(offsets[3] - offsets[2], 0)
+  // spectrum 4 has a different charge than 0 and 1, but 3 has an unknown charge
+  ABORT_IF(offsets[5] - offsets[4] != 1)
+  TEST_EQUAL(neighbors[offsets[4]], 3)
+
+  // identical spectra
+  p.setValue("precursor_mass_tolerance", -1.0);
+  p.setValue("match_charge", "false");
+  p.setValue("top_k", 1);
+  search.setParameters(p);
+  search.setSpectra(spectra);
+  search.getNeighbors(offsets, neighbors, scores, dot_bias);
+  TEST_EQUAL(offsets.back(), 5)
+  TEST_EQUAL(neighbors[0], 2)
+  TEST_REAL_SIMILAR(scores[0], 1.0)
+  // dot bias of identical spectra: sqrt(sum a^4) / 1
+  double sum = 0.0, sum4 = 0.0;
+  for (Size k = 1; k <= 4; ++k) sum += k * k;
+  for (Size k = 1; k <= 4; ++k) sum4 += pow(k * k / sum, 2);
+  TEST_REAL_SIMILAR(dot_bias[0], sqrt(sum4))
+
+  // minimal score
+  p.setValue("min_score", 0.99);
+  search.setParameters(p);
+  search.setSpectra(spectra);
+  search.getNeighbors(offsets, neighbors, scores, dot_bias);
+  TEST_EQUAL(offsets[2] - offsets[1], 0)
+}
+END_SECTION
+
+/////////////////////////////////////////////////////////////
+/////////////////////////////////////////////////////////////
+END_TEST
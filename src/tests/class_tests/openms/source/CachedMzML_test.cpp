@@ -220,6 +220,35 @@ START_SECTION(( const MSExperiment& getMetaData() const ))
 }
 END_SECTION
 
+START_SECTION(( const std::vector<std::streampos>& getSpectraIndex() const ))
+{
+  TEST_EQUAL(cache_example.getSpectraIndex().size(), 4)
+  // the first spectrum directly follows the magic number
+  TEST_EQUAL(cache_example.getSpectraIndex()[0], std::streampos(sizeof(int)))
+  for (Size i = 1; i < cache_example.getSpectraIndex().size(); i++)
+  {
+    TEST_EQUAL(cache_example.getSpectraIndex()[i - 1] < cache_example.getSpectraIndex()[i], true)
+  }
+}
+END_SECTION
+
+START_SECTION(( const std::vector<std::streampos>& getChromatogramIndex() const ))
+{
+  TEST_EQUAL(cache_example.getChromatogramIndex().size(), 2)
+  TEST_EQUAL(cache_example.getChromatogramIndex()[0] > cache_example.getSpectraIndex()[3], true)
+}
+END_SECTION
+
+START_SECTION(( const String& getCachedFilename() const ))
+{
+  TEST_EQUAL(cache_example.getCachedFilename(), tmpf + ".cached")
+
+  CachedmzML copy(cache_example);
+  TEST_EQUAL(copy.getCachedFilename(), tmpf + ".cached")
+  TEST_EQUAL(copy.getSpectrum(1).size(), cache_example.getSpectrum(1).size())
+}
+END_SECTION
+
 /////////////////////////////////////////////////////////////
 /////////////////////////////////////////////////////////////
 END_TEST
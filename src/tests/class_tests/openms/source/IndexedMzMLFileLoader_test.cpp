@@ -121,6 +121,29 @@ START_SECTION(bool load(const String& filename, OnDiscPeakMap& exp))
 }
 END_SECTION
 
+START_SECTION(bool loadParallel(const String& filename, PeakMap& exp, Size nr_threads = 0))
+{
+  IndexedMzMLFileLoader file;
+  PeakMap exp;
+  TEST_EQUAL(file.loadParallel(OPENMS_GET_TEST_DATA_PATH("IndexedmzMLFile_1.mzML"), exp, 2), true)
+
+  PeakMap exp2;
+  MzMLFile().load(OPENMS_GET_TEST_DATA_PATH("IndexedmzMLFile_1.mzML"),exp2);
+
+  TEST_EQUAL(exp.size(), 2)
+  TEST_EQUAL(exp.getChromatograms().size(), 1)
+  for (Size i = 0; i < exp.size(); i++)
+  {
+    TEST_EQUAL(exp[i] == exp2[i], true)
+  }
+  TEST_EQUAL(exp.getChromatograms()[0] == exp2.getChromatograms()[0], true)
+  TEST_EQUAL((OpenMS::ExperimentalSettings)exp == (OpenMS::ExperimentalSettings)exp2, true)
+
+  // not an indexed mzML file
+  TEST_EQUAL(file.loadParallel(OPENMS_GET_TEST_DATA_PATH("MzMLFile_1.mzML"), exp), false)
+}
+END_SECTION
+
 START_SECTION([EXTRA]CheckParsing)
 {
   // Check return value of load
@@ -36,6 +36,7 @@
 #include <OpenMS/test_config.h>
 
 #include <OpenMS/FILTERING/DATAREDUCTION/IsotopeDistributionCache.h>
+#include <OpenMS/CHEMISTRY/ISOTOPEDISTRIBUTION/CoarseIsotopePatternGenerator.h>
 
 using namespace OpenMS;
 
@@ -57,5 +58,81 @@ START_SECTION(const TheoreticalIsotopePattern& getIsotopeDistribution(double mas
   TEST_EQUAL(&p != &c.getIsotopeDistribution(499.9), true);
 END_SECTION
 
+START_SECTION(void getIsotopeDistributions(const std::vector<double>& masses, Size width, std::vector<double>& intensities) const)
+  IsotopeDistributionCache c(1000, 10);
+  std::vector<double> masses = {500.0, 999.0, 505.0};
+  std::vector<double> intensities;
+  c.getIsotopeDistributions(masses, 6, intensities);
+  TEST_EQUAL(intensities.size(), 18)
+  const IsotopeDistributionCache::TheoreticalIsotopePattern &p(c.getIsotopeDistribution(500));
+  for (Size j = 0; j < 4; ++j)
+  {
+    TEST_REAL_SIMILAR(intensities[j], p.intensity[j])
+    TEST_REAL_SIMILAR(intensities[12 + j], p.intensity[j])
+  }
+  TEST_REAL_SIMILAR(intensities[6], c.getIsotopeDistribution(999).intensity[0])
+
+  c.getIsotopeDistributions(std::vector<double>(), 6, intensities);
+  TEST_EQUAL(intensities.size(), 0)
+  masses.push_back(1010.0);
+  TEST_EXCEPTION(Exception::InvalidValue, c.getIsotopeDistributions(masses, 6, intensities))
+END_SECTION
+
+START_SECTION(static void getFormulaIsotopeDistributions(const std::vector<EmpiricalFormula>& formulas, Size width, std::vector<double>& intensities, Size nr_threads = 0))
+  std::vector<EmpiricalFormula> formulas = {EmpiricalFormula("C6H12O6"), EmpiricalFormula("C100H150N30O40S")};
+  std::vector<double> intensities;
+  IsotopeDistributionCache::getFormulaIsotopeDistributions(formulas, 5, intensities, 2);
+  TEST_EQUAL(intensities.size(), 10)
+  for (Size i = 0; i < formulas.size(); ++i)
+  {
+    IsotopeDistribution d = formulas[i].getIsotopeDistribution(CoarseIsotopePatternGenerator(5));
+    double max = 0.0;
+    for (Size j = 0; j < d.size(); ++j) max = std::max(max, (double)d[j].getIntensity());
+    for (Size j = 0; j < d.size(); ++j)
+    {
+      TEST_REAL_SIMILAR(intensities[i * 5 + j], d[j].getIntensity() / max)
+    }
+  }
+  TEST_REAL_SIMILAR(intensities[0], 1.0)
+END_SECTION
+
+START_SECTION(double getMassWindowWidth() const)
+  IsotopeDistributionCache c(1000, 10);
+  TEST_REAL_SIMILAR(c.getMassWindowWidth(), 10.0)
+END_SECTION
+
+START_SECTION(double getMaxMass() const)
+  IsotopeDistributionCache c(1000, 10);
+  TEST_REAL_SIMILAR(c.getMaxMass(), 1010.0)
+END_SECTION
+
+START_SECTION(void store(const String& filename) const)
+  NOT_TESTABLE // tested with load
+END_SECTION
+
+START_SECTION(void load(const String& filename))
+  IsotopeDistributionCache c(1000, 10);
+  String tmp_filename;
+  NEW_TMP_FILE(tmp_filename);
+  c.store(tmp_filename);
+
+  IsotopeDistributionCache loaded(10, 1);
+  loaded.load(tmp_filename);
+  TEST_REAL_SIMILAR(loaded.getMassWindowWidth(), 10.0)
+  TEST_REAL_SIMILAR(loaded.getMaxMass(), c.getMaxMass())
+  const IsotopeDistributionCache::TheoreticalIsotopePattern &p(c.getIsotopeDistribution(500));
+  const IsotopeDistributionCache::TheoreticalIsotopePattern &q(loaded.getIsotopeDistribution(500));
+  TEST_EQUAL(p.intensity.size(), q.intensity.size())
+  for (Size j = 0; j < p.intensity.size(); ++j)
+  {
+    TEST_EQUAL(p.intensity[j], q.intensity[j])
+  }
+  TEST_EQUAL(p.trimmed_left, q.trimmed_left)
+  TEST_EQUAL(p.max, q.max)
+
+  TEST_EXCEPTION(Exception::FileNotFound, loaded.load("this_file_does_not_exist.cache"))
+  TEST_EXCEPTION(Exception::ParseError, loaded.load(OPENMS_GET_TEST_DATA_PATH("AbsoluteQuantitationMethodFile_in_1.csv")))
+END_SECTION
+
 END_TEST
 
@@ -179,6 +179,84 @@ START_SECTION((void queryRegion(double rt_low, double rt_high, double mz_low, do
   NOT_TESTABLE;
 END_SECTION
 
+// grid of features at RT 100, 200, ..., 1000 and m/z 100, 200, ..., 1000 (in two maps)
+FeatureMap grid_1, grid_2;
+for (Size i = 1; i <= 10; ++i)
+{
+  for (Size j = 1; j <= 10; ++j)
+  {
+    Feature f;
+    f.setRT(100.0 * i);
+    f.setMZ(100.0 * j);
+    f.setIntensity(i * j);
+    (i % 2 ? grid_1 : grid_2).push_back(f);
+  }
+}
+vector<FeatureMap> grid_maps;
+grid_maps.push_back(grid_1);
+grid_maps.push_back(grid_2);
+KDTreeFeatureMaps grid(grid_maps, p);
+
+START_SECTION((void queryRegions(const std::vector<double>& rt_low, const std::vector<double>& rt_high, const std::vector<double>& mz_low, const std::vector<double>& mz_high, std::vector<Size>& offsets, std::vector<Size>& result_indices, Size nr_threads = 0) const))
+  vector<double> rt_low = {150, 0, 5000}, rt_high = {350, 2000, 6000}, mz_low = {450, 950, 0}, mz_high = {650, 1050, 1000};
+  vector<Size> offsets, indices;
+  grid.queryRegions(rt_low, rt_high, mz_low, mz_high, offsets, indices, 2);
+  TEST_EQUAL(offsets.size(), 4)
+  TEST_EQUAL(offsets[1] - offsets[0], 4) // RT 200, 300 x m/z 500, 600
+  TEST_EQUAL(offsets[2] - offsets[1], 10)
+  TEST_EQUAL(offsets[3] - offsets[2], 0)
+  vector<Size> expected;
+  grid.queryRegion(150, 350, 450, 650, expected);
+  std::sort(expected.begin(), expected.end());
+  TEST_EQUAL(vector<Size>(indices.begin(), indices.begin() + 4) == expected, true)
+  for (Size k = offsets[1]; k < offsets[2]; ++k)
+  {
+    TEST_REAL_SIMILAR(grid.mz(indices[k]), 1000)
+  }
+
+  rt_low.pop_back();
+  TEST_EXCEPTION(Exception::IllegalArgument, grid.queryRegions(rt_low, rt_high, mz_low, mz_high, offsets, indices))
+END_SECTION
+
+START_SECTION((void queryRadius(const std::vector<double>& rt, const std::vector<double>& mz, double rt_tol, double mz_tol, bool mz_ppm, std::vector<Size>& offsets, std::vector<Size>& result_indices, Size nr_threads = 0) const))
+  vector<double> rt = {500, 510}, mz = {500, 500};
+  vector<Size> offsets, indices;
+  grid.queryRadius(rt, mz, 100, 100, false, offsets, indices);
+  // the box contains 9 features, the ellipse only the center and its 4 direct neighbors
+  TEST_EQUAL(offsets[1] - offsets[0], 5)
+  // shifted center: only (500, 500) and (600, 500)
+  TEST_EQUAL(offsets[2] - offsets[1], 2)
+
+  grid.queryRadius(rt, mz, 100, 2000, true, offsets, indices);
+  TEST_EQUAL(offsets[1] - offsets[0], 3) // m/z tolerance 1 Th
+END_SECTION
+
+START_SECTION((void nearestNeighbors(const std::vector<double>& rt, const std::vector<double>& mz, double rt_tol, double mz_tol, bool mz_ppm, std::vector<SignedSize>& result_indices, Size nr_threads = 0) const))
+  vector<double> rt = {520, 5000}, mz = {480, 500};
+  vector<SignedSize> nearest;
+  grid.nearestNeighbors(rt, mz, 100, 100, false, nearest, 2);
+  TEST_EQUAL(nearest.size(), 2)
+  ABORT_IF(nearest[0] < 0)
+  TEST_REAL_SIMILAR(grid.rt(nearest[0]), 500)
+  TEST_REAL_SIMILAR(grid.mz(nearest[0]), 500)
+  TEST_EQUAL(nearest[1], -1)
+END_SECTION
+
+START_SECTION(([EXTRA] data is copied from the maps))
+  KDTreeFeatureMaps kd;
+  {
+    vector<FeatureMap> tmp_maps(grid_maps);
+    kd.addMaps(tmp_maps);
+  }
+  // the maps are destroyed, but the coordinates are still available
+  TEST_EQUAL(kd.size(), 100)
+  TEST_REAL_SIMILAR(kd.mz(0), 100)
+  TEST_REAL_SIMILAR(kd.intensity(1), 2)
+  vector<Size> result;
+  kd.queryRegion(450, 550, 450, 550, result);
+  TEST_EQUAL(result.size(), 1)
+END_SECTION
+
 START_SECTION((void applyTransformations(const std::vector<TransformationModelLowess*>& trafos)))
   NOT_TESTABLE;
 END_SECTION
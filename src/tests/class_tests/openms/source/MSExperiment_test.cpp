@@ -1092,6 +1092,62 @@ START_SECTION((const MSChromatogram getTIC() const))
   TEST_EQUAL(chrom[1].getIntensity(), 2);
 END_SECTION
 
+START_SECTION((void extractXICs(const std::vector<double>& mz_lo, const std::vector<double>& mz_hi, const std::vector<double>& rt_lo, const std::vector<double>& rt_hi, std::vector<double>& rts, std::vector<float>& intensities, UInt ms_level = 1, Size nr_threads = 0) const))
+  PeakMap tmp;
+  tmp.resize(4);
+  Peak1D p;
+  for (Size s = 0; s < 4; ++s)
+  {
+    tmp[s].setRT(10.0 * (s + 1));
+    tmp[s].setMSLevel(s == 2 ? 2 : 1);
+    for (Size k = 0; k < 5; ++k)
+    {
+      p.setMZ(100.0 + k);
+      p.setIntensity(float(s + 1) * (k + 1));
+      tmp[s].push_back(p);
+    }
+  }
+  // m/z windows given in unsorted order, the last one selects no peaks
+  std::vector<double> mz_lo = {102.0, 100.0, 99.5, 103.5, 200.0};
+  std::vector<double> mz_hi = {103.0, 100.0, 104.5, 104.5, 201.0};
+  std::vector<double> rt_lo = {0.0, 15.0, 0.0, 35.0, 0.0};
+  std::vector<double> rt_hi = {100.0, 100.0, 25.0, 40.0, 100.0};
+  std::vector<double> rts;
+  std::vector<float> intensities;
+  tmp.extractXICs(mz_lo, mz_hi, rt_lo, rt_hi, rts, intensities);
+
+  // MS1 spectra at RT 10, 20 and 40
+  TEST_EQUAL(rts.size(), 3);
+  TEST_REAL_SIMILAR(rts[2], 40.0);
+  TEST_EQUAL(intensities.size(), 15);
+  // m/z 102 and 103 (intensity factors 3 + 4)
+  TEST_REAL_SIMILAR(intensities[0], 7.0);
+  TEST_REAL_SIMILAR(intensities[1], 14.0);
+  TEST_REAL_SIMILAR(intensities[2], 28.0);
+  // only m/z 100, first spectrum outside of the RT range
+  TEST_REAL_SIMILAR(intensities[3], 0.0);
+  TEST_REAL_SIMILAR(intensities[4], 2.0);
+  TEST_REAL_SIMILAR(intensities[5], 4.0);
+  // all peaks of the first two spectra
+  TEST_REAL_SIMILAR(intensities[6], 15.0);
+  TEST_REAL_SIMILAR(intensities[7], 30.0);
+  TEST_REAL_SIMILAR(intensities[8], 0.0);
+  // m/z 104 of the last spectrum
+  TEST_REAL_SIMILAR(intensities[9], 0.0);
+  TEST_REAL_SIMILAR(intensities[10], 0.0);
+  TEST_REAL_SIMILAR(intensities[11], 20.0);
+  TEST_REAL_SIMILAR(intensities[12], 0.0);
+  TEST_REAL_SIMILAR(intensities[13], 0.0);
+  TEST_REAL_SIMILAR(intensities[14], 0.0);
+
+  tmp.extractXICs(mz_lo, mz_hi, rt_lo, rt_hi, rts, intensities, 2);
+  TEST_EQUAL(rts.size(), 1);
+  TEST_REAL_SIMILAR(intensities[0], 21.0);
+
+  rt_hi.pop_back();
+  TEST_EXCEPTION(Exception::IllegalArgument, tmp.extractXICs(mz_lo, mz_hi, rt_lo, rt_hi, rts, intensities));
+END_SECTION
+
 /////////////////////////////////////////////////////////////
 /////////////////////////////////////////////////////////////
 END_TEST
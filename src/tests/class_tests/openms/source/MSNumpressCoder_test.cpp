@@ -199,6 +199,47 @@ START_SECTION(( void decodeNP(const String & in, std::vector<double> & out, bool
 }
 END_SECTION
 
+START_SECTION(( void encodeNPBatch(const std::vector<std::vector<double> > & in, std::vector<String> & result, bool zlib_compression, const NumpressConfig & config, Size nr_threads = 0) ))
+{
+  std::vector<std::vector<double> > in(5, setup_test_vec1());
+  in[2].clear();
+  std::vector<String> out;
+  MSNumpressCoder::NumpressConfig config;
+  config.np_compression = MSNumpressCoder::PIC;
+
+  MSNumpressCoder().encodeNPBatch(in, out, false, config, 2);
+  TEST_EQUAL(out.size(), 5)
+  for (Size i = 0; i < in.size(); i++)
+  {
+    String single;
+    MSNumpressCoder().encodeNP(in[i], single, false, config);
+    TEST_EQUAL(out[i], single)
+  }
+  TEST_EQUAL(out[0].size(), 12)
+  TEST_EQUAL(out[2].size(), 0)
+}
+END_SECTION
+
+START_SECTION(( void decodeNPBatch(const std::vector<String> & in, std::vector<std::vector<double> > & out, bool zlib_compression, const NumpressConfig & config, Size nr_threads = 0) ))
+{
+  std::vector<String> in(3, "ZGaMXCFQkQ==");
+  MSNumpressCoder::NumpressConfig config;
+  config.np_compression = MSNumpressCoder::PIC;
+
+  std::vector<std::vector<double> > out;
+  MSNumpressCoder().decodeNPBatch(in, out, false, config);
+  TEST_EQUAL(out.size(), 3)
+
+  TOLERANCE_ABSOLUTE(0.001)
+  for (Size i = 0; i < out.size(); i++)
+  {
+    TEST_EQUAL(out[i].size(), 4)
+    TEST_REAL_SIMILAR(out[i][0], 100.0)
+    TEST_REAL_SIMILAR(out[i][3], 400.00010)
+  }
+}
+END_SECTION
+
 START_SECTION(([MSNumpressCoder::NumpressConfig] NumpressConfig()))
 {
   MSNumpressCoder::NumpressConfig * config = new MSNumpressCoder::NumpressConfig();
@@ -701,6 +701,44 @@ START_SECTION((template <typename PeakType > void filterExperiment(MSExperiment<
 }
 END_SECTION
 
+START_SECTION((void filterExperiment(PeakMap & exp, Size nr_threads = 0)))
+  PeakMap exp;
+  for (Size s = 0; s < 50; ++s)
+  {
+    MSSpectrum spec;
+    spec.setRT(double(s + 1));
+    Peak1D p;
+    for (Size i = 0; i < 100 + 7 * s; ++i)
+    {
+      p.setMZ(500.0 + 0.01 * i);
+      p.setIntensity(float((i * 37 + s * 11) % 101));
+      spec.push_back(p);
+    }
+    exp.addSpectrum(spec);
+  }
+
+  // struc_elem_length in Thomson, i.e. a different structuring element size per spectrum
+  MorphologicalFilter mf;
+  Param parameters;
+  parameters.setValue("struc_elem_length", 0.15);
+  mf.setParameters(parameters);
+
+  // the result must not depend on the number of threads
+  PeakMap serial = exp;
+  mf.filterExperiment(serial, 1);
+  mf.filterExperiment(exp, 4);
+  TEST_EQUAL(exp.size(), serial.size())
+  bool identical = true;
+  for (Size s = 0; s < exp.size(); ++s)
+  {
+    for (Size i = 0; i < exp[s].size(); ++i)
+    {
+      if (exp[s][i].getIntensity() != serial[s][i].getIntensity() || exp[s][i].getMZ() != serial[s][i].getMZ()) identical = false;
+    }
+  }
+  TEST_EQUAL(identical, true)
+END_SECTION
+
 /////////////////////////////////////////////////////////////
 /////////////////////////////////////////////////////////////
 END_TEST
@@ -198,6 +198,32 @@ START_SECTION((MSSpectrum getSpectrum(Size id)))
 }
 END_SECTION
 
+START_SECTION((std::vector<MSSpectrum> getSpectra(const std::vector<Size>& ids, Size nr_threads = 0) const))
+{
+  OnDiscPeakMap tmp; tmp.openFile(OPENMS_GET_TEST_DATA_PATH("IndexedmzMLFile_1.mzML"));
+  std::vector<Size> ids;
+  ids.push_back(1);
+  ids.push_back(0);
+  ids.push_back(1);
+
+  std::vector<MSSpectrum> spectra = tmp.getSpectra(ids);
+  TEST_EQUAL(spectra.size(), 3)
+  TEST_EQUAL(spectra[0] == tmp.getSpectrum(1), true)
+  TEST_EQUAL(spectra[1] == tmp.getSpectrum(0), true)
+  TEST_EQUAL(spectra[2] == tmp.getSpectrum(1), true)
+  TEST_EQUAL(spectra[1].size(), 19914)
+
+  spectra = tmp.getSpectra(ids, 2);
+  TEST_EQUAL(spectra.size(), 3)
+  TEST_EQUAL(spectra[1].size(), 19914)
+
+  TEST_EQUAL(tmp.getSpectra(std::vector<Size>()).size(), 0)
+
+  ids.push_back(2);
+  TEST_EXCEPTION(Exception::IndexOverflow, tmp.getSpectra(ids))
+}
+END_SECTION
+
 START_SECTION(OpenMS::Interfaces::SpectrumPtr getSpectrumById(Size id))
 {
   OnDiscPeakMap tmp; tmp.openFile(OPENMS_GET_TEST_DATA_PATH("IndexedmzMLFile_1.mzML"));
@@ -221,6 +247,21 @@ START_SECTION((MSChromatogram getChromatogram(Size id)))
 }
 END_SECTION
 
+START_SECTION((std::vector<MSChromatogram> getChromatograms(const std::vector<Size>& ids, Size nr_threads = 0) const))
+{
+  OnDiscPeakMap tmp; tmp.openFile(OPENMS_GET_TEST_DATA_PATH("IndexedmzMLFile_1.mzML"));
+  std::vector<Size> ids(2, 0);
+
+  std::vector<MSChromatogram> chromatograms = tmp.getChromatograms(ids, 2);
+  TEST_EQUAL(chromatograms.size(), 2)
+  TEST_EQUAL(chromatograms[0] == tmp.getChromatogram(0), true)
+  TEST_EQUAL(chromatograms[1].size(), 48)
+
+  ids.push_back(1);
+  TEST_EXCEPTION(Exception::IndexOverflow, tmp.getChromatograms(ids))
+}
+END_SECTION
+
 START_SECTION(OpenMS::Interfaces::ChromatogramPtr getChromatogramById(Size id))
 {
   OnDiscPeakMap tmp; tmp.openFile(OPENMS_GET_TEST_DATA_PATH("IndexedmzMLFile_1.mzML"));
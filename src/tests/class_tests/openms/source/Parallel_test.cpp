@@ -0,0 +1,102 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry               
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+// 
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution 
+//    may be used to endorse or promote products derived from this software 
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS. 
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING 
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// 
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#include <OpenMS/CONCEPT/ClassTest.h>
+#include <OpenMS/test_config.h>
+
+///////////////////////////
+
+#include <OpenMS/CONCEPT/Parallel.h>
+#include <OpenMS/CONCEPT/Exception.h>
+
+#include <vector>
+
+using namespace OpenMS;
+using namespace std;
+
+///////////////////////////
+
+START_TEST(Parallel, "$Id$")
+
+/////////////////////////////////////////////////////////////
+
+START_SECTION((int getParallelThreadCount(Size nr_threads)))
+  TEST_EQUAL(getParallelThreadCount(0) >= 1, true)
+#ifdef _OPENMP
+  TEST_EQUAL(getParallelThreadCount(3), 3)
+#else
+  TEST_EQUAL(getParallelThreadCount(3), 1)
+#endif
+END_SECTION
+
+START_SECTION((template <typename Body> void parallelFor(Size n, Size nr_threads, Body body, Size chunk_size = 1)))
+  vector<Size> result(1000, 0);
+  parallelFor(result.size(), 4, [&result](Size i) { result[i] = i * i; }, 10);
+  bool all_set = true;
+  for (Size i = 0; i < result.size(); ++i)
+  {
+    if (result[i] != i * i) all_set = false;
+  }
+  TEST_EQUAL(all_set, true)
+
+  // nothing to do
+  parallelFor(0, 0, [](Size) { throw Exception::NotImplemented(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION); });
+
+  // exceptions are passed on after the loop
+  TEST_EXCEPTION(Exception::InvalidValue, parallelFor(100, 4, [](Size i)
+  {
+    if (i == 42) throw Exception::InvalidValue(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, "test", String(i));
+  }))
+END_SECTION
+
+START_SECTION((template <typename MakeState, typename Body> void parallelForWithState(Size n, Size nr_threads, MakeState make_state, Body body, Size chunk_size = 1)))
+  vector<Size> result(1000, 0);
+  parallelForWithState(result.size(), 4, []() { return vector<Size>(1, 5); },
+                       [&result](vector<Size>& state, Size i) { state.push_back(i); result[i] = state[0] + i; });
+  bool all_set = true;
+  for (Size i = 0; i < result.size(); ++i)
+  {
+    if (result[i] != 5 + i) all_set = false;
+  }
+  TEST_EQUAL(all_set, true)
+
+  TEST_EXCEPTION(Exception::InvalidValue, parallelForWithState(100, 4, []() -> int
+  {
+    throw Exception::InvalidValue(__FILE__, __LINE__, OPENMS_PRETTY_FUNCTION, "test", "state");
+  }, [](int&, Size) {}))
+END_SECTION
+
+/////////////////////////////////////////////////////////////
+/////////////////////////////////////////////////////////////
+END_TEST
@@ -491,4 +491,59 @@ START_SECTION(void pick(const MSSpectrum& input, MSSpectrum& output, std::vector
     
 END_SECTION
 
+START_SECTION((void pickExperiment(const PeakMap& input, PeakMap& output, const bool check_spectrum_type = true, Size nr_threads = 0) const))
+    // several copies of the spectrum, so that the threads share the work
+    PeakMap multi_input = input;
+    for (Size i = 0; i < 20; ++i)
+    {
+      multi_input.addSpectrum(input[0]);
+      multi_input[multi_input.size() - 1].setRT(100.0 + i);
+    }
+    PeakMap serial, parallel;
+    std::vector<std::vector<PeakPickerHiRes::PeakBoundary> > boundaries_serial, boundaries_parallel, boundaries_c;
+    pp_hires.pickExperiment(multi_input, serial, boundaries_serial, boundaries_c, true, 1);
+    pp_hires.pickExperiment(multi_input, parallel, boundaries_parallel, boundaries_c, true, 4);
+
+    TEST_EQUAL(parallel.size(), multi_input.size())
+    TEST_EQUAL(parallel == serial, true)
+    TEST_EQUAL(boundaries_parallel.size(), boundaries_serial.size())
+    TEST_EQUAL(boundaries_parallel.back().size(), boundaries_serial.back().size())
+    TEST_REAL_SIMILAR(parallel[multi_input.size() - 1].getRT(), 119.0)
+END_SECTION
+
+START_SECTION((void pickExperimentRange(const PeakMap& input, PeakMap& output, Size begin, Size end, const bool check_spectrum_type = true, Size nr_threads = 0) const))
+    PeakMap multi_input = input;
+    for (Size i = 0; i < 10; ++i)
+    {
+      multi_input.addSpectrum(input[0]);
+    }
+    MSChromatogram chromatogram;
+    ChromatogramPeak cp;
+    for (Size i = 0; i < 20; ++i)
+    {
+      cp.setRT(10.0 + 0.1 * i);
+      cp.setIntensity(100.0f - (float)(i - 10) * (float)(i - 10));
+      chromatogram.push_back(cp);
+    }
+    multi_input.addChromatogram(chromatogram);
+
+    PeakMap complete, blocks;
+    pp_hires.pickExperiment(multi_input, complete);
+
+    // the output is initialized by the first block
+    const Size nr_items = multi_input.size() + multi_input.getNrChromatograms();
+    for (Size begin = 0; begin < nr_items; begin += 3)
+    {
+      pp_hires.pickExperimentRange(multi_input, blocks, begin, std::min(begin + 3, nr_items), true, 2);
+    }
+    TEST_EQUAL(blocks.size(), complete.size())
+    TEST_EQUAL(blocks.getNrChromatograms(), 1)
+    TEST_EQUAL(blocks == complete, true)
+
+    TEST_EXCEPTION(Exception::IllegalArgument, pp_hires.pickExperimentRange(multi_input, blocks, 2, 1))
+    TEST_EXCEPTION(Exception::IllegalArgument, pp_hires.pickExperimentRange(multi_input, blocks, 0, nr_items + 1))
+    PeakMap uninitialized;
+    TEST_EXCEPTION(Exception::IllegalArgument, pp_hires.pickExperimentRange(multi_input, uninitialized, 1, 2))
+END_SECTION
+
 END_TEST
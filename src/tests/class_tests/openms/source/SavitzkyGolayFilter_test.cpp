@@ -157,6 +157,59 @@ START_SECTION((template <typename PeakType> void filterExperiment(MSExperiment<P
 
 END_SECTION
 
+START_SECTION((void filterExperiment(PeakMap & map, Size nr_threads = 0)))
+  PeakMap exp;
+  for (Size s = 0; s < 50; ++s)
+  {
+    MSSpectrum spec;
+    spec.setRT(double(s + 1));
+    Peak1D p;
+    for (Size i = 0; i < 100 + 7 * s; ++i)
+    {
+      p.setMZ(500.0 + 0.01 * i);
+      p.setIntensity(float((i * 37 + s * 11) % 101));
+      spec.push_back(p);
+    }
+    exp.addSpectrum(spec);
+  }
+  for (Size c = 0; c < 10; ++c)
+  {
+    MSChromatogram chromatogram;
+    ChromatogramPeak cp;
+    for (Size i = 0; i < 50; ++i)
+    {
+      cp.setRT(10.0 + 0.05 * i);
+      cp.setIntensity(float((i * 13 + c * 5) % 31));
+      chromatogram.push_back(cp);
+    }
+    exp.addChromatogram(chromatogram);
+  }
+
+  SavitzkyGolayFilter sgolay;
+
+  // the result must not depend on the number of threads
+  PeakMap serial = exp;
+  sgolay.filterExperiment(serial, 1);
+  sgolay.filterExperiment(exp, 4);
+  TEST_EQUAL(exp.size(), serial.size())
+  bool identical = true;
+  for (Size s = 0; s < exp.size(); ++s)
+  {
+    for (Size i = 0; i < exp[s].size(); ++i)
+    {
+      if (exp[s][i].getIntensity() != serial[s][i].getIntensity() || exp[s][i].getMZ() != serial[s][i].getMZ()) identical = false;
+    }
+  }
+  for (Size c = 0; c < exp.getChromatograms().size(); ++c)
+  {
+    for (Size i = 0; i < exp.getChromatogram(c).size(); ++i)
+    {
+      if (exp.getChromatogram(c)[i].getIntensity() != serial.getChromatogram(c)[i].getIntensity()) identical = false;
+    }
+  }
+  TEST_EQUAL(identical, true)
+END_SECTION
+
 /////////////////////////////////////////////////////////////
 /////////////////////////////////////////////////////////////
 END_TEST
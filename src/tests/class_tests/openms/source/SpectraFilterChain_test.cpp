@@ -0,0 +1,227 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry               
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+// 
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution 
+//    may be used to endorse or promote products derived from this software 
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS. 
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING 
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, 
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, 
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; 
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, 
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR 
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF 
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+// 
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+//
+
+#include <OpenMS/CONCEPT/ClassTest.h>
+#include <OpenMS/test_config.h>
+
+///////////////////////////
+
+#include <OpenMS/FILTERING/TRANSFORMERS/SpectraFilterChain.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/NLargest.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/Normalizer.h>
+#include <OpenMS/FILTERING/TRANSFORMERS/ThresholdMower.h>
+#include <OpenMS/KERNEL/MSExperiment.h>
+#include <OpenMS/FORMAT/DTAFile.h>
+
+using namespace OpenMS;
+using namespace std;
+
+///////////////////////////
+
+START_TEST(SpectraFilterChain, "$Id$")
+
+/////////////////////////////////////////////////////////////
+
+SpectraFilterChain* e_ptr = nullptr;
+SpectraFilterChain* e_nullPointer = nullptr;
+
+START_SECTION((SpectraFilterChain()))
+  e_ptr = new SpectraFilterChain;
+  TEST_NOT_EQUAL(e_ptr, e_nullPointer)
+  TEST_EQUAL(e_ptr->size(), 0)
+  TEST_EQUAL(e_ptr->empty(), true)
+END_SECTION
+
+START_SECTION((virtual ~SpectraFilterChain()))
+  delete e_ptr;
+END_SECTION
+
+DTAFile dta_file;
+PeakSpectrum spec;
+dta_file.load(OPENMS_GET_TEST_DATA_PATH("Transformers_tests.dta"), spec);
+
+Param threshold_param;
+threshold_param.setValue("threshold", 1.5);
+Param nlargest_param;
+nlargest_param.setValue("n", 10);
+
+START_SECTION((void addFilter(const String& name, const Param& param = Param())))
+  SpectraFilterChain chain;
+  chain.addFilter("ThresholdMower", threshold_param);
+  chain.addFilter("NLargest", nlargest_param);
+  chain.addFilter("Normalizer");
+  TEST_EQUAL(chain.size(), 3)
+  TEST_EQUAL(chain.empty(), false)
+
+  TEST_EXCEPTION(Exception::InvalidValue, chain.addFilter("MarkerMower"))
+  TEST_EXCEPTION(Exception::InvalidValue, chain.addFilter("NoSuchFilter"))
+  TEST_EQUAL(chain.size(), 3)
+END_SECTION
+
+START_SECTION((Size size() const))
+  NOT_TESTABLE // tested above
+END_SECTION
+
+START_SECTION((bool empty() const))
+  NOT_TESTABLE // tested above
+END_SECTION
+
+START_SECTION((void clear()))
+  SpectraFilterChain chain;
+  chain.addFilter("Normalizer");
+  chain.clear();
+  TEST_EQUAL(chain.size(), 0)
+  TEST_EQUAL(chain.getFilterNames().size(), 0)
+END_SECTION
+
+START_SECTION((const StringList& getFilterNames() const))
+  SpectraFilterChain chain;
+  chain.addFilter("NLargest", nlargest_param);
+  chain.addFilter("Normalizer");
+  TEST_EQUAL(ListUtils::concatenate(chain.getFilterNames(), ","), "NLargest,Normalizer")
+END_SECTION
+
+START_SECTION((const Param& getFilterParameters(Size index) const))
+  SpectraFilterChain chain;
+  chain.addFilter("NLargest", nlargest_param);
+  chain.addFilter("Normalizer");
+  TEST_EQUAL((UInt)chain.getFilterParameters(0).getValue("n"), 10)
+  TEST_EQUAL(chain.getFilterParameters(1), Normalizer().getParameters())
+  TEST_EXCEPTION(Exception::IndexOverflow, chain.getFilterParameters(2))
+END_SECTION
+
+START_SECTION((static StringList getAvailableFilters()))
+  StringList filters = SpectraFilterChain::getAvailableFilters();
+  TEST_EQUAL(filters.size(), 8)
+  SpectraFilterChain chain;
+  for (Size i = 0; i < filters.size(); ++i)
+  {
+    chain.addFilter(filters[i]);
+  }
+  TEST_EQUAL(chain.size(), 8)
+END_SECTION
+
+START_SECTION((void filterPeakSpectrum(PeakSpectrum& spectrum)))
+  SpectraFilterChain chain;
+  chain.addFilter("ThresholdMower", threshold_param);
+  chain.addFilter("NLargest", nlargest_param);
+  chain.addFilter("Normalizer");
+
+  PeakSpectrum expected(spec);
+  ThresholdMower threshold;
+  threshold.setParameters(threshold_param);
+  threshold.filterPeakSpectrum(expected);
+  NLargest nlargest(10);
+  nlargest.filterPeakSpectrum(expected);
+  Normalizer().filterPeakSpectrum(expected);
+
+  PeakSpectrum filtered(spec);
+  chain.filterPeakSpectrum(filtered);
+  TEST_EQUAL(filtered.size(), 10)
+  TEST_EQUAL(filtered == expected, true)
+
+  PeakSpectrum empty;
+  chain.filterPeakSpectrum(empty);
+  TEST_EQUAL(empty.size(), 0)
+END_SECTION
+
+START_SECTION((void filterPeakMap(PeakMap& exp, Size nr_threads = 0) const))
+  SpectraFilterChain chain;
+  chain.addFilter("ThresholdMower", threshold_param);
+  chain.addFilter("NLargest", nlargest_param);
+  chain.addFilter("Normalizer");
+
+  PeakMap exp;
+  for (Size i = 0; i < 50; ++i)
+  {
+    PeakSpectrum s(spec);
+    s.setRT(i);
+    // vary the spectra a bit
+    for (Size j = 0; j < s.size(); ++j)
+    {
+      s[j].setIntensity(s[j].getIntensity() * (1.0 + ((i + j) % 7) * 0.1));
+    }
+    exp.addSpectrum(s);
+  }
+  exp.addSpectrum(PeakSpectrum());
+
+  PeakMap expected(exp);
+  for (PeakMap::Iterator it = expected.begin(); it != expected.end(); ++it)
+  {
+    chain.filterPeakSpectrum(*it);
+  }
+
+  PeakMap serial(exp);
+  chain.filterPeakMap(serial, 1);
+  PeakMap parallel(exp);
+  chain.filterPeakMap(parallel, 4);
+  TEST_EQUAL(serial.size(), 51)
+  for (Size i = 0; i < serial.size(); ++i)
+  {
+    TEST_EQUAL(serial[i] == expected[i], true)
+    TEST_EQUAL(parallel[i] == expected[i], true)
+  }
+  TEST_EQUAL(serial[0].size(), 10)
+  TEST_EQUAL(serial[50].size(), 0)
+END_SECTION
+
+START_SECTION((SpectraFilterChain(const SpectraFilterChain& source)))
+  SpectraFilterChain chain;
+  chain.addFilter("NLargest", nlargest_param);
+  SpectraFilterChain copy(chain);
+  TEST_EQUAL(copy.size(), 1)
+  TEST_EQUAL(copy.getFilterParameters(0), chain.getFilterParameters(0))
+
+  PeakSpectrum s(spec);
+  copy.filterPeakSpectrum(s);
+  TEST_EQUAL(s.size(), 10)
+END_SECTION
+
+START_SECTION((SpectraFilterChain& operator=(const SpectraFilterChain& source)))
+  SpectraFilterChain chain;
+  chain.addFilter("NLargest", nlargest_param);
+  SpectraFilterChain copy;
+  copy.addFilter("Normalizer");
+  copy = chain;
+  TEST_EQUAL(ListUtils::concatenate(copy.getFilterNames(), ","), "NLargest")
+
+  PeakSpectrum s(spec);
+  copy.filterPeakSpectrum(s);
+  TEST_EQUAL(s.size(), 10)
+END_SECTION
+
+/////////////////////////////////////////////////////////////
+/////////////////////////////////////////////////////////////
+END_TEST
@@ -356,6 +356,82 @@ START_SECTION(void getSpectrum(PeakSpectrum& spec, const AASequence& peptide, In
 
 END_SECTION
 
+START_SECTION(static Int encodeIonAnnotation(const String& ion_name, Int charge))
+{
+  TEST_EQUAL(TheoreticalSpectrumGenerator::encodeIonAnnotation("y8++", 2), (TheoreticalSpectrumGenerator::Y_ION << 24) | (2 << 16) | 8)
+  TEST_EQUAL(TheoreticalSpectrumGenerator::encodeIonAnnotation("b3-H2O1+", 1), (TheoreticalSpectrumGenerator::B_ION << 24) | (1 << 16) | (1 << 12) | 3)
+  TEST_EQUAL(TheoreticalSpectrumGenerator::encodeIonAnnotation("a12-H3N1+", 1), (TheoreticalSpectrumGenerator::A_ION << 24) | (1 << 16) | (2 << 12) | 12)
+  TEST_EQUAL(TheoreticalSpectrumGenerator::encodeIonAnnotation("[M+H]-H2O++", 2), (TheoreticalSpectrumGenerator::PRECURSOR_ION << 24) | (2 << 16) | (1 << 12))
+  TEST_EQUAL(TheoreticalSpectrumGenerator::encodeIonAnnotation("iY", 1), (TheoreticalSpectrumGenerator::IMMONIUM_ION << 24) | (1 << 16) | 'Y')
+  TEST_EQUAL(TheoreticalSpectrumGenerator::encodeIonAnnotation("", 0), 0)
+}
+END_SECTION
+
+START_SECTION(void getSpectra(const std::vector<AASequence>& peptides, const std::vector<Int>& min_charges, const std::vector<Int>& max_charges, std::vector<Size>& offsets, std::vector<double>& mz, std::vector<float>& intensity, std::vector<Int>& ion_codes, Size nr_threads = 0) const)
+{
+  TheoreticalSpectrumGenerator generator;
+  Param param = generator.getParameters();
+  param.setValue("add_losses", "true");
+  param.setValue("add_precursor_peaks", "true");
+  generator.setParameters(param);
+
+  vector<AASequence> peptides;
+  peptides.push_back(AASequence::fromString("IFSQVGK"));
+  peptides.push_back(AASequence::fromString("PEPTIDER"));
+  peptides.push_back(AASequence());
+  peptides.push_back(AASequence::fromString("M(Oxidation)ATIDEK"));
+  vector<Int> min_charges(1, 1), max_charges(1, 2);
+
+  vector<Size> offsets;
+  vector<double> mz;
+  vector<float> intensity;
+  vector<Int> codes;
+  generator.getSpectra(peptides, min_charges, max_charges, offsets, mz, intensity, codes, 2);
+
+  TEST_EQUAL(offsets.size(), peptides.size() + 1)
+  TEST_EQUAL(offsets[0], 0)
+  TEST_EQUAL(offsets.back(), mz.size())
+  TEST_EQUAL(intensity.size(), mz.size())
+  TEST_EQUAL(codes.size(), mz.size())
+  TEST_EQUAL(offsets[3], offsets[2]) // empty peptide
+
+  // same result as getSpectrum
+  for (Size i = 0; i < peptides.size(); ++i)
+  {
+    PeakSpectrum spec;
+    generator.getSpectrum(spec, peptides[i], 1, 2);
+    TEST_EQUAL(offsets[i + 1] - offsets[i], spec.size())
+    for (Size k = 0; k < spec.size() && offsets[i] + k < mz.size(); ++k)
+    {
+      TEST_REAL_SIMILAR(mz[offsets[i] + k], spec[k].getMZ())
+      TEST_REAL_SIMILAR(intensity[offsets[i] + k], spec[k].getIntensity())
+    }
+  }
+
+  // the ion codes follow the annotation
+  param.setValue("add_metainfo", "true");
+  generator.setParameters(param);
+  PeakSpectrum spec;
+  generator.getSpectrum(spec, peptides[0], 1, 2);
+  for (Size k = 0; k < spec.size(); ++k)
+  {
+    TEST_EQUAL(codes[k], TheoreticalSpectrumGenerator::encodeIonAnnotation(spec.getStringDataArrays()[0][k], spec.getIntegerDataArrays()[0][k]))
+  }
+
+  // one charge range per peptide
+  min_charges.assign(peptides.size(), 1);
+  max_charges.assign(peptides.size(), 1);
+  max_charges[1] = 3;
+  generator.getSpectra(peptides, min_charges, max_charges, offsets, mz, intensity, codes);
+  PeakSpectrum spec3;
+  generator.getSpectrum(spec3, peptides[1], 1, 3);
+  TEST_EQUAL(offsets[2] - offsets[1], spec3.size())
+
+  min_charges.resize(2);
+  TEST_EXCEPTION(Exception::IllegalArgument, generator.getSpectra(peptides, min_charges, max_charges, offsets, mz, intensity, codes))
+}
+END_SECTION
+
 START_SECTION(([EXTRA] bugfix test where losses lead to formulae with negative element frequencies))
 {
   AASequence tmp_aa = AASequence::fromString("RDAGGPALKK");
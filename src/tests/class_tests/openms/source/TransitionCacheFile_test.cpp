@@ -0,0 +1,220 @@
+// --------------------------------------------------------------------------
+//                   OpenMS -- Open-Source Mass Spectrometry
+// --------------------------------------------------------------------------
+// Copyright The OpenMS Team -- Eberhard Karls University Tuebingen,
+// ETH Zurich, and Freie Universitaet Berlin 2002-2018.
+//
+// This software is released under a three-clause BSD license:
+//  * Redistributions of source code must retain the above copyright
+//    notice, this list of conditions and the following disclaimer.
+//  * Redistributions in binary form must reproduce the above copyright
+//    notice, this list of conditions and the following disclaimer in the
+//    documentation and/or other materials provided with the distribution.
+//  * Neither the name of any author or any participating institution
+//    may be used to endorse or promote products derived from this software
+//    without specific prior written permission.
+// For a full list of authors, refer to the file AUTHORS.
+// --------------------------------------------------------------------------
+// THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+// AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+// IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+// ARE DISCLAIMED. IN NO EVENT SHALL ANY OF THE AUTHORS OR THE CONTRIBUTING
+// INSTITUTIONS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+// EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+// PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS;
+// OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY,
+// WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR
+// OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF
+// ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+//
+// --------------------------------------------------------------------------
+// $Maintainer: $
+// $Authors: agent $
+// --------------------------------------------------------------------------
+
+#include <OpenMS/CONCEPT/ClassTest.h>
+#include <OpenMS/test_config.h>
+
+#include <OpenMS/ANALYSIS/OPENSWATH/DATAACCESS/DataAccessHelper.h>
+#include <OpenMS/FORMAT/TraMLFile.h>
+#include <OpenMS/SYSTEM/File.h>
+
+///////////////////////////
+#include <OpenMS/ANALYSIS/OPENSWATH/TransitionCacheFile.h>
+///////////////////////////
+
+#include <fstream>
+
+using namespace OpenMS;
+using namespace std;
+
+START_TEST(TransitionCacheFile, "$Id$")
+
+/////////////////////////////////////////////////////////////
+/////////////////////////////////////////////////////////////
+
+TransitionCacheFile* ptr = nullptr;
+TransitionCacheFile* nullPointer = nullptr;
+
+START_SECTION(TransitionCacheFile())
+{
+  ptr = new TransitionCacheFile();
+  TEST_NOT_EQUAL(ptr, nullPointer)
+}
+END_SECTION
+
+START_SECTION(~TransitionCacheFile())
+{
+  delete ptr;
+}
+END_SECTION
+
+String source = OPENMS_GET_TEST_DATA_PATH("ChromatogramExtractor_input.TraML");
+OpenSwath::LightTargetedExperiment light_exp;
+{
+  TargetedExperiment targeted_exp;
+  TraMLFile().load(source, targeted_exp);
+  OpenSwathDataAccessHelper::convertTargetedExp(targeted_exp, light_exp);
+}
+
+// metabolite and modification information is not part of the TraML file
+{
+  OpenSwath::LightCompound compound;
+  compound.id = "compound_1";
+  compound.compound_name = "Glucose";
+  compound.sum_formula = "C6H12O6";
+  compound.rt = 12.5;
+  compound.setDriftTime(0.75);
+  OpenSwath::LightModification mod;
+  mod.location = 2;
+  mod.unimod_id = 35;
+  compound.modifications.push_back(mod);
+  light_exp.compounds.push_back(compound);
+}
+
+START_SECTION(void store(const String& filename, const OpenSwath::LightTargetedExperiment& targeted_exp, const String& source = ""))
+{
+  String tmp_filename;
+  NEW_TMP_FILE(tmp_filename);
+  TransitionCacheFile().store(tmp_filename, light_exp, source);
+  TEST_EQUAL(File::exists(tmp_filename), true)
+
+  // an existing cache is replaced
+  TransitionCacheFile().store(tmp_filename, light_exp, source);
+  TEST_EQUAL(TransitionCacheFile().isValid(tmp_filename, source), true)
+
+  TEST_EXCEPTION(Exception::UnableToCreateFile, TransitionCacheFile().store("/does/not/exist/cache.bin", light_exp))
+}
+END_SECTION
+
+START_SECTION(void load(const String& filename, OpenSwath::LightTargetedExperiment& targeted_exp))
+{
+  String tmp_filename;
+  NEW_TMP_FILE(tmp_filename);
+  TransitionCacheFile cache;
+  cache.store(tmp_filename, light_exp, source);
+
+  OpenSwath::LightTargetedExperiment loaded;
+  cache.load(tmp_filename, loaded);
+
+  TEST_EQUAL(loaded.getProteins().size(), light_exp.getProteins().size())
+  TEST_EQUAL(loaded.getCompounds().size(), light_exp.getCompounds().size())
+  TEST_EQUAL(loaded.getTransitions().size(), light_exp.getTransitions().size())
+  ABORT_IF(loaded.getTransitions().size() != light_exp.getTransitions().size())
+
+  for (Size i = 0; i < light_exp.getProteins().size(); ++i)
+  {
+    TEST_EQUAL(loaded.getProteins()[i].id, light_exp.getProteins()[i].id)
+    TEST_EQUAL(loaded.getProteins()[i].sequence, light_exp.getProteins()[i].sequence)
+  }
+  for (Size i = 0; i < light_exp.getCompounds().size(); ++i)
+  {
+    const OpenSwath::LightCompound& a = loaded.getCompounds()[i];
+    const OpenSwath::LightCompound& b = light_exp.getCompounds()[i];
+    TEST_EQUAL(a.id, b.id)
+    TEST_EQUAL(a.sequence, b.sequence)
+    TEST_REAL_SIMILAR(a.rt, b.rt)
+    TEST_REAL_SIMILAR(a.getDriftTime(), b.getDriftTime())
+    TEST_EQUAL(a.charge, b.charge)
+    TEST_EQUAL(a.protein_refs.size(), b.protein_refs.size())
+    TEST_EQUAL(a.peptide_group_label, b.peptide_group_label)
+    TEST_EQUAL(a.sum_formula, b.sum_formula)
+    TEST_EQUAL(a.compound_name, b.compound_name)
+    TEST_EQUAL(a.modifications.size(), b.modifications.size())
+  }
+  const OpenSwath::LightCompound& metabolite = loaded.getCompounds().back();
+  TEST_EQUAL(metabolite.isPeptide(), false)
+  TEST_EQUAL(metabolite.modifications.size(), 1)
+  TEST_EQUAL(metabolite.modifications[0].location, 2)
+  TEST_EQUAL(metabolite.modifications[0].unimod_id, 35)
+
+  for (Size i = 0; i < light_exp.getTransitions().size(); ++i)
+  {
+    const OpenSwath::LightTransition& a = loaded.getTransitions()[i];
+    const OpenSwath::LightTransition& b = light_exp.getTransitions()[i];
+    TEST_EQUAL(a.transition_name, b.transition_name)
+    TEST_EQUAL(a.peptide_ref, b.peptide_ref)
+    TEST_REAL_SIMILAR(a.library_intensity, b.library_intensity)
+    TEST_REAL_SIMILAR(a.product_mz, b.product_mz)
+    TEST_REAL_SIMILAR(a.precursor_mz, b.precursor_mz)
+    TEST_EQUAL(a.fragment_charge, b.fragment_charge)
+    TEST_EQUAL(a.decoy, b.decoy)
+    TEST_EQUAL(a.detecting_transition, b.detecting_transition)
+    TEST_EQUAL(a.quantifying_transition, b.quantifying_transition)
+    TEST_EQUAL(a.identifying_transition, b.identifying_transition)
+  }
+
+  // the compound lookup works on the loaded experiment
+  TEST_EQUAL(loaded.getCompoundByRef("compound_1").compound_name, "Glucose")
+
+  TEST_EXCEPTION(Exception::FileNotFound, cache.load("/does/not/exist/cache.bin", loaded))
+  TEST_EXCEPTION(Exception::ParseError, cache.load(source, loaded))
+
+  // truncated file
+  String truncated;
+  NEW_TMP_FILE(truncated);
+  {
+    std::ifstream in(tmp_filename.c_str(), std::ios::binary);
+    std::string content((std::istreambuf_iterator<char>(in)), std::istreambuf_iterator<char>());
+    std::ofstream out(truncated.c_str(), std::ios::binary);
+    out.write(content.data(), content.size() - 10);
+  }
+  TEST_EXCEPTION(Exception::ParseError, cache.load(truncated, loaded))
+}
+END_SECTION
+
+START_SECTION(bool isValid(const String& filename, const String& source))
+{
+  TransitionCacheFile cache;
+  String tmp_filename;
+  NEW_TMP_FILE(tmp_filename);
+  cache.store(tmp_filename, light_exp, source);
+  TEST_EQUAL(cache.isValid(tmp_filename, source), true)
+
+  // a copy of the library (different modification time, same content) is accepted
+  String copy;
+  NEW_TMP_FILE(copy);
+  {
+    std::ifstream in(source.c_str(), std::ios::binary);
+    std::ofstream out(copy.c_str(), std::ios::binary);
+    out << in.rdbuf();
+  }
+  TEST_EQUAL(cache.isValid(tmp_filename, copy), true)
+
+  // a different library is not
+  TEST_EQUAL(cache.isValid(tmp_filename, OPENMS_GET_TEST_DATA_PATH("MRMAssay_detectingTransitions_input.TraML")), false)
+
+  // cache without a source
+  String no_source;
+  NEW_TMP_FILE(no_source);
+  cache.store(no_source, light_exp);
+  TEST_EQUAL(cache.isValid(no_source, source), false)
+
+  TEST_EQUAL(cache.isValid("/does/not/exist/cache.bin", source), false)
+  TEST_EQUAL(cache.isValid(source, source), false)
+}
+END_SECTION
+
+/////////////////////////////////////////////////////////////
+/////////////////////////////////////////////////////////////
+END_TEST
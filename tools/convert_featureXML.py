@@ -34,57 +34,227 @@
 # $Authors: Hendrik Weisser $
 # --------------------------------------------------------------------------
 
-"""Convert featureXML files between formats used before and after OpenMS 1.8"""
+"""Rewrite featureXML files: convert convex hulls between the formats used
+before and after OpenMS 1.8, drop convex hulls or subordinate features and
+filter features by retention time or intensity.
 
-import sys
+The files are processed line by line in bounded memory (only one feature is
+held at a time), so arbitrarily large files can be rewritten. Like the
+featureXML writer of OpenMS, the script expects one XML element per line.
+If the input is a directory, all featureXML files below it are rewritten in
+parallel into the output directory (keeping the directory structure).
+"""
+
+from __future__ import print_function
+
+import argparse
+import multiprocessing
+import os
 import re
-import os.path
-
-if len(sys.argv) < 3:
-    sys.exit("Error: two parameters (input featureXML, output featureXML) "
-             "expected!")
-
-in_path = sys.argv[1]
-out_path = sys.argv[2]
-
-if os.path.realpath(in_path) == os.path.realpath(out_path):
-    sys.exit("Error: output path must be different from input path!")
-
-old_pattern = re.compile('<hullpoint>\n<hposition dim="0">(.*)</hposition>\n'
-                         '<hposition dim="1">(.*)</hposition>\n</hullpoint>')
-new_pattern = re.compile('<pt x="(.*)" y="(.*)" */>')
-
-with open(in_path) as source:
-    with open(out_path, "w") as sink:
-        line_count = 0
-        for line in source:
-            line_count += 1
-            stripped = line.strip()
-            if stripped == "<hullpoint>": # convert old to new:
-                temp_count = line_count
-                indent = line[:line.index("<")]
-                content = stripped
-                while stripped != "</hullpoint>":
-                    stripped = source.next().strip()
-                    line_count += 1
-                    content += "\n" + stripped
-                match = old_pattern.match(content)
-                if not match:
-                    print "skipping unexpected content in lines %d-%d" % \
-                        (temp_count, line_count)
-                else:
-                    sink.write(indent + '<pt x="%s" y="%s" />\n' %
-                               (match.group(1), match.group(2)))
-                continue
-            # else:
-            match = new_pattern.match(stripped)
-            if match: # convert new to old:
-                indent = line[:line.index("<")]
-                sink.write(indent + "<hullpoint>\n")
-                sink.write(indent + '\t<hposition dim="0">%s</hposition>\n' %
-                           match.group(1))
-                sink.write(indent + '\t<hposition dim="1">%s</hposition>\n' %
-                           match.group(2))
-                sink.write(indent + "</hullpoint>\n")
-            else:
-                sink.write(line)
+import sys
+
+OLD_HULL = re.compile(br'<hullpoint>\s*<hposition dim="0">(.*)</hposition>\s*'
+                      br'<hposition dim="1">(.*)</hposition>\s*</hullpoint>$')
+NEW_HULL = re.compile(br'<pt x="(.*)" y="(.*)" */>')
+FEATURE_LIST = re.compile(br'(\s*<featureList count=")(\d+)(".*)', re.DOTALL)
+POSITION_RT = re.compile(br'<position dim="0">(.*)</position>')
+INTENSITY = re.compile(br'<intensity>(.*)</intensity>')
+
+
+class FeatureXMLRewriter(object):
+    """Streaming featureXML transformation
+
+    hull_format is one of "convert" (turn old hull points into new ones and
+    vice versa), "old", "new" (convert to the given format only) or "keep".
+    Features whose retention time or intensity lie outside rt_range or
+    intensity_range (pairs, None for an open bound) are removed together
+    with their subordinates; only top-level features are filtered.
+    """
+
+    def __init__(self, hull_format="convert", drop_hulls=False,
+                 drop_subordinates=False, rt_range=(None, None),
+                 intensity_range=(None, None)):
+        self.to_new = hull_format in ("convert", "new")
+        self.to_old = hull_format in ("convert", "old")
+        self.dropped = []
+        if drop_hulls:
+            self.dropped.append((b"<convexhull", b"</convexhull>"))
+        if drop_subordinates:
+            self.dropped.append((b"<subordinate", b"</subordinate>"))
+        self.rt_range = rt_range
+        self.intensity_range = intensity_range
+        self.filtering = any(x is not None for x in rt_range + intensity_range)
+
+    @staticmethod
+    def _inside(value, bounds):
+        return ((bounds[0] is None or value >= bounds[0]) and
+                (bounds[1] is None or value <= bounds[1]))
+
+    def _keep(self, rt, intensity):
+        if rt is None or intensity is None:
+            return True
+        return (self._inside(rt, self.rt_range) and
+                self._inside(intensity, self.intensity_range))
+
+    def rewrite(self, in_path, out_path):
+        """Rewrites in_path into out_path, returns the number of top-level
+        features read and written"""
+        if os.path.realpath(in_path) == os.path.realpath(out_path):
+            raise ValueError("output path must be different from input path")
+
+        n_read = n_written = 0
+        count_line = None  # (file offset, line) of <featureList count="...">
+        with open(in_path, "rb") as source, open(out_path, "wb") as sink:
+            feature = None  # lines of the current top-level feature
+            depth = 0  # nesting level of <feature> elements
+            skip = None  # (open tag, close tag, level) of a dropped element
+            rt = intensity = None
+            line_count = 0
+            for line in source:
+                line_count += 1
+                stripped = line.strip()
+
+                if skip is not None:
+                    if stripped.startswith(skip[0]) and not stripped.endswith(b"/>"):
+                        skip = (skip[0], skip[1], skip[2] + 1)
+                    elif stripped.startswith(skip[1]):
+                        skip = (skip[0], skip[1], skip[2] - 1) if skip[2] > 1 else None
+                    continue
+                dropped = [d for d in self.dropped if stripped.startswith(d[0])]
+                if dropped:
+                    if not stripped.endswith(b"/>"):
+                        skip = dropped[0] + (1,)
+                    continue
+
+                out = line
+                if stripped.startswith(b"<feature ") or stripped == b"<feature>":
+                    depth += 1
+                    if depth == 1:
+                        n_read += 1
+                        feature = []
+                        rt = intensity = None
+                elif stripped.startswith(b"</feature>"):
+                    depth -= 1
+                elif depth == 1 and self.filtering and stripped.startswith(b"<position dim=\"0\">"):
+                    rt = float(POSITION_RT.match(stripped).group(1))
+                elif depth == 1 and self.filtering and stripped.startswith(b"<intensity>"):
+                    intensity = float(INTENSITY.match(stripped).group(1))
+                elif stripped == b"<hullpoint>" and self.to_new:  # old to new
+                    first = line_count
+                    indent = line[:line.index(b"<")]
+                    content = stripped
+                    while stripped != b"</hullpoint>":
+                        stripped = next(source, b"</hullpoint>").strip()
+                        line_count += 1
+                        content += b"\n" + stripped
+                    match = OLD_HULL.match(content)
+                    if not match:
+                        print("%s: skipping unexpected content in lines %d-%d" %
+                              (in_path, first, line_count), file=sys.stderr)
+                        continue
+                    eol = line[len(line.rstrip(b"\r\n")):]
+                    out = indent + b'<pt x="%s" y="%s" />' % match.groups() + eol
+                elif stripped.startswith(b"<pt ") and self.to_old:  # new to old
+                    match = NEW_HULL.match(stripped)
+                    if match:
+                        indent = line[:line.index(b"<")]
+                        eol = line[len(line.rstrip(b"\r\n")):]
+                        out = (indent + b"<hullpoint>" + eol +
+                               indent + b'\t<hposition dim="0">%s</hposition>' % match.group(1) + eol +
+                               indent + b'\t<hposition dim="1">%s</hposition>' % match.group(2) + eol +
+                               indent + b"</hullpoint>" + eol)
+                elif count_line is None and self.filtering and FEATURE_LIST.match(line):
+                    count_line = (sink.tell(), line)
+
+                if feature is None:
+                    sink.write(out)
+                    continue
+                feature.append(out)
+                if depth == 0:  # end of a top-level feature
+                    if self._keep(rt, intensity):
+                        n_written += 1
+                        sink.write(b"".join(feature))
+                    feature = None
+
+            if count_line is not None and n_written != n_read:
+                self._patchCount(sink, count_line, n_written)
+        return n_read, n_written
+
+    @staticmethod
+    def _patchCount(sink, count_line, count):
+        # overwrite the count in place, padded to the original line length
+        offset, line = count_line
+        prefix, old, suffix = FEATURE_LIST.match(line).groups()
+        new = str(count).encode()
+        if len(new) > len(old):
+            print("warning: featureList count of %s not updated" % sink.name,
+                  file=sys.stderr)
+            return
+        tag_end = suffix.index(b">")
+        suffix = suffix[:tag_end] + b" " * (len(old) - len(new)) + suffix[tag_end:]
+        sink.seek(offset)
+        sink.write(prefix + new + suffix)
+        sink.seek(0, os.SEEK_END)
+
+
+def _rewriteFile(args):
+    rewriter, in_path, out_path = args
+    return in_path, rewriter.rewrite(in_path, out_path)
+
+
+def _findFiles(in_dir, out_dir):
+    for root, _, files in os.walk(in_dir):
+        for name in sorted(files):
+            if name.lower().endswith(".featurexml"):
+                target = os.path.join(out_dir, os.path.relpath(root, in_dir))
+                if not os.path.isdir(target):
+                    os.makedirs(target)
+                yield os.path.join(root, name), os.path.join(target, name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("input", help="input featureXML file or directory")
+    parser.add_argument("output", help="output featureXML file or directory")
+    parser.add_argument("--hulls", choices=["convert", "old", "new", "keep", "drop"],
+                        default="convert",
+                        help="convert hull points old <-> new (default), to one "
+                        "format only, keep them unchanged or drop the convex hulls")
+    parser.add_argument("--drop-subordinates", action="store_true",
+                        help="remove subordinate features")
+    parser.add_argument("--rt-min", type=float, help="minimal feature RT")
+    parser.add_argument("--rt-max", type=float, help="maximal feature RT")
+    parser.add_argument("--intensity-min", type=float, help="minimal feature intensity")
+    parser.add_argument("--intensity-max", type=float, help="maximal feature intensity")
+    parser.add_argument("--threads", type=int, default=0,
+                        help="number of files rewritten in parallel if the "
+                        "input is a directory (default: number of CPUs)")
+    options = parser.parse_args(argv)
+
+    rewriter = FeatureXMLRewriter(
+        hull_format=options.hulls, drop_hulls=options.hulls == "drop",
+        drop_subordinates=options.drop_subordinates,
+        rt_range=(options.rt_min, options.rt_max),
+        intensity_range=(options.intensity_min, options.intensity_max))
+
+    if os.path.isdir(options.input):
+        if os.path.realpath(options.input) == os.path.realpath(options.output):
+            sys.exit("Error: output directory must be different from input directory!")
+        jobs = [(rewriter, i, o) for i, o in _findFiles(options.input, options.output)]
+        pool = multiprocessing.Pool(options.threads or None)
+        try:
+            for in_path, (n_read, n_written) in pool.imap_unordered(_rewriteFile, jobs):
+                print("%s: %d of %d features written" % (in_path, n_written, n_read))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        try:
+            n_read, n_written = rewriter.rewrite(options.input, options.output)
+        except ValueError as e:
+            sys.exit("Error: %s!" % e)
+        print("%d of %d features written" % (n_written, n_read))
+
+
+if __name__ == "__main__":
+    main()